@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+性能测试的公共工具
+"""
+
+import time
+
+
+def 计时(函数, 次数: int = 1) -> float:
+    """运行函数指定次数并返回平均耗时（毫秒）"""
+    开始时间 = time.perf_counter()
+    for _ in range(次数):
+        函数()
+    return (time.perf_counter() - 开始时间) / 次数 * 1000
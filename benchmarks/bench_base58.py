@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Base58Check编码性能测试
+对比项目内置的分块编码器与base58依赖库编码P2PKH地址载荷的速度
+"""
+
+import os
+import sys
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks._common import 计时
+from utils.base58_encoder import Base58编码器
+
+try:
+    import base58
+    BASE58_AVAILABLE = True
+except ImportError:
+    BASE58_AVAILABLE = False
+
+
+def 运行基准测试(数量: int = 10000) -> None:
+    """编码指定数量的地址和扩展公钥载荷并输出吞吐量"""
+    公钥哈希列表 = [os.urandom(20) for _ in range(数量)]
+    扩展公钥列表 = [os.urandom(74) for _ in range(数量)]
+    
+    地址批量耗时 = 计时(lambda: Base58编码器.批量编码校验(公钥哈希列表, b"\x00"))
+    扩展公钥批量耗时 = 计时(lambda: Base58编码器.批量编码校验(扩展公钥列表, bytes.fromhex("0488b21e")))
+    
+    print(f"===== Base58Check编码 ({数量}条) =====")
+    print(f"内置编码器 地址(批量):     {数量 * 1000 / 地址批量耗时:,.0f} 条/秒")
+    print(f"内置编码器 扩展公钥(批量): {数量 * 1000 / 扩展公钥批量耗时:,.0f} 条/秒")
+    
+    if BASE58_AVAILABLE:
+        地址依赖耗时 = 计时(lambda: [base58.b58encode_check(b"\x00" + 数据) for 数据 in 公钥哈希列表])
+        扩展公钥依赖耗时 = 计时(lambda: [base58.b58encode_check(bytes.fromhex("0488b21e") + 数据) for 数据 in 扩展公钥列表])
+        print(f"base58依赖库 地址:         {数量 * 1000 / 地址依赖耗时:,.0f} 条/秒")
+        print(f"base58依赖库 扩展公钥:     {数量 * 1000 / 扩展公钥依赖耗时:,.0f} 条/秒")
+        print(f"加速比: 地址 {地址依赖耗时 / 地址批量耗时:.1f}x, 扩展公钥 {扩展公钥依赖耗时 / 扩展公钥批量耗时:.1f}x")
+    else:
+        print("未安装base58库，跳过对比")
+
+
+if __name__ == "__main__":
+    运行基准测试(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
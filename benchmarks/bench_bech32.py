@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Bech32编码性能测试
+对比项目内置的查表编码器与bech32依赖库编码P2WPKH地址的速度
+"""
+
+import os
+import sys
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks._common import 计时
+from utils.bech32_encoder import Bech32编码器
+
+try:
+    import bech32
+    BECH32_AVAILABLE = True
+except ImportError:
+    BECH32_AVAILABLE = False
+
+
+def 运行基准测试(数量: int = 10000) -> None:
+    """编码指定数量的随机见证程序并输出吞吐量"""
+    程序列表 = [os.urandom(20) for _ in range(数量)]
+    
+    内置批量耗时 = 计时(lambda: Bech32编码器.批量编码隔离见证地址("bc", 0, 程序列表))
+    内置单个耗时 = 计时(lambda: [Bech32编码器.编码隔离见证地址("bc", 0, 程序) for 程序 in 程序列表])
+    
+    print(f"===== Bech32编码 ({数量}个P2WPKH地址) =====")
+    print(f"内置编码器(批量): {数量 * 1000 / 内置批量耗时:,.0f} 地址/秒")
+    print(f"内置编码器(逐个): {数量 * 1000 / 内置单个耗时:,.0f} 地址/秒")
+    
+    if BECH32_AVAILABLE:
+        依赖库耗时 = 计时(lambda: [bech32.encode("bc", 0, 程序) for 程序 in 程序列表])
+        print(f"bech32依赖库:     {数量 * 1000 / 依赖库耗时:,.0f} 地址/秒")
+        print(f"批量加速比: {依赖库耗时 / 内置批量耗时:.1f}x")
+        
+        # 确认两者结果一致
+        assert Bech32编码器.批量编码隔离见证地址("bc", 0, 程序列表[:100]) == \
+            [bech32.encode("bc", 0, 程序) for 程序 in 程序列表[:100]]
+    else:
+        print("未安装bech32库，跳过对比")
+
+
+if __name__ == "__main__":
+    运行基准测试(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
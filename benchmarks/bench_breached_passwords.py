@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+泄露密码索引性能测试
+用随机生成的明文语料构建索引（分段排序加归并），
+再测量内存映射二分查找的单次查询耗时，以及启用索引后密码强度评分的额外开销
+"""
+
+import os
+import sys
+import time
+import random
+import tempfile
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks._common import 计时
+from utils.breached_passwords import 构建泄露密码索引, 泄露密码索引
+from utils.password_checker import 密码强度检查器
+
+
+def 运行基准测试(数量: int = 500000) -> None:
+    """用指定条数的语料构建索引并测量查询"""
+    随机 = random.Random(45)
+    with tempfile.TemporaryDirectory() as 临时目录:
+        语料路径 = os.path.join(临时目录, "corpus.txt")
+        with open(语料路径, "w", encoding="utf-8") as 文件:
+            for _ in range(数量):
+                文件.write(f"{随机.getrandbits(40):x}\n")
+        索引路径 = os.path.join(临时目录, "breached.idx")
+
+        print(f"===== {数量} 条语料 =====")
+        开始时间 = time.perf_counter()
+        记录数 = 构建泄露密码索引([语料路径], 索引路径, 每段记录数=数量 // 4 or 1)
+        print(f"构建: {time.perf_counter() - 开始时间:.2f} 秒, {记录数} 条记录, "
+              f"{os.path.getsize(索引路径) / 1e6:.1f} MB")
+
+        with 泄露密码索引(索引路径) as 索引:
+            查询列表 = [f"{随机.getrandbits(40):x}" for _ in range(10000)]
+            耗时 = 计时(lambda: [密码 in 索引 for 密码 in 查询列表], 1) / len(查询列表)
+            print(f"查询: {耗时 * 1000:.2f} 微秒/次")
+
+            密码 = "correct horse battery staple"
+            无索引 = 计时(lambda: 密码强度检查器.检查密码强度(密码), 5000)
+            密码强度检查器.设置泄露密码索引(索引)
+            有索引 = 计时(lambda: 密码强度检查器.检查密码强度(密码), 5000)
+            密码强度检查器.设置泄露密码索引(None)
+            print(f"密码强度评分: 无索引 {无索引 * 1000:.1f} 微秒, 启用索引 {有索引 * 1000:.1f} 微秒")
+
+
+if __name__ == "__main__":
+    运行基准测试(int(sys.argv[1]) if len(sys.argv) > 1 else 500000)
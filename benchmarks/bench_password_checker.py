@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+密码强度评分性能测试
+对不同长度的随机密码短语批量评分，输出每个密码的耗时和每字符耗时，
+评分耗时应随长度线性增长
+"""
+
+import os
+import sys
+import random
+import string
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks._common import 计时
+from utils.password_checker import 密码强度检查器
+
+
+def 运行基准测试(数量: int = 2000) -> None:
+    """对每种长度生成指定数量的密码并批量评分"""
+    随机 = random.Random(44)
+    字符集 = string.ascii_letters + string.digits + " !@#-"
+
+    print("===== 批量密码强度评分 =====")
+    for 长度 in (8, 16, 32, 64, 128, 256):
+        密码列表 = ["".join(随机.choice(字符集) for _ in range(长度)) for _ in range(数量)]
+        耗时 = 计时(lambda: [密码强度检查器.检查密码强度(密码) for 密码 in 密码列表], 1) / 数量
+        print(f"长度 {长度:>3}: {耗时 * 1000:7.2f} 微秒/个, {耗时 * 1e6 / 长度:6.1f} 纳秒/字符, "
+              f"{1000 / 耗时:8.0f} 个/秒")
+
+
+if __name__ == "__main__":
+    运行基准测试(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+密码猜测次数估计性能测试
+对不同长度的单词密码短语和随机字符密码估计猜测次数，
+64个字符的密码短语应在1毫秒内完成；
+并比较边输入边评分时增量评分器追加一个字符与每次按键重新评分整个密码的耗时
+"""
+
+import os
+import sys
+import random
+import string
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks._common import 计时
+from utils.password_guesses import 估计猜测次数
+from utils.password_checker import 密码强度检查器, _BIP39单词
+
+
+def 运行基准测试(数量: int = 500) -> None:
+    """对每种长度生成指定数量的密码短语和随机密码并估计猜测次数"""
+    随机 = random.Random(46)
+    单词表 = _BIP39单词() or ["correct", "horse", "battery", "staple", "orbit", "lunar", "zebra"]
+    字符集 = string.ascii_letters + string.digits + " !@#-"
+    字典树 = 密码强度检查器._字典树
+
+    for 名称, 生成 in (
+        ("单词密码短语", lambda 长度: " ".join(随机.choice(单词表) for _ in range(长度))[:长度]),
+        ("随机字符", lambda 长度: "".join(随机.choice(字符集) for _ in range(长度))),
+    ):
+        print(f"===== {名称} =====")
+        for 长度 in (8, 16, 32, 64, 128):
+            密码列表 = [生成(长度) for _ in range(数量)]
+            耗时 = 计时(lambda: [估计猜测次数(密码, 字典树) for 密码 in 密码列表], 1) / 数量
+            print(f"长度 {长度:>3}: {耗时 * 1000:7.1f} 微秒/个")
+
+    print("===== 逐字符输入单词密码短语（每次按键） =====")
+    for 长度 in (16, 64, 128):
+        密码列表 = [" ".join(随机.choice(单词表) for _ in range(长度))[:长度] for _ in range(数量 // 10 or 1)]
+
+        def 增量追加():
+            for 密码 in 密码列表:
+                评分器 = 密码强度检查器.创建增量评分器()
+                for 字符 in 密码:
+                    评分器.追加(字符)
+
+        def 重新评分():
+            for 密码 in 密码列表:
+                for 结束 in range(1, 长度 + 1):
+                    密码强度检查器.检查密码强度(密码[:结束])
+
+        按键数 = len(密码列表) * 长度
+        增量耗时 = 计时(增量追加, 1) / 按键数
+        重新耗时 = 计时(重新评分, 1) / 按键数
+        print(f"长度 {长度:>3}: 增量追加 {增量耗时 * 1000:6.1f} 微秒/键  重新评分 {重新耗时 * 1000:7.1f} 微秒/键")
+
+
+if __name__ == "__main__":
+    运行基准测试(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
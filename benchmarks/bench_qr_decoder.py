@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+二维码校验开销测试
+对比生成二维码PNG（编码加栅格化）与解码校验同一张PNG的耗时，
+以及批量打印页中每个单元格生成和校验的耗时，估算校验一万张二维码需要增加的时间
+"""
+
+import os
+import sys
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks._common import 计时
+from utils.qr_encoder import 编码
+from utils.qr_raster import 编码PNG
+from utils.qr_decoder import 解码PNG, 解码1位像素行
+from utils.qr_sheets import _检查版式, _渲染单元格
+
+
+def 运行基准测试(数量: int = 200) -> None:
+    """对几种典型数据各生成和校验指定次数并输出结果"""
+    样例列表 = (
+        ("BTC地址 (M)", "bc1qar0srrr7xfkvy5l643lydnw9re59gtzzwf5mdq", "M"),
+        ("24词助记词 (H)", "attack pizza motion avocado network gather crop fresh patrol unusual wild holiday "
+                        "candy pony ranch winter theme error hybrid van cereal salon goddess expire", "H"),
+        ("64字节种子hex (H)", "ab" * 64, "H"),
+    )
+
+    print("===== 单张PNG（盒子大小10，边框4） =====")
+    for 名称, 数据, 级别 in 样例列表:
+        PNG数据 = 编码PNG(编码(数据, 级别))
+        生成耗时 = 计时(lambda: 编码PNG(编码(数据, 级别)), 数量)
+        校验耗时 = 计时(lambda: 解码PNG(PNG数据), 数量)
+        print(f"{名称:<18} 生成 {生成耗时:6.3f} 毫秒, 校验 {校验耗时:6.3f} 毫秒 "
+              f"(+{校验耗时 / 生成耗时:.0%}), 一万张校验约 {校验耗时 * 10:.1f} 秒")
+
+    print("\n===== 打印页单元格（800像素） =====")
+    版式 = _检查版式({})
+    for 名称, 数据, 级别 in 样例列表:
+        单元格版式 = dict(版式, 错误纠正级别=级别)
+        单元格 = _渲染单元格(数据, 单元格版式)
+        生成耗时 = 计时(lambda: _渲染单元格(数据, 单元格版式), 数量)
+        校验耗时 = 计时(lambda: 解码1位像素行(单元格, 版式["单元格边长"]), 数量)
+        print(f"{名称:<18} 渲染 {生成耗时:6.3f} 毫秒, 校验 {校验耗时:6.3f} 毫秒")
+
+
+if __name__ == "__main__":
+    运行基准测试(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+多帧动态二维码传输吞吐量测试
+模拟接收方从循环播放的动画中任意一帧开始扫描、并随机漏掉一部分帧，
+统计还原所需的帧数，按固定播放帧率换算为向离线机器传输的有效吞吐量（字节/秒）；
+同时给出每帧的二维码尺寸和编码耗时
+"""
+
+import os
+import sys
+import random
+from itertools import islice
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks._common import 计时
+from utils.qr_multipart import 生成帧, 帧矩阵, 多帧解码器
+
+播放帧率 = 5.0
+漏帧率 = 0.2
+
+
+def _所需帧数(帧列表, 随机: random.Random) -> int:
+    """从随机位置开始循环播放，按漏帧率丢帧，返回还原时已经播放的帧数"""
+    解码器 = 多帧解码器()
+    起点 = 随机.randrange(len(帧列表))
+    播放数 = 0
+    while True:
+        帧 = 帧列表[(起点 + 播放数) % len(帧列表)]
+        播放数 += 1
+        if 随机.random() >= 漏帧率 and 解码器.接收(帧):
+            return 播放数
+
+
+def 运行基准测试(数量: int = 50) -> None:
+    """对不同片段长度各模拟指定次数的接收过程并输出吞吐量"""
+    随机 = random.Random(2024)
+    载荷 = bytes(随机.getrandbits(8) for _ in range(4096))
+
+    print(f"===== 4096字节载荷，播放 {播放帧率:.0f} 帧/秒，漏帧 {漏帧率:.0%} =====")
+    print("片段长度  片段数  模块数   编码耗时     平均播放帧数  有效吞吐量")
+    for 片段长度 in (50, 100, 150, 250, 400):
+        帧列表 = list(生成帧(载荷, 片段长度))
+        片段数 = int(帧列表[0].split("/")[1].split("-")[1])
+        矩阵列表 = []
+        编码耗时 = 计时(lambda: 矩阵列表.extend(islice(帧矩阵(载荷, 片段长度), 10)), 1) / 10
+        平均帧数 = sum(_所需帧数(帧列表, 随机) for _ in range(数量)) / 数量
+        吞吐量 = len(载荷) / (平均帧数 / 播放帧率)
+        print(f"{片段长度:>6}  {片段数:>6}  {len(矩阵列表[0]):>4}x{len(矩阵列表[0]):<4} "
+              f"{编码耗时:>6.2f} 毫秒/帧  {平均帧数:>10.1f}  {吞吐量:>8.0f} 字节/秒")
+
+
+if __name__ == "__main__":
+    运行基准测试(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
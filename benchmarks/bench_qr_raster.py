@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+二维码渲染性能测试
+对比直接写出1位PNG与qrcode库标准图像、样式化图像的渲染耗时
+（只测把模块矩阵变成PNG字节的部分，不含数据编码和掩码选择），
+以及带标题的二维码在字体缓存命中和每次重新加载字体时的耗时
+"""
+
+import io
+import os
+import sys
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks._common import 计时
+from utils.qr_raster import 编码PNG
+from utils.qrcode_generator import 二维码生成器, 获取标题字体, 渲染标题栏, _标题字体路径
+
+try:
+    import qrcode
+    from qrcode.image.styledpil import StyledPilImage
+    from qrcode.image.styles.moduledrawers import RoundedModuleDrawer
+    from qrcode.image.styles.colormasks import RadialGradiantColorMask
+    QRCODE_AVAILABLE = True
+except ImportError:
+    QRCODE_AVAILABLE = False
+
+
+def _PIL编码(图像) -> bytes:
+    缓冲区 = io.BytesIO()
+    图像.save(缓冲区, format="PNG")
+    return 缓冲区.getvalue()
+
+
+def 运行基准测试(数量: int = 200) -> None:
+    """渲染24词助记词二维码指定次数并输出平均耗时"""
+    if not QRCODE_AVAILABLE:
+        print("未安装qrcode和pillow库，无法运行")
+        return
+
+    qr = qrcode.QRCode(error_correction=qrcode.constants.ERROR_CORRECT_H, box_size=10, border=4)
+    qr.add_data(" ".join(["abandon"] * 23 + ["art"]))
+    qr.make(fit=True)
+
+    直接耗时 = 计时(lambda: 编码PNG(qr.modules, 10, 4), 数量)
+    标准耗时 = 计时(lambda: _PIL编码(qr.make_image(fill_color="black", back_color="white")), 数量)
+    样式化耗时 = 计时(lambda: _PIL编码(qr.make_image(
+        image_factory=StyledPilImage,
+        module_drawer=RoundedModuleDrawer(),
+        color_mask=RadialGradiantColorMask(center_color=(0, 0, 0), edge_color=(50, 50, 50)),
+    )), max(1, 数量 // 20))
+
+    print(f"===== 24词助记词二维码渲染 (版本{qr.version}, {len(qr.modules)}x{len(qr.modules)}模块) =====")
+    print(f"直接写1位PNG:     {直接耗时:.3f} 毫秒/个")
+    print(f"qrcode标准图像:   {标准耗时:.3f} 毫秒/个 ({标准耗时 / 直接耗时:.0f}x)")
+    print(f"qrcode样式化图像: {样式化耗时:.3f} 毫秒/个 ({样式化耗时 / 直接耗时:.0f}x)")
+
+    def 清空字体缓存() -> None:
+        _标题字体路径.cache_clear()
+        获取标题字体.cache_clear()
+        渲染标题栏.cache_clear()
+
+    序号 = iter(range(10 ** 9))
+    带标题 = lambda: 二维码生成器.生成二维码(qr.data_list[0].data.decode(), None, 标题=f"分享 {next(序号)}")
+    缓存耗时 = 计时(带标题, 数量 // 4)
+    无缓存耗时 = 计时(lambda: (清空字体缓存(), 带标题()), 数量 // 4)
+    print(f"\n===== 带标题的二维码（字体: {_标题字体路径() or 'PIL默认字体'}） =====")
+    print(f"字体缓存命中:     {缓存耗时:.3f} 毫秒/个")
+    print(f"每次重新加载字体: {无缓存耗时:.3f} 毫秒/个")
+
+
+if __name__ == "__main__":
+    运行基准测试(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+终端二维码性能测试
+对比纯Python编码器与qrcode库的编码耗时，以及新进程中导入并显示一个地址二维码的总耗时
+"""
+
+import os
+import sys
+import subprocess
+
+# 添加项目根目录到路径
+项目根目录 = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, 项目根目录)
+
+from benchmarks._common import 计时
+from utils.qr_encoder import 编码
+from utils.qr_terminal import 渲染文本
+
+try:
+    import qrcode
+    QRCODE_AVAILABLE = True
+except ImportError:
+    QRCODE_AVAILABLE = False
+
+地址 = "bc1qar0srrr7xfkvy5l643lydnw9re59gtzzwf5mdq"
+
+
+def _qrcode编码(数据: str, 级别: int):
+    qr = qrcode.QRCode(error_correction=级别, border=0)
+    qr.add_data(数据)
+    qr.make(fit=True)
+    return qr.modules
+
+
+def _冷启动耗时(代码: str, 次数: int) -> float:
+    """在新进程中运行代码，返回去掉解释器自身启动时间后的平均耗时（毫秒）"""
+    空进程 = 计时(lambda: subprocess.run([sys.executable, "-c", "pass"], cwd=项目根目录, check=True), 次数)
+    总耗时 = 计时(lambda: subprocess.run([sys.executable, "-c", 代码], cwd=项目根目录, check=True,
+                                    stdout=subprocess.DEVNULL), 次数)
+    return 总耗时 - 空进程
+
+
+def 运行基准测试(数量: int = 100) -> None:
+    """编码并渲染地址和24词助记词二维码指定次数，输出平均耗时"""
+    助记词 = " ".join(["abandon"] * 23 + ["art"])
+    矩阵 = 编码(地址, "L")
+
+    print("===== 编码耗时（含掩码选择） =====")
+    for 名称, 数据, 级别 in (("地址 (L)", 地址, "L"), ("24词助记词 (H)", 助记词, "H")):
+        本地耗时 = 计时(lambda: 编码(数据, 级别), 数量)
+        行 = f"{名称:<16} 纯Python编码器: {本地耗时:.3f} 毫秒/个"
+        if QRCODE_AVAILABLE:
+            级别值 = getattr(qrcode.constants, f"ERROR_CORRECT_{级别}")
+            参考耗时 = 计时(lambda: _qrcode编码(数据, 级别值), max(1, 数量 // 5))
+            行 += f", qrcode库: {参考耗时:.3f} 毫秒/个 ({参考耗时 / 本地耗时:.1f}x)"
+        print(行)
+
+    渲染耗时 = 计时(lambda: 渲染文本(矩阵, 2, ANSI颜色=True), 数量)
+    print(f"\n半块字符渲染 ({len(矩阵)}x{len(矩阵)}模块): {渲染耗时:.3f} 毫秒/个")
+
+    次数 = max(1, 数量 // 20)
+    终端耗时 = _冷启动耗时(
+        f"import io; from utils.qr_terminal import 显示二维码; 显示二维码({地址!r}, 输出=io.StringIO())", 次数)
+    print("\n===== 新进程中导入并显示一个地址二维码 =====")
+    print(f"utils.qr_terminal:  {终端耗时:.1f} 毫秒")
+    if QRCODE_AVAILABLE:
+        参考耗时 = _冷启动耗时(
+            f"import qrcode, io; qr = qrcode.QRCode(); qr.add_data({地址!r}); qr.print_ascii(out=io.StringIO())", 次数)
+        print(f"qrcode.print_ascii: {参考耗时:.1f} 毫秒")
+
+
+if __name__ == "__main__":
+    运行基准测试(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
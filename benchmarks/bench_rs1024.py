@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SLIP-39 RS1024校验性能测试
+对比项目内置校验器的批量校验与shamir-mnemonic逐个解析分享的速度，
+并测量单个错误单词的定位耗时
+"""
+
+import os
+import sys
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks._common import 计时
+from utils.rs1024_checksum import SLIP39_AVAILABLE, RS1024校验器, 单词表
+
+
+def 运行基准测试(数量: int = 10000) -> None:
+    """校验指定数量的分享并输出吞吐量"""
+    if not SLIP39_AVAILABLE:
+        print("未安装shamir-mnemonic库，无法运行")
+        return
+
+    import shamir_mnemonic
+    from shamir_mnemonic import rs1024
+
+    分享列表 = [
+        分享
+        for 组 in shamir_mnemonic.generate_mnemonics(1, [(8, 16)], os.urandom(32))
+        for 分享 in 组
+    ]
+    分享列表 = (分享列表 * (数量 // len(分享列表) + 1))[:数量]
+
+    批量耗时 = 计时(lambda: RS1024校验器.批量验证(分享列表))
+    参考耗时 = 计时(lambda: [
+        rs1024.verify_checksum(shamir_mnemonic.wordlist.mnemonic_to_indices(分享), b"shamir_extendable")
+        for 分享 in 分享列表
+    ])
+
+    print(f"===== RS1024校验 ({数量}个分享) =====")
+    print(f"内置校验器(批量):  {数量 * 1000 / 批量耗时:,.0f} 个/秒")
+    print(f"shamir-mnemonic:   {数量 * 1000 / 参考耗时:,.0f} 个/秒")
+    print(f"加速比: {参考耗时 / 批量耗时:.1f}x")
+
+    单词 = 分享列表[0].split()
+    单词[len(单词) // 2] = 单词表[0] if 单词[len(单词) // 2] != 单词表[0] else 单词表[1]
+    错误分享 = " ".join(单词)
+    次数 = 50
+    定位耗时 = 计时(lambda: RS1024校验器.定位错误(错误分享), 次数)
+    print(f"单个错误定位(全部位置x1024种替换): {定位耗时:.2f} 毫秒/个")
+
+
+if __name__ == "__main__":
+    运行基准测试(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
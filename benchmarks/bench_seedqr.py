@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SeedQR性能测试
+对比24词助记词按单词原文（H级纠错）、标准SeedQR和紧凑SeedQR编码时的
+符号尺寸、编码加写PNG的耗时以及PNG文件大小
+"""
+
+import os
+import sys
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks._common import 计时
+from utils.qr_encoder import 编码
+from utils.qr_raster import 编码PNG
+from utils.seedqr import MNEMONIC_AVAILABLE, SeedQR模块矩阵
+
+
+def 运行基准测试(数量: int = 100) -> None:
+    """对三种编码方式各生成指定次数的PNG并输出结果"""
+    if not MNEMONIC_AVAILABLE:
+        print("未安装mnemonic库，无法运行")
+        return
+
+    助记词 = ("attack pizza motion avocado network gather crop fresh patrol unusual wild holiday "
+           "candy pony ranch winter theme error hybrid van cereal salon goddess expire")
+    方式列表 = (
+        ("单词原文 (H)", lambda: 编码(助记词, "H")),
+        ("标准SeedQR (L)", lambda: SeedQR模块矩阵(助记词)),
+        ("紧凑SeedQR (L)", lambda: SeedQR模块矩阵(助记词, 紧凑=True)),
+    )
+
+    print("===== 24词助记词二维码 =====")
+    for 名称, 生成矩阵 in 方式列表:
+        矩阵 = 生成矩阵()
+        耗时 = 计时(lambda: 编码PNG(生成矩阵(), 10, 4), 数量)
+        print(f"{名称:<16} {len(矩阵)}x{len(矩阵)} 模块, {耗时:.3f} 毫秒/个, "
+              f"PNG {len(编码PNG(矩阵, 10, 4))} 字节")
+
+
+if __name__ == "__main__":
+    运行基准测试(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
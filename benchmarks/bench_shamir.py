@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SLIP-39 Shamir分割/恢复性能测试
+对比项目内置的GF(256)引擎与shamir-mnemonic库的分割和恢复吞吐量
+（只测秘密共享数学部分，不含Feistel加密）
+"""
+
+import os
+import sys
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks._common import 计时
+from utils.shamir_engine import Shamir引擎
+
+try:
+    from shamir_mnemonic import shamir as 参考实现
+    SHAMIR_MNEMONIC_AVAILABLE = True
+except ImportError:
+    SHAMIR_MNEMONIC_AVAILABLE = False
+
+
+def 运行基准测试(数量: int = 2000) -> None:
+    """按几种常见阈值配置分割和恢复指定数量的秘密并输出吞吐量"""
+    for 阈值, 分享数, 秘密长度 in ((2, 3, 16), (3, 5, 32), (5, 16, 64)):
+        秘密列表 = [os.urandom(秘密长度) for _ in range(数量)]
+        分割耗时 = 计时(lambda: [Shamir引擎.分割秘密(阈值, 分享数, 秘密) for 秘密 in 秘密列表])
+        分享列表 = [Shamir引擎.分割秘密(阈值, 分享数, 秘密)[-阈值:] for 秘密 in 秘密列表]
+        恢复耗时 = 计时(lambda: [Shamir引擎.恢复秘密(阈值, 分享) for 分享 in 分享列表])
+
+        print(f"===== {阈值}-of-{分享数}, {秘密长度}字节 ({数量}个秘密) =====")
+        print(f"内置引擎 分割:     {数量 * 1000 / 分割耗时:,.0f} 个/秒")
+        print(f"内置引擎 恢复:     {数量 * 1000 / 恢复耗时:,.0f} 个/秒")
+
+        if SHAMIR_MNEMONIC_AVAILABLE:
+            参考分享列表 = [[参考实现.RawShare(x, 数据) for x, 数据 in 分享] for 分享 in 分享列表]
+            参考分割耗时 = 计时(lambda: [参考实现._split_secret(阈值, 分享数, 秘密) for 秘密 in 秘密列表])
+            参考恢复耗时 = 计时(lambda: [参考实现._recover_secret(阈值, 分享) for 分享 in 参考分享列表])
+            print(f"shamir-mnemonic 分割: {数量 * 1000 / 参考分割耗时:,.0f} 个/秒")
+            print(f"shamir-mnemonic 恢复: {数量 * 1000 / 参考恢复耗时:,.0f} 个/秒")
+            print(f"加速比: 分割 {参考分割耗时 / 分割耗时:.1f}x, 恢复 {参考恢复耗时 / 恢复耗时:.1f}x")
+        else:
+            print("未安装shamir-mnemonic库，跳过对比")
+        print()
+
+
+if __name__ == "__main__":
+    运行基准测试(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -10,702 +10,51 @@
 许可证: MIT
 """
 
-# 预加载基础模块，减少启动延迟
 import os
 import sys
-import time
-import threading
-import hashlib  # 确保hashlib被导入
+import getpass
 from typing import Dict, List, Tuple, Optional, Union, Any
 
-# 全局变量定义
-SLIP39_AVAILABLE = False
-CONFIG_AVAILABLE = False
-配置 = None
-
-# 默认配置
-DEFAULT_ENTROPY_BITS = 256  # 默认使用256位熵（24个词）
-MIN_ENTROPY_BITS = 128      # 最小允许128位熵（12个词）
-PBKDF2_ITERATIONS = 2048    # BIP-39标准迭代次数
-ENTROPY_SOURCES_REQUIRED = 3  # 要求至少3个熵源
-DEFAULT_LANGUAGE = "english"  # 默认使用英文助记词
-
-# 在后台线程中预加载其他模块
-def 预加载模块():
-    global SLIP39_AVAILABLE, CONFIG_AVAILABLE, 配置
-    
-    try:
-        # 预加载常用模块
-        import hashlib  # 确保hashlib被导入
-        import secrets
-        import unicodedata
-        import getpass
-        import ctypes
-        import platform
-        import random
-        import json
-        from pathlib import Path
-        
-        # 预加载加密相关模块
-        from mnemonic import Mnemonic
-        from cryptography.hazmat.primitives.asymmetric import rsa
-        from cryptography.hazmat.primitives import hashes
-        from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-        from cryptography.hazmat.backends import default_backend
-        
-        # 尝试导入SLIP-39库
-        try:
-            import shamir_mnemonic
-            SLIP39_AVAILABLE = True
-        except ImportError:
-            SLIP39_AVAILABLE = False
-        
-        # 尝试导入配置管理器
-        try:
-            from utils.config_manager import 配置管理器
-            CONFIG_AVAILABLE = True
-            配置 = 配置管理器()
-        except ImportError:
-            CONFIG_AVAILABLE = False
-    except Exception:
-        pass
-
-# 启动预加载线程
-预加载线程 = threading.Thread(target=预加载模块)
-预加载线程.daemon = True
-预加载线程.start()
-
-# 等待基本模块加载完成
-time.sleep(0.1)
+# 熵收集、助记词和SLIP-39引擎在utils.wallet_core中，导入时没有任何副作用；
+# 本模块只是交互菜单，这里重新导出引擎以兼容原有的导入方式
+from utils import wallet_core
+from utils.wallet_core import (
+    安全工具, 熵池, 熵源生成器, 钱包生成器, SLIP39管理器,
+    MNEMONIC_AVAILABLE, CRYPTOGRAPHY_AVAILABLE, SLIP39_AVAILABLE,
+    DEFAULT_ENTROPY_BITS, MIN_ENTROPY_BITS, PBKDF2_ITERATIONS, ENTROPY_SOURCES_REQUIRED, DEFAULT_LANGUAGE,
+)
 
 try:
-    from mnemonic import Mnemonic
-    from cryptography.hazmat.primitives.asymmetric import rsa
-    from cryptography.hazmat.primitives import hashes
-    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-    from cryptography.hazmat.backends import default_backend
-    
-    # 尝试导入SLIP-39库，如果安装了的话
-    try:
-        import shamir_mnemonic
-        SLIP39_AVAILABLE = True
-    except ImportError:
-        SLIP39_AVAILABLE = False
-        
-    # 尝试导入配置管理器
-    try:
-        from utils.config_manager import 配置管理器
-        CONFIG_AVAILABLE = True
-    except ImportError:
-        CONFIG_AVAILABLE = False
+    from utils.config_manager import 配置管理器
+    CONFIG_AVAILABLE = True
 except ImportError:
-    print("错误: 缺少必要的依赖库。请运行: pip install cryptography mnemonic")
-    print("如需SLIP-39支持，请运行: pip install shamir-mnemonic")
-    sys.exit(1)
+    CONFIG_AVAILABLE = False
 
-
-# 加载配置
+# 配置在主程序启动时才加载，见加载配置()
 配置 = None
-if CONFIG_AVAILABLE:
+
+
+def 加载配置() -> None:
+    """创建配置管理器，并从配置中读取助记词长度、熵源数量和助记词语言"""
+    global 配置, CONFIG_AVAILABLE, DEFAULT_ENTROPY_BITS, ENTROPY_SOURCES_REQUIRED, DEFAULT_LANGUAGE
+    
+    if not CONFIG_AVAILABLE or 配置 is not None:
+        return
     try:
         配置 = 配置管理器()
-        # 从配置中加载常量
         DEFAULT_ENTROPY_BITS = 配置.获取配置("默认助记词长度", 256)
-        MIN_ENTROPY_BITS = 128
-        PBKDF2_ITERATIONS = 2048
         ENTROPY_SOURCES_REQUIRED = 配置.获取配置("熵源要求数量", 3)
         DEFAULT_LANGUAGE = 配置.获取配置("默认助记词语言", "english")
     except Exception as e:
         print(f"加载配置时出错: {str(e)}")
         print("将使用默认配置")
+        配置 = None
         CONFIG_AVAILABLE = False
 
-# 如果配置不可用，使用默认常量
-if not CONFIG_AVAILABLE:
-    # 安全常量
-    DEFAULT_ENTROPY_BITS = 256  # 默认使用256位熵（24个词）
-    MIN_ENTROPY_BITS = 128      # 最小允许128位熵（12个词）
-    PBKDF2_ITERATIONS = 2048    # BIP-39标准迭代次数
-    ENTROPY_SOURCES_REQUIRED = 3  # 要求至少3个熵源
-    DEFAULT_LANGUAGE = "english"  # 默认使用英文助记词
 
-
-class 安全工具:
-    """安全相关的工具函数"""
-    
-    @staticmethod
-    def 安全清除内存(数据):
-        """
-        安全清除内存中的敏感数据
-        
-        参数:
-            数据: 要清除的数据对象
-        """
-        if 数据 is None:
-            return
-        
-        try:
-            # 根据数据类型选择不同的清除方法
-            if isinstance(数据, str):
-                # 字符串类型，先覆盖为随机字符，再覆盖为零
-                长度 = len(数据)
-                # 使用ctypes直接操作内存
-                ctypes.memset(id(数据) + 20, ord('X'), 长度)
-                ctypes.memset(id(数据) + 20, 0, 长度)
-            elif isinstance(数据, bytes) or isinstance(数据, bytearray):
-                # 字节类型，先覆盖为随机字节，再覆盖为零
-                长度 = len(数据)
-                if 长度 > 0:
-                    # 使用ctypes直接操作内存
-                    ctypes.memset(id(数据) + 33, 0xFF, 长度)
-                    ctypes.memset(id(数据) + 33, 0, 长度)
-            elif isinstance(数据, list):
-                # 列表类型，递归清除每个元素
-                for i in range(len(数据)):
-                    安全工具.安全清除内存(数据[i])
-                    数据[i] = None
-                数据.clear()
-            elif isinstance(数据, dict):
-                # 字典类型，递归清除每个值
-                for key in 数据:
-                    安全工具.安全清除内存(数据[key])
-                    数据[key] = None
-                数据.clear()
-            elif isinstance(数据, int) or isinstance(数据, float):
-                # 数值类型，无法直接清除，但可以尝试覆盖
-                pass  # Python中的数值是不可变的，无法直接清除
-            
-            # 强制垃圾回收
-            安全工具.强制垃圾回收()
-        except Exception as e:
-            # 捕获所有异常，确保不会因为清除失败而中断程序
-            print(f"内存清除异常: {str(e)}")
-            # 即使出错，也尝试进行垃圾回收
-            安全工具.强制垃圾回收()
-    
-    @staticmethod
-    def 强制垃圾回收():
-        """
-        强制执行Python垃圾回收，确保内存被释放
-        """
-        import gc
-        # 禁用垃圾回收器自动运行
-        gc.disable()
-        # 手动运行垃圾回收
-        gc.collect()
-        # 重新启用垃圾回收器
-        gc.enable()
-        return True
-    
-    @staticmethod
-    def 清除终端显示():
-        """
-        清除终端屏幕上的所有内容
-        """
-        # 对于类Unix系统
-        if platform.system() != "Windows":
-            os.system('clear')
-        # 对于Windows系统
-        else:
-            os.system('cls')
-        return True
-    
-    @staticmethod
-    def 安全清除所有痕迹(敏感数据列表=None):
-        """
-        全面清除所有可能的敏感数据痕迹
-        
-        参数:
-            敏感数据列表: 需要清除的敏感数据对象列表
-        """
-        # 清除指定的敏感数据
-        if 敏感数据列表:
-            for 数据 in 敏感数据列表:
-                安全工具.安全清除内存(数据)
-        
-        # 强制垃圾回收
-        安全工具.强制垃圾回收()
-        
-        # 返回成功
-        return True
-    
-    @staticmethod
-    def 规范化字符串(文本: str) -> str:
-        """
-        对字符串进行NFKD Unicode规范化处理
-        
-        参数:
-            文本: 要规范化的字符串
-            
-        返回:
-            规范化后的字符串
-        """
-        return unicodedata.normalize('NFKD', 文本)
-    
-    @staticmethod
-    def 检查系统安全性() -> Dict[str, bool]:
-        """
-        检查系统安全状态
-        
-        返回:
-            包含安全检查结果的字典
-        """
-        import platform
-        
-        结果 = {}
-        
-        # 检查是否为离线环境（简单检查，不完全可靠）
-        try:
-            import socket
-            # 设置较短的超时时间，避免长时间等待
-            socket.setdefaulttimeout(2.0)
-            # 尝试连接多个网站，增加检测可靠性
-            for host in ["www.baidu.com", "www.google.com", "www.cloudflare.com"]:
-                try:
-                    socket.create_connection((host, 80), timeout=1)
-                    结果["离线环境"] = False
-                    break
-                except:
-                    continue
-            else:  # 如果所有连接都失败
-                结果["离线环境"] = True
-        except Exception as e:
-            # 如果发生任何异常，假设为离线环境
-            结果["离线环境"] = True
-            print(f"网络检测异常: {str(e)}")
-        
-        # 检查操作系统类型
-        结果["操作系统"] = platform.system()
-        
-        # 检查是否有安全的随机源
-        try:
-            os.urandom(16)
-            结果["安全随机源"] = True
-        except NotImplementedError:
-            结果["安全随机源"] = False
-        
-        # 检查是否有硬件随机源
-        结果["硬件随机源"] = os.path.exists('/dev/hwrng')
-        
-        return 结果
-
-
-class 熵池:
-    """熵池管理器，负责收集和混合多源熵"""
-    
-    def __init__(self):
-        """初始化熵池"""
-        self.熵源计数 = 0
-        self.熵池 = hashlib.sha512()
-        self.已添加熵源 = set()
-    
-    def 添加熵(self, 熵源名称: str, 熵数据: bytes) -> None:
-        """
-        向熵池添加熵
-        
-        参数:
-            熵源名称: 熵源的名称标识
-            熵数据: 熵数据
-        """
-        if 熵源名称 not in self.已添加熵源:
-            self.熵池.update(熵数据)
-            self.熵源计数 += 1
-            self.已添加熵源.add(熵源名称)
-    
-    def 获取熵池状态(self) -> Dict[str, Any]:
-        """
-        获取熵池当前状态
-        
-        返回:
-            包含熵池状态的字典
-        """
-        return {
-            "熵源数量": self.熵源计数,
-            "已添加熵源": list(self.已添加熵源),
-            "熵池健康度": min(100, self.熵源计数 * 100 // ENTROPY_SOURCES_REQUIRED)
-        }
-    
-    def 熵池是否健康(self) -> bool:
-        """
-        检查熵池是否有足够的熵源
-        
-        返回:
-            如果熵池有足够的熵源，返回True
-        """
-        return self.熵源计数 >= ENTROPY_SOURCES_REQUIRED
-    
-    def 获取熵(self, 字节数: int) -> bytes:
-        """
-        从熵池获取指定字节数的熵
-        
-        参数:
-            字节数: 需要的字节数
-            
-        返回:
-            随机字节
-        
-        异常:
-            ValueError: 如果熵池不健康
-        """
-        if not self.熵池是否健康():
-            raise ValueError(f"熵池不健康，当前熵源数量: {self.熵源计数}，需要至少: {ENTROPY_SOURCES_REQUIRED}")
-        
-        # 获取当前熵池的哈希
-        当前哈希 = self.熵池.digest()
-        
-        # 创建一个新的哈希对象用于扩展熵
-        扩展哈希 = hashlib.sha512()
-        扩展哈希.update(当前哈希)
-        
-        # 如果需要的字节数超过了哈希长度，则需要扩展
-        结果 = bytearray()
-        剩余字节 = 字节数
-        计数器 = 0
-        
-        while 剩余字节 > 0:
-            # 添加计数器以生成不同的哈希
-            计数器哈希 = hashlib.sha512()
-            计数器哈希.update(当前哈希)
-            计数器哈希.update(计数器.to_bytes(4, byteorder='big'))
-            
-            哈希结果 = 计数器哈希.digest()
-            取用字节数 = min(len(哈希结果), 剩余字节)
-            结果.extend(哈希结果[:取用字节数])
-            
-            剩余字节 -= 取用字节数
-            计数器 += 1
-        
-        return bytes(结果)
-
-
-class 熵源生成器:
-    """负责从多种来源收集熵"""
-    
-    def __init__(self):
-        """初始化熵源生成器"""
-        self.熵池 = 熵池()
-    
-    def 收集系统熵(self) -> None:
-        """从操作系统的CSPRNG收集熵"""
-        try:
-            系统熵 = os.urandom(64)
-            self.熵池.添加熵("系统CSPRNG", 系统熵)
-            print("✓ 系统熵收集成功")
-        except NotImplementedError:
-            print("✗ 警告: 当前系统不支持os.urandom，无法获取系统随机熵")
-        except Exception as e:
-            print(f"✗ 系统熵收集失败: {str(e)}")
-    
-    def 收集Python安全熵(self) -> None:
-        """从Python的secrets模块收集熵"""
-        try:
-            安全熵 = secrets.token_bytes(64)
-            self.熵池.添加熵("Python_secrets", 安全熵)
-            print("✓ Python安全熵收集成功")
-        except Exception as e:
-            print(f"✗ 警告: 无法从Python的secrets模块获取熵: {str(e)}")
-    
-    def 收集时间熵(self) -> None:
-        """从高精度时间收集熵（弱熵源，仅作为补充）"""
-        try:
-            时间哈希 = hashlib.sha256()
-            
-            # 收集多个时间点以增加熵
-            for _ in range(10):
-                时间哈希.update(str(time.time_ns()).encode())
-                time.sleep(0.01)  # 微小延迟以获取不同时间
-            
-            self.熵池.添加熵("时间熵", 时间哈希.digest())
-            print("✓ 时间熵收集成功")
-        except Exception as e:
-            print(f"✗ 时间熵收集失败: {str(e)}")
-    
-    def 收集硬件熵(self) -> None:
-        """尝试从硬件随机源收集熵"""
-        try:
-            # 尝试读取/dev/hwrng (硬件随机数生成器)
-            if os.path.exists('/dev/hwrng'):
-                with open('/dev/hwrng', 'rb') as f:
-                    硬件熵 = f.read(64)
-                    self.熵池.添加熵("硬件RNG", 硬件熵)
-                    print("✓ 硬件随机源熵收集成功")
-                    return
-            # 尝试读取/dev/random (高质量熵池)
-            elif os.path.exists('/dev/random'):
-                with open('/dev/random', 'rb') as f:
-                    随机设备熵 = f.read(64)
-                    self.熵池.添加熵("dev_random", 随机设备熵)
-                    print("✓ /dev/random熵收集成功")
-                    return
-            print("✗ 未找到硬件随机源，跳过此熵源")
-        except Exception as e:
-            print(f"✗ 硬件熵收集失败: {str(e)}")
-    
-    def 收集计算熵(self) -> None:
-        """通过计算密集型操作生成熵"""
-        try:
-            # 生成RSA密钥对是计算密集型的，可以作为熵源
-            私钥 = rsa.generate_private_key(
-                public_exponent=65537,
-                key_size=2048
-            )
-            # 使用私钥的内存地址和对象ID作为熵
-            计算熵 = hashlib.sha256()
-            计算熵.update(str(id(私钥)).encode())
-            计算熵.update(str(私钥.private_numbers().d).encode())
-            
-            self.熵池.添加熵("计算熵", 计算熵.digest())
-            print("✓ 计算熵收集成功")
-        except Exception as e:
-            print(f"✗ 计算熵收集失败: {str(e)}")
-    
-    def 收集用户熵(self, 用户输入: str = None) -> None:
-        """
-        从用户输入收集熵
-        
-        参数:
-            用户输入: 用户提供的熵字符串，如果为None则提示用户输入
-        """
-        try:
-            if 用户输入 is None:
-                print("\n为增强随机性，请输入一些随机字符（按回车结束）:")
-                用户输入 = getpass.getpass("（输入内容不会显示）: ")
-            
-            if 用户输入:
-                用户熵 = hashlib.sha256(用户输入.encode()).digest()
-                self.熵池.添加熵("用户输入", 用户熵)
-                print("✓ 用户熵收集成功")
-            else:
-                print("✗ 未提供用户输入，跳过此熵源")
-        except Exception as e:
-            print(f"✗ 用户熵收集失败: {str(e)}")
-    
-    def 收集所有可用熵(self, 包含用户熵: bool = True) -> None:
-        """
-        收集所有可用的熵源
-        
-        参数:
-            包含用户熵: 是否包含用户输入的熵
-        """
-        # 显示初始熵池状态
-        熵池状态 = self.获取熵池状态()
-        print(f"初始熵池状态: {熵池状态['熵池健康度']}% ({熵池状态['熵源数量']}/{ENTROPY_SOURCES_REQUIRED}个熵源)")
-        if 熵池状态['熵源数量'] > 0:
-            print(f"已添加熵源: {', '.join(熵池状态['已添加熵源'])}")
-        else:
-            print("已添加熵源: 无")
-        
-        # 收集系统熵
-        print("\n正在收集系统熵...")
-        self.收集系统熵()
-        
-        # 收集Python安全熵
-        print("正在收集Python安全熵...")
-        self.收集Python安全熵()
-        
-        # 收集时间熵
-        print("正在收集时间熵...")
-        self.收集时间熵()
-        
-        # 收集硬件熵
-        print("正在尝试收集硬件熵...")
-        self.收集硬件熵()
-        
-        # 收集计算熵
-        print("正在生成计算熵...")
-        self.收集计算熵()
-        
-        # 收集用户熵
-        if 包含用户熵:
-            self.收集用户熵()
-        
-        # 再次显示熵池状态
-        熵池状态 = self.获取熵池状态()
-        print(f"\n当前熵池状态: {熵池状态['熵池健康度']}% ({熵池状态['熵源数量']}/{ENTROPY_SOURCES_REQUIRED}个熵源)")
-        print(f"已添加熵源: {', '.join(熵池状态['已添加熵源'])}")
-    
-    def 获取熵(self, 字节数: int) -> bytes:
-        """
-        获取指定字节数的熵
-        
-        参数:
-            字节数: 需要的字节数
-            
-        返回:
-            随机字节
-        """
-        # 确保熵池健康
-        if not self.熵池.熵池是否健康():
-            print("\n警告: 熵池不够健康，正在收集更多熵...")
-            self.收集所有可用熵(包含用户熵=True)
-            
-            # 再次检查熵池健康状态
-            if not self.熵池.熵池是否健康():
-                print("\n严重警告: 熵池仍然不够健康，但将继续生成。")
-                print("生成的助记词可能不具备足够的随机性和安全性。")
-                print("建议取消操作，检查系统随机源后重试。")
-                
-                # 询问用户是否继续
-                继续操作 = input("\n是否仍要继续生成? (y/n): ").lower()
-                if 继续操作 not in ['y', 'yes', '是']:
-                    raise ValueError("用户取消了操作")
-        
-        return self.熵池.获取熵(字节数)
-    
-    def 获取熵池状态(self) -> Dict[str, Any]:
-        """
-        获取熵池状态
-        
-        返回:
-            熵池状态字典
-        """
-        return self.熵池.获取熵池状态()
-
-
-class 钱包生成器:
-    """钱包助记词生成器，遵循BIP-39标准"""
-    
-    def __init__(self):
-        """
-        初始化钱包生成器，只使用英文助记词
-        """
-        self.语言 = DEFAULT_LANGUAGE
-        self.助记词工具 = Mnemonic(self.语言)
-        self.熵源生成器 = 熵源生成器()
-    
-    def 生成助记词(self, 强度: int = DEFAULT_ENTROPY_BITS) -> str:
-        """
-        生成BIP-39标准助记词
-        
-        参数:
-            强度: 熵的位数，必须是32的倍数，范围是128-256
-                 128位生成12个词，256位生成24个词
-        
-        返回:
-            助记词字符串
-        """
-        if 强度 % 32 != 0 or 强度 < MIN_ENTROPY_BITS or 强度 > 256:
-            raise ValueError(f"熵的位数必须是32的倍数，范围是{MIN_ENTROPY_BITS}-256")
-        
-        print("\n开始收集熵源...")
-        
-        # 确保hashlib已导入
-        import hashlib
-        
-        # 收集所有可用熵
-        self.熵源生成器.收集所有可用熵()
-        
-        # 显示最终熵池状态
-        熵池状态 = self.熵源生成器.获取熵池状态()
-        print(f"\n最终熵池状态: {熵池状态['熵池健康度']}% ({熵池状态['熵源数量']}/{ENTROPY_SOURCES_REQUIRED}个熵源)")
-        print(f"已添加熵源: {', '.join(熵池状态['已添加熵源'])}")
-        
-        # 计算需要的字节数
-        字节数 = 强度 // 8
-        
-        print("\n正在生成助记词...")
-        
-        # 获取熵
-        熵 = self.熵源生成器.获取熵(字节数)
-        
-        # 生成助记词
-        助记词 = self.助记词工具.to_mnemonic(熵)
-        
-        return 助记词
-    
-    def 验证助记词(self, 助记词: str) -> bool:
-        """
-        验证助记词是否有效
-        
-        参数:
-            助记词: 助记词字符串
-            
-        返回:
-            是否有效
-        """
-        # 对助记词进行NFKD规范化
-        规范化助记词 = 安全工具.规范化字符串(助记词)
-        return self.助记词工具.check(规范化助记词)
-    
-    def 助记词转种子(self, 助记词: str, 密码: str = "") -> bytes:
-        """
-        将助记词转换为种子
-        
-        参数:
-            助记词: 助记词字符串
-            密码: 可选密码短语
-            
-        返回:
-            种子字节
-        """
-        # 对助记词和密码进行NFKD规范化
-        规范化助记词 = 安全工具.规范化字符串(助记词)
-        规范化密码 = 安全工具.规范化字符串(密码)
-        
-        # 使用BIP-39标准的PBKDF2函数
-        种子 = self.助记词工具.to_seed(规范化助记词, 规范化密码)
-        
-        return 种子
-
-
-class SLIP39管理器:
-    """SLIP-39 Shamir备份管理器"""
-    
-    def __init__(self):
-        """初始化SLIP-39管理器"""
-        if not SLIP39_AVAILABLE:
-            raise ImportError("SLIP-39功能需要安装shamir-mnemonic库")
-    
-    def 生成分享(self, 主秘密: bytes, 组数: int, 阈值: int, 
-              每组成员数: List[int], 每组阈值: List[int], 
-              密码: str = "") -> List[List[str]]:
-        """
-        将主秘密分割为多个分享
-        
-        参数:
-            主秘密: 要分割的主秘密
-            组数: 分组数量
-            阈值: 恢复所需的组数量
-            每组成员数: 每个组的成员数量列表
-            每组阈值: 每个组的阈值列表
-            密码: 可选密码短语
-            
-        返回:
-            分享列表的列表，每个内部列表代表一个组的所有分享
-        """
-        # 对密码进行NFKD规范化
-        规范化密码 = 安全工具.规范化字符串(密码)
-        
-        # 生成分享
-        所有分享 = shamir_mnemonic.generate_mnemonics(
-            group_threshold=阈值,
-            groups=[(每组阈值[i], 每组成员数[i]) for i in range(组数)],
-            master_secret=主秘密,
-            passphrase=规范化密码.encode()
-        )
-        
-        return 所有分享
-    
-    def 恢复秘密(self, 分享列表: List[str], 密码: str = "") -> bytes:
-        """
-        从分享中恢复主秘密
-        
-        参数:
-            分享列表: SLIP-39分享列表
-            密码: 可选密码短语
-            
-        返回:
-            恢复的主秘密
-        """
-        # 对密码进行NFKD规范化
-        规范化密码 = 安全工具.规范化字符串(密码)
-        
-        # 恢复主秘密
-        主秘密 = shamir_mnemonic.combine_mnemonics(分享列表, 规范化密码.encode())
-        
-        return 主秘密
+def 创建钱包生成器() -> 钱包生成器:
+    """按配置的助记词语言和熵源数量创建钱包生成器"""
+    return 钱包生成器(DEFAULT_LANGUAGE, ENTROPY_SOURCES_REQUIRED)
 
 
 def 显示安全提示(提示类型: str) -> None:
@@ -805,6 +154,44 @@ def 选择助记词长度() -> int:
             print("无效选择，请重新输入")
 
 
+def 加载泄露密码索引(检查器: Any) -> None:
+    """
+    按配置项"高级选项.泄露密码索引路径"为密码强度检查器加载离线泄露密码索引，只加载一次
+
+    参数:
+        检查器: 密码强度检查器类
+    """
+    路径 = 配置.获取配置("高级选项.泄露密码索引路径", "") if 配置 else ""
+    if not 路径 or 检查器.泄露密码索引 is not None:
+        return
+    try:
+        检查器.设置泄露密码索引(os.path.expanduser(路径))
+    except (OSError, ValueError) as e:
+        print(f"警告: 无法加载泄露密码索引 {路径}: {e}")
+
+
+def 加载破解速度校准(检查器: Any) -> None:
+    """
+    从配置目录读取BIP-39种子派生速度的校准缓存，没有缓存时测量一次并写入缓存，
+    然后按配置项"高级选项.攻击者档案"设置到密码强度检查器上，只加载一次
+
+    参数:
+        检查器: 密码强度检查器类
+    """
+    if 检查器.每秒种子数 is not None:
+        return
+    from utils.crack_time import 校准文件名, 读取校准, 校准
+    路径 = os.path.join(os.path.dirname(配置.配置文件路径), 校准文件名) if 配置 else None
+    try:
+        结果 = 读取校准(路径)
+        if 结果 is None:
+            print("正在测量本机的种子派生速度（只需一次）...")
+            结果 = 校准(路径, 重新测量=True)
+        检查器.设置破解速度(结果["每秒种子数"], (配置.获取配置("高级选项.攻击者档案") if 配置 else None) or None)
+    except (OSError, ValueError) as e:
+        print(f"警告: 无法校准破解耗时: {e}")
+
+
 def 是否使用密码短语() -> Tuple[bool, str]:
     """
     询问是否使用密码短语
@@ -828,6 +215,8 @@ def 是否使用密码短语() -> Tuple[bool, str]:
             # 检查密码强度
             try:
                 from utils.password_checker import 密码强度检查器
+                加载泄露密码索引(密码强度检查器)
+                加载破解速度校准(密码强度检查器)
                 强度结果 = 密码强度检查器.检查密码强度(密码短语)
                 print(密码强度检查器.格式化输出密码强度(强度结果))
                 
@@ -856,6 +245,22 @@ def 是否使用密码短语() -> Tuple[bool, str]:
             print("无效选择，请输入 y、n 或 0 返回上一步")
 
 
+def 显示地址二维码(地址信息列表: List[Dict]) -> None:
+    """
+    在终端中以二维码显示钱包地址（Unicode半块字符，不需要qrcode和PIL）
+
+    参数:
+        地址信息列表: 钱包地址生成器返回的地址信息字典列表
+    """
+    from utils.qr_terminal import 显示二维码
+
+    for 地址信息 in 地址信息列表:
+        if "错误" in 地址信息:
+            continue
+        print(f"\n===== {地址信息['币种']}地址: {地址信息['地址']} =====")
+        显示二维码(地址信息["地址"])
+
+
 def 生成新钱包() -> None:
     """生成新的钱包助记词"""
     try:
@@ -874,7 +279,7 @@ def 生成新钱包() -> None:
         print("\n正在初始化熵源生成器...")
         
         # 创建钱包生成器
-        生成器 = 钱包生成器()
+        生成器 = 创建钱包生成器()
         
         # 生成助记词
         助记词 = 生成器.生成助记词(强度)
@@ -984,7 +389,7 @@ def 验证助记词() -> None:
     使用密码短语, 密码短语 = 是否使用密码短语()
     
     try:
-        生成器 = 钱包生成器()
+        生成器 = 创建钱包生成器()
         是否有效 = 生成器.验证助记词(助记词)
         
         if 是否有效:
@@ -1017,6 +422,10 @@ def 验证助记词() -> None:
                             以太坊地址信息 = 钱包地址生成器.从助记词生成地址(助记词, 密码短语, "ETH")
                             print(钱包地址生成器.格式化地址信息(以太坊地址信息))
                             
+                            print("\n是否在终端以二维码显示以上地址? (y/n):")
+                            if input("> ").lower() in ['y', 'yes', '是']:
+                                显示地址二维码([比特币地址信息, 以太坊地址信息])
+                            
                             # 询问是否生成更多币种的地址
                             print("\n是否生成更多币种的钱包地址? (y/n):")
                             更多地址选择 = input("> ").lower()
@@ -1059,9 +468,7 @@ def 验证助记词() -> None:
 
 def 生成SLIP39分割() -> None:
     """生成SLIP-39分割备份"""
-    global SLIP39_AVAILABLE
-    
-    if not SLIP39_AVAILABLE:
+    if not wallet_core.SLIP39_AVAILABLE:
         print("\n错误: SLIP-39功能需要安装shamir-mnemonic库")
         print("正在尝试自动安装shamir-mnemonic库...")
         
@@ -1072,36 +479,36 @@ def 生成SLIP39分割() -> None:
             
             # 尝试使用pip安装
             print("尝试方法1: 使用pip安装...")
-            result = subprocess.run([sys.executable, "-m", "pip", "install", "--upgrade", "shamir-mnemonic==0.2.2"], 
+            result = subprocess.run([sys.executable, "-m", "pip", "install", "--upgrade", "shamir-mnemonic>=0.3.0"], 
                                    capture_output=True, text=True)
             
             if result.returncode == 0:
                 print("安装成功！正在导入shamir-mnemonic库...")
                 try:
                     import shamir_mnemonic
-                    SLIP39_AVAILABLE = True
+                    wallet_core.SLIP39_AVAILABLE = True
                     print("shamir-mnemonic库导入成功！")
                 except ImportError:
                     print("导入失败，尝试方法2...")
                     
                     # 尝试使用pip3安装
                     print("尝试方法2: 使用pip3安装...")
-                    result = subprocess.run(["pip3", "install", "--upgrade", "shamir-mnemonic==0.2.2"], 
+                    result = subprocess.run(["pip3", "install", "--upgrade", "shamir-mnemonic>=0.3.0"], 
                                           capture_output=True, text=True)
                     
                     if result.returncode == 0:
                         print("安装成功！正在导入shamir-mnemonic库...")
                         try:
                             import shamir_mnemonic
-                            SLIP39_AVAILABLE = True
+                            wallet_core.SLIP39_AVAILABLE = True
                             print("shamir-mnemonic库导入成功！")
                         except ImportError:
-                            print("导入失败，请手动安装：pip install --upgrade shamir-mnemonic==0.2.2")
+                            print("导入失败，请手动安装：pip install --upgrade \"shamir-mnemonic>=0.3.0\"")
                             input("\n按回车键继续...")
                             return
                     else:
                         print(f"安装失败: {result.stderr}")
-                        print("请手动运行: pip install --upgrade shamir-mnemonic==0.2.2")
+                        print("请手动运行: pip install --upgrade \"shamir-mnemonic>=0.3.0\"")
                         input("\n按回车键继续...")
                         return
             else:
@@ -1109,27 +516,27 @@ def 生成SLIP39分割() -> None:
                 print("尝试方法2: 使用pip3安装...")
                 
                 # 尝试使用pip3安装
-                result = subprocess.run(["pip3", "install", "--upgrade", "shamir-mnemonic==0.2.2"], 
+                result = subprocess.run(["pip3", "install", "--upgrade", "shamir-mnemonic>=0.3.0"], 
                                       capture_output=True, text=True)
                 
                 if result.returncode == 0:
                     print("安装成功！正在导入shamir-mnemonic库...")
                     try:
                         import shamir_mnemonic
-                        SLIP39_AVAILABLE = True
+                        wallet_core.SLIP39_AVAILABLE = True
                         print("shamir-mnemonic库导入成功！")
                     except ImportError:
-                        print("导入失败，请手动安装：pip install --upgrade shamir-mnemonic==0.2.2")
+                        print("导入失败，请手动安装：pip install --upgrade \"shamir-mnemonic>=0.3.0\"")
                         input("\n按回车键继续...")
                         return
                 else:
                     print(f"安装失败: {result.stderr}")
-                    print("请手动运行: pip install --upgrade shamir-mnemonic==0.2.2")
+                    print("请手动运行: pip install --upgrade \"shamir-mnemonic>=0.3.0\"")
                     input("\n按回车键继续...")
                     return
         except Exception as e:
             print(f"安装过程中出错: {str(e)}")
-            print("请手动运行: pip install --upgrade shamir-mnemonic==0.2.2")
+            print("请手动运行: pip install --upgrade \"shamir-mnemonic>=0.3.0\"")
             input("\n按回车键继续...")
             return
     
@@ -1144,6 +551,13 @@ def 生成SLIP39分割() -> None:
         except AttributeError:
             print("无法获取shamir-mnemonic库版本")
         
+        # 内置的Shamir引擎需要0.3.0或更高版本
+        from utils.shamir_engine import SLIP39_AVAILABLE as 版本可用, 安装提示
+        if not 版本可用:
+            print(f"\n错误: {安装提示}")
+            input("\n按回车键继续...")
+            return
+        
         # 测试生成功能
         try:
             test_result = shamir_mnemonic.generate_mnemonics(
@@ -1156,13 +570,13 @@ def 生成SLIP39分割() -> None:
         except Exception as e:
             print(f"\n错误: shamir-mnemonic库无法正常工作: {str(e)}")
             print("请确保安装了正确版本的shamir-mnemonic库")
-            print("建议运行: pip install --upgrade shamir-mnemonic==0.2.2")
+            print("建议运行: pip install --upgrade \"shamir-mnemonic>=0.3.0\"")
             input("\n按回车键继续...")
             return
     except Exception as e:
         print(f"\n错误: shamir-mnemonic库无法正常工作: {str(e)}")
         print("请确保安装了正确版本的shamir-mnemonic库")
-        print("建议运行: pip install --upgrade shamir-mnemonic==0.2.2")
+        print("建议运行: pip install --upgrade \"shamir-mnemonic>=0.3.0\"")
         input("\n按回车键继续...")
         return
     
@@ -1179,7 +593,7 @@ def 生成SLIP39分割() -> None:
     选择 = input("\n请输入选项 (1-2): ")
     
     try:
-        生成器 = 钱包生成器()
+        生成器 = 创建钱包生成器()
         slip39管理器 = SLIP39管理器()
         
         if 选择 == "1":
@@ -1276,7 +690,27 @@ def 生成SLIP39分割() -> None:
             if slip39密码 != 确认密码:
                 print("\n两次输入的密码短语不匹配，将不使用密码短语")
                 slip39密码 = ""
-        
+
+        # 询问迭代指数，按本机速度给出推荐值
+        from utils.slip39_cost import 默认迭代指数, 默认目标秒数, 推荐迭代指数, 成本说明, 测量PBKDF2速度
+        每秒迭代次数 = 测量PBKDF2速度()
+        推荐值 = 推荐迭代指数(默认目标秒数, 每秒迭代次数)
+        print("\n迭代指数决定恢复耗时和密码短语抗暴力破解的强度，每加1翻倍")
+        print(f"默认: {成本说明(默认迭代指数, 每秒迭代次数)}")
+        print(f"推荐: {成本说明(推荐值, 每秒迭代次数)}")
+        迭代指数 = 默认迭代指数
+        while True:
+            输入 = input(f"请输入迭代指数 (0-15，直接回车使用默认值{默认迭代指数}): ").strip()
+            if not 输入:
+                break
+            try:
+                迭代指数 = int(输入)
+                if 0 <= 迭代指数 <= 15:
+                    break
+                print("迭代指数必须在0到15之间")
+            except ValueError:
+                print("请输入有效的数字")
+
         try:
             # 生成SLIP-39分享
             分享列表 = slip39管理器.生成分享(
@@ -1285,7 +719,8 @@ def 生成SLIP39分割() -> None:
                 阈值=恢复组数,
                 每组成员数=每组成员数,
                 每组阈值=每组阈值,
-                密码=slip39密码
+                密码=slip39密码,
+                迭代指数=迭代指数
             )
             
             # 显示分享
@@ -1302,6 +737,7 @@ def 生成SLIP39分割() -> None:
             print(f"- 需要至少 {恢复组数} 个组的有效分享才能恢复")
             for i in range(组数):
                 print(f"- 组 {i+1} 需要至少 {每组阈值[i]} 个成员的分享")
+            print(f"- {成本说明(迭代指数, 每秒迭代次数)}")
         except Exception as e:
             print(f"\n错误: {str(e)}")
             input("\n按回车键继续...")
@@ -1324,9 +760,7 @@ def 生成SLIP39分割() -> None:
 
 def 恢复SLIP39分割() -> None:
     """恢复SLIP-39分割备份"""
-    global SLIP39_AVAILABLE
-    
-    if not SLIP39_AVAILABLE:
+    if not wallet_core.SLIP39_AVAILABLE:
         print("\n错误: SLIP-39功能需要安装shamir-mnemonic库")
         print("正在尝试自动安装shamir-mnemonic库...")
         
@@ -1337,36 +771,36 @@ def 恢复SLIP39分割() -> None:
             
             # 尝试使用pip安装
             print("尝试方法1: 使用pip安装...")
-            result = subprocess.run([sys.executable, "-m", "pip", "install", "--upgrade", "shamir-mnemonic==0.2.2"], 
+            result = subprocess.run([sys.executable, "-m", "pip", "install", "--upgrade", "shamir-mnemonic>=0.3.0"], 
                                    capture_output=True, text=True)
             
             if result.returncode == 0:
                 print("安装成功！正在导入shamir-mnemonic库...")
                 try:
                     import shamir_mnemonic
-                    SLIP39_AVAILABLE = True
+                    wallet_core.SLIP39_AVAILABLE = True
                     print("shamir-mnemonic库导入成功！")
                 except ImportError:
                     print("导入失败，尝试方法2...")
                     
                     # 尝试使用pip3安装
                     print("尝试方法2: 使用pip3安装...")
-                    result = subprocess.run(["pip3", "install", "--upgrade", "shamir-mnemonic==0.2.2"], 
+                    result = subprocess.run(["pip3", "install", "--upgrade", "shamir-mnemonic>=0.3.0"], 
                                           capture_output=True, text=True)
                     
                     if result.returncode == 0:
                         print("安装成功！正在导入shamir-mnemonic库...")
                         try:
                             import shamir_mnemonic
-                            SLIP39_AVAILABLE = True
+                            wallet_core.SLIP39_AVAILABLE = True
                             print("shamir-mnemonic库导入成功！")
                         except ImportError:
-                            print("导入失败，请手动安装：pip install --upgrade shamir-mnemonic==0.2.2")
+                            print("导入失败，请手动安装：pip install --upgrade \"shamir-mnemonic>=0.3.0\"")
                             input("\n按回车键继续...")
                             return
                     else:
                         print(f"安装失败: {result.stderr}")
-                        print("请手动运行: pip install --upgrade shamir-mnemonic==0.2.2")
+                        print("请手动运行: pip install --upgrade \"shamir-mnemonic>=0.3.0\"")
                         input("\n按回车键继续...")
                         return
             else:
@@ -1374,27 +808,27 @@ def 恢复SLIP39分割() -> None:
                 print("尝试方法2: 使用pip3安装...")
                 
                 # 尝试使用pip3安装
-                result = subprocess.run(["pip3", "install", "--upgrade", "shamir-mnemonic==0.2.2"], 
+                result = subprocess.run(["pip3", "install", "--upgrade", "shamir-mnemonic>=0.3.0"], 
                                       capture_output=True, text=True)
                 
                 if result.returncode == 0:
                     print("安装成功！正在导入shamir-mnemonic库...")
                     try:
                         import shamir_mnemonic
-                        SLIP39_AVAILABLE = True
+                        wallet_core.SLIP39_AVAILABLE = True
                         print("shamir-mnemonic库导入成功！")
                     except ImportError:
-                        print("导入失败，请手动安装：pip install --upgrade shamir-mnemonic==0.2.2")
+                        print("导入失败，请手动安装：pip install --upgrade \"shamir-mnemonic>=0.3.0\"")
                         input("\n按回车键继续...")
                         return
                 else:
                     print(f"安装失败: {result.stderr}")
-                    print("请手动运行: pip install --upgrade shamir-mnemonic==0.2.2")
+                    print("请手动运行: pip install --upgrade \"shamir-mnemonic>=0.3.0\"")
                     input("\n按回车键继续...")
                     return
         except Exception as e:
             print(f"安装过程中出错: {str(e)}")
-            print("请手动运行: pip install --upgrade shamir-mnemonic==0.2.2")
+            print("请手动运行: pip install --upgrade \"shamir-mnemonic>=0.3.0\"")
             input("\n按回车键继续...")
             return
     
@@ -1409,6 +843,13 @@ def 恢复SLIP39分割() -> None:
         except AttributeError:
             print("无法获取shamir-mnemonic库版本")
         
+        # 内置的Shamir引擎需要0.3.0或更高版本
+        from utils.shamir_engine import SLIP39_AVAILABLE as 版本可用, 安装提示
+        if not 版本可用:
+            print(f"\n错误: {安装提示}")
+            input("\n按回车键继续...")
+            return
+        
         # 测试生成功能
         try:
             test_result = shamir_mnemonic.generate_mnemonics(
@@ -1421,13 +862,13 @@ def 恢复SLIP39分割() -> None:
         except Exception as e:
             print(f"\n错误: shamir-mnemonic库无法正常工作: {str(e)}")
             print("请确保安装了正确版本的shamir-mnemonic库")
-            print("建议运行: pip install --upgrade shamir-mnemonic==0.2.2")
+            print("建议运行: pip install --upgrade \"shamir-mnemonic>=0.3.0\"")
             input("\n按回车键继续...")
             return
     except Exception as e:
         print(f"\n错误: shamir-mnemonic库无法正常工作: {str(e)}")
         print("请确保安装了正确版本的shamir-mnemonic库")
-        print("建议运行: pip install --upgrade shamir-mnemonic==0.2.2")
+        print("建议运行: pip install --upgrade \"shamir-mnemonic>=0.3.0\"")
         input("\n按回车键继续...")
         return
     
@@ -1447,23 +888,36 @@ def 恢复SLIP39分割() -> None:
             print("\n请输入SLIP-39密码短语 (将不会显示在屏幕上):")
             slip39密码 = getpass.getpass()
         
-        # 收集分享
-        分享列表 = []
-        print("\n请输入SLIP-39分享 (每行一个，输入空行结束):")
-        
-        while True:
+        # 逐个收集分享，每个分享输入后立即校验，达到阈值时自动结束
+        组合器 = slip39管理器.创建组合器()
+        print("\n请输入SLIP-39分享 (每行一个，输入空行取消):")
+
+        while not 组合器.已完成:
             分享 = input()
             if not 分享:
                 break
-            分享列表.append(分享)
-        
-        if len(分享列表) < 1:
-            print("\n错误: 至少需要输入一个分享")
+            try:
+                状态 = 组合器.添加分享(分享)
+            except ValueError as e:
+                print(f"✗ {e}，请重新输入")
+                continue
+
+            if 状态["重复"]:
+                print("ℹ️ 该分享已输入过")
+                continue
+            进度 = 组合器.进度()
+            组进度 = 进度["组"][状态["组索引"]]
+            print(f"✓ 组 {状态['组索引'] + 1}: {组进度['已有']}/{组进度['需要']} 个成员"
+                  f"{' (已完成)' if 组进度['已完成'] else ''}，"
+                  f"已完成 {进度['已完成组数']}/{进度['组阈值']} 个组")
+
+        if not 组合器.已完成:
+            print("\n错误: 分享数量不足，无法恢复主秘密")
             input("\n按回车键继续...")
             return
-        
+
         # 恢复主秘密
-        主秘密 = slip39管理器.恢复秘密(分享列表, slip39密码)
+        主秘密 = 组合器.主秘密(slip39密码)
         
         # 显示恢复的种子
         print("\n成功恢复主秘密!")
@@ -1515,6 +969,13 @@ def 主程序() -> None:
     # 显示启动信息
     print("\n正在启动加密货币钱包助记词生成工具...")
     
+    if not (MNEMONIC_AVAILABLE and CRYPTOGRAPHY_AVAILABLE):
+        print("错误: 缺少必要的依赖库。请运行: pip install cryptography mnemonic")
+        print("如需SLIP-39支持，请运行: pip install shamir-mnemonic")
+        sys.exit(1)
+    
+    加载配置()
+    
     # 检查备份提醒
     if CONFIG_AVAILABLE and 配置:
         if 配置.检查备份提醒():
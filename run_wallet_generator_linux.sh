@@ -170,14 +170,14 @@ show_menu() {
                 2)
                     pip3 install -r requirements_secure.txt
                     # 确保安装正确版本的shamir-mnemonic
-                    pip3 install --upgrade shamir-mnemonic==0.2.2
+                    pip3 install --upgrade "shamir-mnemonic>=0.3.0"
                     echo -e "${GREEN}高安全标准版本依赖安装完成！${NC}"
                     ;;
                 3)
                     pip3 install -r requirements.txt
                     pip3 install -r requirements_secure.txt
                     # 确保安装正确版本的shamir-mnemonic
-                    pip3 install --upgrade shamir-mnemonic==0.2.2
+                    pip3 install --upgrade "shamir-mnemonic>=0.3.0"
                     echo -e "${GREEN}所有依赖安装完成！${NC}"
                     ;;
                 4)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Base58/Base58Check编码测试
+"""
+
+import unittest
+import sys
+import os
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.base58_encoder import Base58编码器
+
+
+class Base58编码测试(unittest.TestCase):
+    """Base58编码器的测试"""
+    
+    def setUp(self):
+        """测试前的准备工作"""
+        # 格式: (十六进制数据, Base58编码)
+        self.测试向量 = [
+            ("", ""),
+            ("61", "2g"),
+            ("626262", "a3gV"),
+            ("636363", "aPEr"),
+            ("73696d706c792061206c6f6e6720737472696e67", "2cFupjhnEsSn59qHXstmK2ffpLv2"),
+            ("00eb15231dfceb60925886b67d065299925915aeb172c06647", "1NS17iag9jJgTHD1VXjvLCEnZuQ3rJDE9L"),
+            ("516b6fcd0f", "ABnLTmg"),
+            ("bf4f89001e670274dd", "3SEo3LWLoPntC"),
+            ("572e4794", "3EFU7m"),
+            ("ecac89cad93923c02321", "EJDM8drfXA6uyA"),
+            ("10c8511e", "Rt5zm"),
+            ("00000000000000000000", "1111111111"),
+        ]
+    
+    def test_编码向量(self):
+        """测试编码结果与已知向量一致"""
+        for 十六进制, 期望 in self.测试向量:
+            self.assertEqual(Base58编码器.编码(bytes.fromhex(十六进制)), 期望)
+    
+    def test_解码向量(self):
+        """测试解码结果与已知向量一致"""
+        for 十六进制, 编码 in self.测试向量:
+            self.assertEqual(Base58编码器.解码(编码), bytes.fromhex(十六进制))
+    
+    def test_长数据往返(self):
+        """测试跨越多个58^10分块的数据往返编码"""
+        for 长度 in (1, 9, 10, 11, 33, 78, 82, 200):
+            数据 = b"\0\0" + bytes(range(256))[:长度]
+            self.assertEqual(Base58编码器.解码(Base58编码器.编码(数据)), 数据)
+    
+    def test_校验编码(self):
+        """测试Base58Check编码和校验"""
+        载荷 = bytes.fromhex("00" + "751e76e8199196d454941c45d1b3a323f1433bd6")
+        地址 = Base58编码器.编码校验(载荷)
+        
+        self.assertEqual(地址, "1BgGZ9tcN4rm9KBzDn7KprQz87SZ26SAMH")
+        self.assertEqual(Base58编码器.解码校验(地址), 载荷)
+        self.assertTrue(Base58编码器.验证校验(地址, b"\x00"))
+        self.assertFalse(Base58编码器.验证校验(地址, b"\x1e"))
+        
+        # 修改一个字符后校验和应失败
+        错误地址 = 地址[:-1] + ("J" if 地址[-1] != "J" else "K")
+        self.assertFalse(Base58编码器.验证校验(错误地址))
+        with self.assertRaises(ValueError):
+            Base58编码器.解码校验(错误地址)
+    
+    def test_非法字符(self):
+        """测试非法字符被拒绝"""
+        for 文本 in ("0abc", "Oabc", "Iabc", "labc", "中文"):
+            with self.assertRaises(ValueError):
+                Base58编码器.解码(文本)
+    
+    def test_批量校验编码(self):
+        """测试共享前缀的批量编码与逐个编码一致"""
+        载荷列表 = [bytes([i]) * 20 for i in range(40)]
+        批量结果 = Base58编码器.批量编码校验(载荷列表, b"\x30")
+        self.assertEqual(批量结果, [Base58编码器.编码校验(b"\x30" + 载荷) for 载荷 in 载荷列表])
+        self.assertEqual(Base58编码器.批量编码校验(载荷列表[:3]), [Base58编码器.编码校验(载荷) for 载荷 in 载荷列表[:3]])
+
+
+if __name__ == "__main__":
+    unittest.main()
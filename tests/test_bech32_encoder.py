@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Bech32/Bech32m编码测试
+使用BIP-173和BIP-350测试向量验证编码和校验
+"""
+
+import unittest
+import sys
+import os
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.bech32_encoder import Bech32编码器
+
+
+class Bech32编码测试(unittest.TestCase):
+    """Bech32编码器的测试"""
+    
+    def setUp(self):
+        """测试前的准备工作"""
+        # 格式: (前缀, 地址, 见证版本, 见证程序(十六进制))
+        self.有效向量 = [
+            ("bc", "BC1QW508D6QEJXTDG4Y5R3ZARVARY0C5XW7KV8F3T4", 0,
+             "751e76e8199196d454941c45d1b3a323f1433bd6"),
+            ("tb", "tb1qrp33g0q5c5txsp9arysrx4k6zdkfs4nce4xj0gdcccefvpysxf3q0sl5k7", 0,
+             "1863143c14c5166804bd19203356da136c985678cd4d27a1b8c6329604903262"),
+            ("bc", "bc1p0xlxvlhemja6c4dqv22uapctqupfhlxm9h8z3k2e72q4k9hcz7vqzk5jj0", 1,
+             "79be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798"),
+            ("bc", "BC1SW50QGDZ25J", 16, "751e"),
+            ("bc", "bc1zw508d6qejxtdg4y5r3zarvaryvaxxpcs", 2,
+             "751e76e8199196d454941c45d1b3a323"),
+        ]
+    
+    def test_编码向量(self):
+        """测试编码结果与官方向量一致"""
+        for 前缀, 地址, 见证版本, 程序十六进制 in self.有效向量:
+            编码结果 = Bech32编码器.编码隔离见证地址(前缀, 见证版本, bytes.fromhex(程序十六进制))
+            self.assertEqual(编码结果, 地址.lower())
+    
+    def test_解码向量(self):
+        """测试解码结果与官方向量一致"""
+        for 前缀, 地址, 见证版本, 程序十六进制 in self.有效向量:
+            self.assertEqual(Bech32编码器.解码隔离见证地址(前缀, 地址),
+                             (见证版本, bytes.fromhex(程序十六进制)))
+    
+    def test_无效地址(self):
+        """测试无效地址被拒绝"""
+        无效地址 = [
+            # 校验和错误
+            "bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kv8f3t5",
+            # 混合大小写
+            "tb1qrp33g0q5c5txsp9arysrx4k6zdkfs4nce4xj0gdcccefvpysxf3q0sL5k7",
+            # 版本1使用了Bech32而不是Bech32m校验和
+            "bc1p0xlxvlhemja6c4dqv22uapctqupfhlxm9h8z3k2e72q4k9hcz7vqh2y7hd",
+            # 版本0使用了Bech32m校验和
+            "bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kemeawh",
+            # 非法字符
+            "bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kv8f3tb",
+            # 缺少数据部分
+            "bc1gmk9yu",
+        ]
+        for 地址 in 无效地址:
+            self.assertFalse(Bech32编码器.验证隔离见证地址("bc", 地址), 地址)
+        
+        # 前缀不匹配
+        self.assertFalse(Bech32编码器.验证隔离见证地址("ltc", self.有效向量[0][1]))
+    
+    def test_无效见证程序(self):
+        """测试编码时拒绝无效的见证程序"""
+        with self.assertRaises(ValueError):
+            Bech32编码器.编码隔离见证地址("bc", 0, bytes(21))
+        with self.assertRaises(ValueError):
+            Bech32编码器.编码隔离见证地址("bc", 17, bytes(20))
+    
+    def test_批量编码(self):
+        """测试批量编码与逐个编码结果一致"""
+        程序列表 = [bytes([i]) * 20 for i in range(50)]
+        批量结果 = Bech32编码器.批量编码隔离见证地址("ltc", 0, 程序列表)
+        self.assertEqual(批量结果, [Bech32编码器.编码隔离见证地址("ltc", 0, 程序) for 程序 in 程序列表])
+        for 地址, 程序 in zip(批量结果, 程序列表):
+            self.assertEqual(Bech32编码器.解码隔离见证地址("ltc", 地址), (0, 程序))
+
+
+if __name__ == "__main__":
+    unittest.main()
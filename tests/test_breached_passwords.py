@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+离线泄露密码索引测试
+"""
+
+import unittest
+import sys
+import os
+import hashlib
+import tempfile
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.breached_passwords import 构建泄露密码索引, 泄露密码索引, 读取语料摘要, 头部长度, 主程序
+from utils.password_checker import 密码强度检查器
+
+
+class 泄露密码索引测试(unittest.TestCase):
+    """泄露密码索引构建和查询的测试"""
+
+    def setUp(self):
+        """测试前的准备工作"""
+        self.临时目录 = tempfile.TemporaryDirectory()
+        self.密码列表 = [f"leaked-{i}" for i in range(500)] + ["密码短语", "correct horse"]
+        self.明文语料 = self._写入("rockyou.txt", "\n".join(self.密码列表 + self.密码列表[:50]) + "\r\n\n")
+
+    def tearDown(self):
+        """测试后的清理工作"""
+        密码强度检查器.设置泄露密码索引(None)
+        self.临时目录.cleanup()
+
+    def _写入(self, 文件名: str, 内容: str) -> str:
+        路径 = os.path.join(self.临时目录.name, 文件名)
+        with open(路径, "w", encoding="utf-8") as 文件:
+            文件.write(内容)
+        return 路径
+
+    def test_分段构建与查询(self):
+        """测试多段归并去重后每个密码都能查到，其他密码查不到"""
+        索引路径 = os.path.join(self.临时目录.name, "索引.idx")
+        记录数 = 构建泄露密码索引([self.明文语料], 索引路径, 每段记录数=64)
+        self.assertEqual(记录数, len(self.密码列表))
+        self.assertEqual(os.path.getsize(索引路径), 头部长度 + 记录数 * 8)
+
+        with 泄露密码索引(索引路径) as 索引:
+            self.assertEqual(len(索引), 记录数)
+            self.assertTrue(all(密码 in 索引 for 密码 in self.密码列表))
+            self.assertFalse(any(f"fresh-{i}" in 索引 for i in range(500)))
+
+    def test_多轮归并(self):
+        """测试段数超过最大归并路数时分多轮归并，结果与一轮归并相同"""
+        一轮 = os.path.join(self.临时目录.name, "一轮.idx")
+        多轮 = os.path.join(self.临时目录.name, "多轮.idx")
+        构建泄露密码索引([self.明文语料], 一轮, 每段记录数=64)
+        # 550条记录分成69段，每轮最多同时打开3个段文件
+        self.assertEqual(构建泄露密码索引([self.明文语料], 多轮, 每段记录数=8, 最大归并路数=3), len(self.密码列表))
+        with open(一轮, "rb") as 文件一, open(多轮, "rb") as 文件二:
+            self.assertEqual(文件一.read(), 文件二.read())
+        self.assertEqual(sorted(os.listdir(self.临时目录.name)), sorted(["rockyou.txt", "一轮.idx", "多轮.idx"]))
+
+        with self.assertRaises(ValueError):
+            构建泄露密码索引([self.明文语料], 多轮, 最大归并路数=1)
+
+    def test_HIBP格式(self):
+        """测试"SHA1:次数"格式的语料，自动识别格式"""
+        行列表 = [hashlib.sha1(密码.encode()).hexdigest().upper() + ":3" for 密码 in ("hunter2", "letmein")]
+        语料 = self._写入("pwned.txt", "\n".join(行列表) + "\n")
+        self.assertEqual(list(读取语料摘要(语料)), [hashlib.sha1(b"hunter2").digest(), hashlib.sha1(b"letmein").digest()])
+
+        索引路径 = os.path.join(self.临时目录.name, "pwned.idx")
+        构建泄露密码索引([语料], 索引路径, 前缀字节数=12)
+        with 泄露密码索引(索引路径) as 索引:
+            self.assertIn("hunter2", 索引)
+            self.assertNotIn("hunter3", 索引)
+
+        with self.assertRaises(ValueError):
+            list(读取语料摘要(self._写入("bad.txt", 行列表[0] + "\nnot-a-hash\n"), "SHA1"))
+
+    def test_无效索引文件(self):
+        """测试空语料得到空索引，截断或无关的文件被拒绝"""
+        空索引 = os.path.join(self.临时目录.name, "空.idx")
+        self.assertEqual(构建泄露密码索引([self._写入("空.txt", "")], 空索引), 0)
+        with 泄露密码索引(空索引) as 索引:
+            self.assertNotIn("anything", 索引)
+
+        with open(空索引, "ab") as 文件:
+            文件.write(b"\x00" * 3)
+        for 路径 in (空索引, self.明文语料):
+            with self.assertRaises(ValueError):
+                泄露密码索引(路径)
+
+    def test_密码强度硬性惩罚(self):
+        """测试泄露的密码无论多复杂都判为0分"""
+        索引路径 = os.path.join(self.临时目录.name, "索引.idx")
+        self.assertEqual(主程序([self.明文语料, "-o", 索引路径]), 0)
+
+        强密码 = "Tr0ub4dor&3-Correct-Horse!"
+        self._写入("extra.txt", 强密码)
+        构建泄露密码索引([self.明文语料, os.path.join(self.临时目录.name, "extra.txt")], 索引路径)
+        self.assertGreater(密码强度检查器.检查密码强度(强密码)["分数"], 0)
+
+        密码强度检查器.设置泄露密码索引(索引路径)
+        结果 = 密码强度检查器.检查密码强度(强密码)
+        self.assertEqual((结果["分数"], 结果["强度"], 结果["详情"]["泄露密码"]), (0, "极弱", True))
+        self.assertFalse(密码强度检查器.检查密码强度("unseen Passphrase 42!")["详情"]["泄露密码"])
+
+
+if __name__ == "__main__":
+    unittest.main()
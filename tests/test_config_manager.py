@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+配置管理器测试
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+from unittest import mock
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils import config_manager
+from utils.config_manager import 配置管理器
+
+
+class 配置管理器测试(unittest.TestCase):
+    """配置的延迟加载、原子写入、批量修改和刷新的测试"""
+
+    def setUp(self):
+        """测试前的准备工作"""
+        self.临时目录 = tempfile.TemporaryDirectory()
+        self.路径 = os.path.join(self.临时目录.name, "配置", "config.json")
+
+    def tearDown(self):
+        """测试后的清理工作"""
+        self.临时目录.cleanup()
+
+    def _读取文件(self):
+        with open(self.路径, "r", encoding="utf-8") as 文件:
+            return json.load(文件)
+
+    def test_创建和读取不写文件(self):
+        """测试创建配置管理器不访问磁盘，读取默认配置也不创建目录或文件"""
+        with mock.patch.object(config_manager.os, "stat", side_effect=AssertionError("不应访问磁盘")):
+            配置 = 配置管理器(self.路径)
+        self.assertEqual(配置.获取配置("高级选项.密码强度最低要求"), 40)
+        self.assertEqual(配置.获取配置("高级选项.不存在", "默认"), "默认")
+        self.assertFalse(os.path.exists(os.path.dirname(self.路径)))
+
+    def test_批量修改只写一次(self):
+        """测试批量修改中的多次设置只在退出时原子写入一次，不留下临时文件"""
+        配置 = 配置管理器(self.路径)
+        with mock.patch.object(config_manager, "写入私有文件", wraps=config_manager.写入私有文件) as 写入:
+            with 配置.批量修改():
+                配置.设置配置("语言", "english")
+                with 配置.批量修改():
+                    配置.设置配置("高级选项.允许导出私钥", True)
+                配置.设置配置("路径.默认导出目录", "/tmp/export")
+                self.assertEqual(写入.call_count, 0)
+            self.assertEqual(写入.call_count, 1)
+            # 值没有变化时不写文件
+            配置.设置配置("语言", "english")
+            self.assertEqual(写入.call_count, 1)
+
+        self.assertEqual(self._读取文件()["高级选项"]["允许导出私钥"], True)
+        self.assertEqual(os.listdir(os.path.dirname(self.路径)), ["config.json"])
+        # 修改嵌套的配置项不影响默认配置
+        self.assertFalse(配置管理器.默认配置["高级选项"]["允许导出私钥"])
+
+    def test_批量修改异常时撤销(self):
+        """测试批量修改中发生异常时撤销修改且不写文件"""
+        配置 = 配置管理器(self.路径)
+        with self.assertRaises(RuntimeError):
+            with 配置.批量修改():
+                配置.设置配置("语言", "english")
+                raise RuntimeError("中止")
+        self.assertEqual(配置.获取配置("语言"), "chinese_simplified")
+        self.assertFalse(os.path.exists(self.路径))
+
+    def test_按修改时间刷新(self):
+        """测试文件被其他实例修改后刷新才重新加载，未修改时不重新读取"""
+        配置 = 配置管理器(self.路径)
+        配置.设置配置("语言", "english")
+        with mock.patch("builtins.open", side_effect=AssertionError("不应重新读取")):
+            self.assertFalse(配置.刷新())
+
+        配置管理器(self.路径).设置配置("语言", "japanese")
+        self.assertEqual(配置.获取配置("语言"), "english")
+        self.assertTrue(配置.刷新())
+        self.assertEqual(配置.获取配置("语言"), "japanese")
+
+
+if __name__ == "__main__":
+    unittest.main()
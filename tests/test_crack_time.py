@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+密码短语破解耗时估计测试
+"""
+
+import unittest
+import sys
+import os
+import json
+import stat
+import tempfile
+from unittest import mock
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils import crack_time
+from utils.crack_time import 校准, 读取校准, 估计破解耗时, 格式化耗时, 测量每秒种子数
+from utils.password_checker import 密码强度检查器
+
+
+class 破解耗时测试(unittest.TestCase):
+    """校准缓存和破解耗时估计的测试"""
+
+    def setUp(self):
+        """测试前的准备工作"""
+        self.临时目录 = tempfile.TemporaryDirectory()
+        self.路径 = os.path.join(self.临时目录.name, "配置", "pbkdf2_calibration.json")
+
+    def tearDown(self):
+        """测试后的清理工作"""
+        密码强度检查器.设置破解速度(None)
+        self.临时目录.cleanup()
+
+    def test_校准缓存(self):
+        """测试首次校准写入仅所有者可读写的缓存，之后只读缓存不再测量"""
+        self.assertIsNone(读取校准(self.路径))
+        结果 = 校准(self.路径, 最短秒数=0.01)
+        self.assertGreater(结果["每秒种子数"], 0)
+        self.assertEqual(stat.S_IMODE(os.stat(self.路径).st_mode), 0o600)
+
+        with mock.patch.object(crack_time, "测量每秒种子数", side_effect=AssertionError("不应重新测量")):
+            self.assertEqual(校准(self.路径), 结果)
+
+        with mock.patch.object(crack_time, "测量每秒种子数", return_value=123.0):
+            self.assertEqual(校准(self.路径, 重新测量=True)["每秒种子数"], 123.0)
+        self.assertEqual(读取校准(self.路径)["每秒种子数"], 123.0)
+
+    def test_换机器后缓存作废(self):
+        """测试机器标识不同或文件损坏时不使用缓存"""
+        结果 = 校准(self.路径, 最短秒数=0.01)
+        结果["机器"]["核心数"] = -1
+        with open(self.路径, "w", encoding="utf-8") as 文件:
+            json.dump(结果, 文件)
+        self.assertIsNone(读取校准(self.路径))
+        with open(self.路径, "w", encoding="utf-8") as 文件:
+            文件.write("{")
+        self.assertIsNone(读取校准(self.路径))
+
+    def test_估计破解耗时(self):
+        """测试按攻击者档案的倍数换算耗时"""
+        估计 = 估计破解耗时(1e6, 100, {"单核": 1, "集群": 1000})
+        self.assertEqual([行["档案"] for 行 in 估计], ["单核", "集群"])
+        self.assertAlmostEqual(估计[0]["秒数"], 1e4)
+        self.assertAlmostEqual(估计[1]["秒数"], 10)
+        self.assertEqual(估计[1]["描述"], "10秒")
+        self.assertIn("本机单核", [行["档案"] for 行 in 估计破解耗时(1, 100)])
+        for 速度, 档案 in ((0, None), (100, {"无效": 0})):
+            with self.assertRaises(ValueError):
+                估计破解耗时(1, 速度, 档案)
+
+    def test_格式化耗时(self):
+        """测试各时间单位的描述"""
+        self.assertEqual(格式化耗时(0.5), "不到1秒")
+        self.assertEqual(格式化耗时(150), "2分钟")
+        self.assertEqual(格式化耗时(3 * 86400), "3天")
+        self.assertEqual(格式化耗时(30 * 86400 * 365), "30年")
+        self.assertEqual(格式化耗时(2.5e4 * 86400 * 365), "约2.5万年")
+        self.assertEqual(格式化耗时(1e30), "超过1万亿年")
+
+    def test_密码强度报告破解耗时(self):
+        """测试设置速度后检查密码强度报告破解耗时，未设置时不报告"""
+        self.assertNotIn("破解耗时", 密码强度检查器.检查密码强度("correct horse")["详情"])
+        密码强度检查器.设置破解速度(100, {"单核": 1})
+        结果 = 密码强度检查器.检查密码强度("correct horse")
+        猜测次数 = 结果["详情"]["猜测次数"]["猜测次数"]
+        self.assertAlmostEqual(结果["详情"]["破解耗时"][0]["秒数"], 猜测次数 / 100)
+        self.assertIn("- 单核: ", 密码强度检查器.格式化输出密码强度(结果))
+        with self.assertRaises(ValueError):
+            密码强度检查器.设置破解速度(0)
+
+    def test_测量速度(self):
+        """测试测量得到正的速度"""
+        self.assertGreater(测量每秒种子数(0.01), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
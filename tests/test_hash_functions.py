@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+地址哈希工具测试
+测试HASH160和Keccak-256的原生实现与内置回退实现
+"""
+
+import unittest
+import sys
+import os
+from unittest import mock
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils import hash_functions
+from utils.hash_functions import hash160, hash160_batch, keccak256, keccak_batch
+
+
+class 地址哈希测试(unittest.TestCase):
+    """HASH160和Keccak-256的测试"""
+    
+    def setUp(self):
+        """测试前的准备工作"""
+        self.RIPEMD160向量 = [
+            (b"", "9c1185a5c5e9fc54612808977ee8f548b2258d31"),
+            (b"abc", "8eb208f7e05d987a9b044a8e98c6b087f15a0bfc"),
+            (b"message digest", "5d0689ef49d2fae572b881b123a85ffa21595f36"),
+            (b"1234567890" * 8, "9b752e45573d4b39f4dbd3323cab82bf63326bfb"),
+        ]
+        self.Keccak向量 = [
+            (b"", "c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470"),
+            (b"abc", "4e03657aea45a94fc7d47ba826c8d667c0d1e6e33a64a036ec44f58fa12d6c45"),
+        ]
+        self.测试公钥 = bytes.fromhex("0279be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798")
+    
+    def test_内置RIPEMD160(self):
+        """测试内置RIPEMD-160实现"""
+        for 数据, 期望 in self.RIPEMD160向量:
+            self.assertEqual(hash_functions._ripemd160(数据).hex(), 期望)
+    
+    def test_内置Keccak(self):
+        """测试内置Keccak-256实现，包括跨越速率边界的输入"""
+        for 数据, 期望 in self.Keccak向量:
+            self.assertEqual(hash_functions._keccak256(数据).hex(), 期望)
+        
+        if hash_functions.KECCAK_原生可用:
+            for 长度 in (135, 136, 137, 272, 300):
+                数据 = bytes(range(256)) * 2
+                self.assertEqual(hash_functions._keccak256(数据[:长度]), keccak256(数据[:长度]))
+    
+    def test_HASH160(self):
+        """测试HASH160已知向量"""
+        self.assertEqual(hash160(self.测试公钥).hex(), "751e76e8199196d454941c45d1b3a323f1433bd6")
+    
+    def test_回退实现(self):
+        """测试原生实现不可用时回退到内置实现"""
+        with mock.patch.object(hash_functions, "RIPEMD160_原生可用", False):
+            self.assertEqual(hash160(self.测试公钥).hex(), "751e76e8199196d454941c45d1b3a323f1433bd6")
+        
+        with mock.patch.object(hash_functions, "KECCAK_原生可用", False), \
+                mock.patch.object(hash_functions, "_原生keccak", None):
+            self.assertEqual(keccak256(b"abc").hex(), self.Keccak向量[1][1])
+    
+    def test_批量哈希(self):
+        """测试批量接口与单个接口结果一致"""
+        数据列表 = [bytes([i]) * 33 for i in range(20)]
+        self.assertEqual(hash160_batch(数据列表), [hash160(数据) for 数据 in 数据列表])
+        self.assertEqual(keccak_batch(数据列表), [keccak256(数据) for 数据 in 数据列表])
+        self.assertEqual(hash160_batch([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,6 +8,7 @@
 import unittest
 import sys
 import os
+import random
 
 # 添加项目根目录到路径
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -57,6 +58,24 @@ class 密码强度检查器测试(unittest.TestCase):
         结果 = 密码强度检查器.检查密码强度(序列密码)
         self.assertTrue(结果["详情"]["序列模式"]["存在"])
     
+    def test_模式优先级(self):
+        """测试三连字符优先于更早出现的重复双字符，序列按常见序列的先后报告"""
+        self.assertEqual(密码强度检查器._检查重复模式("ababccc"),
+                         {"存在": True, "惩罚": 10, "模式": "ccc"})
+        self.assertEqual(密码强度检查器._检查重复模式("xabab"),
+                         {"存在": True, "惩罚": 5, "模式": "abab"})
+        self.assertEqual(密码强度检查器._检查序列模式("Z90-fgh-XYZ")["模式"], "fgh")
+        self.assertEqual(密码强度检查器._检查序列模式("k1l2m3")["存在"], False)
+
+    def test_字符类别与常见密码(self):
+        """测试Unicode数字同时算作数字和特殊字符，空白不算特殊字符，常见密码不区分大小写"""
+        复杂度 = 密码强度检查器.检查密码强度("pass ٣")["详情"]["复杂度"]
+        self.assertEqual((复杂度["数字"], 复杂度["特殊字符"]), (True, True))
+        self.assertFalse(密码强度检查器.检查密码强度("pass word")["详情"]["复杂度"]["特殊字符"])
+        大小写混合结果 = 密码强度检查器.检查密码强度("PassWord")
+        self.assertEqual(大小写混合结果["建议"], 密码强度检查器.检查密码强度("password")["建议"])
+        self.assertEqual(大小写混合结果["强度"], "极弱")
+
     def test_复杂度检测(self):
         """测试复杂度检测"""
         复杂密码 = "Abc123!@#"
@@ -90,6 +109,22 @@ class 密码强度检查器测试(unittest.TestCase):
         self.assertIn("强度:", 输出)
         self.assertIn("建议:", 输出)
 
+    def test_增量评分(self):
+        """测试逐字符输入和退格后的评分与对整个密码检查的结果相同"""
+        随机 = random.Random(48)
+        字符集 = "aAbc123qwe !@İ/horse"
+        for _ in range(200):
+            评分器 = 密码强度检查器.创建增量评分器("pass")
+            for _ in range(20):
+                if 随机.random() < 0.3:
+                    评分器.删除(随机.randint(1, 3))
+                else:
+                    评分器.追加(随机.choice(字符集))
+                self.assertEqual(评分器.结果(), 密码强度检查器.检查密码强度(评分器.密码))
+        评分器.清空()
+        self.assertEqual(len(评分器), 0)
+        self.assertEqual(评分器.结果()["建议"], ["密码不能为空"])
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+密码猜测次数估计测试
+"""
+
+import unittest
+import sys
+import os
+import math
+import random
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.password_guesses import 构建字典树, 排名词表, 查找所有匹配, 最优分段, 估计猜测次数, 增量猜测估计器, _总猜测次数对数
+from utils.password_checker import 密码强度检查器
+
+
+class 密码猜测次数测试(unittest.TestCase):
+    """模式匹配和最优分段的测试"""
+
+    def setUp(self):
+        """测试前的准备工作"""
+        self.字典树 = 构建字典树({
+            "常见密码": 排名词表(["password", "dragon", "monkey"]),
+            "单词": 排名词表(["correct", "horse", "battery", "staple"], 排名=2048),
+        })
+
+    def _模式(self, 密码: str):
+        return [(段["模式"], 段["片段"]) for 段 in 估计猜测次数(密码, self.字典树)["匹配序列"]]
+
+    def test_各类模式(self):
+        """测试字典、键盘路径、重复、序列和日期都能被识别为整段"""
+        self.assertEqual(self._模式("Password"), [("字典", "Password")])
+        self.assertEqual(self._模式("zxcvbnm,./"), [("键盘路径", "zxcvbnm,./")])
+        self.assertEqual(self._模式("abcabcabc"), [("重复", "abcabcabc")])
+        self.assertEqual(self._模式("13579"), [("序列", "13579")])
+        self.assertEqual(self._模式("13/11/1997"), [("日期", "13/11/1997")])
+
+        结果 = 估计猜测次数("dragon1987", self.字典树)
+        self.assertEqual([段["模式"] for 段 in 结果["匹配序列"]], ["字典", "日期"])
+        self.assertEqual(结果["匹配序列"][1]["年"], 1987)
+
+    def test_重复字符不算高熵(self):
+        """测试aaaaBBBB分成两段重复，猜测次数远少于同长度的随机字符"""
+        结果 = 估计猜测次数("aaaaBBBB", self.字典树)
+        self.assertEqual([(段["重复单元"], 段["重复次数"]) for 段 in 结果["匹配序列"]], [("a", 4), ("B", 4)])
+        self.assertLess(结果["猜测次数对数"], 估计猜测次数("q7#Vp2!m", self.字典树)["猜测次数对数"] - 3)
+
+    def test_最优分段(self):
+        """测试分段首尾相接，且总猜测次数等于逐状态穷举的最小值"""
+        随机 = random.Random(46)
+        字符集 = "abcqwe123 !@Az0/."
+        for _ in range(300):
+            密码 = "".join(随机.choice(字符集) for _ in range(随机.randint(1, 14)))
+            密码 += 随机.choice(["", "horse", "1987", "qwerty", "11/12/2001"])
+            匹配列表 = 查找所有匹配(密码, self.字典树)
+            总对数, 分段 = 最优分段(密码, 匹配列表)
+
+            self.assertEqual([(段[0], 段[1]) for 段 in 分段],
+                             list(zip([0] + [段[1] + 1 for 段 in 分段[:-1]], [段[1] for 段 in 分段])))
+            self.assertEqual(分段[-1][1], len(密码) - 1)
+            self.assertAlmostEqual(总对数, _总猜测次数对数(len(分段), sum(段[2] for 段 in 分段)))
+            self.assertAlmostEqual(总对数, self._穷举最小值(密码, 匹配列表))
+
+    def _穷举最小值(self, 密码, 匹配列表):
+        """逐个前缀、逐个段数的朴素动态规划，作为对照"""
+        长度 = len(密码)
+        模式 = [{} for _ in range(长度 + 1)]
+        暴力 = [{} for _ in range(长度 + 1)]
+        模式[0][0] = 0.0
+        for 前缀 in range(1, 长度 + 1):
+            for 开始, 结束, 对数, _, _ in 匹配列表:
+                if 结束 + 1 == 前缀:
+                    for 前驱 in (模式[开始], 暴力[开始]):
+                        for 段数, 和 in 前驱.items():
+                            模式[前缀][段数 + 1] = min(模式[前缀].get(段数 + 1, math.inf), 和 + 对数)
+            for 段数, 和 in 暴力[前缀 - 1].items():
+                暴力[前缀][段数] = min(暴力[前缀].get(段数, math.inf), 和 + 1)
+            for 段数, 和 in 模式[前缀 - 1].items():
+                暴力[前缀][段数 + 1] = min(暴力[前缀].get(段数 + 1, math.inf), 和 + 1)
+        return min(_总猜测次数对数(段数, 和) for 状态 in (模式[长度], 暴力[长度]) for 段数, 和 in 状态.items())
+
+    def test_增量估计(self):
+        """测试逐字符追加和删除后的估计与对整个密码估计的结果相同"""
+        随机 = random.Random(48)
+        字符集 = "abcqwe123 !@Az0/.horse"
+        估计器 = 增量猜测估计器(self.字典树)
+        for _ in range(2000):
+            if 随机.random() < 0.3:
+                估计器.删除(随机.randint(1, 4))
+            else:
+                估计器.追加("".join(随机.choice(字符集) for _ in range(随机.randint(1, 3))))
+            结果 = 估计器.结果()
+            对照 = 估计猜测次数(估计器.密码, self.字典树)
+            self.assertAlmostEqual(结果["猜测次数对数"], 对照["猜测次数对数"])
+            self.assertEqual("".join(段["片段"] for 段 in 结果["匹配序列"]), 估计器.密码)
+
+    def test_密码强度熵值(self):
+        """测试检查密码强度按猜测次数计算熵值，并给出分段详情"""
+        结果 = 密码强度检查器.检查密码强度("aaaaBBBB")
+        self.assertIn("匹配序列", 结果["详情"]["猜测次数"])
+        self.assertAlmostEqual(结果["详情"]["熵值"]["值"],
+                               结果["详情"]["猜测次数"]["猜测次数对数"] * math.log2(10))
+        self.assertLess(结果["详情"]["熵值"]["分数"], 密码强度检查器.检查密码强度("q7#Vp2!m")["详情"]["熵值"]["分数"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+私有文件写入测试
+"""
+
+import unittest
+import sys
+import os
+import stat
+import tempfile
+from unittest import mock
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils import private_file
+from utils.private_file import 写入私有文件
+
+
+class 私有文件写入测试(unittest.TestCase):
+    """权限、原子替换和出错清理的测试"""
+
+    def setUp(self):
+        """测试前的准备工作"""
+        self.临时目录 = tempfile.TemporaryDirectory()
+        self.路径 = os.path.join(self.临时目录.name, "秘密.txt")
+
+    def tearDown(self):
+        """测试后的清理工作"""
+        self.临时目录.cleanup()
+
+    @unittest.skipIf(os.name == "nt", "Windows不支持POSIX权限位")
+    def test_仅所有者可读写(self):
+        """测试新建和替换后的文件权限都是0600"""
+        with open(self.路径, "w") as 文件:
+            文件.write("旧内容")
+        os.chmod(self.路径, 0o644)
+        写入私有文件(self.路径, "新内容")
+        self.assertEqual(stat.S_IMODE(os.stat(self.路径).st_mode), 0o600)
+
+    def test_文本和字节(self):
+        """测试字符串按UTF-8写入，字节串原样写入"""
+        写入私有文件(self.路径, "分享")
+        with open(self.路径, "rb") as 文件:
+            self.assertEqual(文件.read(), "分享".encode("utf-8"))
+        写入私有文件(self.路径, b"\x89PNG")
+        with open(self.路径, "rb") as 文件:
+            self.assertEqual(文件.read(), b"\x89PNG")
+
+    def test_出错时保留原文件(self):
+        """测试替换失败时原文件不变，也不留下临时文件"""
+        写入私有文件(self.路径, "原内容")
+        with mock.patch.object(private_file.os, "replace", side_effect=OSError("磁盘已满")):
+            with self.assertRaises(OSError):
+                写入私有文件(self.路径, "新内容")
+        with open(self.路径, encoding="utf-8") as 文件:
+            self.assertEqual(文件.read(), "原内容")
+        self.assertEqual(os.listdir(self.临时目录.name), ["秘密.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
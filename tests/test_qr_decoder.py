@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+纯Python二维码解码器测试
+"""
+
+import unittest
+import sys
+import os
+import io
+import random
+from unittest import mock
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.qr_encoder import 编码, 编码分段, 数字分段, 字母数字分段, 字节分段, RS纠错码
+from utils.qr_raster import 编码PNG, 像素行, 图像尺寸
+from utils.qr_decoder import RS纠错, 解码矩阵, 解码PNG, 解码1位像素行, 读取PNG
+from utils.qrcode_generator import 二维码生成器
+
+try:
+    from PIL import Image
+    from utils.qr_decoder import 解码图像
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+
+class 二维码解码器测试(unittest.TestCase):
+    """二维码解码器的测试"""
+
+    def setUp(self):
+        """测试前的准备工作"""
+        self.随机 = random.Random(43)
+
+    def test_矩阵往返(self):
+        """测试各模式、各纠错级别和多个版本的矩阵都能还原"""
+        字符集 = ("0123456789", "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:")
+        for _ in range(60):
+            长度 = self.随机.randrange(1, 800)
+            种类 = self.随机.randrange(3)
+            if 种类 < 2:
+                数据 = "".join(self.随机.choice(字符集[种类]) for _ in range(长度))
+                期望 = 数据.encode("ascii")
+            else:
+                数据 = 期望 = bytes(self.随机.getrandbits(8) for _ in range(长度))
+            级别 = self.随机.choice("LMQH")
+            self.assertEqual(解码矩阵(编码(数据, 级别)), 期望)
+
+        混合 = [数字分段("2024"), 字母数字分段("SEED-"), 字节分段("助记词")]
+        self.assertEqual(解码矩阵(编码分段(混合, "Q")), "2024SEED-助记词".encode("utf-8"))
+        self.assertEqual(解码矩阵(编码("7", "H", 最小版本=40)), b"7")
+
+    def test_RS纠错(self):
+        """测试纠错能力以内的错误被纠正，超出时抛出异常"""
+        for _ in range(50):
+            纠错码字数 = self.随机.randrange(7, 31)
+            数据 = [self.随机.getrandbits(8) for _ in range(self.随机.randrange(1, 120))]
+            码字 = 数据 + RS纠错码(数据, 纠错码字数)
+            损坏 = list(码字)
+            for 位置 in self.随机.sample(range(len(码字)), 纠错码字数 // 2):
+                损坏[位置] ^= self.随机.randrange(1, 256)
+            self.assertEqual(RS纠错(损坏, 纠错码字数), 码字)
+
+        数据 = [0x10, 0x20, 0x0C, 0x56, 0x61, 0x80, 0xEC, 0x11, 0xEC, 0x11, 0xEC, 0x11, 0xEC, 0x11, 0xEC, 0x11]
+        损坏 = 数据 + RS纠错码(数据, 10)
+        for 位置 in range(0, 16, 2):
+            损坏[位置] ^= 0xFF
+        with self.assertRaises(ValueError):
+            RS纠错(损坏, 10)
+
+    def test_损坏模块被纠正(self):
+        """测试翻转少量数据模块后仍能解码"""
+        助记词 = "abandon ability able about above absent absorb abstract absurd abuse access accident"
+        矩阵 = 编码(助记词, "H")
+        for 行, 列 in ((12, 12), (13, 12), (20, 25), (30, 30)):
+            矩阵[行][列] = not 矩阵[行][列]
+        self.assertEqual(解码矩阵(矩阵), 助记词.encode("ascii"))
+
+    def test_PNG往返(self):
+        """测试不同盒子大小和边框大小的1位PNG都能定位和解码"""
+        矩阵 = 编码("bc1qar0srrr7xfkvy5l643lydnw9re59gtzzwf5mdq", "M")
+        for 盒子大小, 边框大小 in ((1, 1), (3, 0), (10, 4), (7, 2)):
+            with self.subTest(盒子大小=盒子大小, 边框大小=边框大小):
+                self.assertEqual(解码PNG(编码PNG(矩阵, 盒子大小, 边框大小)),
+                                 b"bc1qar0srrr7xfkvy5l643lydnw9re59gtzzwf5mdq")
+
+        边长 = 图像尺寸(矩阵, 4, 4)
+        self.assertEqual(解码1位像素行([行 for 行 in 像素行(矩阵, 4, 4) for _ in range(4)], 边长),
+                         b"bc1qar0srrr7xfkvy5l643lydnw9re59gtzzwf5mdq")
+
+        with self.assertRaises(ValueError):
+            读取PNG(b"GIF89a")
+        # IHDR长度字段损坏或数据块被截断时报ValueError，而不是struct.error
+        数据 = 编码PNG(矩阵, 4, 4)
+        for 损坏 in (数据[:8] + b"\x00\x00\x00\x0c" + 数据[12:], 数据[:8] + b"\x00\x00\x00\x0e" + 数据[12:],
+                   数据[:20]):
+            with self.assertRaises(ValueError):
+                解码PNG(损坏)
+        空白 = [[False] * 21 for _ in range(21)]
+        with self.assertRaises(ValueError):
+            解码PNG(编码PNG(空白, 4, 4))
+
+    @unittest.skipUnless(PIL_AVAILABLE, "需要安装pillow库")
+    def test_PIL保存的灰度和彩色图像(self):
+        """测试带标题的8位灰度PNG（PIL使用各种过滤器）和RGB图像"""
+        矩阵 = 编码("hello world", "H")
+        边长 = 图像尺寸(矩阵, 5, 4)
+        二维码 = Image.frombytes("1", (边长, 边长), b"".join(行 * 5 for 行 in 像素行(矩阵, 5, 4)))
+        画布 = Image.new("L", (边长, 边长 + 40), 255)
+        画布.paste(Image.new("L", (边长 // 2, 20), 0), (边长 // 4, 10))
+        画布.paste(二维码.convert("L"), (0, 40))
+
+        输出 = io.BytesIO()
+        画布.save(输出, format="PNG")
+        self.assertEqual(解码PNG(输出.getvalue()), b"hello world")
+        self.assertEqual(解码图像(画布.convert("RGB")), b"hello world")
+
+    def test_生成器校验(self):
+        """测试生成器的校验选项能发现内容不一致"""
+        结果 = 二维码生成器.生成二维码("校验测试", 校验=True)
+        self.assertIsInstance(结果, str)
+        self.assertIsNotNone(二维码生成器.生成种子二维码(bytes(range(64)), 二进制=True, 校验=True))
+
+        with mock.patch("utils.qrcode_generator.解码PNG", return_value=b"other"):
+            with self.assertRaises(ValueError):
+                二维码生成器.生成二维码("校验测试", 校验=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
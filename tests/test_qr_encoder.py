@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+纯Python二维码编码器测试
+"""
+
+import unittest
+import sys
+import os
+import random
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.qr_encoder import (
+    编码, 编码分段, 数字分段, 字母数字分段, 字节分段, 自动分段, 选择版本,
+    数字模式, 字母数字模式, 字节模式, RS纠错码,
+)
+
+try:
+    import qrcode
+    import qrcode.util
+    QRCODE_AVAILABLE = True
+except ImportError:
+    QRCODE_AVAILABLE = False
+
+
+class 二维码编码器测试(unittest.TestCase):
+    """二维码编码器的测试"""
+
+    def test_分段位串(self):
+        """测试各模式分段的位长度和自动选择的模式"""
+        self.assertEqual(数字分段("01234567"), (数字模式, 8, "0000001100" "0101011001" "1000011"))
+        self.assertEqual(字母数字分段("AC-42"), (字母数字模式, 5, "00111001110" "11100111001" "000010"))
+        self.assertEqual(字节分段("é")[:2], (字节模式, 2))
+        self.assertEqual(自动分段("2024")[0], 数字模式)
+        self.assertEqual(自动分段("HELLO WORLD")[0], 字母数字模式)
+        self.assertEqual(自动分段("hello")[0], 字节模式)
+        with self.assertRaises(ValueError):
+            数字分段("12a")
+        with self.assertRaises(ValueError):
+            字母数字分段("abc")
+
+    def test_RS纠错码(self):
+        """测试ISO/IEC 18004附录中版本1-M示例的纠错码字"""
+        数据 = [0x10, 0x20, 0x0C, 0x56, 0x61, 0x80, 0xEC, 0x11, 0xEC, 0x11, 0xEC, 0x11, 0xEC, 0x11, 0xEC, 0x11]
+        self.assertEqual(RS纠错码(数据, 10), [0xA5, 0x24, 0xD4, 0xC1, 0xED, 0x36, 0xC7, 0x87, 0x2C, 0x55])
+
+    def test_版本选择与容量(self):
+        """测试版本1-L的容量边界和超出容量的数据"""
+        self.assertEqual(选择版本([数字分段("1" * 41)], "L"), 1)
+        self.assertEqual(选择版本([数字分段("1" * 42)], "L"), 2)
+        self.assertEqual(选择版本([字节分段(b"x" * 17)], "L"), 1)
+        self.assertEqual(len(编码("x", "L", 最小版本=5)), 37)
+        with self.assertRaises(ValueError):
+            编码("x" * 3000, "H")
+        with self.assertRaises(ValueError):
+            编码("x", "X")
+        with self.assertRaises(ValueError):
+            编码("x", "L", 掩码=8)
+
+    def test_多分段(self):
+        """测试多个分段拼接后仍能选择版本并编码"""
+        矩阵 = 编码分段([字节分段("ur:"), 数字分段("0123456789" * 5)], "M")
+        self.assertEqual(len(矩阵), 25)
+
+    @unittest.skipUnless(QRCODE_AVAILABLE, "需要安装qrcode库")
+    def test_与qrcode库一致(self):
+        """测试各种模式、长度和纠错级别下与qrcode库的模块矩阵完全一致"""
+        级别表 = {"L": qrcode.constants.ERROR_CORRECT_L, "M": qrcode.constants.ERROR_CORRECT_M,
+               "Q": qrcode.constants.ERROR_CORRECT_Q, "H": qrcode.constants.ERROR_CORRECT_H}
+        模式表 = {数字模式: qrcode.util.MODE_NUMBER, 字母数字模式: qrcode.util.MODE_ALPHA_NUM,
+               字节模式: qrcode.util.MODE_8BIT_BYTE}
+        随机 = random.Random(39)
+        字符集列表 = ("0123456789", "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:",
+                  "abcdefghijklmnopqrstuvwxyz ", "中文助记词ü")
+        for _ in range(60):
+            字符集 = 随机.choice(字符集列表)
+            数据 = "".join(随机.choice(字符集) for _ in range(随机.choice((1, 20, 90, 300, 900))))
+            级别 = 随机.choice("LMQH")
+            try:
+                矩阵 = 编码(数据, 级别)
+            except ValueError:
+                continue
+            qr = qrcode.QRCode(error_correction=级别表[级别], border=0)
+            qr.add_data(qrcode.util.QRData(数据, mode=模式表[自动分段(数据)[0]]))
+            qr.make(fit=True)
+            self.assertEqual(矩阵, qr.modules, f"{级别} {数据!r}")
+
+
+if __name__ == "__main__":
+    unittest.main()
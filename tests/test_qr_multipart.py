@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+多帧动态二维码（喷泉码）测试
+"""
+
+import unittest
+import sys
+import os
+import io
+import stat
+import random
+import tempfile
+from contextlib import redirect_stderr
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.qr_encoder import 字母数字字符集
+from utils.qr_multipart import (
+    生成帧, 解析帧, 解码帧, 多帧解码器, 选择片段, 切分片段, 帧矩阵, 导出PNG帧, 导出GIF, 主程序,
+)
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+
+class 多帧二维码测试(unittest.TestCase):
+    """多帧编码和喷泉码解码的测试"""
+
+    def setUp(self):
+        """测试前的准备工作"""
+        self.载荷 = bytes(random.Random(42).getrandbits(8) for _ in range(1000))
+        self.帧列表 = list(生成帧(self.载荷, 100, 60))
+
+    def test_帧格式(self):
+        """测试帧为字母数字模式字符且能解析出传输参数"""
+        self.assertEqual(len(self.帧列表), 60)
+        self.assertTrue(all(字符 in 字母数字字符集 for 帧 in self.帧列表 for 字符 in 帧))
+        序号, 片段数, 消息长度, _, 片段 = 解析帧(self.帧列表[11])
+        self.assertEqual((序号, 片段数, 消息长度, len(片段)), (12, 10, 1000, 100))
+        for 无效帧 in ("", "MQR/1-2", "XYZ/1-2/AAAAAAAAAAAAAAAAAAAA", "MQR/0-2/AAAAAAAAAAAAAAAAAAAA", "MQR/1-2/A"):
+            with self.assertRaises(ValueError):
+                解析帧(无效帧)
+
+        # 篡改片段数：与消息长度和片段长度不一致，或超过上限
+        前缀, _, 正文 = self.帧列表[11].split("/")
+        for 片段数 in (9, 11, 10 ** 9):
+            with self.assertRaises(ValueError):
+                解析帧(f"{前缀}/12-{片段数}/{正文}")
+        # 篡改序号：超出32位的序号不能进入选片段
+        for 帧 in (f"{前缀}/{2 ** 32}-10/{正文}", f"{前缀}/{2 ** 32}-1/{正文}"):
+            with self.assertRaises(ValueError):
+                解析帧(帧)
+            with self.assertRaises(ValueError):
+                解码帧([帧])
+        with self.assertRaises(ValueError):
+            切分片段(b"x" * 70000, 1)
+
+    def test_切分片段(self):
+        """测试片段等长且补齐最少"""
+        片段列表 = 切分片段(b"x" * 250, 100)
+        self.assertEqual([len(片段) for 片段 in 片段列表], [84, 84, 84])
+        with self.assertRaises(ValueError):
+            切分片段(b"", 100)
+
+    def test_选择片段固定(self):
+        """测试选片段的伪随机序列与平台和Python版本无关"""
+        self.assertEqual(选择片段(3, 25, 0x12345678), frozenset({2}))
+        self.assertEqual(sorted(选择片段(26, 25, 0x12345678)), [7, 8])
+        self.assertEqual(len(选择片段(1000, 300, 0xDEADBEEF)), 62)
+
+    def test_任意子集还原(self):
+        """测试乱序、只收喷泉帧或丢帧时都能还原"""
+        self.assertEqual(解码帧(self.帧列表), self.载荷)
+        self.assertEqual(解码帧(self.帧列表[10:]), self.载荷)
+
+        随机 = random.Random(7)
+        for _ in range(20):
+            帧列表 = 随机.sample(self.帧列表, len(self.帧列表))
+            解码器 = 多帧解码器()
+            for 帧 in 帧列表:
+                if 解码器.接收(帧):
+                    break
+            self.assertEqual(解码器.结果, self.载荷)
+            self.assertLessEqual(解码器.接收帧数, 30)
+
+        with self.assertRaises(ValueError):
+            解码帧(self.帧列表[:9])
+
+    def test_重复帧与混入其他传输(self):
+        """测试重复帧不计入进度，其他传输的帧被拒绝"""
+        解码器 = 多帧解码器()
+        for _ in range(3):
+            解码器.接收(self.帧列表[0])
+        self.assertEqual(解码器.接收帧数, 3)
+        self.assertAlmostEqual(解码器.进度, 0.1)
+        with self.assertRaises(ValueError):
+            解码器.接收(next(生成帧(b"other payload", 100)))
+
+    def test_帧矩阵版本一致(self):
+        """测试所有帧使用同一版本的二维码"""
+        边长集合 = {len(矩阵) for 矩阵 in 帧矩阵(self.载荷, 100, 120)}
+        self.assertEqual(len(边长集合), 1)
+
+    def test_导出(self):
+        """测试导出PNG帧（仅所有者可读写）和动画GIF"""
+        with tempfile.TemporaryDirectory() as 临时目录:
+            路径列表 = 导出PNG帧(self.载荷, os.path.join(临时目录, "帧"), 200, 8)
+            self.assertEqual([os.path.basename(路径) for 路径 in 路径列表][:2], ["frame-0001.png", "frame-0002.png"])
+            self.assertEqual(len(路径列表), 8)
+            self.assertEqual(stat.S_IMODE(os.stat(路径列表[0]).st_mode), 0o600)
+
+            if PIL_AVAILABLE:
+                路径 = 导出GIF(self.载荷, os.path.join(临时目录, "动画.gif"), 200, 8)
+                with Image.open(路径) as 图像:
+                    self.assertEqual(图像.n_frames, 8)
+
+    def test_无效导出参数(self):
+        """测试空载荷、片段长度为0和帧数少于片段数时报ValueError，且不创建输出目录"""
+        with tempfile.TemporaryDirectory() as 临时目录:
+            输出目录 = os.path.join(临时目录, "帧")
+            for 载荷, 片段长度, 帧数 in ((b"", 100, None), (self.载荷, 0, None), (self.载荷, 100, -3),
+                                  (self.载荷, 100, 9)):
+                with self.subTest(片段长度=片段长度, 帧数=帧数):
+                    with self.assertRaises(ValueError):
+                        生成帧(载荷, 片段长度, 帧数)
+                    with self.assertRaises(ValueError):
+                        导出PNG帧(载荷, 输出目录, 片段长度, 帧数)
+                    if PIL_AVAILABLE:
+                        with self.assertRaises(ValueError):
+                            导出GIF(载荷, os.path.join(临时目录, "动画.gif"), 片段长度, 帧数)
+            self.assertEqual(os.listdir(临时目录), [])
+
+            空文件 = os.path.join(临时目录, "empty.bin")
+            open(空文件, "wb").close()
+            载荷文件 = os.path.join(临时目录, "payload.bin")
+            with open(载荷文件, "wb") as 文件:
+                文件.write(self.载荷)
+            with redirect_stderr(io.StringIO()):
+                self.assertEqual(主程序([空文件, "-o", 输出目录]), 1)
+                self.assertEqual(主程序([载荷文件, "-o", 输出目录, "-f", "0"]), 1)
+                self.assertEqual(主程序([载荷文件, "-o", os.path.join(临时目录, "x.gif"), "-n", "-3"]), 1)
+            self.assertEqual(sorted(os.listdir(临时目录)), ["empty.bin", "payload.bin"])
+
+
+if __name__ == "__main__":
+    unittest.main()
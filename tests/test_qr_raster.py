@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+二维码1位栅格化与PNG写入测试
+"""
+
+import unittest
+import sys
+import os
+import io
+import zlib
+import struct
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.qr_raster import 编码PNG, 像素行, 图像尺寸
+
+try:
+    import qrcode
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+
+def _解析PNG(内容: bytes):
+    """返回IHDR字段和解压后的扫描行数据"""
+    位置 = 8
+    头部 = None
+    数据 = b""
+    while 位置 < len(内容):
+        长度, = struct.unpack(">I", 内容[位置:位置 + 4])
+        类型 = 内容[位置 + 4:位置 + 8]
+        块 = 内容[位置 + 8:位置 + 8 + 长度]
+        if 类型 == b"IHDR":
+            头部 = struct.unpack(">IIBBBBB", 块)
+        elif 类型 == b"IDAT":
+            数据 += 块
+        位置 += 12 + 长度
+    return 头部, zlib.decompress(数据)
+
+
+class 二维码栅格化测试(unittest.TestCase):
+    """1位PNG写入的测试"""
+
+    def setUp(self):
+        """测试前的准备工作"""
+        self.矩阵 = [[(行 * 3 + 列) % 5 == 0 for 列 in range(21)] for 行 in range(21)]
+
+    def test_PNG头部(self):
+        """测试输出为1位灰度PNG且尺寸正确"""
+        内容 = 编码PNG(self.矩阵, 3, 2)
+        self.assertTrue(内容.startswith(b"\x89PNG\r\n\x1a\n"))
+        头部, 数据 = _解析PNG(内容)
+        self.assertEqual(头部, (75, 75, 1, 0, 0, 0, 0))
+        self.assertEqual(len(数据), 75 * (1 + 10))
+        self.assertEqual(图像尺寸(self.矩阵, 3, 2), 75)
+
+    def test_像素行(self):
+        """测试放大后的像素位与模块矩阵一致"""
+        行列表 = list(像素行(self.矩阵, 3, 2))
+        self.assertEqual(len(行列表), 25)
+        for 模块行号, 行 in enumerate(行列表):
+            位 = bin(int.from_bytes(行, "big"))[2:].zfill(len(行) * 8)
+            for x in range(75):
+                行号, 列号 = 模块行号 - 2, x // 3 - 2
+                深色 = 0 <= 行号 < 21 and 0 <= 列号 < 21 and self.矩阵[行号][列号]
+                self.assertEqual(位[x], "0" if 深色 else "1")
+
+    def test_无效参数(self):
+        """测试非法盒子大小和边框大小"""
+        with self.assertRaises(ValueError):
+            编码PNG(self.矩阵, 0, 4)
+        with self.assertRaises(ValueError):
+            编码PNG(self.矩阵, 10, -1)
+
+    @unittest.skipUnless(PIL_AVAILABLE, "需要安装qrcode和pillow库")
+    def test_与qrcode库渲染一致(self):
+        """测试不同盒子和边框大小下与qrcode库的标准图像逐像素一致"""
+        数据 = " ".join(["abandon"] * 23 + ["art"])
+        for 盒子大小, 边框大小 in ((10, 4), (1, 0), (3, 1), (7, 2)):
+            qr = qrcode.QRCode(box_size=盒子大小, border=边框大小,
+                               error_correction=qrcode.constants.ERROR_CORRECT_H)
+            qr.add_data(数据)
+            qr.make(fit=True)
+            参考图像 = qr.make_image().get_image().convert("L")
+            图像 = Image.open(io.BytesIO(编码PNG(qr.modules, 盒子大小, 边框大小))).convert("L")
+            self.assertEqual(图像.size, 参考图像.size)
+            self.assertEqual(图像.tobytes(), 参考图像.tobytes())
+
+
+if __name__ == "__main__":
+    unittest.main()
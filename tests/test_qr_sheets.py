@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+批量二维码页面生成测试
+"""
+
+import unittest
+import sys
+import os
+import io
+import stat
+import tempfile
+from unittest import mock
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.qr_sheets import 批量生成二维码页, 读取条目文件, 页面尺寸, 主程序
+from utils.qr_raster import 编码PNG
+
+try:
+    import qrcode
+    from PIL import Image
+    QRCODE_AVAILABLE = True
+except ImportError:
+    QRCODE_AVAILABLE = False
+
+
+@unittest.skipUnless(QRCODE_AVAILABLE, "需要安装qrcode和pillow库")
+class 二维码页面测试(unittest.TestCase):
+    """批量二维码页面的测试"""
+
+    def setUp(self):
+        """测试前的准备工作"""
+        self.临时目录 = tempfile.TemporaryDirectory()
+        self.版式 = {"列数": 2, "行数": 2, "单元格边长": 200, "页边距": 16}
+        self.条目列表 = [(f"addr-{i}", f"bc1qtestaddress{i:04d}") for i in range(5)]
+
+    def tearDown(self):
+        """测试后的清理工作"""
+        self.临时目录.cleanup()
+
+    def test_分页与索引(self):
+        """测试按网格分页、写出索引且页面仅所有者可读写"""
+        页面列表 = 批量生成二维码页(self.条目列表, self.临时目录.name, self.版式, 进程数=1)
+        self.assertEqual([页面["页号"] for 页面 in 页面列表], [1, 2])
+        self.assertEqual(页面列表[1]["标签"], ["addr-4"])
+        self.assertEqual(stat.S_IMODE(os.stat(页面列表[0]["文件"]).st_mode), 0o600)
+
+        图像 = Image.open(页面列表[0]["文件"])
+        self.assertEqual(图像.mode, "1")
+        self.assertEqual(图像.size, 页面尺寸(self.版式))
+        self.assertEqual(图像.size, (432, 432))
+
+        with open(os.path.join(self.临时目录.name, "索引.tsv"), encoding="utf-8") as 文件:
+            索引 = 文件.read().splitlines()
+        self.assertEqual(索引[1:], ["1\t1\t1\taddr-0", "1\t1\t2\taddr-1", "1\t2\t1\taddr-2",
+                                  "1\t2\t2\taddr-3", "2\t1\t1\taddr-4"])
+
+    def test_单元格内容与单个二维码一致(self):
+        """测试页面中每个单元格与单独渲染的二维码逐像素一致"""
+        页面列表 = 批量生成二维码页(self.条目列表[:4], self.临时目录.name, self.版式, 进程数=1)
+        页面 = Image.open(页面列表[0]["文件"]).convert("L")
+
+        for 序号, (_, 数据) in enumerate(self.条目列表[:4]):
+            qr = qrcode.QRCode(error_correction=qrcode.constants.ERROR_CORRECT_M, border=0)
+            qr.add_data(数据)
+            qr.make(fit=True)
+            盒子大小 = 200 // (len(qr.modules) + 8)
+            单个 = Image.open(io.BytesIO(编码PNG(qr.modules, 盒子大小, 4))).convert("L")
+            偏移 = (200 - 单个.width) // 2
+            左 = 16 + (序号 % 2) * 200 + 偏移
+            上 = 16 + (序号 // 2) * 200 + 偏移
+            self.assertEqual(页面.crop((左, 上, 左 + 单个.width, 上 + 单个.height)).tobytes(), 单个.tobytes())
+
+    def test_多进程结果一致(self):
+        """测试多进程与单进程生成的页面内容相同"""
+        单进程 = 批量生成二维码页(self.条目列表, os.path.join(self.临时目录.name, "a"), self.版式, 进程数=1)
+        多进程 = 批量生成二维码页(self.条目列表, os.path.join(self.临时目录.name, "b"), self.版式, 进程数=2)
+        for 甲, 乙 in zip(单进程, 多进程):
+            with open(甲["文件"], "rb") as 文件甲, open(乙["文件"], "rb") as 文件乙:
+                self.assertEqual(文件甲.read(), 文件乙.read())
+
+    def test_放不下的数据(self):
+        """测试数据太长时只记录该条目的错误"""
+        条目列表 = self.条目列表[:1] + [("long", "x" * 1800), ("overflow", "x" * 5000)]
+        版式 = dict(self.版式, 单元格边长=160)
+        页面列表 = 批量生成二维码页(条目列表, self.临时目录.name, 版式, 进程数=1)
+        self.assertEqual([标签 for 标签, _ in 页面列表[0]["错误"]], ["long", "overflow"])
+
+    def test_校验单元格(self):
+        """测试启用校验时解码结果不一致的条目被留空并计入错误"""
+        版式 = dict(self.版式, 校验=True)
+        页面列表 = 批量生成二维码页(self.条目列表, self.临时目录.name, 版式, 进程数=1)
+        self.assertEqual([页面["错误"] for 页面 in 页面列表], [[], []])
+
+        with mock.patch("utils.qr_sheets.解码1位像素行", side_effect=[b"bc1qtestaddress0000", b"wrong"]):
+            页面列表 = 批量生成二维码页(self.条目列表[:2], self.临时目录.name, 版式, 进程数=1)
+        self.assertEqual([标签 for 标签, _ in 页面列表[0]["错误"]], ["addr-1"])
+
+    def test_无效版式(self):
+        """测试非法版式被拒绝"""
+        for 版式 in ({"列数": 0}, {"单元格边长": 4}, {"错误纠正级别": "X"}, {"页边距": -8}):
+            with self.assertRaises(ValueError):
+                批量生成二维码页(self.条目列表, self.临时目录.name, 版式)
+
+    def test_条目文件与命令行(self):
+        """测试读取带标签和不带标签的条目文件并通过命令行生成"""
+        条目路径 = os.path.join(self.临时目录.name, "条目.txt")
+        with open(条目路径, "w", encoding="utf-8") as 文件:
+            文件.write("# 注释\nvault-1\tfirst data\n\nsecond data\n")
+        self.assertEqual(读取条目文件(条目路径), [("vault-1", "first data"), ("4", "second data")])
+
+        输出目录 = os.path.join(self.临时目录.name, "输出")
+        self.assertEqual(主程序([条目路径, "-o", 输出目录, "-j", "1", "--单元格边长", "160"]), 0)
+        self.assertEqual(sorted(os.listdir(输出目录)), ["page-0001.png", "索引.tsv"])
+
+
+if __name__ == "__main__":
+    unittest.main()
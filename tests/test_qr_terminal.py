@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+终端二维码显示测试
+"""
+
+import unittest
+import sys
+import os
+import io
+import subprocess
+from contextlib import redirect_stdout
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.qr_encoder import 编码
+from utils.qr_terminal import 渲染文本, 显示二维码, 主程序
+
+项目根目录 = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def _还原模块(文本: str, 边框大小: int):
+    """把半块文本还原为模块矩阵（前景为浅色模块）"""
+    上半 = {" ": False, "▄": False, "▀": True, "█": True}
+    下半 = {" ": False, "▄": True, "▀": False, "█": True}
+    行列表 = []
+    for 行 in 文本.split("\n"):
+        行列表.append([not 上半[字符] for 字符 in 行])
+        行列表.append([not 下半[字符] for 字符 in 行])
+    return [行[边框大小:-边框大小] for 行 in 行列表[边框大小:边框大小 + len(行列表[0]) - 2 * 边框大小]]
+
+
+class 终端二维码测试(unittest.TestCase):
+    """终端二维码显示的测试"""
+
+    def setUp(self):
+        """测试前的准备工作"""
+        self.地址 = "bc1qar0srrr7xfkvy5l643lydnw9re59gtzzwf5mdq"
+        self.矩阵 = 编码(self.地址, "L")
+
+    def test_半块渲染(self):
+        """测试每行文字表示两行模块且能还原出模块矩阵"""
+        文本 = 渲染文本(self.矩阵, 2)
+        行列表 = 文本.split("\n")
+        self.assertEqual(len(行列表), (len(self.矩阵) + 4 + 1) // 2)
+        self.assertTrue(all(len(行) == len(self.矩阵) + 4 for 行 in 行列表))
+        self.assertEqual(行列表[0], "█" * (len(self.矩阵) + 4))
+        self.assertEqual(_还原模块(文本, 2), self.矩阵)
+
+    def test_反色与ANSI颜色(self):
+        """测试反色交换前景和背景，ANSI颜色包裹每一行"""
+        普通 = 渲染文本(self.矩阵, 1)
+        反色 = 渲染文本(self.矩阵, 1, 反色=True)
+        互换 = str.maketrans({" ": "█", "█": " ", "▀": "▄", "▄": "▀"})
+        self.assertEqual(反色, 普通.translate(互换))
+
+        彩色 = 渲染文本(self.矩阵, 1, ANSI颜色=True, 反色=True)
+        self.assertTrue(all(行.startswith("\x1b[97;40m") and 行.endswith("\x1b[0m") for 行 in 彩色.split("\n")))
+        self.assertEqual(彩色.replace("\x1b[97;40m", "").replace("\x1b[0m", ""), 普通)
+
+        with self.assertRaises(ValueError):
+            渲染文本(self.矩阵, -1)
+
+    def test_显示与命令行(self):
+        """测试显示到指定输出流以及命令行入口"""
+        缓冲区 = io.StringIO()
+        显示二维码(self.地址, 输出=缓冲区)
+        self.assertEqual(缓冲区.getvalue(), 渲染文本(self.矩阵) + "\n")
+
+        缓冲区 = io.StringIO()
+        with redirect_stdout(缓冲区):
+            self.assertEqual(主程序([self.地址, "--无颜色"]), 0)
+        self.assertEqual(缓冲区.getvalue(), 渲染文本(self.矩阵) + "\n")
+
+    def test_不导入PIL和qrcode(self):
+        """测试显示二维码时不会导入PIL和qrcode"""
+        代码 = ("import sys, io; from utils.qr_terminal import 显示二维码; "
+              "显示二维码('bc1q', 输出=io.StringIO()); "
+              "print(sorted(m for m in ('PIL', 'qrcode') if m in sys.modules))")
+        结果 = subprocess.run([sys.executable, "-c", 代码], cwd=项目根目录,
+                            capture_output=True, text=True, check=True)
+        self.assertEqual(结果.stdout.strip(), "[]")
+
+
+if __name__ == "__main__":
+    unittest.main()
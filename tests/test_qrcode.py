@@ -9,14 +9,17 @@
 import unittest
 import sys
 import os
+import io
 import tempfile
 import base64
+from unittest import mock
 
 # 添加项目根目录到路径
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 try:
-    from utils.qrcode_generator import 二维码生成器
+    from utils.qrcode_generator import 二维码生成器, 获取标题字体, 渲染标题栏, _标题字体路径
+    from PIL import Image
     QRCODE_AVAILABLE = True
 except ImportError:
     QRCODE_AVAILABLE = False
@@ -150,6 +153,29 @@ class 二维码测试(unittest.TestCase):
         # 所以我们只是检查两个文件是否不同
         self.assertNotEqual(普通大小, 样式化大小)
     
+    @unittest.skipIf(not QRCODE_AVAILABLE, "二维码生成器依赖不可用，跳过测试")
+    def test_带标题二维码(self):
+        """测试带标题的二维码为灰度图像，标题栏下方与无标题的二维码逐像素一致"""
+        无标题 = Image.open(io.BytesIO(base64.b64decode(二维码生成器.生成二维码("测试数据", None))))
+        带标题 = Image.open(io.BytesIO(base64.b64decode(二维码生成器.生成二维码("测试数据", None, 标题="分享 1/3"))))
+        self.assertEqual(带标题.mode, "L")
+        self.assertEqual(带标题.size, (无标题.width, 无标题.height + 40))
+        self.assertEqual(带标题.crop((0, 40, 带标题.width, 带标题.height)).tobytes(),
+                         无标题.convert("L").tobytes())
+        # 标题栏上有文字
+        self.assertLess(min(带标题.crop((0, 0, 带标题.width, 40)).getdata()), 255)
+
+    @unittest.skipIf(not QRCODE_AVAILABLE, "二维码生成器依赖不可用，跳过测试")
+    def test_标题字体缓存(self):
+        """测试字体只探测和加载一次，之后生成带标题的二维码不再访问文件系统"""
+        二维码生成器.生成二维码("测试数据", None, 标题="第一个")
+        self.assertIs(获取标题字体(20), 获取标题字体(20))
+        self.assertIs(渲染标题栏("第一个", 330), 渲染标题栏("第一个", 330))
+
+        with mock.patch("os.path.exists", side_effect=AssertionError("不应再探测字体")):
+            二维码生成器.生成二维码("测试数据", None, 标题="第二个")
+        self.assertEqual(_标题字体路径.cache_info().misses, 1)
+
     def test_安全提示(self):
         """测试安全提示功能"""
         安全提示 = 二维码生成器.显示二维码安全提示()
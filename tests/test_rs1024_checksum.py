@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SLIP-39 RS1024校验和纠错测试
+"""
+
+import unittest
+import sys
+import os
+import random
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.rs1024_checksum import SLIP39_AVAILABLE, RS1024校验器, 单词表, 助记词转索引
+
+if SLIP39_AVAILABLE:
+    import shamir_mnemonic
+    from shamir_mnemonic import rs1024 as 参考实现
+
+
+@unittest.skipUnless(SLIP39_AVAILABLE, "需要安装shamir-mnemonic库")
+class RS1024校验测试(unittest.TestCase):
+    """RS1024校验器的测试"""
+
+    def setUp(self):
+        """测试前的准备工作"""
+        # 官方SLIP-39测试向量1（不可扩展）和向量43（可扩展）的分享
+        self.向量分享 = [
+            "duckling enlarge academic academic agency result length solution fridge kidney "
+            "coal piece deal husband erode duke ajar critical decision keyboard",
+            "enemy favorite academic acid cowboy phrase havoc level response walnut "
+            "budget painting inside trash adjust froth kitchen learn tidy punish",
+        ]
+        self.随机 = random.Random(39)
+
+    def test_有效分享(self):
+        """测试官方向量和新生成的分享都能通过校验"""
+        生成分享 = [分享 for 组 in shamir_mnemonic.generate_mnemonics(1, [(3, 5)], os.urandom(32))
+                for 分享 in 组]
+        self.assertEqual(RS1024校验器.批量验证(self.向量分享 + 生成分享),
+                         [True] * (len(self.向量分享) + len(生成分享)))
+        self.assertTrue(RS1024校验器.验证(self.向量分享[0].upper()))
+
+    def test_与参考实现一致(self):
+        """测试随机单词序列的校验结果与shamir-mnemonic一致"""
+        for _ in range(200):
+            索引 = [self.随机.randrange(1024) for _ in range(20)]
+            可扩展 = bool((索引[1] >> 4) & 1)
+            定制 = b"shamir_extendable" if 可扩展 else b"shamir"
+            索引[-3:] = 参考实现.create_checksum(索引[:-3], 定制)
+            助记词 = " ".join(单词表[i] for i in 索引)
+            self.assertTrue(RS1024校验器.验证(助记词))
+            self.assertEqual(助记词转索引(助记词), 索引)
+
+    def test_无效输入(self):
+        """测试未知单词和长度不足"""
+        单词 = self.向量分享[0].split()
+        self.assertEqual(RS1024校验器.批量验证([" ".join(单词[:-1]), " ".join(单词[:-1] + ["zzz"])]),
+                         [False, False])
+        with self.assertRaises(ValueError):
+            助记词转索引("academic zzz")
+
+    def test_定位所有位置的单个错误(self):
+        """测试每个位置上的替换错误都能唯一定位并纠正"""
+        for 分享 in self.向量分享:
+            单词 = 分享.split()
+            for 位置 in range(len(单词)):
+                错误单词 = list(单词)
+                while 错误单词[位置] == 单词[位置]:
+                    错误单词[位置] = self.随机.choice(单词表)
+                错误分享 = " ".join(错误单词)
+
+                self.assertFalse(RS1024校验器.验证(错误分享))
+                self.assertEqual(RS1024校验器.定位错误(错误分享), [(位置, 单词[位置])])
+                self.assertEqual(RS1024校验器.纠正(错误分享), 分享)
+
+    def test_未知单词视为擦除(self):
+        """测试不在单词表中的单词按已知位置纠正"""
+        单词 = self.向量分享[1].split()
+        for 位置 in (0, 1, 2, 10, 19):
+            错误单词 = list(单词)
+            错误单词[位置] = "notaword"
+            self.assertEqual(RS1024校验器.定位错误(" ".join(错误单词)), [(位置, 单词[位置])])
+
+    def test_多个错误无法纠正(self):
+        """测试两个错误单词时不给出错误的纠正"""
+        单词 = self.向量分享[0].split()
+        单词[3] = "zero" if 单词[3] != "zero" else "zone"
+        单词[12] = "zero" if 单词[12] != "zero" else "zone"
+        错误分享 = " ".join(单词)
+        self.assertFalse(RS1024校验器.验证(错误分享))
+        self.assertIsNone(RS1024校验器.纠正(错误分享))
+
+    def test_批量检查(self):
+        """测试批量检查只对无效分享给出建议"""
+        错误分享 = self.向量分享[0].replace("fridge", "frozen")
+        结果 = RS1024校验器.批量检查([self.向量分享[0], 错误分享])
+        self.assertEqual(结果[0], {"有效": True, "建议": []})
+        self.assertEqual(结果[1], {"有效": False, "建议": [(8, "fridge")]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SeedQR紧凑助记词二维码测试
+"""
+
+import unittest
+import sys
+import os
+import io
+import base64
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.seedqr import (
+    MNEMONIC_AVAILABLE, 助记词转SeedQR, SeedQR转助记词, 助记词转紧凑SeedQR, 紧凑SeedQR转助记词,
+    解码SeedQR, SeedQR模块矩阵,
+)
+from utils.qrcode_generator import 二维码生成器, QRCODE_AVAILABLE
+
+if QRCODE_AVAILABLE:
+    from PIL import Image
+
+
+@unittest.skipUnless(MNEMONIC_AVAILABLE, "需要安装mnemonic库")
+class SeedQR测试(unittest.TestCase):
+    """SeedQR编码和解码的测试"""
+
+    def setUp(self):
+        """测试前的准备工作"""
+        # SeedQR规范中的24词示例
+        self.助记词24 = ("attack pizza motion avocado network gather crop fresh patrol unusual wild holiday "
+                      "candy pony ranch winter theme error hybrid van cereal salon goddess expire")
+        self.数字串24 = ("0115132511540127119007710415074212891906200808700266134314202016"
+                      "17920614089619290300152408010643")
+        self.助记词12 = "abandon " * 11 + "about"
+
+    def test_规范示例(self):
+        """测试标准SeedQR与规范示例一致"""
+        self.assertEqual(助记词转SeedQR(self.助记词24), self.数字串24)
+        self.assertEqual(SeedQR转助记词(self.数字串24), self.助记词24)
+        self.assertEqual(助记词转SeedQR(self.助记词12), "0000" * 11 + "0003")
+
+    def test_紧凑格式往返(self):
+        """测试紧凑SeedQR的熵与助记词互相转换"""
+        self.assertEqual(助记词转紧凑SeedQR(self.助记词12), bytes(16))
+        for 熵 in (bytes(range(16)), bytes(range(20)), bytes(range(32))):
+            助记词 = 紧凑SeedQR转助记词(熵)
+            self.assertEqual(助记词转紧凑SeedQR(助记词), 熵)
+            self.assertEqual(解码SeedQR(熵), 助记词)
+            self.assertEqual(解码SeedQR(助记词转SeedQR(助记词)), 助记词)
+
+    def test_无效输入(self):
+        """测试无效助记词、数字串和熵被拒绝"""
+        for 助记词 in ("abandon " * 12, "abandon about", "notaword " * 11 + "about"):
+            with self.assertRaises(ValueError):
+                助记词转SeedQR(助记词)
+        for 数字串 in ("0000" * 11, "0000" * 11 + "000", "2048" * 12, "0000" * 12, "000a" * 12):
+            with self.assertRaises(ValueError):
+                SeedQR转助记词(数字串)
+        with self.assertRaises(ValueError):
+            紧凑SeedQR转助记词(bytes(17))
+
+    def test_符号尺寸(self):
+        """测试12词和24词在两种格式下的二维码尺寸符合规范"""
+        self.assertEqual(len(SeedQR模块矩阵(self.助记词12)), 25)
+        self.assertEqual(len(SeedQR模块矩阵(self.助记词24)), 29)
+        self.assertEqual(len(SeedQR模块矩阵(self.助记词12, 紧凑=True)), 21)
+        self.assertEqual(len(SeedQR模块矩阵(self.助记词24, 紧凑=True)), 25)
+
+    @unittest.skipUnless(QRCODE_AVAILABLE, "需要安装qrcode和pillow库")
+    def test_生成助记词二维码(self):
+        """测试二维码生成器的SeedQR编码方式生成更小的图像"""
+        尺寸 = {}
+        for 编码方式 in ("文本", "SeedQR", "紧凑SeedQR"):
+            结果 = 二维码生成器.生成助记词二维码(self.助记词24, None, 编码方式=编码方式)
+            尺寸[编码方式] = Image.open(io.BytesIO(base64.b64decode(结果))).width
+        self.assertEqual(尺寸["SeedQR"], (29 + 8) * 10)
+        self.assertEqual(尺寸["紧凑SeedQR"], (25 + 8) * 10)
+        self.assertGreater(尺寸["文本"], 尺寸["SeedQR"])
+        with self.assertRaises(ValueError):
+            二维码生成器.生成助记词二维码(self.助记词24, None, 编码方式="未知")
+
+        种子 = bytes(range(64))
+        十六进制 = Image.open(io.BytesIO(base64.b64decode(二维码生成器.生成种子二维码(种子))))
+        二进制 = Image.open(io.BytesIO(base64.b64decode(二维码生成器.生成种子二维码(种子, 二进制=True))))
+        self.assertLess(二进制.width, 十六进制.width)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SLIP-39 Shamir引擎测试
+使用官方SLIP-39测试向量(python-shamir-mnemonic/vectors.json)验证恢复结果
+"""
+
+import unittest
+import sys
+import os
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.shamir_engine import (
+    SLIP39_AVAILABLE, Shamir引擎, 生成SLIP39分享, 组合SLIP39分享, 摘要索引, 秘密索引
+)
+
+if SLIP39_AVAILABLE:
+    import shamir_mnemonic
+    from shamir_mnemonic import shamir as 参考实现
+
+
+class Shamir引擎测试(unittest.TestCase):
+    """GF(256)分割和插值的测试"""
+
+    def test_分割后任意阈值子集可恢复(self):
+        """测试任意阈值个分享都能恢复秘密"""
+        for 阈值, 分享数 in ((1, 1), (2, 2), (2, 3), (3, 5), (7, 16), (16, 16)):
+            秘密 = os.urandom(32)
+            分享 = Shamir引擎.分割秘密(阈值, 分享数, 秘密)
+            self.assertEqual([x for x, _ in 分享], list(range(分享数)))
+            self.assertEqual(Shamir引擎.恢复秘密(阈值, 分享[:阈值]), 秘密)
+            self.assertEqual(Shamir引擎.恢复秘密(阈值, 分享[-阈值:][::-1]), 秘密)
+
+    def test_插值经过已知点(self):
+        """测试插值多项式经过秘密点和摘要点"""
+        分享 = Shamir引擎.分割秘密(3, 5, bytes(range(16)))
+        秘密, 摘要分享 = Shamir引擎.插值多点(分享[1:4], [秘密索引, 摘要索引])
+        self.assertEqual(秘密, bytes(range(16)))
+        self.assertEqual(Shamir引擎.插值(分享[2:5], 摘要索引), 摘要分享)
+        self.assertEqual(Shamir引擎.插值(分享[:3], 4), 分享[4][1])
+
+    def test_摘要校验失败(self):
+        """测试分享被篡改时摘要校验失败"""
+        分享 = Shamir引擎.分割秘密(2, 3, os.urandom(16))
+        篡改 = (分享[1][0], bytes([分享[1][1][0] ^ 1]) + 分享[1][1][1:])
+        with self.assertRaises(ValueError):
+            Shamir引擎.恢复秘密(2, [分享[0], 篡改])
+
+    def test_无效参数(self):
+        """测试无效的分割参数和分享"""
+        with self.assertRaises(ValueError):
+            Shamir引擎.分割秘密(3, 2, bytes(16))
+        with self.assertRaises(ValueError):
+            Shamir引擎.分割秘密(2, 17, bytes(16))
+        with self.assertRaises(ValueError):
+            Shamir引擎.插值([(1, b"ab"), (1, b"cd")], 255)
+        with self.assertRaises(ValueError):
+            Shamir引擎.插值([(1, b"ab"), (2, b"c")], 255)
+        with self.assertRaises(ValueError):
+            Shamir引擎.恢复秘密(3, [(0, b"ab"), (1, b"cd")])
+
+    @unittest.skipUnless(SLIP39_AVAILABLE, "需要安装shamir-mnemonic库")
+    def test_与参考实现逐字节一致(self):
+        """测试使用相同随机源时分割结果与shamir-mnemonic完全一致"""
+        for 阈值, 分享数 in ((1, 1), (2, 3), (3, 5), (5, 16)):
+            随机数据 = os.urandom(4096)
+            位置 = [0]
+
+            def 随机源(长度):
+                位置[0] += 长度
+                return 随机数据[位置[0] - 长度:位置[0]]
+
+            秘密 = os.urandom(32)
+            本项目结果 = Shamir引擎.分割秘密(阈值, 分享数, 秘密, 随机源)
+            位置[0] = 0
+            原随机源 = 参考实现.RANDOM_BYTES
+            参考实现.RANDOM_BYTES = 随机源
+            try:
+                参考结果 = 参考实现._split_secret(阈值, 分享数, 秘密)
+            finally:
+                参考实现.RANDOM_BYTES = 原随机源
+            self.assertEqual(本项目结果, [(分享.x, 分享.data) for 分享 in 参考结果])
+
+
+@unittest.skipUnless(SLIP39_AVAILABLE, "需要安装shamir-mnemonic库")
+class SLIP39向量测试(unittest.TestCase):
+    """官方SLIP-39测试向量，密码短语均为TREZOR"""
+
+    def setUp(self):
+        """测试前的准备工作"""
+        # 格式: (向量说明, 分享列表, 主秘密)
+        self.有效向量 = [
+            ("1. Valid mnemonic without sharing (128 bits)",
+             ["duckling enlarge academic academic agency result length solution fridge kidney "
+              "coal piece deal husband erode duke ajar critical decision keyboard"],
+             "bb54aac4b89dc868ba37d9cc21b2cece"),
+            ("4. Basic sharing 2-of-3 (128 bits)",
+             ["shadow pistol academic always adequate wildlife fancy gross oasis cylinder "
+              "mustang wrist rescue view short owner flip making coding armed",
+              "shadow pistol academic acid actress prayer class unknown daughter sweater "
+              "depict flip twice unkind craft early superior advocate guest smoking"],
+             "b43ceb7e57a0ea8766221624d01b0864"),
+            ("43. Valid extendable mnemonic, basic sharing 2-of-3 (128 bits)",
+             ["enemy favorite academic acid cowboy phrase havoc level response walnut "
+              "budget painting inside trash adjust froth kitchen learn tidy punish",
+              "enemy favorite academic always academic sniff script carpet romp kind "
+              "promise scatter center unfair training emphasis evening belong fake enforce"],
+             "48b1a4b80b8c209ad42c33672bdaa428"),
+        ]
+
+    def test_有效向量(self):
+        """测试官方有效向量恢复出期望的主秘密"""
+        for 说明, 分享列表, 主秘密 in self.有效向量:
+            with self.subTest(说明):
+                self.assertEqual(组合SLIP39分享(分享列表, b"TREZOR").hex(), 主秘密)
+                self.assertEqual(组合SLIP39分享(分享列表[::-1], b"TREZOR").hex(), 主秘密)
+
+    def test_分享不足(self):
+        """测试2-of-3向量只给一个分享时失败"""
+        with self.assertRaises(ValueError):
+            组合SLIP39分享(self.有效向量[1][1][:1], b"TREZOR")
+
+    def test_校验和错误(self):
+        """测试修改最后一个词后校验和失败"""
+        单词 = self.有效向量[0][1][0].split()
+        单词[-1] = "kidney"
+        with self.assertRaises(ValueError):
+            组合SLIP39分享([" ".join(单词)], b"TREZOR")
+
+    def test_生成后两种实现均可恢复(self):
+        """测试本项目生成的分享可被参考实现恢复，反之亦然"""
+        主秘密 = os.urandom(32)
+        分组 = [(2, 3), (1, 1), (3, 5)]
+
+        本项目分享 = 生成SLIP39分享(2, 分组, 主秘密, b"TREZOR", 可扩展=False)
+        self.assertEqual(
+            shamir_mnemonic.combine_mnemonics(本项目分享[0][1:] + 本项目分享[2][:3], b"TREZOR"),
+            主秘密,
+        )
+        self.assertEqual(组合SLIP39分享(本项目分享[1] + 本项目分享[2][2:], b"TREZOR"), 主秘密)
+
+        参考分享 = shamir_mnemonic.generate_mnemonics(2, 分组, 主秘密, b"TREZOR")
+        self.assertEqual(组合SLIP39分享(参考分享[0][:2] + 参考分享[1], b"TREZOR"), 主秘密)
+
+    def test_无效主秘密(self):
+        """测试过短或奇数长度的主秘密被拒绝"""
+        for 主秘密 in (bytes(14), bytes(17)):
+            with self.assertRaises(ValueError):
+                生成SLIP39分享(1, [(1, 1)], 主秘密)
+
+
+if __name__ == "__main__":
+    unittest.main()
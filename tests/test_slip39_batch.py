@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SLIP-39批量分享生成测试
+"""
+
+import unittest
+import sys
+import os
+import json
+import stat
+import tempfile
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.slip39_batch import (
+    SLIP39_AVAILABLE, 加载清单, 批量生成分享, 迭代生成分享, 主程序
+)
+
+if SLIP39_AVAILABLE:
+    import shamir_mnemonic
+
+
+@unittest.skipUnless(SLIP39_AVAILABLE, "需要安装shamir-mnemonic库")
+class SLIP39批量生成测试(unittest.TestCase):
+    """批量分享生成的测试"""
+
+    def setUp(self):
+        """测试前的准备工作"""
+        self.临时目录 = tempfile.TemporaryDirectory()
+        self.模板 = {"组阈值": 2, "组": [[2, 3], [1, 1], [2, 2]]}
+        self.条目列表 = [
+            {"名称": f"vault-{i:03d}", "主秘密": os.urandom(16), "密码": "TREZOR" if i % 2 else ""}
+            for i in range(4)
+        ]
+
+    def tearDown(self):
+        """测试后的清理工作"""
+        self.临时目录.cleanup()
+
+    def _读取分享(self, 文件路径):
+        with open(文件路径, "r", encoding="utf-8") as 文件:
+            return [行 for 行 in 文件.read().splitlines() if 行 and not 行.startswith("#")]
+
+    def test_并行生成并写入文件(self):
+        """测试多进程生成的分享写入各自文件并能恢复原秘密"""
+        结果列表 = 批量生成分享(self.条目列表, self.模板, self.临时目录.name, 进程数=2)
+
+        self.assertEqual([结果["名称"] for 结果 in 结果列表], [条目["名称"] for 条目 in self.条目列表])
+        for 条目, 结果 in zip(self.条目列表, 结果列表):
+            self.assertNotIn("错误", 结果)
+            self.assertEqual(stat.S_IMODE(os.stat(结果["文件"]).st_mode), 0o600)
+
+            分享 = self._读取分享(结果["文件"])
+            self.assertEqual(len(分享), 3 + 1 + 2)
+            # 组1取2个成员，组2取唯一成员
+            恢复 = shamir_mnemonic.combine_mnemonics(分享[:2] + 分享[3:4], 条目["密码"].encode())
+            self.assertEqual(恢复, 条目["主秘密"])
+
+    def test_单进程迭代(self):
+        """测试进程数为1时顺序产出全部结果"""
+        结果 = dict(迭代生成分享(self.条目列表[:2], self.模板, 进程数=1))
+        self.assertEqual(set(结果), {"vault-000", "vault-001"})
+        self.assertEqual([len(组) for 组 in 结果["vault-000"]], [3, 1, 2])
+
+    def test_单个条目失败不影响其他条目(self):
+        """测试无效主秘密只导致对应条目失败"""
+        条目列表 = self.条目列表[:2] + [{"名称": "bad", "主秘密": b"short", "密码": ""}]
+        结果列表 = 批量生成分享(条目列表, self.模板, self.临时目录.name, 进程数=2)
+
+        self.assertIn("文件", 结果列表[0])
+        self.assertIn("文件", 结果列表[1])
+        self.assertIn("错误", 结果列表[2])
+        self.assertFalse(os.path.exists(os.path.join(self.临时目录.name, "bad.slip39.txt")))
+
+    def test_无效模板(self):
+        """测试无效的分组模板在启动进程前被拒绝"""
+        for 模板 in ({"组阈值": 3, "组": [[1, 1], [1, 1]]},
+                   {"组阈值": 1, "组": [[1, 3]]},
+                   {"组阈值": 1, "组": [[4, 3]]},
+                   {"组": [[1, 1]]}):
+            with self.assertRaises(ValueError):
+                批量生成分享(self.条目列表, 模板, self.临时目录.name)
+
+    def test_直接调用时检查名称(self):
+        """测试不经过清单直接调用时也拒绝路径名称和重复名称，且不写任何文件"""
+        输出目录 = os.path.join(self.临时目录.name, "输出")
+        for 名称列表 in (["vault-000", "../escape"], ["a\\b"], ["vault", " vault "], ["Vault", "vault"]):
+            条目列表 = [dict(self.条目列表[0], 名称=名称) for 名称 in 名称列表]
+            with self.subTest(名称列表=名称列表):
+                with self.assertRaises(ValueError):
+                    批量生成分享(条目列表, self.模板, 输出目录, 进程数=1)
+        self.assertFalse(os.path.exists(输出目录))
+
+        结果列表 = 批量生成分享([dict(self.条目列表[0], 名称=" padded ")], self.模板, 输出目录, 进程数=1)
+        self.assertEqual(结果列表[0]["名称"], "padded")
+        self.assertTrue(os.path.exists(os.path.join(输出目录, "padded.slip39.txt")))
+
+    def test_清单与命令行(self):
+        """测试从JSON清单加载并通过命令行入口生成"""
+        清单路径 = os.path.join(self.临时目录.name, "清单.json")
+        with open(清单路径, "w", encoding="utf-8") as 文件:
+            json.dump({
+                "模板": self.模板,
+                "秘密": [{"名称": "a", "主秘密": "bb54aac4b89dc868ba37d9cc21b2cece"},
+                       {"主秘密": "00" * 32}],
+            }, 文件)
+
+        模板, 条目列表 = 加载清单(清单路径)
+        self.assertEqual(模板["组"], [(2, 3), (1, 1), (2, 2)])
+        self.assertEqual([条目["名称"] for 条目 in 条目列表], ["a", "secret-0002"])
+        self.assertEqual(条目列表[0]["主秘密"], bytes.fromhex("bb54aac4b89dc868ba37d9cc21b2cece"))
+
+        输出目录 = os.path.join(self.临时目录.name, "输出")
+        self.assertEqual(主程序([清单路径, "-o", 输出目录, "-j", "1"]), 0)
+        self.assertEqual(sorted(os.listdir(输出目录)), ["a.slip39.txt", "secret-0002.slip39.txt"])
+
+    def test_迭代指数与成本记录(self):
+        """测试迭代指数传入分享，成本说明写在文件头部，命令行参数覆盖模板"""
+        模板 = dict(self.模板, 迭代指数=0)
+        结果列表 = 批量生成分享(self.条目列表[:1], 模板, self.临时目录.name, 进程数=1)
+        with open(结果列表[0]["文件"], "r", encoding="utf-8") as 文件:
+            self.assertIn("# 迭代指数 0（PBKDF2共 10,000 次迭代", 文件.read())
+        分享 = self._读取分享(结果列表[0]["文件"])
+        self.assertEqual(shamir_mnemonic.Share.from_mnemonic(分享[0]).iteration_exponent, 0)
+
+        with self.assertRaises(ValueError):
+            批量生成分享(self.条目列表, dict(self.模板, 迭代指数=16), self.临时目录.name)
+
+        清单路径 = os.path.join(self.临时目录.name, "清单.json")
+        with open(清单路径, "w", encoding="utf-8") as 文件:
+            json.dump({"模板": 模板, "秘密": [{"名称": "e", "主秘密": "00" * 16}]}, 文件)
+        输出目录 = os.path.join(self.临时目录.name, "输出")
+        self.assertEqual(主程序([清单路径, "-o", 输出目录, "-j", "1", "-e", "2"]), 0)
+        分享 = self._读取分享(os.path.join(输出目录, "e.slip39.txt"))
+        self.assertEqual(shamir_mnemonic.Share.from_mnemonic(分享[0]).iteration_exponent, 2)
+
+    def test_无效清单条目(self):
+        """测试清单中的非法名称和主秘密被拒绝"""
+        清单路径 = os.path.join(self.临时目录.name, "清单.json")
+        for 条目 in ({"名称": "../x", "主秘密": "00" * 16},
+                   {"名称": "x", "主秘密": "zz"},
+                   {"名称": "x", "主秘密": "00" * 15}):
+            with open(清单路径, "w", encoding="utf-8") as 文件:
+                json.dump({"模板": self.模板, "秘密": [条目]}, 文件)
+            with self.assertRaises(ValueError):
+                加载清单(清单路径)
+
+
+if __name__ == "__main__":
+    unittest.main()
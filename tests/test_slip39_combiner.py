@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SLIP-39增量分享组合器测试
+"""
+
+import unittest
+import sys
+import os
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.slip39_combiner import SLIP39_AVAILABLE, SLIP39增量组合器
+
+if SLIP39_AVAILABLE:
+    import shamir_mnemonic
+
+
+@unittest.skipUnless(SLIP39_AVAILABLE, "需要安装shamir-mnemonic库")
+class SLIP39增量组合器测试(unittest.TestCase):
+    """增量组合器的测试"""
+
+    def setUp(self):
+        """测试前的准备工作"""
+        self.主秘密 = bytes.fromhex("bb54aac4b89dc868ba37d9cc21b2cece")
+        self.分享组 = shamir_mnemonic.generate_mnemonics(
+            2, [(2, 3), (1, 1), (3, 5)], self.主秘密, b"TREZOR"
+        )
+        self.组合器 = SLIP39增量组合器()
+
+    def test_逐个添加并提前完成(self):
+        """测试达到阈值时立即完成，不需要输入全部分享"""
+        状态 = self.组合器.添加分享(self.分享组[2][4])
+        self.assertEqual((状态["组索引"], 状态["成员索引"]), (2, 4))
+        self.assertFalse(状态["组已完成"])
+
+        状态 = self.组合器.添加分享(self.分享组[1][0])
+        self.assertTrue(状态["组已完成"])
+        self.assertFalse(状态["已完成"])
+        self.assertEqual(self.组合器.已完成组, [1])
+
+        self.组合器.添加分享(self.分享组[2][1])
+        状态 = self.组合器.添加分享(self.分享组[2][0])
+        self.assertTrue(状态["已完成"])
+        self.assertEqual(self.组合器.主秘密("TREZOR"), self.主秘密)
+
+        进度 = self.组合器.进度()
+        self.assertEqual(进度["已完成组数"], 2)
+        self.assertEqual(进度["组"][2], {"已有": 3, "需要": 3, "已完成": True})
+
+    def test_完成后继续添加(self):
+        """测试完成后多余的分享只做元数据检查"""
+        for 分享 in (self.分享组[0][0], self.分享组[0][1], self.分享组[1][0]):
+            self.组合器.添加分享(分享)
+        self.assertTrue(self.组合器.已完成)
+
+        状态 = self.组合器.添加分享(self.分享组[0][2])
+        self.assertTrue(状态["已完成"])
+        self.assertEqual(self.组合器.进度()["组"][0]["已有"], 3)
+        self.assertEqual(self.组合器.主秘密("TREZOR"), self.主秘密)
+
+    def test_重复分享(self):
+        """测试重复输入同一分享"""
+        self.组合器.添加分享(self.分享组[0][0])
+        状态 = self.组合器.添加分享("  " + self.分享组[0][0].upper() + " ")
+        self.assertTrue(状态["重复"])
+        self.assertEqual(self.组合器.进度()["组"][0]["已有"], 1)
+
+    def test_校验和错误立即拒绝(self):
+        """测试校验和错误的分享被拒绝且不改变状态"""
+        self.组合器.添加分享(self.分享组[0][0])
+        单词 = self.分享组[0][1].split()
+        单词[5] = "academic" if 单词[5] != "academic" else "acid"
+
+        with self.assertRaises(ValueError):
+            self.组合器.添加分享(" ".join(单词))
+        self.assertEqual(self.组合器.进度()["组"][0]["已有"], 1)
+
+        self.组合器.添加分享(self.分享组[0][1])
+        self.assertIn(0, self.组合器.已完成组)
+
+    def test_错误单词给出纠正建议(self):
+        """测试单个单词输错时错误信息指出位置和建议单词"""
+        单词 = self.分享组[1][0].split()
+        原单词 = 单词[9]
+        单词[9] = "academic" if 原单词 != "academic" else "acid"
+
+        with self.assertRaises(ValueError) as 上下文:
+            self.组合器.添加分享(" ".join(单词))
+        self.assertIn("第 10 个单词", str(上下文.exception))
+        self.assertIn(原单词, str(上下文.exception))
+
+    def test_不同分享集被拒绝(self):
+        """测试标识符不同的分享被拒绝"""
+        其他分享组 = shamir_mnemonic.generate_mnemonics(2, [(2, 3), (1, 1), (3, 5)], self.主秘密)
+        self.组合器.添加分享(self.分享组[0][0])
+
+        with self.assertRaises(ValueError):
+            self.组合器.添加分享(其他分享组[0][1])
+        self.assertEqual(self.组合器.进度()["组"][0]["已有"], 1)
+
+    def test_未完成时不能恢复(self):
+        """测试分享不足时获取主秘密报错"""
+        self.组合器.添加分享(self.分享组[2][0])
+        with self.assertRaises(ValueError):
+            self.组合器.主秘密("TREZOR")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SLIP-39迭代指数成本校准测试
+"""
+
+import unittest
+import sys
+import os
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.slip39_cost import 总迭代次数, 测量PBKDF2速度, 估计耗时, 推荐迭代指数, 校准, 成本说明
+from utils.shamir_engine import SLIP39_AVAILABLE, 生成SLIP39分享
+
+if SLIP39_AVAILABLE:
+    import shamir_mnemonic
+
+
+class 迭代指数成本测试(unittest.TestCase):
+    """成本估计与推荐的测试"""
+
+    def test_总迭代次数(self):
+        """测试总迭代次数与SLIP-39规范一致"""
+        self.assertEqual(总迭代次数(0), 10000)
+        self.assertEqual(总迭代次数(1), 20000)
+        self.assertEqual(总迭代次数(15), 10000 << 15)
+        for 迭代指数 in (-1, 16):
+            with self.assertRaises(ValueError):
+                总迭代次数(迭代指数)
+
+    def test_推荐迭代指数(self):
+        """测试推荐值是不超过目标耗时的最大指数"""
+        速度 = 1_000_000
+        self.assertEqual(推荐迭代指数(0.04, 速度), 2)
+        self.assertEqual(推荐迭代指数(0.0399, 速度), 1)
+        self.assertEqual(推荐迭代指数(0.001, 速度), 0)
+        self.assertEqual(推荐迭代指数(1e9, 速度), 15)
+        with self.assertRaises(ValueError):
+            推荐迭代指数(0, 速度)
+
+    def test_校准(self):
+        """测试校准结果包含全部指数且耗时逐级翻倍"""
+        结果 = 校准(1.0, 每秒迭代次数=1_000_000)
+        self.assertEqual(len(结果["指数表"]), 16)
+        self.assertAlmostEqual(结果["指数表"][3]["耗时"], 估计耗时(3, 1_000_000))
+        self.assertAlmostEqual(结果["指数表"][4]["耗时"] / 结果["指数表"][3]["耗时"], 2.0)
+        self.assertEqual(结果["推荐迭代指数"], 6)
+        self.assertIn("迭代指数 6", 成本说明(6, 1_000_000))
+
+    def test_测量速度(self):
+        """测试测量得到正的速度"""
+        self.assertGreater(测量PBKDF2速度(0.01), 0)
+
+    @unittest.skipUnless(SLIP39_AVAILABLE, "需要安装shamir-mnemonic库")
+    def test_分享使用指定迭代指数(self):
+        """测试生成的分享携带指定的迭代指数并能恢复"""
+        主秘密 = os.urandom(16)
+        分享组 = 生成SLIP39分享(1, [(1, 1)], 主秘密, b"TREZOR", 迭代指数=0)
+        self.assertEqual(shamir_mnemonic.Share.from_mnemonic(分享组[0][0]).iteration_exponent, 0)
+        self.assertEqual(shamir_mnemonic.combine_mnemonics(分享组[0], b"TREZOR"), 主秘密)
+        with self.assertRaises(ValueError):
+            生成SLIP39分享(1, [(1, 1)], 主秘密, 迭代指数=16)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SLIP-39分享堆组合恢复测试
+"""
+
+import unittest
+import sys
+import os
+import io
+import stat
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.slip39_recovery import SLIP39_AVAILABLE, 从分享堆恢复, 整理分享堆, 枚举尝试, 主程序
+from utils.wallet_address import 钱包地址生成器
+
+if SLIP39_AVAILABLE:
+    import shamir_mnemonic
+
+
+def _改错单词(分享: str, 位置: int) -> str:
+    单词 = 分享.split()
+    单词[位置] = "zero" if 单词[位置] != "zero" else "zoom"
+    return " ".join(单词)
+
+
+@unittest.skipUnless(SLIP39_AVAILABLE, "需要安装shamir-mnemonic库")
+class 分享堆恢复测试(unittest.TestCase):
+    """分享堆恢复的测试"""
+
+    def setUp(self):
+        """测试前的准备工作"""
+        self.主秘密 = bytes.fromhex("bb54aac4b89dc868ba37d9cc21b2cece")
+        self.分享组 = shamir_mnemonic.generate_mnemonics(
+            2, [(3, 5), (2, 4), (1, 1)], self.主秘密, b"TREZOR"
+        )
+        # 另一分享集的分享不足以恢复，只作为干扰
+        其他分享组 = shamir_mnemonic.generate_mnemonics(2, [(2, 3), (2, 3)], os.urandom(16))
+        self.干扰分享 = 其他分享组[0][:2] + 其他分享组[1][:1]
+
+    def test_混杂分享堆(self):
+        """测试混有其他分享集、重复和错误分享时仍能恢复"""
+        分享堆 = (
+            self.干扰分享
+            + [_改错单词(self.分享组[0][1], 7), "not a share"]
+            + self.分享组[0][2:] + [self.分享组[0][0]] * 2
+            + self.分享组[1][:2]
+        )
+        for 进程数 in (1, 2):
+            结果 = 从分享堆恢复(分享堆, "TREZOR", 进程数=进程数, 纠正单词错误=False)
+            self.assertTrue(结果["成功"])
+            self.assertEqual(结果["主秘密"], self.主秘密)
+            self.assertEqual(结果["确认方式"], "摘要")
+            self.assertEqual(len(结果["使用分享"]), 5)
+            self.assertGreaterEqual(结果["尝试次数"], 1)
+            self.assertIn((3, "校验和无效"), 结果["拒绝"])
+            self.assertIn((4, "校验和无效"), 结果["拒绝"])
+            self.assertIn((9, "重复"), 结果["拒绝"])
+
+    def test_纠正单个错误单词(self):
+        """测试只有单个错误单词的分享被纠正后参与恢复"""
+        分享堆 = [_改错单词(self.分享组[1][0], 12), self.分享组[1][1], self.分享组[2][0]]
+        结果 = 从分享堆恢复(分享堆, "TREZOR", 进程数=1)
+        self.assertTrue(结果["成功"])
+        self.assertEqual(结果["主秘密"], self.主秘密)
+        self.assertEqual([(序号, 位置) for 序号, 位置, _ in 结果["纠正"]], [(0, 12)])
+
+    def test_分享不足(self):
+        """测试无法凑齐阈值时报告失败"""
+        结果 = 从分享堆恢复(self.干扰分享 + self.分享组[0][:2], 进程数=1)
+        self.assertFalse(结果["成功"])
+        self.assertIsNone(结果["主秘密"])
+
+    def test_枚举只选不同成员索引(self):
+        """测试同一成员索引的分享不会出现在同一子集中"""
+        整理结果 = 整理分享堆(self.分享组[0][:3] + self.分享组[1][:2])
+        尝试列表 = list(枚举尝试(整理结果))
+        self.assertEqual(len(尝试列表), 1)
+        self.assertEqual(len(整理结果["分享集"]), 1)
+
+    def test_阈值为1时需要目标地址确认(self):
+        """测试没有摘要分享时不接受未经确认的重建"""
+        分享组 = shamir_mnemonic.generate_mnemonics(1, [(1, 1)], self.主秘密)
+        结果 = 从分享堆恢复(分享组[0], 进程数=1)
+        self.assertFalse(结果["成功"])
+
+    @unittest.skipUnless(钱包地址生成器.检查依赖(), "需要安装hdwallet库")
+    def test_目标地址确认(self):
+        """测试用目标地址确认重建结果"""
+        分享组 = shamir_mnemonic.generate_mnemonics(1, [(1, 1)], self.主秘密)
+        目标地址 = 钱包地址生成器.批量生成地址(self.主秘密, "BTC", 0, 3, 1).所有地址()[0]
+        结果 = 从分享堆恢复(分享组[0], 目标地址=目标地址, 检查地址数=5, 进程数=1)
+        self.assertTrue(结果["成功"])
+        self.assertEqual(结果["确认方式"], "地址")
+        self.assertEqual(结果["主秘密"], self.主秘密)
+
+        结果 = 从分享堆恢复(分享组[0], 目标地址=目标地址, 检查地址数=3, 进程数=1)
+        self.assertFalse(结果["成功"])
+
+    def test_命令行输出完整主秘密(self):
+        """测试命令行默认只显示首尾，--显示输出完整主秘密，-o写入仅所有者可读写的文件"""
+        主秘密 = os.urandom(32)
+        分享组 = shamir_mnemonic.generate_mnemonics(1, [(2, 3)], 主秘密)
+        with tempfile.TemporaryDirectory() as 临时目录:
+            分享路径 = os.path.join(临时目录, "分享.txt")
+            with open(分享路径, "w", encoding="utf-8") as 文件:
+                文件.write("# 分享堆\n" + "\n".join(分享组[0]) + "\n")
+
+            def 运行(*选项):
+                输出, 错误输出 = io.StringIO(), io.StringIO()
+                with redirect_stdout(输出), redirect_stderr(错误输出):
+                    self.assertEqual(主程序([分享路径, "-j", "1", *选项]), 0)
+                return 输出.getvalue(), 错误输出.getvalue()
+
+            输出, _ = 运行()
+            self.assertNotIn(主秘密.hex(), 输出)
+            self.assertIn(主秘密.hex()[:16], 输出)
+
+            输出, 错误输出 = 运行("--显示")
+            self.assertIn(主秘密.hex(), 输出)
+            self.assertIn("⚠️", 错误输出)
+
+            秘密路径 = os.path.join(临时目录, "秘密.txt")
+            输出, _ = 运行("-o", 秘密路径)
+            self.assertNotIn(主秘密.hex(), 输出)
+            with open(秘密路径, "r", encoding="utf-8") as 文件:
+                self.assertEqual(bytes.fromhex(文件.read().strip()), 主秘密)
+            if os.name != "nt":
+                self.assertEqual(stat.S_IMODE(os.stat(秘密路径).st_mode), 0o600)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,12 +10,15 @@ import unittest
 import sys
 import os
 import re
+import subprocess
+import tracemalloc
+from unittest import mock
 
 # 添加项目根目录到路径
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 try:
-    from utils.wallet_address import 钱包地址生成器
+    from utils.wallet_address import 钱包地址生成器, 地址批次, 地址记录
     WALLET_ADDRESS_AVAILABLE = True
 except ImportError:
     WALLET_ADDRESS_AVAILABLE = False
@@ -109,6 +112,150 @@ class 钱包地址测试(unittest.TestCase):
         self.assertIn("钱包地址安全提示", 安全提示)
         self.assertIn("钱包地址是公开信息", 安全提示)
 
+    
+    def test_已知地址向量(self):
+        """测试BIP-44已知地址向量"""
+        比特币地址信息 = 钱包地址生成器.从助记词生成地址(self.测试助记词, self.测试密码短语, "BTC")
+        以太坊地址信息 = 钱包地址生成器.从助记词生成地址(self.测试助记词, self.测试密码短语, "ETH")
+        
+        self.assertEqual(比特币地址信息["地址"], "1LqBGSKuX5yYUonjxT5qGfpUsXKYYWeabA")
+        self.assertEqual(以太坊地址信息["地址"], "0x9858EfFD232B4033E47d90003D41EC34EcaEda94")
+        self.assertTrue(比特币地址信息["扩展公钥"].startswith("xpub6BosfCnifzxcFwrSzQiqu2DBVTshkCXacvNs"))
+    
+    def test_内置哈希回退(self):
+        """测试hashlib缺少ripemd160且未安装pycryptodome时地址不变"""
+        from utils import hash_functions
+        with mock.patch.object(hash_functions, "RIPEMD160_原生可用", False), \
+                mock.patch.object(hash_functions, "KECCAK_原生可用", False), \
+                mock.patch.object(hash_functions, "_原生keccak", None):
+            比特币地址信息 = 钱包地址生成器.从助记词生成地址(self.测试助记词, self.测试密码短语, "BTC")
+            以太坊批次 = 钱包地址生成器.从助记词批量生成地址(self.测试助记词, self.测试密码短语, "ETH", 数量=2)
+            
+            self.assertEqual(比特币地址信息["地址"], "1LqBGSKuX5yYUonjxT5qGfpUsXKYYWeabA")
+            self.assertEqual(以太坊批次[0].地址, "0x9858EfFD232B4033E47d90003D41EC34EcaEda94")
+            self.assertEqual(以太坊批次.所有地址(), [记录.地址 for 记录 in 以太坊批次])
+    
+    def test_隔离见证地址(self):
+        """测试P2WPKH地址生成"""
+        比特币地址信息 = 钱包地址生成器.从助记词生成地址(self.测试助记词, self.测试密码短语, "BTC")
+        狗狗币地址信息 = 钱包地址生成器.从助记词生成地址(self.测试助记词, self.测试密码短语, "DOGE")
+        
+        self.assertEqual(比特币地址信息["隔离见证地址"], "bc1qmxrw6qdh5g3ztfcwm0et5l8mvws4eva24kmp8m")
+        self.assertIsNone(狗狗币地址信息["隔离见证地址"])
+        
+        批次 = 钱包地址生成器.从助记词批量生成地址(self.测试助记词, self.测试密码短语, "LTC", 数量=3)
+        self.assertEqual(批次.所有隔离见证地址(), [记录.隔离见证地址 for 记录 in 批次])
+        self.assertTrue(all(地址.startswith("ltc1q") for 地址 in 批次.所有隔离见证地址()))
+    
+    def test_批量生成地址(self):
+        """测试批量生成与单个生成结果一致"""
+        批次 = 钱包地址生成器.从助记词批量生成地址(self.测试助记词, self.测试密码短语, "BTC", 起始索引=3, 数量=4)
+        
+        self.assertEqual(len(批次), 4)
+        for 记录 in 批次:
+            单个记录 = 钱包地址生成器.从助记词生成地址(self.测试助记词, self.测试密码短语, "BTC", 地址索引=记录.地址索引)
+            self.assertEqual(记录.地址, 单个记录["地址"])
+            self.assertEqual(记录.HD路径, 单个记录["HD路径"])
+        
+        self.assertEqual(批次[-1].地址索引, 6)
+        self.assertEqual(批次.所有地址(), [记录.地址 for 记录 in 批次])
+    
+    def test_账户扩展公钥(self):
+        """测试批量生成的账户扩展公钥与地址批次中的一致"""
+        种子 = bytes.fromhex("5eb00bbddcf069084889a8ab9155568165f5c453ccb85e70811aaed6f6da5fc19a5ac40b389cd370d086206dec8aa6c43daea6690f20ad3d8d48b2d2ce9e38e4")
+        扩展公钥列表 = 钱包地址生成器.生成账户扩展公钥(种子, "BTC", 起始账户=0, 数量=3)
+        
+        self.assertEqual(len(扩展公钥列表), 3)
+        self.assertEqual(len(set(扩展公钥列表)), 3)
+        for 账户索引, 扩展公钥 in enumerate(扩展公钥列表):
+            self.assertEqual(钱包地址生成器.批量生成地址(种子, "BTC", 账户索引).扩展公钥, 扩展公钥)
+        
+        批次 = 钱包地址生成器.批量生成地址(种子, "DOGE", 数量=5)
+        self.assertEqual(批次.所有地址(), [记录.地址 for 记录 in 批次])
+    
+    def test_批量索引范围(self):
+        """测试账户索引和地址索引超出非硬化范围时报错"""
+        种子 = bytes(64)
+        for 参数 in ({"账户索引": -1}, {"账户索引": 2 ** 31}, {"起始索引": -1},
+                   {"起始索引": 2 ** 31 - 1, "数量": 2}):
+            with self.subTest(参数=参数):
+                with self.assertRaises(ValueError):
+                    钱包地址生成器.批量生成地址(种子, "BTC", **参数)
+        with self.assertRaises(ValueError):
+            钱包地址生成器.生成账户扩展公钥(种子, "BTC", 起始账户=2 ** 31 - 1, 数量=2)
+        
+        批次 = 钱包地址生成器.批量生成地址(种子, "BTC", 账户索引=2 ** 31 - 1, 起始索引=2 ** 31 - 1)
+        self.assertEqual(批次[0].地址索引, 2 ** 31 - 1)
+    
+    def test_地址记录兼容字典访问(self):
+        """测试地址记录的字典式访问"""
+        记录 = 钱包地址生成器.从助记词生成地址(self.测试助记词, self.测试密码短语, "LTC")
+        
+        self.assertIsInstance(记录, 地址记录)
+        self.assertEqual(set(记录.转字典().keys()), set(地址记录.字段))
+        self.assertNotIn("私钥", 记录)
+        self.assertIsNone(记录.get("私钥"))
+        with self.assertRaises(KeyError):
+            记录["私钥"]
+        self.assertFalse(hasattr(记录, "__dict__"))
+    
+    def test_不支持的币种(self):
+        """测试不支持的币种返回错误信息"""
+        地址信息 = 钱包地址生成器.从助记词生成地址(self.测试助记词, self.测试密码短语, "XYZ")
+        self.assertIn("错误", 地址信息)
+    
+    def test_批次内存占用(self):
+        """测试批次存储比逐个字典存储节省内存"""
+        样本 = 钱包地址生成器.从助记词生成地址(self.测试助记词, self.测试密码短语, "BTC")
+        数量 = 2000
+        
+        tracemalloc.start()
+        批次 = 地址批次("BTC", 0, 样本["扩展公钥"])
+        for _ in range(数量):
+            批次.添加公钥(样本.公钥字节)
+        批次内存 = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        
+        # 旧接口每个地址各自持有一份字符串副本
+        tracemalloc.start()
+        字典列表 = [{键: (值 if not isinstance(值, str) else "".join(值)) for 键, 值 in 样本.转字典().items()} for _ in range(数量)]
+        字典内存 = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        
+        self.assertGreater(字典内存, 批次内存 * 4)
+
+
+
+class 延迟导入测试(unittest.TestCase):
+    """钱包地址模块导入开销的回归测试"""
+    
+    def _运行(self, 代码: str) -> str:
+        项目根目录 = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        结果 = subprocess.run([sys.executable, "-c", 代码], cwd=项目根目录,
+                            capture_output=True, text=True, check=True)
+        return 结果.stdout.strip()
+    
+    def test_导入时不加载依赖(self):
+        """测试导入模块和检查依赖不会导入HD钱包依赖库"""
+        输出 = self._运行(
+            "import sys\n"
+            "from utils.wallet_address import 钱包地址生成器\n"
+            "钱包地址生成器.检查依赖()\n"
+            "print(sorted(m for m in ('hdwallet', 'ecdsa', 'base58', 'bech32', 'Crypto') if m in sys.modules))"
+        )
+        self.assertEqual(输出, "[]")
+    
+    @unittest.skipIf(not WALLET_ADDRESS_AVAILABLE or not 钱包地址生成器.检查依赖(), "钱包地址依赖不可用，跳过测试")
+    def test_首次派生时加载依赖(self):
+        """测试首次派生地址时才加载依赖库"""
+        输出 = self._运行(
+            "import sys\n"
+            "from utils.wallet_address import 钱包地址生成器\n"
+            "钱包地址生成器.批量生成地址(bytes(64))\n"
+            "print('hdwallet' in sys.modules)"
+        )
+        self.assertEqual(输出, "True")
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
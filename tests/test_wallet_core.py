@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+钱包核心引擎测试
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+import subprocess
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.wallet_core import 熵池, 钱包生成器, MNEMONIC_AVAILABLE
+
+# 导入耗时的上限（秒）；原先导入时仅固定等待预加载线程就要0.1秒，再加上依赖库的导入
+导入耗时上限 = 0.15
+
+
+class 无副作用导入测试(unittest.TestCase):
+    """导入引擎和交互菜单模块不应读写文件、启动线程或等待"""
+
+    def _导入(self, 模块: str) -> dict:
+        """在临时主目录下的子进程中导入模块，返回导入耗时、线程数、已导入的依赖库和主目录内容"""
+        项目根目录 = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        with tempfile.TemporaryDirectory() as 主目录:
+            代码 = (
+                "import sys, os, time, json, threading\n"
+                "开始 = time.perf_counter()\n"
+                f"import {模块}\n"
+                "耗时 = time.perf_counter() - 开始\n"
+                "print(json.dumps({'耗时': 耗时, '线程数': threading.active_count(),\n"
+                "    '依赖库': sorted(m for m in ('mnemonic', 'cryptography', 'shamir_mnemonic') if m in sys.modules),\n"
+                "    '主目录': os.listdir(os.path.expanduser('~'))}))\n"
+            )
+            环境 = dict(os.environ, HOME=主目录, USERPROFILE=主目录)
+            结果 = subprocess.run([sys.executable, "-c", 代码], cwd=项目根目录, env=环境,
+                                capture_output=True, text=True, check=True)
+        return json.loads(结果.stdout)
+
+    def test_导入引擎无副作用(self):
+        """测试导入utils.wallet_core不创建文件、不启动线程、不导入依赖库，且在预算内完成"""
+        结果 = self._导入("utils.wallet_core")
+        self.assertEqual(结果["主目录"], [])
+        self.assertEqual(结果["线程数"], 1)
+        self.assertEqual(结果["依赖库"], [])
+        self.assertLess(结果["耗时"], 导入耗时上限)
+
+    def test_导入交互菜单无副作用(self):
+        """测试导入交互菜单模块也不创建配置文件、不启动线程"""
+        结果 = self._导入("crypto_wallet_secure_optimized")
+        self.assertEqual(结果["主目录"], [])
+        self.assertEqual(结果["线程数"], 1)
+        self.assertEqual(结果["依赖库"], [])
+        self.assertLess(结果["耗时"], 导入耗时上限)
+
+
+class 引擎配置测试(unittest.TestCase):
+    """配置项通过构造参数传入引擎"""
+
+    def test_熵源数量(self):
+        """测试熵池按传入的熵源数量判断是否健康"""
+        池 = 熵池(要求熵源数=2)
+        池.添加熵("一", b"\x01" * 32)
+        self.assertFalse(池.熵池是否健康())
+        池.添加熵("二", b"\x02" * 32)
+        self.assertTrue(池.熵池是否健康())
+        self.assertEqual(池.获取熵池状态()["熵池健康度"], 100)
+
+    @unittest.skipIf(not MNEMONIC_AVAILABLE, "未安装mnemonic库，跳过测试")
+    def test_助记词语言(self):
+        """测试钱包生成器使用传入的助记词语言"""
+        生成器 = 钱包生成器("english", 要求熵源数=1)
+        self.assertEqual(生成器.语言, "english")
+        self.assertEqual(生成器.熵源生成器.熵池.要求熵源数, 1)
+        self.assertTrue(生成器.验证助记词("abandon " * 11 + "about"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Base58/Base58Check编码工具
+用于传统地址(P2PKH)和扩展公钥的编码，按58^10分块做大整数除法
+"""
+
+import hashlib
+from typing import List, Optional, Sequence
+
+
+字母表 = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+# 每次除以58^10，一次大整数除法产出10个Base58字符
+_块位数 = 10
+_块基数 = 58 ** _块位数
+
+# 两位Base58字符查找表（58^2项），把每块的10位拆成5次小整数除法
+_双字符表 = [a + b for a in 字母表 for b in 字母表]
+
+# 字符到数值的反查表，非法字符为-1
+_字符值 = [-1] * 128
+for _值, _字符 in enumerate(字母表):
+    _字符值[ord(_字符)] = _值
+
+
+def _块转字符(值: int) -> str:
+    """将小于58^10的整数转换为定长10位Base58字符串"""
+    表 = _双字符表
+    值, r0 = divmod(值, 3364)
+    值, r1 = divmod(值, 3364)
+    值, r2 = divmod(值, 3364)
+    r4, r3 = divmod(值, 3364)
+    return 表[r4] + 表[r3] + 表[r2] + 表[r1] + 表[r0]
+
+
+def _双重SHA256(数据: bytes, 前缀哈希=None) -> bytes:
+    """计算SHA256(SHA256(数据))，可传入已更新过公共前缀的哈希对象"""
+    if 前缀哈希 is None:
+        第一轮 = hashlib.sha256(数据)
+    else:
+        第一轮 = 前缀哈希.copy()
+        第一轮.update(数据)
+    return hashlib.sha256(第一轮.digest()).digest()
+
+
+class Base58编码器:
+    """Base58和Base58Check编码器"""
+
+    @staticmethod
+    def 编码(数据: bytes) -> str:
+        """
+        Base58编码
+
+        参数:
+            数据: 原始字节
+
+        返回:
+            Base58字符串，每个前导零字节编码为一个'1'
+        """
+        去零数据 = 数据.lstrip(b"\0")
+        前导零数 = len(数据) - len(去零数据)
+        整数 = int.from_bytes(去零数据, "big")
+
+        块列表 = []
+        while 整数:
+            整数, 余数 = divmod(整数, _块基数)
+            块列表.append(_块转字符(余数))
+        块列表.reverse()
+
+        return "1" * 前导零数 + "".join(块列表).lstrip("1")
+
+    @staticmethod
+    def 解码(文本: str) -> bytes:
+        """
+        Base58解码
+
+        参数:
+            文本: Base58字符串
+
+        返回:
+            原始字节
+
+        异常:
+            ValueError: 包含非法字符
+        """
+        去零文本 = 文本.lstrip("1")
+        前导零数 = len(文本) - len(去零文本)
+
+        数值列表 = []
+        for 字符 in 去零文本:
+            值 = _字符值[ord(字符)] if ord(字符) < 128 else -1
+            if 值 < 0:
+                raise ValueError(f"Base58字符串包含非法字符: {字符}")
+            数值列表.append(值)
+
+        # 同样按10位一块累加，减少大整数乘法次数
+        整数 = 0
+        首块长度 = len(数值列表) % _块位数 or _块位数
+        位置 = 0
+        块长度 = 首块长度
+        while 位置 < len(数值列表):
+            块值 = 0
+            for 值 in 数值列表[位置:位置 + 块长度]:
+                块值 = 块值 * 58 + 值
+            整数 = 整数 * (58 ** 块长度) + 块值
+            位置 += 块长度
+            块长度 = _块位数
+
+        字节数 = (整数.bit_length() + 7) // 8
+        return b"\0" * 前导零数 + 整数.to_bytes(字节数, "big")
+
+    @staticmethod
+    def 编码校验(数据: bytes) -> str:
+        """
+        Base58Check编码（附加4字节双重SHA256校验和）
+
+        参数:
+            数据: 包含版本前缀的载荷
+
+        返回:
+            Base58Check字符串
+        """
+        return Base58编码器.编码(数据 + _双重SHA256(数据)[:4])
+
+    @staticmethod
+    def 批量编码校验(载荷列表: Sequence[bytes], 前缀: bytes = b"") -> List[str]:
+        """
+        批量Base58Check编码
+
+        所有载荷共享同一个前缀（如地址版本字节或扩展公钥版本号）时，
+        前缀的SHA256状态只计算一次，之后对每个载荷复制该状态继续计算。
+
+        参数:
+            载荷列表: 不含前缀的载荷字节列表
+            前缀: 每个载荷前附加的公共前缀
+
+        返回:
+            Base58Check字符串列表，顺序与输入一致
+        """
+        前缀哈希 = hashlib.sha256(前缀) if 前缀 else None
+        编码 = Base58编码器.编码
+        结果 = []
+        for 载荷 in 载荷列表:
+            校验和 = _双重SHA256(载荷, 前缀哈希)[:4]
+            结果.append(编码(前缀 + 载荷 + 校验和))
+        return 结果
+
+    @staticmethod
+    def 解码校验(文本: str) -> bytes:
+        """
+        Base58Check解码并验证校验和
+
+        参数:
+            文本: Base58Check字符串
+
+        返回:
+            去掉校验和的载荷（包含版本前缀）
+
+        异常:
+            ValueError: 字符非法或校验和错误
+        """
+        数据 = Base58编码器.解码(文本)
+        if len(数据) < 4:
+            raise ValueError("Base58Check数据过短")
+        载荷, 校验和 = 数据[:-4], 数据[-4:]
+        if _双重SHA256(载荷)[:4] != 校验和:
+            raise ValueError("Base58Check校验和无效")
+        return 载荷
+
+    @staticmethod
+    def 验证校验(文本: str, 版本前缀: Optional[bytes] = None) -> bool:
+        """
+        检查Base58Check字符串是否有效
+
+        参数:
+            文本: Base58Check字符串
+            版本前缀: 如果提供，还要求载荷以该前缀开头
+
+        返回:
+            是否有效
+        """
+        try:
+            载荷 = Base58编码器.解码校验(文本)
+        except ValueError:
+            return False
+        return 版本前缀 is None or 载荷.startswith(版本前缀)
+
+
+# 测试代码
+if __name__ == "__main__":
+    测试载荷 = bytes.fromhex("00d6bc5d9a0e2b8e6b1d0e13c9c0e10bfd01c3f6a0")
+    编码结果 = Base58编码器.编码校验(测试载荷)
+    print(f"Base58Check: {编码结果}")
+    print(f"解码一致: {Base58编码器.解码校验(编码结果) == 测试载荷}")
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Bech32/Bech32m编码工具
+按BIP-173和BIP-350编码和校验SegWit地址，使用预计算的多项式表
+"""
+
+from typing import List, Sequence, Tuple
+
+
+字符集 = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+
+# 字符到5位值的反查表，非法字符为-1
+_字符值 = [-1] * 128
+for _值, _字符 in enumerate(字符集):
+    _字符值[ord(_字符)] = _值
+    _字符值[ord(_字符.upper())] = _值
+
+BECH32_常量 = 1
+BECH32M_常量 = 0x2BC830A3
+
+_生成多项式 = (0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3)
+
+# 多项式表：校验状态最高5位为b时需要异或的值，
+# 每输入一个5位值只需一次查表，而不是逐位判断5个生成多项式
+_多项式表 = []
+for _高位 in range(32):
+    _累计 = 0
+    for _i in range(5):
+        if (_高位 >> _i) & 1:
+            _累计 ^= _生成多项式[_i]
+    _多项式表.append(_累计)
+
+
+def _多项式模(状态: int, 值列表: Sequence[int]) -> int:
+    """从给定状态继续计算BCH校验多项式"""
+    表 = _多项式表
+    for 值 in 值列表:
+        状态 = ((状态 & 0x1FFFFFF) << 5) ^ 值 ^ 表[状态 >> 25]
+    return 状态
+
+
+def _前缀状态(hrp: str) -> int:
+    """计算人类可读前缀扩展后的校验状态"""
+    return _多项式模(1, [ord(c) >> 5 for c in hrp] + [0] + [ord(c) & 31 for c in hrp])
+
+
+def _程序转5位(见证程序: bytes) -> List[int]:
+    """将8位字节的见证程序转换为5位分组（末尾按需补零）"""
+    位数 = len(见证程序) * 8
+    分组数 = (位数 + 4) // 5
+    整数 = int.from_bytes(见证程序, "big") << (分组数 * 5 - 位数)
+    return [(整数 >> (5 * (分组数 - 1 - i))) & 31 for i in range(分组数)]
+
+
+def _5位转程序(分组: Sequence[int]) -> bytes:
+    """将5位分组还原为8位字节，填充位必须为零且不超过4位"""
+    位数 = len(分组) * 5
+    字节数 = 位数 // 8
+    填充位 = 位数 - 字节数 * 8
+    if 填充位 > 4:
+        raise ValueError("Bech32数据填充过长")
+    整数 = 0
+    for 值 in 分组:
+        整数 = (整数 << 5) | 值
+    if 整数 & ((1 << 填充位) - 1):
+        raise ValueError("Bech32数据填充位非零")
+    return (整数 >> 填充位).to_bytes(字节数, "big")
+
+
+def _检查见证程序(见证版本: int, 见证程序: bytes) -> None:
+    if not 0 <= 见证版本 <= 16:
+        raise ValueError(f"无效的见证版本: {见证版本}")
+    if not 2 <= len(见证程序) <= 40:
+        raise ValueError(f"无效的见证程序长度: {len(见证程序)}")
+    if 见证版本 == 0 and len(见证程序) not in (20, 32):
+        raise ValueError("版本0的见证程序必须为20或32字节")
+
+
+class Bech32编码器:
+    """SegWit地址的Bech32/Bech32m编码器和校验器"""
+
+    @staticmethod
+    def 编码隔离见证地址(hrp: str, 见证版本: int, 见证程序: bytes) -> str:
+        """
+        将见证程序编码为SegWit地址
+
+        参数:
+            hrp: 人类可读前缀，如 bc、ltc、tb
+            见证版本: 见证版本(0使用Bech32，1-16使用Bech32m)
+            见证程序: 原始见证程序字节（P2WPKH为20字节，P2WSH/P2TR为32字节）
+
+        返回:
+            小写的SegWit地址
+        """
+        return Bech32编码器.批量编码隔离见证地址(hrp, 见证版本, [见证程序])[0]
+
+    @staticmethod
+    def 批量编码隔离见证地址(hrp: str, 见证版本: int, 见证程序列表: Sequence[bytes]) -> List[str]:
+        """
+        批量将同一前缀和版本的见证程序编码为SegWit地址
+
+        前缀和见证版本部分的校验状态只计算一次，之后每个见证程序只需处理
+        自身的数据分组。
+
+        参数:
+            hrp: 人类可读前缀
+            见证版本: 见证版本
+            见证程序列表: 原始见证程序字节列表
+
+        返回:
+            地址列表，顺序与输入一致
+        """
+        hrp = hrp.lower()
+        常量 = BECH32_常量 if 见证版本 == 0 else BECH32M_常量
+        起始状态 = _多项式模(_前缀状态(hrp), [见证版本])
+        地址前缀 = hrp + "1" + 字符集[见证版本]
+        表 = _多项式表
+        结果 = []
+
+        for 见证程序 in 见证程序列表:
+            _检查见证程序(见证版本, 见证程序)
+            数据 = _程序转5位(见证程序)
+            状态 = 起始状态
+            for 值 in 数据:
+                状态 = ((状态 & 0x1FFFFFF) << 5) ^ 值 ^ 表[状态 >> 25]
+            for _ in range(6):
+                状态 = ((状态 & 0x1FFFFFF) << 5) ^ 表[状态 >> 25]
+            状态 ^= 常量
+            校验和 = [(状态 >> 5 * (5 - i)) & 31 for i in range(6)]
+            结果.append(地址前缀 + "".join(字符集[值] for 值 in 数据 + 校验和))
+
+        return 结果
+
+    @staticmethod
+    def 解码隔离见证地址(hrp: str, 地址: str) -> Tuple[int, bytes]:
+        """
+        解码并校验SegWit地址
+
+        参数:
+            hrp: 期望的人类可读前缀
+            地址: SegWit地址
+
+        返回:
+            (见证版本, 见证程序)
+
+        异常:
+            ValueError: 地址格式、前缀、校验和或见证程序无效
+        """
+        if len(地址) > 90:
+            raise ValueError("Bech32地址过长")
+        if 地址.lower() != 地址 and 地址.upper() != 地址:
+            raise ValueError("Bech32地址不能混合大小写")
+        地址 = 地址.lower()
+        分隔位置 = 地址.rfind("1")
+        if 分隔位置 < 1 or 分隔位置 + 7 > len(地址):
+            raise ValueError("Bech32地址分隔符位置无效")
+
+        前缀 = 地址[:分隔位置]
+        if 前缀 != hrp.lower():
+            raise ValueError(f"地址前缀不匹配: {前缀}")
+        if any(not 33 <= ord(c) <= 126 for c in 前缀):
+            raise ValueError("Bech32前缀包含非法字符")
+
+        数据 = []
+        for 字符 in 地址[分隔位置 + 1:]:
+            值 = _字符值[ord(字符)] if ord(字符) < 128 else -1
+            if 值 < 0:
+                raise ValueError(f"Bech32地址包含非法字符: {字符}")
+            数据.append(值)
+
+        if len(数据) < 7:
+            raise ValueError("Bech32地址缺少见证版本")
+        常量 = _多项式模(_前缀状态(前缀), 数据)
+        见证版本 = 数据[0]
+        期望常量 = BECH32_常量 if 见证版本 == 0 else BECH32M_常量
+        if 常量 != 期望常量:
+            raise ValueError("Bech32校验和无效")
+
+        见证程序 = _5位转程序(数据[1:-6])
+        _检查见证程序(见证版本, 见证程序)
+        return 见证版本, 见证程序
+
+    @staticmethod
+    def 验证隔离见证地址(hrp: str, 地址: str) -> bool:
+        """
+        检查SegWit地址是否有效
+
+        参数:
+            hrp: 期望的人类可读前缀
+            地址: SegWit地址
+
+        返回:
+            是否有效
+        """
+        try:
+            Bech32编码器.解码隔离见证地址(hrp, 地址)
+            return True
+        except ValueError:
+            return False
+
+
+# 测试代码
+if __name__ == "__main__":
+    测试程序 = bytes.fromhex("751e76e8199196d454941c45d1b3a323f1433bd6")
+    测试地址 = Bech32编码器.编码隔离见证地址("bc", 0, 测试程序)
+    print(f"P2WPKH地址: {测试地址}")
+    print(f"校验结果: {Bech32编码器.验证隔离见证地址('bc', 测试地址)}")
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+离线泄露密码索引
+从本地泄露密码库构建索引文件，用于在离线环境中筛查密码短语。
+语料可以是每行一个明文密码的字典文件，也可以是Have I Been Pwned的"SHA1:次数"格式；
+每条记录是密码UTF-8编码的SHA-1摘要的前8字节，排序去重后定长存放。
+构建时分段排序再归并，内存占用与语料大小无关；查询时内存映射索引文件并二分查找，
+一次查询只读取约log2(记录数)条记录。
+8字节前缀在十亿条记录下把任意一个新密码误判为泄露的概率约为5×10⁻¹¹
+"""
+
+import os
+import sys
+import mmap
+import heapq
+import struct
+import getpass
+import hashlib
+import argparse
+import tempfile
+from itertools import chain
+from typing import BinaryIO, Iterable, Iterator, List, Optional
+
+# 文件头: 魔数(6) + 格式版本(1) + 前缀字节数(1) + 记录数(8)
+索引魔数 = b"PWIDX\x00"
+索引格式版本 = 1
+_头部格式 = ">6sBBQ"
+头部长度 = struct.calcsize(_头部格式)
+默认前缀字节数 = 8
+默认每段记录数 = 1 << 20
+# 每轮归并同时打开的段文件数上限，段数更多时分多轮归并，避免超出进程的文件描述符上限
+默认最大归并路数 = 64
+语料格式 = ("自动", "明文", "SHA1")
+
+
+def 密码摘要(密码: str) -> bytes:
+    """返回密码UTF-8编码的SHA-1摘要（与Have I Been Pwned一致）"""
+    return hashlib.sha1(密码.encode("utf-8")).digest()
+
+
+def _是SHA1行(行: bytes) -> bool:
+    """判断一行是否为"40位十六进制SHA-1[:次数]"格式"""
+    if len(行) < 40 or (len(行) > 40 and 行[40:41] != b":"):
+        return False
+    try:
+        bytes.fromhex(行[:40].decode("ascii"))
+    except (UnicodeDecodeError, ValueError):
+        return False
+    return True
+
+
+def 读取语料摘要(路径: str, 格式: str = "自动") -> Iterator[bytes]:
+    """
+    逐行读取语料文件，产出每个条目的SHA-1摘要
+
+    参数:
+        路径: 语料文件路径
+        格式: "明文"（每行一个密码，按原始字节计算SHA-1）、"SHA1"（"十六进制SHA-1[:次数]"）
+             或"自动"（按第一个非空行判断）
+
+    异常:
+        ValueError: 格式未知，或SHA1格式的文件中有无法解析的行
+    """
+    if 格式 not in 语料格式:
+        raise ValueError(f"语料格式必须是 {'、'.join(语料格式)} 之一")
+    with open(路径, "rb") as 文件:
+        for 行号, 行 in enumerate(文件, 1):
+            行 = 行.rstrip(b"\r\n")
+            if not 行:
+                continue
+            if 格式 == "自动":
+                格式 = "SHA1" if _是SHA1行(行) else "明文"
+            if 格式 == "明文":
+                yield hashlib.sha1(行).digest()
+            else:
+                try:
+                    yield bytes.fromhex(行[:40].decode("ascii"))
+                except (UnicodeDecodeError, ValueError):
+                    raise ValueError(f"{路径} 第 {行号} 行不是SHA-1十六进制摘要")
+
+
+def _写入有序段(记录列表: List[bytes], 目录: str) -> str:
+    """把一段记录排序去重后写入临时文件，返回文件路径"""
+    描述符, 路径 = tempfile.mkstemp(suffix=".run", dir=目录)
+    with os.fdopen(描述符, "wb") as 文件:
+        文件.write(b"".join(sorted(set(记录列表))))
+    return 路径
+
+
+def _读取有序段(文件: BinaryIO, 记录长度: int) -> Iterator[bytes]:
+    """按块读取有序段文件，逐条产出记录"""
+    while True:
+        块 = 文件.read(记录长度 * 8192)
+        if not 块:
+            return
+        for 位置 in range(0, len(块), 记录长度):
+            yield 块[位置:位置 + 记录长度]
+
+
+def _归并有序段(段路径列表: List[str], 记录长度: int, 输出: BinaryIO) -> int:
+    """把若干有序段多路归并去重后写入输出文件，返回写入的记录数"""
+    段文件列表 = [open(路径, "rb") for 路径 in 段路径列表]
+    try:
+        记录数 = 0
+        上一条 = None
+        批次: List[bytes] = []
+        for 记录 in heapq.merge(*(_读取有序段(文件, 记录长度) for 文件 in 段文件列表)):
+            if 记录 != 上一条:
+                批次.append(记录)
+                上一条 = 记录
+                if len(批次) >= 65536:
+                    输出.write(b"".join(批次))
+                    记录数 += len(批次)
+                    批次 = []
+        输出.write(b"".join(批次))
+        return 记录数 + len(批次)
+    finally:
+        for 文件 in 段文件列表:
+            文件.close()
+
+
+def 构建泄露密码索引(语料路径列表: Iterable[str], 输出路径: str, 格式: str = "自动",
+              前缀字节数: int = 默认前缀字节数, 每段记录数: int = 默认每段记录数,
+              最大归并路数: int = 默认最大归并路数) -> int:
+    """
+    从泄露密码语料构建索引文件
+
+    语料按每段记录数分段，在内存中排序后写成临时文件，再多路归并去重写出；
+    段数超过最大归并路数时先分组归并成较少的段，每轮同时打开的文件数不超过
+    最大归并路数。全部完成后才原子替换输出文件。
+
+    参数:
+        语料路径列表: 语料文件路径
+        输出路径: 索引文件路径
+        格式: 语料格式，见读取语料摘要
+        前缀字节数: 每条记录保存的SHA-1前缀字节数（4-20）
+        每段记录数: 每段在内存中排序的记录数
+        最大归并路数: 每轮归并同时打开的段文件数（至少为2）
+
+    返回:
+        索引中的记录数（去重后）
+
+    异常:
+        OSError: 文件读写失败
+        ValueError: 参数无效或语料无法解析
+    """
+    if not 4 <= 前缀字节数 <= 20:
+        raise ValueError("前缀字节数必须在4到20之间")
+    if 每段记录数 < 1:
+        raise ValueError("每段记录数必须为正数")
+    if 最大归并路数 < 2:
+        raise ValueError("最大归并路数至少为2")
+
+    输出目录 = os.path.dirname(os.path.abspath(输出路径))
+    with tempfile.TemporaryDirectory(dir=输出目录) as 临时目录:
+        段路径列表 = []
+        缓冲: List[bytes] = []
+        摘要迭代器 = chain.from_iterable(读取语料摘要(路径, 格式) for 路径 in 语料路径列表)
+        for 摘要 in 摘要迭代器:
+            缓冲.append(摘要[:前缀字节数])
+            if len(缓冲) >= 每段记录数:
+                段路径列表.append(_写入有序段(缓冲, 临时目录))
+                缓冲 = []
+        if 缓冲 or not 段路径列表:
+            段路径列表.append(_写入有序段(缓冲, 临时目录))
+
+        # 每轮把最多最大归并路数个段归并成一个，归并完的段立即删除，磁盘占用不超过语料的两倍
+        while len(段路径列表) > 最大归并路数:
+            下一轮: List[str] = []
+            for 开始 in range(0, len(段路径列表), 最大归并路数):
+                分组 = 段路径列表[开始:开始 + 最大归并路数]
+                描述符, 路径 = tempfile.mkstemp(suffix=".run", dir=临时目录)
+                with os.fdopen(描述符, "wb") as 输出:
+                    _归并有序段(分组, 前缀字节数, 输出)
+                for 旧路径 in 分组:
+                    os.unlink(旧路径)
+                下一轮.append(路径)
+            段路径列表 = 下一轮
+
+        临时输出 = os.path.join(临时目录, "index.tmp")
+        with open(临时输出, "wb") as 输出:
+            输出.write(b"\x00" * 头部长度)
+            记录数 = _归并有序段(段路径列表, 前缀字节数, 输出)
+            输出.seek(0)
+            输出.write(struct.pack(_头部格式, 索引魔数, 索引格式版本, 前缀字节数, 记录数))
+        os.replace(临时输出, 输出路径)
+    return 记录数
+
+
+class 泄露密码索引:
+    """内存映射的泄露密码索引，按SHA-1前缀二分查找"""
+
+    def __init__(self, 路径: str):
+        """
+        打开索引文件
+
+        异常:
+            OSError: 文件无法打开
+            ValueError: 不是有效的索引文件
+        """
+        self.路径 = 路径
+        self._文件 = open(路径, "rb")
+        try:
+            头部 = self._文件.read(头部长度)
+            if len(头部) != 头部长度:
+                raise ValueError(f"{路径} 不是泄露密码索引文件")
+            魔数, 版本, self.前缀字节数, self.记录数 = struct.unpack(_头部格式, 头部)
+            if 魔数 != 索引魔数 or 版本 != 索引格式版本:
+                raise ValueError(f"{路径} 不是泄露密码索引文件")
+            if os.fstat(self._文件.fileno()).st_size != 头部长度 + self.记录数 * self.前缀字节数:
+                raise ValueError(f"{路径} 的长度与记录数不符")
+            self._映射 = mmap.mmap(self._文件.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._文件.close()
+            raise
+
+    def __len__(self) -> int:
+        return self.记录数
+
+    def 包含摘要(self, 摘要: bytes) -> bool:
+        """判断SHA-1摘要（取前缀）是否在索引中"""
+        目标 = 摘要[:self.前缀字节数]
+        宽度 = self.前缀字节数
+        映射 = self._映射
+        低, 高 = 0, self.记录数
+        while 低 < 高:
+            中 = (低 + 高) // 2
+            位置 = 头部长度 + 中 * 宽度
+            记录 = 映射[位置:位置 + 宽度]
+            if 记录 < 目标:
+                低 = 中 + 1
+            elif 记录 > 目标:
+                高 = 中
+            else:
+                return True
+        return False
+
+    def 包含(self, 密码: str) -> bool:
+        """判断密码是否出现在泄露密码库中"""
+        return self.包含摘要(密码摘要(密码))
+
+    def __contains__(self, 密码: str) -> bool:
+        return self.包含(密码)
+
+    def 关闭(self) -> None:
+        """关闭内存映射和文件"""
+        self._映射.close()
+        self._文件.close()
+
+    def __enter__(self) -> "泄露密码索引":
+        return self
+
+    def __exit__(self, *异常信息) -> None:
+        self.关闭()
+
+
+def 主程序(参数列表: Optional[List[str]] = None) -> int:
+    """命令行入口"""
+    解析器 = argparse.ArgumentParser(description="构建离线泄露密码索引，或检查密码是否已泄露")
+    解析器.add_argument("语料文件", nargs="*", help="泄露密码语料（每行一个密码，或HIBP的SHA1:次数格式）")
+    解析器.add_argument("-o", "--输出", help="要构建的索引文件路径")
+    解析器.add_argument("--格式", default="自动", choices=语料格式, help="语料格式")
+    解析器.add_argument("-c", "--检查", metavar="索引文件", help="隐藏输入一个密码，检查它是否在索引中")
+    参数 = 解析器.parse_args(参数列表)
+
+    try:
+        if 参数.检查:
+            with 泄露密码索引(参数.检查) as 索引:
+                已泄露 = getpass.getpass("密码: ") in 索引
+            print("✗ 该密码出现在泄露密码库中" if 已泄露 else "✓ 未在泄露密码库中找到该密码")
+            return 1 if 已泄露 else 0
+        if not 参数.语料文件 or not 参数.输出:
+            解析器.error("构建索引需要语料文件和 -o 输出路径")
+        记录数 = 构建泄露密码索引(参数.语料文件, 参数.输出, 参数.格式)
+    except (OSError, ValueError) as e:
+        print(f"错误: {e}", file=sys.stderr)
+        return 1
+    print(f"✓ 已写入 {记录数} 条记录到 {参数.输出}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(主程序())
@@ -3,15 +3,37 @@
 
 """
 配置文件管理工具
-用于管理钱包生成工具的配置选项
+用于管理钱包生成工具的配置选项。
+创建配置管理器不访问磁盘，第一次读取配置时才读取文件；写入先写临时文件再原子替换，
+批量修改()中的多次设置只写一次文件；刷新()按文件的修改时间判断是否需要重新读取
 """
 
 import os
+import copy
 import json
 import time
-from typing import Dict, Any, Optional
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Any, Iterator, Optional, Tuple
 from pathlib import Path
 
+from utils.private_file import 写入私有文件
+
+
+@lru_cache(maxsize=256)
+def _编译键路径(键: str) -> Tuple[str, ...]:
+    """把点号分隔的键拆成路径，同一个键只拆分一次"""
+    return tuple(键.split('.'))
+
+
+def _文件标识(路径: str) -> Optional[Tuple[int, int, int]]:
+    """文件的(修改时间, 大小, inode)，原子替换后inode也会变化；文件不存在时为None"""
+    try:
+        信息 = os.stat(路径)
+    except OSError:
+        return None
+    return 信息.st_mtime_ns, 信息.st_size, 信息.st_ino
+
 
 class 配置管理器:
     """配置管理器类，用于管理和持久化配置选项"""
@@ -39,6 +61,8 @@ class 配置管理器:
             "允许生成二维码": True,
             "允许生成钱包地址": True,
             "密码强度最低要求": 40,  # 0-100分
+            "泄露密码索引路径": "",  # python -m utils.breached_passwords 构建的索引文件
+            "攻击者档案": {},  # 档案名 -> 相对本机单核的速度倍数，为空时使用utils.crack_time的默认档案
         },
         "路径": {
             "默认导出目录": "",
@@ -48,55 +72,73 @@ class 配置管理器:
     
     def __init__(self, 配置文件路径: Optional[str] = None):
         """
-        初始化配置管理器
+        初始化配置管理器，不访问磁盘
         
         参数:
-            配置文件路径: 配置文件的路径，如果为None则使用默认路径
+            配置文件路径: 配置文件的路径，如果为None则使用默认路径（~/.crypto_wallet/config.json）
         """
         if 配置文件路径 is None:
-            # 使用用户主目录下的.crypto_wallet目录
-            主目录 = str(Path.home())
-            配置目录 = os.path.join(主目录, ".crypto_wallet")
-            
-            # 确保配置目录存在
-            os.makedirs(配置目录, exist_ok=True)
-            
-            self.配置文件路径 = os.path.join(配置目录, "config.json")
-        else:
-            self.配置文件路径 = 配置文件路径
+            # 使用用户主目录下的.crypto_wallet目录，第一次保存时才创建
+            配置文件路径 = os.path.join(str(Path.home()), ".crypto_wallet", "config.json")
+        self.配置文件路径 = 配置文件路径
         
-        # 加载配置
-        self.配置 = self.加载配置()
+        self._配置: Optional[Dict[str, Any]] = None
+        # 上次读取或写入时配置文件的标识，用于判断文件是否被其他进程修改
+        self._文件标识: Optional[Tuple[int, int, int]] = None
+        # 批量修改的嵌套层数，以及其间是否有未保存的修改
+        self._批量层数 = 0
+        self._有未保存修改 = False
+    
+    @property
+    def 配置(self) -> Dict[str, Any]:
+        """当前配置，第一次访问时才从文件加载"""
+        if self._配置 is None:
+            self._配置 = self.加载配置()
+        return self._配置
+    
+    @配置.setter
+    def 配置(self, 配置: Dict[str, Any]) -> None:
+        self._配置 = 配置
     
     def 加载配置(self) -> Dict[str, Any]:
         """
-        从文件加载配置，如果文件不存在则使用默认配置
+        从文件加载配置，如果文件不存在则使用默认配置（不会写入文件）
         
         返回:
             配置字典
         """
-        if os.path.exists(self.配置文件路径):
-            try:
-                with open(self.配置文件路径, 'r', encoding='utf-8') as f:
-                    配置 = json.load(f)
-                
-                # 合并默认配置和加载的配置，确保所有必要的键都存在
-                合并配置 = self.默认配置.copy()
-                self._递归更新字典(合并配置, 配置)
-                
-                return 合并配置
-            except Exception as e:
-                print(f"加载配置文件时出错: {str(e)}")
-                print("将使用默认配置")
-                return self.默认配置.copy()
-        else:
-            # 如果配置文件不存在，使用默认配置并保存
-            self.保存配置(self.默认配置)
-            return self.默认配置.copy()
+        self._文件标识 = _文件标识(self.配置文件路径)
+        if self._文件标识 is None:
+            return copy.deepcopy(self.默认配置)
+        try:
+            with open(self.配置文件路径, 'r', encoding='utf-8') as f:
+                配置 = json.load(f)
+            
+            # 合并默认配置和加载的配置，确保所有必要的键都存在
+            合并配置 = copy.deepcopy(self.默认配置)
+            self._递归更新字典(合并配置, 配置)
+            
+            return 合并配置
+        except Exception as e:
+            print(f"加载配置文件时出错: {str(e)}")
+            print("将使用默认配置")
+            return copy.deepcopy(self.默认配置)
+    
+    def 刷新(self) -> bool:
+        """
+        配置文件自上次读取或写入后被修改过时重新加载，否则只做一次stat
+        
+        返回:
+            是否重新加载了配置
+        """
+        if self._配置 is not None and _文件标识(self.配置文件路径) == self._文件标识:
+            return False
+        self._配置 = self.加载配置()
+        return True
     
     def 保存配置(self, 配置: Dict[str, Any] = None) -> bool:
         """
-        保存配置到文件
+        保存配置到文件，先写临时文件再原子替换；在批量修改中只标记，退出时统一保存
         
         参数:
             配置: 要保存的配置字典，如果为None则使用当前配置
@@ -107,14 +149,46 @@ class 配置管理器:
         if 配置 is None:
             配置 = self.配置
         
+        if self._批量层数 and 配置 is self._配置:
+            self._有未保存修改 = True
+            return True
+        
         try:
-            with open(self.配置文件路径, 'w', encoding='utf-8') as f:
-                json.dump(配置, f, ensure_ascii=False, indent=2)
+            os.makedirs(os.path.dirname(os.path.abspath(self.配置文件路径)), exist_ok=True)
+            写入私有文件(self.配置文件路径, json.dumps(配置, ensure_ascii=False, indent=2))
+            self._文件标识 = _文件标识(self.配置文件路径)
             return True
         except Exception as e:
             print(f"保存配置文件时出错: {str(e)}")
             return False
     
+    @contextmanager
+    def 批量修改(self) -> Iterator["配置管理器"]:
+        """
+        批量修改配置，其间的设置配置都只修改内存，退出时只写一次文件；
+        发生异常时撤销其间的全部修改，不写文件。可以嵌套，最外层退出时才保存
+        
+        用法:
+            with 配置.批量修改():
+                配置.设置配置("语言", "english")
+                配置.设置配置("高级选项.允许导出私钥", True)
+        """
+        if self._批量层数 == 0:
+            快照 = copy.deepcopy(self.配置)
+        self._批量层数 += 1
+        try:
+            yield self
+        except BaseException:
+            self._批量层数 -= 1
+            if self._批量层数 == 0:
+                self._配置 = 快照
+                self._有未保存修改 = False
+            raise
+        self._批量层数 -= 1
+        if self._批量层数 == 0 and self._有未保存修改:
+            self._有未保存修改 = False
+            self.保存配置()
+    
     def 获取配置(self, 键: str, 默认值: Any = None) -> Any:
         """
         获取配置项的值
@@ -126,12 +200,10 @@ class 配置管理器:
         返回:
             配置项的值
         """
-        # 处理嵌套键
-        键路径 = 键.split('.')
         当前值 = self.配置
         
         try:
-            for 部分 in 键路径:
+            for 部分 in _编译键路径(键):
                 当前值 = 当前值[部分]
             return 当前值
         except (KeyError, TypeError):
@@ -139,7 +211,7 @@ class 配置管理器:
     
     def 设置配置(self, 键: str, 值: Any) -> bool:
         """
-        设置配置项的值
+        设置配置项的值，值没有变化时不写文件
         
         参数:
             键: 配置项的键，可以使用点号分隔的路径，如"高级选项.允许导出私钥"
@@ -148,19 +220,19 @@ class 配置管理器:
         返回:
             是否成功设置
         """
-        # 处理嵌套键
-        键路径 = 键.split('.')
+        键路径 = _编译键路径(键)
         当前字典 = self.配置
         
         # 遍历路径，直到最后一个键
-        for i, 部分 in enumerate(键路径[:-1]):
-            if 部分 not in 当前字典:
-                当前字典[部分] = {}
-            elif not isinstance(当前字典[部分], dict):
+        for 部分 in 键路径[:-1]:
+            if not isinstance(当前字典.get(部分), dict):
                 当前字典[部分] = {}
             
             当前字典 = 当前字典[部分]
         
+        if 键路径[-1] in 当前字典 and 当前字典[键路径[-1]] == 值 and self._文件标识 is not None:
+            return True
+        
         # 设置最后一个键的值
         当前字典[键路径[-1]] = 值
         
@@ -174,7 +246,7 @@ class 配置管理器:
         返回:
             是否成功重置
         """
-        self.配置 = self.默认配置.copy()
+        self.配置 = copy.deepcopy(self.默认配置)
         return self.保存配置()
     
     def 显示配置(self) -> str:
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+密码短语破解耗时估计
+攻击者拿到助记词后，每猜一个密码短语都要按BIP-39做一次PBKDF2-HMAC-SHA512
+（2048次迭代）派生种子。本工具测量本机每秒能派生的种子数，按攻击者档案
+（相对本机单核的倍数）换算，估计试完密码短语的猜测次数需要多久。
+测量结果缓存在配置目录中，评分时只读取缓存，不会重新测量
+"""
+
+import os
+import sys
+import json
+import time
+import getpass
+import hashlib
+import argparse
+import platform
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from utils.private_file import 写入私有文件
+
+BIP39迭代次数 = 2048
+最短测量秒数 = 0.2
+校准文件名 = "pbkdf2_calibration.json"
+校准格式版本 = 1
+
+# 相对本机单核的速度倍数，GPU的倍数是按公开的PBKDF2-HMAC-SHA512跑分粗略折算的
+_GPU倍数 = 200
+_集群GPU数 = 1000
+
+
+def 默认攻击者档案() -> Dict[str, float]:
+    """返回默认的攻击者档案：档案名 -> 相对本机单核的速度倍数"""
+    档案: Dict[str, float] = {"本机单核": 1}
+    核心数 = os.cpu_count() or 1
+    if 核心数 > 1:
+        档案[f"本机{核心数}核"] = 核心数
+    档案["单块高端GPU"] = _GPU倍数
+    档案[f"{_集群GPU数}块GPU集群"] = _GPU倍数 * _集群GPU数
+    return 档案
+
+
+def 测量每秒种子数(最短秒数: float = 最短测量秒数) -> float:
+    """
+    测量本机单核按BIP-39派生种子的速度
+
+    使用与助记词转种子相同的参数（24个单词长度的助记词、"mnemonic"加密码短语作盐、
+    2048次迭代、64字节输出），派生次数逐次翻倍，直到单次测量不短于最短秒数。
+
+    参数:
+        最短秒数: 单次测量的最短耗时
+
+    返回:
+        每秒派生的种子数
+    """
+    助记词 = " ".join(["abandon"] * 23 + ["art"]).encode("utf-8")
+    盐 = b"mnemonic" + b"correct horse battery staple"
+    次数 = 1
+    while True:
+        开始时间 = time.perf_counter()
+        for _ in range(次数):
+            hashlib.pbkdf2_hmac("sha512", 助记词, 盐, BIP39迭代次数)
+        耗时 = time.perf_counter() - 开始时间
+        if 耗时 >= 最短秒数:
+            return 次数 / 耗时
+        次数 *= 2
+
+
+def _机器标识() -> Dict[str, Any]:
+    """影响PBKDF2速度的机器和解释器信息，变化时缓存的测量结果作废"""
+    return {
+        "架构": platform.machine(),
+        "处理器": platform.processor(),
+        "核心数": os.cpu_count(),
+        "Python": f"{platform.python_implementation()} {platform.python_version()}",
+    }
+
+
+def 默认校准路径() -> str:
+    """返回配置目录（~/.crypto_wallet）中的校准缓存文件路径"""
+    return os.path.join(str(Path.home()), ".crypto_wallet", 校准文件名)
+
+
+def 读取校准(路径: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    读取缓存的校准结果
+
+    参数:
+        路径: 校准缓存文件路径，为None时使用默认路径
+
+    返回:
+        校准结果；文件不存在、无法解析、格式版本不符或不是在本机测得时返回None
+    """
+    路径 = 路径 or 默认校准路径()
+    try:
+        with open(路径, "r", encoding="utf-8") as 文件:
+            结果 = json.load(文件)
+    except (OSError, ValueError):
+        return None
+    if (not isinstance(结果, dict) or 结果.get("版本") != 校准格式版本
+            or 结果.get("机器") != _机器标识() or not 结果.get("每秒种子数", 0) > 0):
+        return None
+    return 结果
+
+
+def 校准(路径: Optional[str] = None, 重新测量: bool = False,
+       最短秒数: float = 最短测量秒数) -> Dict[str, Any]:
+    """
+    返回本机的校准结果，没有可用的缓存时现场测量并写入缓存
+
+    参数:
+        路径: 校准缓存文件路径，为None时使用默认路径
+        重新测量: 忽略缓存，重新测量
+        最短秒数: 测量时单次测量的最短耗时
+
+    返回:
+        {"版本": int, "每秒种子数": float, "迭代次数": 2048, "测量时间": 时间戳, "机器": dict}
+
+    异常:
+        OSError: 缓存文件无法写入
+    """
+    路径 = 路径 or 默认校准路径()
+    if not 重新测量:
+        结果 = 读取校准(路径)
+        if 结果 is not None:
+            return 结果
+    结果 = {
+        "版本": 校准格式版本,
+        "每秒种子数": 测量每秒种子数(最短秒数),
+        "迭代次数": BIP39迭代次数,
+        "测量时间": time.time(),
+        "机器": _机器标识(),
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(路径)), mode=0o700, exist_ok=True)
+    写入私有文件(路径, json.dumps(结果, ensure_ascii=False, indent=2))
+    return 结果
+
+
+_一年秒数 = 86400 * 365
+# (上限秒数, 单位秒数, 单位)
+_时间单位 = (
+    (60, 1, "秒"),
+    (3600, 60, "分钟"),
+    (86400, 3600, "小时"),
+    (86400 * 30, 86400, "天"),
+    (_一年秒数, 86400 * 30, "个月"),
+)
+
+
+def 格式化耗时(秒数: float) -> str:
+    """把秒数格式化为"3小时"、"约2.5万年"这样的中文描述"""
+    if 秒数 < 1:
+        return "不到1秒"
+    for 上限, 单位秒数, 单位 in _时间单位:
+        if 秒数 < 上限:
+            return f"{秒数 / 单位秒数:.0f}{单位}"
+    年数 = 秒数 / _一年秒数
+    if 年数 < 1e4:
+        return f"{年数:.0f}年"
+    if 年数 < 1e8:
+        return f"约{年数 / 1e4:.1f}万年"
+    if 年数 < 1e12:
+        return f"约{年数 / 1e8:.1f}亿年"
+    return "超过1万亿年"
+
+
+def 估计破解耗时(猜测次数: float, 每秒种子数: float,
+           攻击者档案: Optional[Dict[str, float]] = None) -> List[Dict[str, Any]]:
+    """
+    估计各攻击者档案试完全部猜测所需的时间
+
+    参数:
+        猜测次数: 密码短语的猜测次数（见utils.password_guesses）
+        每秒种子数: 本机单核每秒派生的种子数
+        攻击者档案: 档案名 -> 相对本机单核的速度倍数，为None时使用默认档案
+
+    返回:
+        [{"档案", "倍数", "每秒猜测次数", "秒数", "描述"}, ...]，按档案顺序排列
+
+    异常:
+        ValueError: 速度或倍数不是正数
+    """
+    if 每秒种子数 <= 0:
+        raise ValueError("每秒种子数必须大于0")
+    结果 = []
+    for 档案, 倍数 in (攻击者档案 or 默认攻击者档案()).items():
+        if 倍数 <= 0:
+            raise ValueError(f"攻击者档案 {档案} 的倍数必须大于0")
+        每秒猜测次数 = 每秒种子数 * 倍数
+        秒数 = 猜测次数 / 每秒猜测次数
+        结果.append({"档案": 档案, "倍数": 倍数, "每秒猜测次数": 每秒猜测次数,
+                     "秒数": 秒数, "描述": 格式化耗时(秒数)})
+    return 结果
+
+
+def 主程序(参数列表: Optional[List[str]] = None) -> int:
+    """命令行入口"""
+    解析器 = argparse.ArgumentParser(description="测量本机BIP-39种子派生速度，估计密码短语的破解耗时")
+    解析器.add_argument("--校准文件", help=f"校准缓存文件路径（默认 {默认校准路径()}）")
+    解析器.add_argument("--重新校准", action="store_true", help="忽略缓存，重新测量")
+    解析器.add_argument("-c", "--检查", action="store_true", help="隐藏输入一个密码短语，估计它的破解耗时")
+    参数 = 解析器.parse_args(参数列表)
+
+    try:
+        结果 = 校准(参数.校准文件, 参数.重新校准)
+        猜测次数 = None
+        if 参数.检查:
+            from utils.password_checker import 密码强度检查器
+            猜测次数 = 密码强度检查器.检查密码强度(getpass.getpass("密码短语: "))["详情"].get("猜测次数", {}).get("猜测次数")
+        估计 = 估计破解耗时(猜测次数 or 1, 结果["每秒种子数"])
+    except (OSError, ValueError) as e:
+        print(f"错误: {e}", file=sys.stderr)
+        return 1
+
+    print(f"本机BIP-39种子派生速度: {结果['每秒种子数']:,.0f} 个/秒（单核，PBKDF2-HMAC-SHA512 {BIP39迭代次数}次迭代）")
+    print(f"测量时间: {time.strftime('%Y-%m-%d %H:%M', time.localtime(结果['测量时间']))}\n")
+    if 猜测次数 is not None:
+        print(f"估计猜测次数: {猜测次数:.3g}")
+    for 行 in 估计:
+        耗时 = f"  {行['描述']}" if 猜测次数 is not None else ""
+        print(f"{行['档案']:<12} {行['每秒猜测次数']:>16,.0f} 次/秒{耗时}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(主程序())
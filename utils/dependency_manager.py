@@ -32,8 +32,6 @@ class 依赖管理器:
         "qrcode": "qrcode[pil]>=7.3.1",
         "pillow": "pillow>=9.0.0",
         "hdwallet": "hdwallet>=2.1.1",
-        "base58": "base58>=2.1.1",
-        "bech32": "bech32>=1.2.0",
         "ecdsa": "ecdsa>=0.18.0"
     }
     
@@ -48,7 +46,7 @@ class 依赖管理器:
         "基础功能": ["mnemonic", "cryptography"],
         "SLIP-39分割备份": ["shamir_mnemonic"],
         "二维码生成": ["qrcode", "pillow"],
-        "钱包地址生成": ["hdwallet", "base58", "bech32", "ecdsa"]
+        "钱包地址生成": ["hdwallet", "ecdsa"]
     }
     
     # PyPI镜像源列表
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+地址哈希工具
+提供HASH160(RIPEMD160(SHA256))和Keccak-256的单个与批量计算，
+当hashlib缺少ripemd160（OpenSSL 3未启用legacy provider）或未安装
+pycryptodome时，自动回退到项目内置的纯Python实现
+"""
+
+import hashlib
+import importlib.util
+import struct
+from typing import List, Sequence
+
+
+def _检测原生RIPEMD160() -> bool:
+    try:
+        hashlib.new('ripemd160', b"")
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+# 在模块导入时检测一次。pycryptodome只检查是否安装，首次计算Keccak时才导入
+RIPEMD160_原生可用 = _检测原生RIPEMD160()
+KECCAK_原生可用 = importlib.util.find_spec("Crypto") is not None
+
+_原生keccak = None
+
+
+# ===== RIPEMD-160 =====
+
+_掩码32 = 0xFFFFFFFF
+
+_左消息顺序 = (
+    0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15,
+    7, 4, 13, 1, 10, 6, 15, 3, 12, 0, 9, 5, 2, 14, 11, 8,
+    3, 10, 14, 4, 9, 15, 8, 1, 2, 7, 0, 6, 13, 11, 5, 12,
+    1, 9, 11, 10, 0, 8, 12, 4, 13, 3, 7, 15, 14, 5, 6, 2,
+    4, 0, 5, 9, 7, 12, 2, 10, 14, 1, 3, 8, 11, 6, 15, 13,
+)
+_右消息顺序 = (
+    5, 14, 7, 0, 9, 2, 11, 4, 13, 6, 15, 8, 1, 10, 3, 12,
+    6, 11, 3, 7, 0, 13, 5, 10, 14, 15, 8, 12, 4, 9, 1, 2,
+    15, 5, 1, 3, 7, 14, 6, 9, 11, 8, 12, 2, 10, 0, 4, 13,
+    8, 6, 4, 1, 3, 11, 15, 0, 5, 12, 2, 13, 9, 7, 10, 14,
+    12, 15, 10, 4, 1, 5, 8, 7, 6, 2, 13, 14, 0, 3, 9, 11,
+)
+_左循环位移 = (
+    11, 14, 15, 12, 5, 8, 7, 9, 11, 13, 14, 15, 6, 7, 9, 8,
+    7, 6, 8, 13, 11, 9, 7, 15, 7, 12, 15, 9, 11, 7, 13, 12,
+    11, 13, 6, 7, 14, 9, 13, 15, 14, 8, 13, 6, 5, 12, 7, 5,
+    11, 12, 14, 15, 14, 15, 9, 8, 9, 14, 5, 6, 8, 6, 5, 12,
+    9, 15, 5, 11, 6, 8, 13, 12, 5, 12, 13, 14, 11, 8, 5, 6,
+)
+_右循环位移 = (
+    8, 9, 9, 11, 13, 15, 15, 5, 7, 7, 8, 11, 14, 14, 12, 6,
+    9, 13, 15, 7, 12, 8, 9, 11, 7, 7, 12, 7, 6, 15, 13, 11,
+    9, 7, 15, 11, 8, 6, 6, 14, 12, 13, 5, 14, 13, 13, 7, 5,
+    15, 5, 8, 11, 14, 14, 6, 14, 6, 9, 12, 9, 12, 5, 15, 8,
+    8, 5, 12, 9, 12, 5, 14, 6, 8, 13, 6, 5, 15, 13, 11, 11,
+)
+_左常量 = (0x00000000, 0x5A827999, 0x6ED9EBA1, 0x8F1BBCDC, 0xA953FD4E)
+_右常量 = (0x50A28BE6, 0x5C4DD124, 0x6D703EF3, 0x7A6D76E9, 0x00000000)
+
+# 预先把每一步的(消息字下标, 位移, 常量, 轮函数编号)展开成表，压缩循环体
+_左步骤 = tuple((_左消息顺序[j], _左循环位移[j], _左常量[j >> 4], j >> 4) for j in range(80))
+_右步骤 = tuple((_右消息顺序[j], _右循环位移[j], _右常量[j >> 4], 4 - (j >> 4)) for j in range(80))
+
+
+def _ripemd160压缩(状态: List[int], 块: bytes) -> None:
+    X = struct.unpack("<16I", 块)
+    h0, h1, h2, h3, h4 = 状态
+
+    结果 = []
+    for 步骤表 in (_左步骤, _右步骤):
+        a, b, c, d, e = h0, h1, h2, h3, h4
+        for 下标, 位移, 常量, 轮 in 步骤表:
+            if 轮 == 0:
+                f = b ^ c ^ d
+            elif 轮 == 1:
+                f = (b & c) | (~b & d)
+            elif 轮 == 2:
+                f = (b | ~c) ^ d
+            elif 轮 == 3:
+                f = (b & d) | (c & ~d)
+            else:
+                f = b ^ (c | ~d)
+            t = (a + (f & _掩码32) + X[下标] + 常量) & _掩码32
+            t = (((t << 位移) | (t >> (32 - 位移))) + e) & _掩码32
+            a, e, d = e, d, ((c << 10) | (c >> 22)) & _掩码32
+            c, b = b, t
+        结果.append((a, b, c, d, e))
+
+    (al, bl, cl, dl, el), (ar, br, cr, dr, er) = 结果
+    状态[:] = [
+        (h1 + cl + dr) & _掩码32,
+        (h2 + dl + er) & _掩码32,
+        (h3 + el + ar) & _掩码32,
+        (h4 + al + br) & _掩码32,
+        (h0 + bl + cr) & _掩码32,
+    ]
+
+
+def _ripemd160(数据: bytes) -> bytes:
+    """纯Python的RIPEMD-160实现"""
+    状态 = [0x67452301, 0xEFCDAB89, 0x98BADCFE, 0x10325476, 0xC3D2E1F0]
+    填充 = b"\x80" + b"\0" * ((55 - len(数据)) % 64) + struct.pack("<Q", len(数据) * 8)
+    消息 = 数据 + 填充
+    for 偏移 in range(0, len(消息), 64):
+        _ripemd160压缩(状态, 消息[偏移:偏移 + 64])
+    return struct.pack("<5I", *状态)
+
+
+# ===== Keccak-f[1600] =====
+
+_掩码64 = 0xFFFFFFFFFFFFFFFF
+_KECCAK256_速率 = 136
+
+
+def _生成轮常量() -> List[int]:
+    """按Keccak规范用LFSR生成24个轮常量"""
+    轮常量 = []
+    r = 1
+    for _ in range(24):
+        常量 = 0
+        for j in range(7):
+            if r & 1:
+                常量 |= 1 << ((1 << j) - 1)
+            r = ((r << 1) ^ 0x171) if r & 0x80 else (r << 1)
+        轮常量.append(常量)
+    return 轮常量
+
+
+def _生成置换表() -> List[tuple]:
+    """
+    生成rho循环位移与pi置换合并后的表
+
+    每项为(源下标, theta列下标, 目标下标, 左移位数, 右移位数)。
+    lane 0 的位移为0，单独处理，不放入表中。
+    """
+    位移 = [0] * 25
+    x, y = 1, 0
+    for t in range(24):
+        位移[x + 5 * y] = ((t + 1) * (t + 2) // 2) % 64
+        x, y = y, (2 * x + 3 * y) % 5
+    return [(x + 5 * y, x, y + 5 * ((2 * x + 3 * y) % 5), 位移[x + 5 * y], 64 - 位移[x + 5 * y])
+            for y in range(5) for x in range(5) if x or y]
+
+
+_轮常量 = _生成轮常量()
+_置换表 = _生成置换表()
+
+
+def _keccak_f1600(A: List[int]) -> None:
+    """对25个64位lane原地执行24轮Keccak-f[1600]置换"""
+    B = [0] * 25
+    置换表 = _置换表
+    for 轮常量 in _轮常量:
+        # theta
+        C0 = A[0] ^ A[5] ^ A[10] ^ A[15] ^ A[20]
+        C1 = A[1] ^ A[6] ^ A[11] ^ A[16] ^ A[21]
+        C2 = A[2] ^ A[7] ^ A[12] ^ A[17] ^ A[22]
+        C3 = A[3] ^ A[8] ^ A[13] ^ A[18] ^ A[23]
+        C4 = A[4] ^ A[9] ^ A[14] ^ A[19] ^ A[24]
+        D = (
+            C4 ^ (((C1 << 1) | (C1 >> 63)) & _掩码64),
+            C0 ^ (((C2 << 1) | (C2 >> 63)) & _掩码64),
+            C1 ^ (((C3 << 1) | (C3 >> 63)) & _掩码64),
+            C2 ^ (((C4 << 1) | (C4 >> 63)) & _掩码64),
+            C3 ^ (((C0 << 1) | (C0 >> 63)) & _掩码64),
+        )
+        # rho + pi
+        B[0] = A[0] ^ D[0]
+        for 源, 列, 目标, 左移, 右移 in 置换表:
+            v = A[源] ^ D[列]
+            B[目标] = ((v << 左移) | (v >> 右移)) & _掩码64
+        # chi
+        for y in (0, 5, 10, 15, 20):
+            b0, b1, b2, b3, b4 = B[y], B[y + 1], B[y + 2], B[y + 3], B[y + 4]
+            A[y] = b0 ^ (~b1 & b2)
+            A[y + 1] = b1 ^ (~b2 & b3)
+            A[y + 2] = b2 ^ (~b3 & b4)
+            A[y + 3] = b3 ^ (~b4 & b0)
+            A[y + 4] = b4 ^ (~b0 & b1)
+        # iota
+        A[0] ^= 轮常量
+
+
+def _keccak256(数据: bytes) -> bytes:
+    """纯Python的Keccak-256实现（以太坊使用的原始Keccak填充，不是SHA3-256）"""
+    速率 = _KECCAK256_速率
+    填充长度 = 速率 - len(数据) % 速率
+    if 填充长度 == 1:
+        消息 = 数据 + b"\x81"
+    else:
+        消息 = 数据 + b"\x01" + b"\0" * (填充长度 - 2) + b"\x80"
+
+    A = [0] * 25
+    for 偏移 in range(0, len(消息), 速率):
+        lanes = struct.unpack_from("<17Q", 消息, 偏移)
+        for i in range(17):
+            A[i] ^= lanes[i]
+        _keccak_f1600(A)
+    return struct.pack("<4Q", A[0], A[1], A[2], A[3])
+
+
+def _加载原生keccak():
+    """首次使用时导入pycryptodome的Keccak，失败则永久回退到内置实现"""
+    global _原生keccak, KECCAK_原生可用
+    if _原生keccak is None and KECCAK_原生可用:
+        try:
+            from Crypto.Hash import keccak
+            _原生keccak = keccak
+        except ImportError:
+            KECCAK_原生可用 = False
+    return _原生keccak
+
+
+# ===== 公开接口 =====
+
+def hash160(数据: bytes) -> bytes:
+    """计算RIPEMD160(SHA256(数据))"""
+    return hash160_batch([数据])[0]
+
+
+def hash160_batch(数据列表: Sequence[bytes]) -> List[bytes]:
+    """
+    批量计算HASH160
+
+    参数:
+        数据列表: 待哈希的字节串列表（通常是压缩公钥）
+
+    返回:
+        20字节摘要列表，顺序与输入一致
+    """
+    sha256 = hashlib.sha256
+    if RIPEMD160_原生可用:
+        new = hashlib.new
+        return [new('ripemd160', sha256(数据).digest()).digest() for 数据 in 数据列表]
+    return [_ripemd160(sha256(数据).digest()) for 数据 in 数据列表]
+
+
+def keccak256(数据: bytes) -> bytes:
+    """计算Keccak-256"""
+    return keccak_batch([数据])[0]
+
+
+def keccak_batch(数据列表: Sequence[bytes]) -> List[bytes]:
+    """
+    批量计算Keccak-256
+
+    参数:
+        数据列表: 待哈希的字节串列表（通常是64字节未压缩公钥）
+
+    返回:
+        32字节摘要列表，顺序与输入一致
+    """
+    原生keccak = _加载原生keccak()
+    if 原生keccak is not None:
+        new = 原生keccak.new
+        return [new(digest_bits=256, data=数据).digest() for 数据 in 数据列表]
+    return [_keccak256(数据) for 数据 in 数据列表]
+
+
+# 测试代码
+if __name__ == "__main__":
+    print(f"原生RIPEMD160: {'可用' if RIPEMD160_原生可用 else '不可用，使用内置实现'}")
+    print(f"原生Keccak: {'可用' if KECCAK_原生可用 else '不可用，使用内置实现'}")
+    print(f"HASH160(''): {hash160(b'').hex()}")
+    print(f"Keccak-256(''): {keccak256(b'').hex()}")
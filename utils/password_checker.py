@@ -3,12 +3,119 @@
 
 """
 密码强度检查工具
-用于检查密码短语(passphrase)的强度，提供安全建议
+用于检查密码短语(passphrase)的强度，提供安全建议。
+字符类别、重复字符和键盘/字母序列各只线性扫描一遍密码，
+序列按预先计算的三字符表查找，常见密码用集合查找，评分耗时与密码长度成正比。
+熵值按utils.password_guesses估计的最少猜测次数计算，常见密码和BIP-39词表在导入时编译成字典树
 """
 
-import re
 import math
-from typing import Dict, List, Tuple
+from itertools import repeat
+from operator import eq
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.password_guesses import 构建字典树, 排名词表, 估计猜测次数, 增量猜测估计器
+from utils.crack_time import 估计破解耗时
+
+try:
+    from mnemonic import Mnemonic
+    MNEMONIC_AVAILABLE = True
+except ImportError:
+    MNEMONIC_AVAILABLE = False
+
+# 字符类别位
+_小写字母位 = 1
+_大写字母位 = 2
+_数字位 = 4
+_特殊字符位 = 8
+
+# 常见的字母、数字和键盘序列
+_常见序列 = (
+    "abcdefghijklmnopqrstuvwxyz",
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    "0123456789",
+    "qwertyuiop",
+    "asdfghjkl",
+    "zxcvbnm",
+)
+
+
+def _字符类别(字符: str) -> int:
+    """
+    返回单个字符的类别位：小写和大写只计ASCII字母，数字与正则的\\d一致（含其他Unicode数字），
+    特殊字符为ASCII字母数字和空白以外的字符
+    """
+    if "a" <= 字符 <= "z":
+        return _小写字母位
+    if "A" <= 字符 <= "Z":
+        return _大写字母位
+    if "0" <= 字符 <= "9":
+        return _数字位
+    if 字符.isspace():
+        return 0
+    return (_数字位 if 字符.isdecimal() else 0) | _特殊字符位
+
+
+_ASCII字符类别 = {chr(码位): _字符类别(chr(码位)) for 码位 in range(128)}
+
+# 序列中的每个三字符片段（字符三元组） -> 按序列和位置先后的次序，
+# 多个片段同时出现时报告次序最小的一个
+_序列三元组: Dict[Tuple[str, str, str], int] = {}
+for _序列 in _常见序列:
+    for _三元组 in zip(_序列, _序列[1:], _序列[2:]):
+        _序列三元组.setdefault(_三元组, len(_序列三元组))
+_序列三元组次序 = sorted(_序列三元组, key=_序列三元组.__getitem__)
+_无序列 = len(_序列三元组)
+
+
+def _扫描密码(密码: str) -> Tuple[int, int, int, str]:
+    """
+    检查字符类别、重复字符和常见序列
+
+    每项检查都只在C层面线性扫描一遍密码（或其中不同的字符），
+    不再为每个序列片段或每类字符重新搜索整个字符串。
+
+    返回:
+        (字符类别位, 第一个三连字符的位置, 第一个重复双字符的位置, 序列模式)；
+        位置为-1、序列模式为空串表示不存在
+    """
+    类别 = 0
+    for 字符 in set(密码):
+        位 = _ASCII字符类别.get(字符)
+        类别 |= _字符类别(字符) if 位 is None else 位
+
+    # 相邻（间隔1）字符是否相同的标记串中，连续两个1即三连字符；间隔2的标记串中即重复双字符
+    三连位置 = bytes(map(eq, 密码, 密码[1:])).find(b"\x01\x01")
+    双字符位置 = bytes(map(eq, 密码, 密码[2:])).find(b"\x01\x01")
+
+    小写密码 = 密码.lower()
+    序列次序 = min(
+        map(_序列三元组.get, zip(小写密码, 小写密码[1:], 小写密码[2:]), repeat(_无序列)),
+        default=_无序列,
+    )
+    序列模式 = "".join(_序列三元组次序[序列次序]) if 序列次序 < _无序列 else ""
+    return 类别, 三连位置, 双字符位置, 序列模式
+
+
+def _BIP39单词() -> List[str]:
+    """英文BIP-39词表，未安装mnemonic库时为空"""
+    return Mnemonic("english").wordlist if MNEMONIC_AVAILABLE else []
+
+
+def _重复模式结果(密码: str, 三连位置: int, 双字符位置: int) -> Dict:
+    """由扫描结果生成重复模式详情，三连字符优先于重复双字符"""
+    if 三连位置 >= 0:
+        return {"存在": True, "惩罚": 10, "模式": 密码[三连位置] * 3}
+    if 双字符位置 >= 0:
+        return {"存在": True, "惩罚": 5, "模式": 密码[双字符位置:双字符位置 + 2] * 2}
+    return {"存在": False, "惩罚": 0, "模式": ""}
+
+
+def _序列模式结果(序列模式: str) -> Dict:
+    """由扫描结果生成序列模式详情"""
+    if 序列模式:
+        return {"存在": True, "惩罚": 10, "模式": 序列模式}
+    return {"存在": False, "惩罚": 0, "模式": ""}
 
 
 class 密码强度检查器:
@@ -38,7 +145,61 @@ class 密码强度检查器:
         "qwerty", "password", "123abc", "abc123", "123qwe",
         "qwe123", "123456789", "12345678", "111111", "000000"
     ]
+
+    _常见密码集合 = frozenset(常见密码)
+    _中文常见密码集合 = frozenset(中文常见密码)
+
+    # 估计猜测次数用的字典树：常见密码按列表顺序排名，BIP-39单词从2048个词中均匀选取
+    _字典树 = 构建字典树({
+        "常见密码": 排名词表(常见密码),
+        "中文常见密码": 排名词表(中文常见密码),
+        "BIP39单词": 排名词表(_BIP39单词(), 排名=2048),
+    })
+
+    # 可选的离线泄露密码索引（utils.breached_passwords.泄露密码索引），见设置泄露密码索引
+    泄露密码索引: Any = None
+
+    @staticmethod
+    def 设置泄露密码索引(索引: Any) -> None:
+        """
+        设置检查密码强度时使用的离线泄露密码索引
+
+        参数:
+            索引: 索引文件路径、已打开的泄露密码索引对象，或None（不再检查）
+
+        异常:
+            OSError: 索引文件无法打开
+            ValueError: 不是有效的索引文件
+        """
+        if isinstance(索引, str):
+            from utils.breached_passwords import 泄露密码索引
+            索引 = 泄露密码索引(索引)
+        旧索引 = 密码强度检查器.泄露密码索引
+        密码强度检查器.泄露密码索引 = 索引
+        if 旧索引 is not None and 旧索引 is not 索引 and hasattr(旧索引, "关闭"):
+            旧索引.关闭()
     
+    # 本机单核每秒派生的BIP-39种子数（utils.crack_time的校准结果）和攻击者档案，见设置破解速度
+    每秒种子数: Optional[float] = None
+    攻击者档案: Optional[Dict[str, float]] = None
+
+    @staticmethod
+    def 设置破解速度(每秒种子数: Optional[float], 攻击者档案: Optional[Dict[str, float]] = None) -> None:
+        """
+        设置估计破解耗时用的种子派生速度，检查密码强度不会自己测量速度
+
+        参数:
+            每秒种子数: utils.crack_time.校准返回的"每秒种子数"，None表示不再估计破解耗时
+            攻击者档案: 档案名 -> 相对本机单核的速度倍数，为None时使用默认档案
+
+        异常:
+            ValueError: 速度不是正数
+        """
+        if 每秒种子数 is not None and 每秒种子数 <= 0:
+            raise ValueError("每秒种子数必须大于0")
+        密码强度检查器.每秒种子数 = 每秒种子数
+        密码强度检查器.攻击者档案 = 攻击者档案
+
     @staticmethod
     def 检查密码强度(密码: str) -> Dict:
         """
@@ -59,6 +220,11 @@ class 密码强度检查器:
                 "详情": {}
             }
         
+        return 密码强度检查器._评分(密码, *_扫描密码(密码), 估计猜测次数(密码, 密码强度检查器._字典树))
+
+    @staticmethod
+    def _评分(密码: str, 类别: int, 三连位置: int, 双字符位置: int, 序列: str, 猜测次数: Dict) -> Dict:
+        """由扫描结果和猜测次数估计计算评分，检查密码强度和增量密码评分器共用"""
         # 初始化评分和详情
         分数 = 0
         详情 = {}
@@ -81,10 +247,10 @@ class 密码强度检查器:
         详情["长度"] = {"分数": 长度分数, "值": 长度}
         
         # 检查复杂度
-        有小写字母 = bool(re.search(r'[a-z]', 密码))
-        有大写字母 = bool(re.search(r'[A-Z]', 密码))
-        有数字 = bool(re.search(r'\d', 密码))
-        有特殊字符 = bool(re.search(r'[^a-zA-Z0-9\s]', 密码))
+        有小写字母 = bool(类别 & _小写字母位)
+        有大写字母 = bool(类别 & _大写字母位)
+        有数字 = bool(类别 & _数字位)
+        有特殊字符 = bool(类别 & _特殊字符位)
         
         复杂度分数 = 0
         if 有小写字母:
@@ -117,7 +283,7 @@ class 密码强度检查器:
         }
         
         # 检查重复模式
-        重复模式 = 密码强度检查器._检查重复模式(密码)
+        重复模式 = _重复模式结果(密码, 三连位置, 双字符位置)
         if 重复模式["存在"]:
             分数 -= 重复模式["惩罚"]
             建议.append(f"避免使用重复的字符或模式（如'{重复模式['模式']}'）")
@@ -125,7 +291,7 @@ class 密码强度检查器:
         详情["重复模式"] = 重复模式
         
         # 检查序列模式
-        序列模式 = 密码强度检查器._检查序列模式(密码)
+        序列模式 = _序列模式结果(序列)
         if 序列模式["存在"]:
             分数 -= 序列模式["惩罚"]
             建议.append(f"避免使用连续的字符序列（如'{序列模式['模式']}'）")
@@ -133,18 +299,34 @@ class 密码强度检查器:
         详情["序列模式"] = 序列模式
         
         # 检查常见密码
-        if 密码.lower() in 密码强度检查器.常见密码 or 密码 in 密码强度检查器.中文常见密码:
+        if 密码.lower() in 密码强度检查器._常见密码集合 or 密码 in 密码强度检查器._中文常见密码集合:
             分数 = 0
             建议 = ["这是一个非常常见的密码，极易被猜测。请使用更独特的密码。"]
         
-        # 计算熵值（信息熵）
-        熵值 = 密码强度检查器._计算密码熵(密码)
+        # 按最少猜测次数的模式分段计算熵值（位），"aaaaBBBB"这类重复和序列不再算作高熵
+        熵值 = 猜测次数["猜测次数对数"] * math.log2(10)
         熵分数 = min(25, int(熵值 / 4))  # 最高25分
         分数 += 熵分数
         详情["熵值"] = {"分数": 熵分数, "值": 熵值}
+        详情["猜测次数"] = 猜测次数
+        if 密码强度检查器.每秒种子数 is not None:
+            详情["破解耗时"] = 估计破解耗时(猜测次数["猜测次数"], 密码强度检查器.每秒种子数,
+                                     密码强度检查器.攻击者档案)
         
         # 确保分数在0-100之间
         分数 = max(0, min(100, 分数))
+
+        # 出现在泄露密码库中的密码会被字典攻击优先尝试，直接判为0分
+        if 密码强度检查器.泄露密码索引 is not None:
+            已泄露 = 密码 in 密码强度检查器.泄露密码索引
+            详情["泄露密码"] = 已泄露
+            if 已泄露:
+                分数 = 0
+                建议 = ["这个密码出现在已泄露的密码库中，攻击者会最先尝试。请使用从未用过的密码短语。"]
+                if "破解耗时" in 详情:
+                    # 攻击者最多试完整个泄露密码库
+                    详情["破解耗时"] = 估计破解耗时(max(1, len(密码强度检查器.泄露密码索引)),
+                                             密码强度检查器.每秒种子数, 密码强度检查器.攻击者档案)
         
         # 确定强度级别
         if 分数 < 20:
@@ -178,78 +360,27 @@ class 密码强度检查器:
     @staticmethod
     def _检查重复模式(密码: str) -> Dict:
         """检查密码中的重复模式"""
-        结果 = {"存在": False, "惩罚": 0, "模式": ""}
-        
-        # 检查连续重复字符
-        for i in range(len(密码) - 2):
-            if 密码[i] == 密码[i+1] == 密码[i+2]:
-                结果["存在"] = True
-                结果["惩罚"] = 10
-                结果["模式"] = 密码[i] * 3
-                return 结果
-        
-        # 检查重复的双字符
-        for i in range(len(密码) - 3):
-            if 密码[i:i+2] == 密码[i+2:i+4]:
-                结果["存在"] = True
-                结果["惩罚"] = 5
-                结果["模式"] = 密码[i:i+2] * 2
-                return 结果
-        
-        return 结果
+        _, 三连位置, 双字符位置, _ = _扫描密码(密码)
+        return _重复模式结果(密码, 三连位置, 双字符位置)
     
     @staticmethod
     def _检查序列模式(密码: str) -> Dict:
         """检查密码中的序列模式"""
-        结果 = {"存在": False, "惩罚": 0, "模式": ""}
-        
-        # 常见序列
-        序列 = [
-            "abcdefghijklmnopqrstuvwxyz",
-            "ABCDEFGHIJKLMNOPQRSTUVWXYZ",
-            "0123456789",
-            "qwertyuiop",
-            "asdfghjkl",
-            "zxcvbnm"
-        ]
-        
-        for s in 序列:
-            for i in range(len(s) - 2):
-                模式 = s[i:i+3]
-                if 模式 in 密码.lower():
-                    结果["存在"] = True
-                    结果["惩罚"] = 10
-                    结果["模式"] = 模式
-                    return 结果
-        
-        return 结果
+        return _序列模式结果(_扫描密码(密码)[3])
     
     @staticmethod
-    def _计算密码熵(密码: str) -> float:
-        """计算密码的信息熵"""
-        if not 密码:
-            return 0.0
-        
-        # 计算字符频率
-        字符频率 = {}
-        for 字符 in 密码:
-            if 字符 in 字符频率:
-                字符频率[字符] += 1
-            else:
-                字符频率[字符] = 1
-        
-        # 计算熵
-        熵 = 0.0
-        长度 = len(密码)
-        for 频率 in 字符频率.values():
-            概率 = 频率 / 长度
-            熵 -= 概率 * math.log2(概率)
-        
-        # 调整熵值，考虑密码长度
-        调整熵 = 熵 * 长度
-        
-        return 调整熵
-    
+    def 创建增量评分器(初始密码: str = "") -> "增量密码评分器":
+        """
+        创建边输入边评分的评分器，每次按键后调用其结果()即可显示实时强度
+
+        参数:
+            初始密码: 评分器的初始内容
+
+        返回:
+            增量密码评分器
+        """
+        return 增量密码评分器(初始密码)
+
     @staticmethod
     def 生成密码建议() -> List[str]:
         """生成强密码的建议"""
@@ -271,6 +402,12 @@ class 密码强度检查器:
         输出 = f"\n===== 密码强度检查结果 =====\n"
         输出 += f"强度: {结果['强度']} ({结果['分数']}/100)\n"
         
+        破解耗时 = 结果.get("详情", {}).get("破解耗时")
+        if 破解耗时:
+            输出 += "\n已知助记词时穷举该密码短语的耗时:\n"
+            for 行 in 破解耗时:
+                输出 += f"- {行['档案']}: {行['描述']}\n"
+
         if 结果['建议']:
             输出 += "\n建议:\n"
             for 建议 in 结果['建议']:
@@ -279,6 +416,91 @@ class 密码强度检查器:
         return 输出
 
 
+class 增量密码评分器:
+    """
+    边输入边评分，结果与对整个密码调用检查密码强度相同
+
+    每个前缀保存一份扫描状态：字符类别、第一个三连字符和重复双字符的位置、
+    最后两个小写字符和其中最靠前的序列三元组，猜测次数由增量猜测估计器维护（含字典树中
+    尚未走完的节点）。追加一个字符只需根据上一个前缀的状态计算，删除只需丢弃末尾的状态；
+    只有结果()中的常见密码和泄露密码查找需要整个密码
+    """
+
+    def __init__(self, 初始密码: str = ""):
+        self._字符列表: List[str] = []
+        # 每个前缀: (字符类别位, 三连位置, 双字符位置, 最后两个小写字符, 序列次序)
+        self._状态: List[Tuple[int, int, int, str, int]] = []
+        self._猜测估计器 = 增量猜测估计器(密码强度检查器._字典树)
+        self.追加(初始密码)
+
+    @property
+    def 密码(self) -> str:
+        """当前的密码"""
+        return "".join(self._字符列表)
+
+    def __len__(self) -> int:
+        return len(self._字符列表)
+
+    def 追加(self, 字符串: str) -> None:
+        """在末尾追加字符（如每次按键输入的字符）"""
+        for 字符 in 字符串:
+            self._追加字符(字符)
+        self._猜测估计器.追加(字符串)
+
+    def _追加字符(self, 字符: str) -> None:
+        字符列表 = self._字符列表
+        类别, 三连位置, 双字符位置, 末尾小写, 序列次序 = (
+            self._状态[-1] if self._状态 else (0, -1, -1, "", _无序列))
+        位置 = len(字符列表)
+        字符列表.append(字符)
+
+        位 = _ASCII字符类别.get(字符)
+        类别 |= _字符类别(字符) if 位 is None else 位
+        if 三连位置 < 0 and 位置 >= 2 and 字符 == 字符列表[位置 - 1] == 字符列表[位置 - 2]:
+            三连位置 = 位置 - 2
+        if (双字符位置 < 0 and 位置 >= 3 and 字符 == 字符列表[位置 - 2]
+                and 字符列表[位置 - 1] == 字符列表[位置 - 3]):
+            双字符位置 = 位置 - 3
+        # 小写后可能不止一个字符，与对整个密码调用lower()得到的三元组相同
+        for 小写字符 in 字符.lower():
+            if len(末尾小写) == 2:
+                序列次序 = min(序列次序, _序列三元组.get((末尾小写[0], 末尾小写[1], 小写字符), _无序列))
+            末尾小写 = 末尾小写[-1:] + 小写字符
+
+        self._状态.append((类别, 三连位置, 双字符位置, 末尾小写, 序列次序))
+
+    def 删除(self, 个数: int = 1) -> None:
+        """
+        删除末尾的字符（如退格键）
+
+        参数:
+            个数: 删除的字符数，超过密码长度时删除全部字符
+        """
+        个数 = min(个数, len(self))
+        if 个数 > 0:
+            del self._字符列表[-个数:]
+            del self._状态[-个数:]
+            self._猜测估计器.删除(个数)
+
+    def 清空(self) -> None:
+        """删除全部字符"""
+        self.删除(len(self))
+
+    def 结果(self) -> Dict:
+        """
+        当前密码的评分
+
+        返回:
+            与检查密码强度相同格式的字典
+        """
+        if not self._字符列表:
+            return 密码强度检查器.检查密码强度("")
+        类别, 三连位置, 双字符位置, _, 序列次序 = self._状态[-1]
+        序列模式 = "".join(_序列三元组次序[序列次序]) if 序列次序 < _无序列 else ""
+        return 密码强度检查器._评分(self.密码, 类别, 三连位置, 双字符位置, 序列模式,
+                                  self._猜测估计器.结果())
+
+
 # 测试代码
 if __name__ == "__main__":
     测试密码 = "password123"
@@ -0,0 +1,665 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+密码猜测次数估计
+仿照zxcvbn：先找出密码中所有可能的模式匹配（字典单词、键盘路径、重复、序列、日期），
+每个匹配都估计攻击者按该模式猜中它所需的次数，再用动态规划在匹配位置上
+选出整体猜测次数最少的分段，未被匹配覆盖的字符按暴力破解计算。
+字典在调用方导入时一次性编译成字典树。匹配按字符逐个扫描，每追加一个字符只报告以它结尾的匹配，
+因此可以边输入边估计（见增量猜测估计器）
+"""
+
+import re
+import math
+from datetime import date
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 匹配: (开始, 结束(含), 猜测次数的常用对数, 模式, 附加信息)
+匹配 = Tuple[int, int, float, str, Dict[str, Any]]
+
+# 暴力破解每个字符的猜测次数，以及未覆盖整个密码的单字符/多字符匹配的最少猜测次数
+_暴力破解基数 = 10
+_单字符最少猜测次数 = 10
+_多字符最少猜测次数 = 50
+# 分段越多攻击者需要尝试的组合越多，每多一段至少乘以这个数
+_分段增长惩罚对数 = 4.0
+
+_参考年份 = date.today().year
+_最小年份跨度 = 20
+_最小年份, _最大年份 = 1000, 2050
+
+# 字典树中保存(字典名, 排名)的键，空串不会与任何字符冲突
+_词尾 = ""
+
+
+class 字典树(dict):
+    """字典树的根节点，按对象身份哈希，可以作为缓存的键"""
+
+    __hash__ = object.__hash__
+
+
+def 构建字典树(词典: Dict[str, Dict[str, int]]) -> 字典树:
+    """
+    把若干排名词表编译成一棵字典树
+
+    参数:
+        词典: 字典名 -> {单词: 排名}，排名即攻击者按该词表猜中此单词需要的次数；
+              同一单词出现在多个词表中时取排名最小的一个
+
+    返回:
+        嵌套字典形式的字典树，单词统一按小写存放
+    """
+    根节点 = 字典树()
+    for 字典名, 词表 in 词典.items():
+        for 单词, 排名 in 词表.items():
+            if not 单词:
+                continue
+            节点 = 根节点
+            for 字符 in 单词.lower():
+                节点 = 节点.setdefault(字符, {})
+            已有 = 节点.get(_词尾)
+            if 已有 is None or 排名 < 已有[1]:
+                节点[_词尾] = (字典名, 排名)
+    return 根节点
+
+
+def 排名词表(单词列表: Iterable[str], 排名: Optional[int] = None) -> Dict[str, int]:
+    """
+    由单词列表生成排名词表
+
+    参数:
+        单词列表: 按常用程度排序的单词
+        排名: 指定时所有单词使用同一排名（如从固定词表中均匀随机选词）
+
+    返回:
+        单词 -> 排名，重复的单词保留第一次出现的排名
+    """
+    词表: Dict[str, int] = {}
+    for 序号, 单词 in enumerate(单词列表, 1):
+        词表.setdefault(单词.lower(), 排名 or 序号)
+    return 词表
+
+
+def _大小写变化(片段: str) -> int:
+    """字典单词的大小写变体数：全小写为1，首字母、末字母或全部大写为2，否则按大写字母的组合数"""
+    if 片段.islower() or 片段 == 片段.lower():
+        return 1
+    if 片段.isupper() or 片段[1:] == 片段[1:].lower() or 片段[:-1] == 片段[:-1].lower():
+        return 2
+    大写数 = sum(1 for 字符 in 片段 if 字符.isupper())
+    小写数 = sum(1 for 字符 in 片段 if 字符.islower())
+    return sum(math.comb(大写数 + 小写数, 个数) for 个数 in range(1, min(大写数, 小写数) + 1))
+
+
+# 美式QWERTY键盘：每行的未按/按住Shift字符和相对第一行的水平偏移（以键宽为单位）
+_键盘行 = (
+    ("`1234567890-=", "~!@#$%^&*()_+", 0.0),
+    ("qwertyuiop[]\\", "QWERTYUIOP{}|", 1.5),
+    ("asdfghjkl;'", "ASDFGHJKL:\"", 1.75),
+    ("zxcvbnm,./", "ZXCVBNM<>?", 2.25),
+)
+
+
+def _构建键盘图() -> Tuple[Dict[str, Tuple[str, bool]], Dict[str, Dict[str, Tuple[int, int]]]]:
+    """返回 字符 -> (按键, 是否按住Shift) 和 按键 -> {相邻按键: 方向}"""
+    键位: Dict[str, Tuple[str, bool]] = {}
+    坐标: Dict[str, Tuple[int, float]] = {}
+    for 行号, (未上档, 上档, 偏移) in enumerate(_键盘行):
+        for 列号, (按键, 上档字符) in enumerate(zip(未上档, 上档)):
+            键位[按键] = (按键, False)
+            键位[上档字符] = (按键, True)
+            坐标[按键] = (行号, 列号 + 偏移)
+    相邻: Dict[str, Dict[str, Tuple[int, int]]] = {按键: {} for 按键 in 坐标}
+    for 按键, (行号, 横坐标) in 坐标.items():
+        for 另一键, (另一行, 另一横坐标) in 坐标.items():
+            行差, 横差 = 另一行 - 行号, 另一横坐标 - 横坐标
+            if (行差 == 0 and abs(横差) == 1) or (abs(行差) == 1 and abs(横差) <= 0.75):
+                相邻[按键][另一键] = (行差, round(横差 * 4))
+    return 键位, 相邻
+
+
+_键位, _相邻按键 = _构建键盘图()
+_键盘起点数 = len(_相邻按键)
+_键盘平均度 = sum(map(len, _相邻按键.values())) / _键盘起点数
+
+
+@lru_cache(maxsize=4096)
+def _键盘路径猜测次数(长度: int, 转弯数: int, 上档数: int) -> float:
+    """长度不超过L、转弯不超过T次的键盘路径总数，按住Shift的字符再乘以组合数"""
+    猜测次数 = 0.0
+    for 路径长度 in range(2, 长度 + 1):
+        for 转弯 in range(1, min(转弯数, 路径长度 - 1) + 1):
+            猜测次数 += math.comb(路径长度 - 1, 转弯 - 1) * _键盘起点数 * _键盘平均度 ** 转弯
+    未上档数 = 长度 - 上档数
+    if 上档数 and 未上档数:
+        猜测次数 *= sum(math.comb(长度, 个数) for 个数 in range(1, min(上档数, 未上档数) + 1))
+    elif 上档数:
+        猜测次数 *= 2
+    return 猜测次数
+
+
+_年份 = re.compile(r"19\d\d|20\d\d")
+# 日期只由数字和这些分隔符组成
+_日期字符 = frozenset("0123456789/\\_. -")
+_最长日期 = 10
+_无分隔日期 = re.compile(r"\d{4,8}")
+_有分隔日期 = re.compile(r"(\d{1,4})([\s/\\_.-])(\d{1,2})\2(\d{1,4})")
+
+# 无分隔符日期按长度的两处切分位置，如"13111997"切成13/11/1997
+_日期切分 = {
+    4: ((1, 2), (2, 3)),
+    5: ((1, 3), (2, 3)),
+    6: ((1, 2), (2, 4), (4, 5)),
+    7: ((1, 3), (2, 3), (4, 5), (4, 6)),
+    8: ((2, 4), (4, 6)),
+}
+
+
+def _日月(两数: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+    """按日月或月日解释两个整数，返回(日, 月)"""
+    for 日, 月 in (两数, 两数[::-1]):
+        if 1 <= 日 <= 31 and 1 <= 月 <= 12:
+            return 日, 月
+    return None
+
+
+def _年月日(三数: Tuple[int, int, int]) -> Optional[Tuple[int, int, int]]:
+    """把三个整数解释为(年, 月, 日)，年份在首或尾，两位年份补全到1951-2050"""
+    if 三数[1] > 31 or 三数[1] <= 0:
+        return None
+    超过12 = 超过31 = 小于1 = 0
+    for 数 in 三数:
+        if 99 < 数 < _最小年份 or 数 > _最大年份:
+            return None
+        超过31 += 数 > 31
+        超过12 += 数 > 12
+        小于1 += 数 <= 0
+    if 超过31 >= 2 or 超过12 == 3 or 小于1 >= 2:
+        return None
+    候选 = ((三数[2], 三数[:2]), (三数[0], 三数[1:]))
+    for 年, 其余 in 候选:
+        if _最小年份 <= 年 <= _最大年份:
+            日月 = _日月(其余)
+            return (年, 日月[1], 日月[0]) if 日月 else None
+    for 年, 其余 in 候选:
+        日月 = _日月(其余)
+        if 日月:
+            年 = 年 if 年 > 99 else 1900 + 年 if 年 > 50 else 2000 + 年
+            return 年, 日月[1], 日月[0]
+    return None
+
+
+def _日期猜测次数对数(年: int, 有分隔符: bool) -> float:
+    return math.log10(max(abs(年 - _参考年份), _最小年份跨度) * 365 * (4 if 有分隔符 else 1))
+
+
+@lru_cache(maxsize=4096)
+def _解析日期(子串: str) -> Optional[Tuple[int, int, int, bool]]:
+    """把4-8位数字或带分隔符的6-10个字符解释为日期，返回(年, 月, 日, 是否有分隔符)"""
+    if len(子串) <= 8 and _无分隔日期.fullmatch(子串):
+        候选 = []
+        for 切点一, 切点二 in _日期切分[len(子串)]:
+            年月日 = _年月日((int(子串[:切点一]), int(子串[切点一:切点二]), int(子串[切点二:])))
+            if 年月日:
+                候选.append(年月日)
+        if 候选:
+            return min(候选, key=lambda 候选日期: abs(候选日期[0] - _参考年份)) + (False,)
+    elif len(子串) >= 6:
+        分段 = _有分隔日期.fullmatch(子串)
+        if 分段:
+            年月日 = _年月日((int(分段.group(1)), int(分段.group(3)), int(分段.group(4))))
+            if 年月日:
+                return 年月日 + (True,)
+    return None
+
+
+# 重复单元只在同一字符最近几次出现的位置中找，避免长串相同字符时逐个长度比较
+_重复候选数 = 8
+
+
+def _序列基数(首字符: str, 公差: int) -> int:
+    """等差序列的起点个数：常见起点（a、z、0、1、9）为4，数字为10，其余为26，递减的再乘以2"""
+    if 首字符 in "aAzZ019":
+        基数 = 4
+    elif 首字符.isdigit():
+        基数 = 10
+    else:
+        基数 = 26
+    return 基数 * 2 if 公差 < 0 else 基数
+
+
+class _匹配扫描器:
+    """
+    逐字符扫描密码，每追加一个字符只报告以它结尾的匹配
+
+    每个位置保存一份扫描状态：字典树中仍在前进的节点、当前的键盘路径和等差序列、
+    以此结尾的各重复单元的重复次数、连续的日期字符数。追加字符只需看上一个位置的状态，
+    删除最后一个字符只需丢弃它的状态，之前报告的匹配都不受影响
+    """
+
+    def __init__(self, 字典树: Dict):
+        self.字典树 = 字典树
+        self.字符列表: List[str] = []
+        # 每个位置: (字典树活动节点, 键盘路径, 等差序列, {重复单元长度: 重复次数}, 连续日期字符数)
+        self._状态: List[Tuple] = []
+        self._出现位置: Dict[str, List[int]] = {}
+
+    def 追加(self, 字符: str) -> List[匹配]:
+        """
+        追加一个字符
+
+        参数:
+            字符: 追加的字符
+
+        返回:
+            以该字符结尾的匹配，猜测次数尚未应用最少次数
+        """
+        字符列表 = self.字符列表
+        位置 = len(字符列表)
+        字符列表.append(字符)
+        上一状态 = self._状态[-1] if self._状态 else ((), None, None, {}, 0)
+        结果: List[匹配] = []
+
+        # 字典：已有的活动节点和从这里开始的根节点各走一步（小写后可能不止一个字符）
+        小写 = 字符.lower()
+        活动节点 = []
+        for 开始, 节点 in 上一状态[0] + ((位置, self.字典树),):
+            for 小写字符 in 小写:
+                节点 = 节点.get(小写字符)
+                if 节点 is None:
+                    break
+            else:
+                活动节点.append((开始, 节点))
+                条目 = 节点.get(_词尾)
+                if 条目 is not None:
+                    片段 = "".join(字符列表[开始:])
+                    结果.append((开始, 位置, math.log10(条目[1] * _大小写变化(片段)), "字典",
+                                 {"字典": 条目[0], "单词": 片段.lower(), "排名": 条目[1]}))
+
+        # 键盘路径: (开始, 转弯数, 上档数, 上一方向, 当前按键)
+        键位 = _键位.get(字符)
+        键盘路径 = None
+        if 键位 is not None:
+            上一路径 = 上一状态[1]
+            方向 = None if 上一路径 is None else _相邻按键[上一路径[4]].get(键位[0])
+            if 方向 is None:
+                键盘路径 = (位置, 0, int(键位[1]), None, 键位[0])
+            else:
+                开始, 转弯数, 上档数, 上一方向, _ = 上一路径
+                键盘路径 = (开始, 转弯数 + (方向 != 上一方向), 上档数 + 键位[1], 方向, 键位[0])
+                if 位置 - 开始 >= 2:
+                    结果.append((开始, 位置, math.log10(_键盘路径猜测次数(位置 - 开始 + 1, *键盘路径[1:3])),
+                                 "键盘路径", {"转弯数": 键盘路径[1], "上档数": 键盘路径[2]}))
+
+        # 等差序列: (开始, 公差)，相邻的两段序列共用端点；公差为±1时两个字符即可
+        等差序列 = None
+        if 位置:
+            公差 = ord(字符) - ord(字符列表[位置 - 1])
+            上一序列 = 上一状态[2]
+            开始 = 上一序列[0] if 上一序列 is not None and 上一序列[1] == 公差 else 位置 - 1
+            等差序列 = (开始, 公差)
+            if 0 < abs(公差) <= 5 and (位置 - 开始 > 1 or abs(公差) == 1):
+                结果.append((开始, 位置, math.log10(_序列基数(字符列表[开始], 公差) * (位置 - 开始 + 1)),
+                             "序列", {"公差": 公差}))
+
+        # 重复：单元长度只可能是到同一字符之前出现位置的距离，取覆盖最长（相同时单元最短）的一种
+        重复: Dict[int, int] = {}
+        出现位置 = self._出现位置.setdefault(字符, [])
+        最长覆盖 = 最佳单元 = 0
+        for 之前 in reversed(出现位置[-_重复候选数:]):
+            单元长度 = 位置 - 之前
+            if 单元长度 * 2 > 位置 + 1:
+                break
+            if 字符列表[之前 - 单元长度 + 1:之前 + 1] == 字符列表[之前 + 1:位置 + 1]:
+                重复次数 = 重复[单元长度] = self._状态[之前][3].get(单元长度, 1) + 1
+                if 重复次数 * 单元长度 > 最长覆盖:
+                    最长覆盖, 最佳单元 = 重复次数 * 单元长度, 单元长度
+        出现位置.append(位置)
+        if 最长覆盖:
+            单元 = "".join(字符列表[位置 - 最佳单元 + 1:])
+            # 单个字符的重复单元直接按暴力破解计算
+            单元对数 = _暴力对数 if 最佳单元 == 1 else _最少猜测次数对数(单元, self.字典树)
+            结果.append((位置 - 最长覆盖 + 1, 位置, 单元对数 + math.log10(重复[最佳单元]), "重复",
+                         {"重复单元": 单元, "重复次数": 重复[最佳单元]}))
+
+        # 日期：以此结尾的年份（19xx/20xx），以及以此结尾的最长的日/月/年组合
+        日期字符数 = 上一状态[4] + 1 if 字符 in _日期字符 else 0
+        if 日期字符数 >= 4:
+            尾部 = "".join(字符列表[位置 + 1 - min(日期字符数, _最长日期):])
+            if _年份.fullmatch(尾部[-4:]):
+                年 = int(尾部[-4:])
+                结果.append((位置 - 3, 位置, math.log10(max(abs(年 - _参考年份), _最小年份跨度)),
+                             "日期", {"年": 年}))
+            for 长度 in range(len(尾部), 3, -1):
+                日期 = _解析日期(尾部[-长度:])
+                if 日期:
+                    年, 月, 日, 有分隔符 = 日期
+                    结果.append((位置 - 长度 + 1, 位置, _日期猜测次数对数(年, 有分隔符), "日期",
+                                 {"年": 年, "月": 月, "日": 日}))
+                    break
+
+        self._状态.append((tuple(活动节点), 键盘路径, 等差序列, 重复, 日期字符数))
+        return 结果
+
+    def 删除(self) -> None:
+        """删除最后一个字符"""
+        字符 = self.字符列表.pop()
+        self._状态.pop()
+        self._出现位置[字符].pop()
+
+
+def 查找所有匹配(密码: str, 字典树: Dict) -> List[匹配]:
+    """
+    找出密码中所有的模式匹配
+
+    参数:
+        密码: 要分析的密码
+        字典树: 构建字典树返回的字典树
+
+    返回:
+        匹配列表，每项为(开始, 结束(含), 猜测次数的常用对数, 模式, 附加信息)；
+        未覆盖整个密码的匹配至少计10（单字符）或50次猜测
+    """
+    扫描器 = _匹配扫描器(字典树)
+    结果: List[匹配] = []
+    for 字符 in 密码:
+        结果 += 扫描器.追加(字符)
+
+    末位 = len(密码) - 1
+    for 序号, 项 in enumerate(结果):
+        if 项[0] > 0 or 项[1] < 末位:
+            结果[序号] = _应用最少次数(项)
+    return 结果
+
+
+_单字符下限 = math.log10(_单字符最少猜测次数)
+_多字符下限 = math.log10(_多字符最少猜测次数)
+_暴力对数 = math.log10(_暴力破解基数)
+
+
+def _应用最少次数(项: 匹配) -> 匹配:
+    """未覆盖整个密码的匹配至少计10（单字符）或50次猜测"""
+    下限 = _单字符下限 if 项[0] == 项[1] else _多字符下限
+    return 项 if 项[2] >= 下限 else (项[0], 项[1], 下限, 项[3], 项[4])
+
+
+_自然对数10 = math.log(10)
+
+
+def _阶乘对数(段数: int) -> float:
+    """段数!的常用对数"""
+    return math.lgamma(段数 + 1) / _自然对数10
+
+
+def _总猜测次数对数(段数: int, 对数和: float) -> float:
+    """log10(段数! × ∏各段猜测次数 + 10000^(段数-1))"""
+    第一项 = _阶乘对数(段数) + 对数和
+    第二项 = _分段增长惩罚对数 * (段数 - 1)
+    较大, 较小 = (第一项, 第二项) if 第一项 >= 第二项 else (第二项, 第一项)
+    return 较大 + math.log10(1 + 10 ** (较小 - 较大))
+
+
+def _保留非劣状态(状态: Dict[int, Tuple]) -> Dict[int, Tuple]:
+    """
+    去掉不可能得到更少总猜测次数的状态
+
+    段数较少的状态只要 对数和 + log10(段数!) 不更大，之后无论再接哪些段，
+    总猜测次数都不会比段数较多的状态更大，段数较多的状态即可舍弃
+    """
+    if len(状态) < 2:
+        return 状态
+    保留 = {}
+    最小值 = math.inf
+    for 段数 in sorted(状态):
+        值 = 状态[段数][0] + _阶乘对数(段数)
+        if 值 < 最小值:
+            最小值 = 值
+            保留[段数] = 状态[段数]
+    return 保留
+
+
+def _暴力状态(暴力起点: Dict[int, Tuple[float, int, int]], 前缀: int) -> Dict[int, Tuple]:
+    """由暴力起点得到以暴力破解结尾、长度为前缀的状态，回溯为(暴力破解段开始, 上一段数)"""
+    return {段数: (代价 + 前缀 * _暴力对数, (开始, 上一段数))
+            for 段数, (代价, 开始, 上一段数) in 暴力起点.items()}
+
+
+def _接上匹配(新模式: Dict[int, Tuple], 项: 匹配, 模式前驱: Dict[int, Tuple], 暴力前驱: Dict[int, Tuple],
+          段数上限: float = math.inf) -> None:
+    """把匹配接在它开始位置的模式状态和暴力状态之后，按段数保留对数和最小的状态"""
+    开始, 对数 = 项[0], 项[2]
+    for 是暴力, 前驱 in ((False, 模式前驱), (True, 暴力前驱)):
+        for 段数, (对数和, _) in 前驱.items():
+            if 段数 >= 段数上限:
+                continue
+            新和 = 对数和 + 对数
+            已有 = 新模式.get(段数 + 1)
+            if 已有 is None or 新和 < 已有[0]:
+                新模式[段数 + 1] = (新和, (开始, 是暴力, 段数, 项))
+
+
+def _更新暴力起点(暴力起点: Dict[int, Tuple[float, int, int]], 新模式: Dict[int, Tuple], 前缀: int,
+            段数上限: float = math.inf) -> Dict[int, Tuple[float, int, int]]:
+    """返回加入前缀处的模式状态后的暴力起点，不修改传入的字典"""
+    结果 = dict(暴力起点)
+    for 段数, (对数和, _) in 新模式.items():
+        if 段数 >= 段数上限:
+            continue
+        代价 = 对数和 - 前缀 * _暴力对数
+        已有 = 结果.get(段数 + 1)
+        if 已有 is None or 代价 < 已有[0]:
+            结果[段数 + 1] = (代价, 前缀, 段数)
+    return _保留非劣状态(结果)
+
+
+def _选出最优(模式状态: Dict[int, Tuple], 暴力状态: Dict[int, Tuple]) -> Tuple[float, bool, int]:
+    """在以整个密码结尾的状态中选出总猜测次数最少的，返回(总对数, 是否暴力破解结尾, 段数)"""
+    最优 = None
+    for 是暴力, 状态 in ((False, 模式状态), (True, 暴力状态)):
+        for 段数, (对数和, _) in 状态.items():
+            总对数 = _总猜测次数对数(段数, 对数和)
+            if 最优 is None or 总对数 < 最优[0]:
+                最优 = (总对数, 是暴力, 段数)
+    return 最优
+
+
+def _回溯分段(模式状态: Sequence[Dict[int, Tuple]], 暴力状态: Callable[[int], Dict[int, Tuple]],
+          前缀: int, 是暴力: bool, 段数: int) -> List[匹配]:
+    """
+    从最优状态回溯出按位置排列的分段
+
+    参数:
+        模式状态: 可按前缀长度取以模式匹配结尾的状态
+        暴力状态: 由前缀长度得到以暴力破解结尾的状态
+        前缀, 是暴力, 段数: 最优状态
+    """
+    分段: List[匹配] = []
+    while 前缀 > 0:
+        if 是暴力:
+            开始, 上一段数 = 暴力状态(前缀)[段数][1]
+            分段.append((开始, 前缀 - 1, (前缀 - 开始) * _暴力对数, "暴力破解", {}))
+            前缀, 是暴力, 段数 = 开始, False, 上一段数
+        else:
+            开始, 是暴力, 上一段数, 项 = 模式状态[前缀][段数][1]
+            分段.append(项)
+            前缀, 段数 = 开始, 上一段数
+    分段.reverse()
+    return 分段
+
+
+def 最优分段(密码: str, 匹配列表: List[匹配]) -> Tuple[float, List[匹配]]:
+    """
+    选出总猜测次数最少的分段
+
+    总猜测次数按zxcvbn计算：段数! × 各段猜测次数之积 + 10000^(段数-1)。
+    状态为(前缀长度, 段数)，值为各段猜测次数的对数和，分最后一段是模式匹配和暴力破解两种；
+    连续的暴力破解字符合并为一段，每个字符乘以10。
+    只有匹配的起止位置和密码末尾需要计算状态：以暴力破解结尾的状态等于
+    之前某个模式状态加上其后全部字符的暴力破解代价，按段数维护这个代价的最小值即可。
+
+    参数:
+        密码: 要分析的密码
+        匹配列表: 查找所有匹配的结果
+
+    返回:
+        (总猜测次数的常用对数, 按位置排列的分段)，暴力破解段的模式为"暴力破解"
+    """
+    长度 = len(密码)
+    按结束位置: Dict[int, List[匹配]] = {}
+    起点位置 = {长度}
+    for 项 in 匹配列表:
+        按结束位置.setdefault(项[1] + 1, []).append(项)
+        起点位置.add(项[0])
+    起点位置.discard(0)
+
+    # 全部按暴力破解的总猜测次数对数不超过 长度×暴力对数+1，而总猜测次数至少是10000^(段数-1)，
+    # 段数更多的分段不可能更优
+    段数上限 = int((长度 * _暴力对数 + 1) / _分段增长惩罚对数) + 1
+    # 前缀长度 -> {段数: (对数和, 回溯)}
+    # 模式状态的回溯为(本段开始, 上一状态是否为暴力破解, 上一段数, 本段匹配)，
+    # 暴力状态的回溯为(暴力破解段开始, 上一段数)，上一状态总是模式状态
+    模式状态: Dict[int, Dict[int, Tuple]] = {0: {0: (0.0, None)}}
+    暴力状态: Dict[int, Dict[int, Tuple]] = {}
+    # 暴力破解段之后的段数 -> (之前模式状态的对数和 - 开始位置 × 每字符代价, 开始位置, 之前段数)
+    暴力起点: Dict[int, Tuple[float, int, int]] = {1: (0.0, 0, 0)}
+    for 前缀 in sorted(起点位置.union(按结束位置)):
+        # 暴力状态只在有匹配从这里开始或到达末尾时才会用到
+        if 前缀 in 起点位置:
+            暴力状态[前缀] = _暴力状态(暴力起点, 前缀)
+
+        新模式: Dict[int, Tuple] = {}
+        for 项 in 按结束位置.get(前缀, ()):
+            _接上匹配(新模式, 项, 模式状态.get(项[0], {}), 暴力状态.get(项[0], {}), 段数上限)
+        if not 新模式:
+            continue
+        模式状态[前缀] = 新模式 = _保留非劣状态(新模式)
+        暴力起点 = _更新暴力起点(暴力起点, 新模式, 前缀, 段数上限)
+
+    总对数, 是暴力, 段数 = _选出最优(模式状态.get(长度, {}), 暴力状态[长度])
+    return 总对数, _回溯分段(模式状态, 暴力状态.__getitem__, 长度, 是暴力, 段数)
+
+
+@lru_cache(maxsize=1024)
+def _最少猜测次数对数(密码: str, 字典树: Dict) -> float:
+    """重复单元的最少猜测次数对数"""
+    return 最优分段(密码, 查找所有匹配(密码, 字典树))[0]
+
+
+def _次数(对数: float) -> float:
+    """由常用对数还原猜测次数，超出浮点数范围（约300个暴力破解字符）时为无穷大"""
+    return 10 ** 对数 if 对数 < 308 else math.inf
+
+
+def _汇总(密码: str, 总对数: float, 分段: List[匹配]) -> Dict:
+    """把最优分段整理成估计猜测次数的返回格式"""
+    匹配序列 = []
+    for 开始, 结束, 对数, 模式, 附加 in 分段:
+        匹配序列.append({"模式": 模式, "片段": 密码[开始:结束 + 1], "开始": 开始, "结束": 结束,
+                         "猜测次数": _次数(对数), **附加})
+    return {"猜测次数": _次数(总对数), "猜测次数对数": 总对数, "匹配序列": 匹配序列}
+
+
+def 估计猜测次数(密码: str, 字典树: Dict) -> Dict:
+    """
+    估计攻击者按已知模式猜中密码所需的次数
+
+    参数:
+        密码: 要分析的密码
+        字典树: 构建字典树返回的字典树
+
+    返回:
+        {"猜测次数": 浮点数, "猜测次数对数": 常用对数, "匹配序列": [每段的模式、片段、位置和猜测次数]}
+    """
+    if not 密码:
+        return _汇总(密码, 0.0, [])
+    总对数, 分段 = 最优分段(密码, 查找所有匹配(密码, 字典树))
+    return _汇总(密码, 总对数, 分段)
+
+
+class 增量猜测估计器:
+    """
+    边输入边估计猜测次数，结果与对整个密码调用估计猜测次数相同
+
+    匹配扫描器只报告以新字符结尾的匹配，最优分段的状态也只依赖以各位置结尾的匹配，
+    所以追加一个字符只需计算新前缀的状态。每个前缀的状态都保留着，
+    删除最后一个字符只需丢弃它们，不必重新扫描整个密码。
+    状态中的匹配都按未覆盖整个密码应用了最少次数，覆盖整个前缀的匹配另外记下原值，
+    在取结果时比较
+    """
+
+    def __init__(self, 字典树: Dict, 密码: str = ""):
+        self._扫描器 = _匹配扫描器(字典树)
+        # 前缀长度 -> 以模式匹配结尾的状态，格式同最优分段
+        self._模式状态: List[Dict[int, Tuple]] = [{0: (0.0, None)}]
+        # 前缀长度 -> 处理完该前缀后的暴力起点，没有变化时与上一个前缀共用同一个字典
+        self._暴力起点: List[Dict[int, Tuple[float, int, int]]] = [{1: (0.0, 0, 0)}]
+        # 前缀长度 -> 覆盖整个前缀、未应用最少次数的最优匹配
+        self._整体匹配: List[Optional[匹配]] = [None]
+        self.追加(密码)
+
+    @property
+    def 密码(self) -> str:
+        """当前的密码"""
+        return "".join(self._扫描器.字符列表)
+
+    def __len__(self) -> int:
+        return len(self._扫描器.字符列表)
+
+    def 追加(self, 字符串: str) -> None:
+        """在末尾追加字符"""
+        for 字符 in 字符串:
+            self._追加字符(字符)
+
+    def 删除(self, 个数: int = 1) -> None:
+        """
+        删除末尾的字符
+
+        参数:
+            个数: 删除的字符数，超过密码长度时删除全部字符
+        """
+        for _ in range(min(个数, len(self))):
+            self._扫描器.删除()
+            self._模式状态.pop()
+            self._暴力起点.pop()
+            self._整体匹配.pop()
+
+    def _暴力状态(self, 前缀: int) -> Dict[int, Tuple]:
+        """以暴力破解结尾、长度为前缀的状态"""
+        return _暴力状态(self._暴力起点[前缀 - 1], 前缀) if 前缀 else {}
+
+    def _追加字符(self, 字符: str) -> None:
+        前缀 = len(self) + 1
+        新模式: Dict[int, Tuple] = {}
+        整体匹配 = None
+        for 项 in self._扫描器.追加(字符):
+            开始 = 项[0]
+            if 开始 == 0 and (整体匹配 is None or 项[2] < 整体匹配[2]):
+                整体匹配 = 项
+            _接上匹配(新模式, _应用最少次数(项), self._模式状态[开始], self._暴力状态(开始))
+        新模式 = _保留非劣状态(新模式)
+
+        暴力起点 = self._暴力起点[-1]
+        if 新模式:
+            暴力起点 = _更新暴力起点(暴力起点, 新模式, 前缀)
+
+        self._模式状态.append(新模式)
+        self._暴力起点.append(暴力起点)
+        self._整体匹配.append(整体匹配)
+
+    def 结果(self) -> Dict:
+        """
+        当前密码的估计结果
+
+        返回:
+            与估计猜测次数相同格式的字典
+        """
+        长度 = len(self)
+        if not 长度:
+            return _汇总("", 0.0, [])
+        总对数, 是暴力, 段数 = _选出最优(self._模式状态[长度], self._暴力状态(长度))
+        整体匹配 = self._整体匹配[长度]
+        if 整体匹配 is not None and _总猜测次数对数(1, 整体匹配[2]) < 总对数:
+            return _汇总(self.密码, _总猜测次数对数(1, 整体匹配[2]), [整体匹配])
+        return _汇总(self.密码, 总对数, _回溯分段(self._模式状态, self._暴力状态, 长度, 是暴力, 段数))
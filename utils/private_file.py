@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+私有文件写入
+分享、二维码、配置和校准缓存都通过这里落盘：文件仅所有者可读写，
+先写同目录的临时文件再原子替换，中途出错不会留下写了一半的文件
+"""
+
+import os
+import tempfile
+from typing import Union
+
+
+def 写入私有文件(路径: str, 内容: Union[str, bytes]) -> None:
+    """
+    原子地写入仅所有者可读写(0600)的文件，已存在的文件会被替换
+
+    参数:
+        路径: 目标文件路径，所在目录必须已存在
+        内容: 字符串按UTF-8写入，字节串原样写入
+    """
+    目录 = os.path.dirname(os.path.abspath(路径))
+    # mkstemp创建的文件权限就是0600，替换后目标文件沿用这个权限
+    描述符, 临时路径 = tempfile.mkstemp(dir=目录, suffix=".tmp")
+    try:
+        if isinstance(内容, str):
+            with os.fdopen(描述符, "w", encoding="utf-8") as 文件:
+                文件.write(内容)
+        else:
+            with os.fdopen(描述符, "wb") as 文件:
+                文件.write(内容)
+        os.replace(临时路径, 路径)
+    except BaseException:
+        os.unlink(临时路径)
+        raise
@@ -0,0 +1,522 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+纯Python二维码解码器
+用于校验本项目生成的二维码图像能否还原为原始数据，只处理干净、轴对齐、
+无透视变形的图像（utils.qr_raster写出的PNG、带标题的灰度图像和批量打印页的单元格）。
+从左下定位图形测出模块大小，沿竖直定时图形数出边长，在每个模块中心采样，
+然后读格式信息、去掉掩码、解交织、Reed-Solomon纠错并解析数字/字母数字/字节分段；
+版本相关的表格与编码器共用同一份缓存
+"""
+
+import io
+import sys
+import zlib
+import struct
+import hashlib
+import argparse
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from utils.qr_encoder import (
+    数字模式, 字母数字模式, 字节模式, 字母数字字符集, 纠错级别编码,
+    格式信息坐标, 数据模块顺序, 分块结构,
+    _字符计数位数, _原始码字数, _格式信息位, _掩码行, _生成多项式, _指数表, _对数表,
+)
+from utils.qr_raster import PNG签名
+
+# 二值像素行中1表示深色、0表示浅色
+_阈值表 = bytes(1 if 值 < 128 else 0 for 值 in range(256))
+_位字符表 = bytes.maketrans(b"\x00\x01", b"01")
+# 1位像素的位字符到二值像素（0位为黑色）
+_1位展开表 = bytes.maketrans(b"01", b"\x01\x00")
+
+# 全部32种合法格式信息 -> (纠错级别, 掩码)
+_格式信息表 = {_格式信息位(级别, 掩码): (级别, 掩码) for 级别 in 纠错级别编码 for 掩码 in range(8)}
+
+
+def _乘(甲: int, 乙: int) -> int:
+    """GF(256)乘法"""
+    if 甲 == 0 or 乙 == 0:
+        return 0
+    return _指数表[_对数表[甲] + _对数表[乙]]
+
+
+def _求值(多项式: Sequence[int], x: int) -> int:
+    """按Horner法则计算多项式在x处的值（系数从低次到高次）"""
+    结果 = 0
+    for 系数 in reversed(多项式):
+        结果 = _乘(结果, x) ^ 系数
+    return 结果
+
+
+@lru_cache(maxsize=64)
+def _余数表(纠错码字数: int) -> Tuple[int, ...]:
+    """每个因子乘以生成多项式（不含首项）后打包成的整数，用于逐字节计算余数"""
+    return tuple(
+        int.from_bytes(bytes(_乘(因子, 系数) for 系数 in _生成多项式(纠错码字数)), "big")
+        for 因子 in range(256)
+    )
+
+
+def _纠错余数(数据: Sequence[int], 纠错码字数: int) -> int:
+    """计算数据码字的纠错码字（打包成整数），每个码字只需一次查表和移位"""
+    表 = _余数表(纠错码字数)
+    移位 = 8 * (纠错码字数 - 1)
+    掩码 = (1 << 移位) - 1
+    余数 = 0
+    for 字节 in 数据:
+        余数 = ((余数 & 掩码) << 8) ^ 表[(余数 >> 移位) ^ 字节]
+    return 余数
+
+
+def RS纠错(码字: Sequence[int], 纠错码字数: int) -> List[int]:
+    """
+    纠正一个纠错块中的错误码字
+
+    参数:
+        码字: 数据码字加纠错码字（与RS纠错码的输出拼接顺序一致）
+        纠错码字数: 块中的纠错码字数
+
+    返回:
+        纠正后的全部码字
+
+    异常:
+        ValueError: 错误超出纠错能力
+    """
+    长度 = len(码字)
+    # 绝大多数块没有错误：重新计算的纠错码字与收到的一致即可直接返回
+    if _纠错余数(码字[:长度 - 纠错码字数], 纠错码字数) == int.from_bytes(bytes(码字[长度 - 纠错码字数:]), "big"):
+        return list(码字)
+
+    # 码字[0]是最高次项，伴随式 S_j = r(α^j)
+    伴随式 = []
+    for j in range(纠错码字数):
+        值 = 0
+        for 字节 in 码字:
+            值 = (_指数表[_对数表[值] + j] if 值 else 0) ^ 字节
+        伴随式.append(值)
+    if not any(伴随式):
+        return list(码字)
+
+    # Berlekamp-Massey求错误位置多项式
+    定位, 上一个 = [1], [1]
+    阶数, 间隔, 上一差值 = 0, 1, 1
+    for k in range(纠错码字数):
+        差值 = 伴随式[k]
+        for i in range(1, 阶数 + 1):
+            差值 ^= _乘(定位[i], 伴随式[k - i])
+        if 差值 == 0:
+            间隔 += 1
+            continue
+        系数 = _乘(差值, _指数表[255 - _对数表[上一差值]])
+        新定位 = 定位 + [0] * max(0, len(上一个) + 间隔 - len(定位))
+        for i, 值 in enumerate(上一个):
+            新定位[i + 间隔] ^= _乘(系数, 值)
+        if 2 * 阶数 <= k:
+            上一个, 上一差值, 阶数, 间隔 = 定位, 差值, k + 1 - 阶数, 1
+        else:
+            间隔 += 1
+        定位 = 新定位
+    if 2 * 阶数 > 纠错码字数:
+        raise ValueError("错误超出纠错能力")
+
+    # Chien搜索：位置多项式在 α^(-e) 处为零的次数e即错误位置
+    错误次数 = [e for e in range(长度) if _求值(定位, _指数表[(255 - e) % 255]) == 0]
+    if len(错误次数) != 阶数:
+        raise ValueError("错误超出纠错能力")
+
+    # Forney算法：Ω = S·Λ mod x^n，错误值 = X·Ω(X⁻¹)/Λ'(X⁻¹)
+    评估 = [0] * 纠错码字数
+    for i, 甲 in enumerate(伴随式):
+        for j, 乙 in enumerate(定位[:纠错码字数 - i]):
+            评估[i + j] ^= _乘(甲, 乙)
+    导数 = [定位[i] if i % 2 else 0 for i in range(1, len(定位))]
+    结果 = list(码字)
+    for e in 错误次数:
+        逆 = _指数表[(255 - e) % 255]
+        分母 = _求值(导数, 逆)
+        if 分母 == 0:
+            raise ValueError("错误超出纠错能力")
+        值 = _乘(_乘(_指数表[e], _求值(评估, 逆)), _指数表[255 - _对数表[分母]])
+        结果[长度 - 1 - e] ^= 值
+    return 结果
+
+
+@lru_cache(maxsize=40)
+def _数据位读取器(版本: int) -> Callable[[str], Tuple[str, ...]]:
+    """返回从按行拼接的模块字符串中依次取出全部码字位的函数"""
+    边长 = 版本 * 4 + 17
+    位数 = _原始码字数(版本) * 8
+    return itemgetter(*[行 * 边长 + 列 for 行, 列 in 数据模块顺序(版本)[:位数]])
+
+
+def _读取格式信息(行串: List[str], 边长: int) -> Tuple[str, int]:
+    """读取两份格式信息，返回汉明距离最近（不超过3）的 (纠错级别, 掩码)"""
+    最佳距离, 最佳 = 4, None
+    for 坐标列表 in 格式信息坐标(边长):
+        值 = sum(1 << i for i, (行, 列) in enumerate(坐标列表) if 行串[行][列] == "1")
+        if 值 in _格式信息表:
+            return _格式信息表[值]
+        for 合法值, 结果 in _格式信息表.items():
+            距离 = bin(值 ^ 合法值).count("1")
+            if 距离 < 最佳距离:
+                最佳距离, 最佳 = 距离, 结果
+    if 最佳 is None:
+        raise ValueError("无法读取格式信息")
+    return 最佳
+
+
+def _解析分段(数据码字: bytes, 版本: int) -> bytes:
+    """按模式指示符依次解析分段，返回拼接后的字节"""
+    位串 = format(int.from_bytes(数据码字, "big"), "0{}b".format(len(数据码字) * 8))
+    结果 = bytearray()
+    位置 = 0
+    while 位置 + 4 <= len(位串):
+        模式 = int(位串[位置:位置 + 4], 2)
+        位置 += 4
+        if 模式 == 0:
+            break
+        if 模式 not in (数字模式, 字母数字模式, 字节模式):
+            raise ValueError(f"不支持的分段模式: {模式:04b}")
+        计数位数 = _字符计数位数(模式, 版本)
+        数量 = int(位串[位置:位置 + 计数位数] or "0", 2)
+        位置 += 计数位数
+
+        if 模式 == 数字模式:
+            结束 = 位置 + 数量 // 3 * 10 + (0, 4, 7)[数量 % 3]
+            while 位置 < 结束:
+                位数 = min(10, 结束 - 位置)
+                结果 += str(int(位串[位置:位置 + 位数], 2)).zfill(位数 // 3).encode("ascii")
+                位置 += 位数
+        elif 模式 == 字母数字模式:
+            结束 = 位置 + 数量 // 2 * 11 + 数量 % 2 * 6
+            while 位置 < 结束:
+                if 结束 - 位置 >= 11:
+                    值 = int(位串[位置:位置 + 11], 2)
+                    结果 += (字母数字字符集[值 // 45] + 字母数字字符集[值 % 45]).encode("ascii")
+                    位置 += 11
+                else:
+                    结果 += 字母数字字符集[int(位串[位置:位置 + 6], 2)].encode("ascii")
+                    位置 += 6
+        else:
+            结束 = 位置 + 数量 * 8
+            if 数量:
+                结果 += int(位串[位置:结束], 2).to_bytes(数量, "big")
+            位置 = 结束
+        if 位置 > len(位串):
+            raise ValueError("数据流被截断")
+    return bytes(结果)
+
+
+def _解码行串(行串: List[str]) -> bytes:
+    """从模块行字符串（'1'为深色）解码出数据"""
+    边长 = len(行串)
+    if 边长 < 21 or 边长 > 177 or (边长 - 17) % 4:
+        raise ValueError(f"无效的二维码边长: {边长}")
+    版本 = (边长 - 17) // 4
+    级别, 掩码 = _读取格式信息(行串, 边长)
+
+    格式 = "0{}b".format(边长)
+    去掩码 = "".join(format(int(行, 2) ^ 翻转, 格式) for 行, 翻转 in zip(行串, _掩码行(版本)[掩码]))
+    码字 = int("".join(_数据位读取器(版本)(去掩码)), 2).to_bytes(_原始码字数(版本), "big")
+
+    # 解交织：先按列取数据码字，再按列取纠错码字
+    块长度列表, 纠错码字数 = 分块结构(版本, 级别)
+    块列表: List[List[int]] = [[] for _ in 块长度列表]
+    位置 = 0
+    for i in range(块长度列表[-1]):
+        for 块, 长度 in zip(块列表, 块长度列表):
+            if i < 长度:
+                块.append(码字[位置])
+                位置 += 1
+    for _ in range(纠错码字数):
+        for 块 in 块列表:
+            块.append(码字[位置])
+            位置 += 1
+
+    数据码字 = bytearray()
+    for 块, 长度 in zip(块列表, 块长度列表):
+        数据码字 += bytes(RS纠错(块, 纠错码字数)[:长度])
+    return _解析分段(bytes(数据码字), 版本)
+
+
+def 解码矩阵(矩阵: Sequence[Sequence[bool]]) -> bytes:
+    """
+    解码二维码模块矩阵
+
+    参数:
+        矩阵: 模块矩阵（不含静区），True表示深色模块
+
+    返回:
+        解码得到的数据（数字和字母数字分段按ASCII）
+
+    异常:
+        ValueError: 边长无效、格式信息无法读取、错误超出纠错能力或数据流无效
+    """
+    return _解码行串([bytes(行).translate(_位字符表).decode("ascii") for 行 in 矩阵])
+
+
+def _找游程终点(行: bytes, 起点: int, 次数: int) -> int:
+    """从起点开始跨过指定个数的同色游程，返回终点位置"""
+    位置 = 起点
+    for _ in range(次数):
+        颜色 = 行[位置]
+        下一个 = 行.find(1 - 颜色, 位置)
+        位置 = len(行) if 下一个 < 0 else 下一个
+        if 位置 >= len(行):
+            break
+    return 位置
+
+
+def 采样模块(二值行列表: Sequence[bytes]) -> List[str]:
+    """
+    在二值图像中定位二维码并在每个模块中心采样
+
+    二维码下方和左方必须是空白（静区），上方可以有标题等内容。
+
+    参数:
+        二值行列表: 图像像素行，每个字节1表示深色、0表示浅色
+
+    返回:
+        模块行字符串列表，'1'表示深色
+
+    异常:
+        ValueError: 找不到定位图形或定时图形
+    """
+    底行 = next((y for y in range(len(二值行列表) - 1, -1, -1) if 1 in 二值行列表[y]), -1)
+    if 底行 < 0:
+        raise ValueError("图像中没有二维码")
+
+    # 底行的定位图形宽度只是粗略估计（圆角模块会缩短），
+    # 再在左下定位图形中心附近按1:1:3:1:1的五个游程精确测量
+    行 = 二值行列表[底行]
+    左 = 行.find(1)
+    粗略盒子 = (_找游程终点(行, 左, 1) - 左) / 7
+    中心行 = 二值行列表[max(0, int(底行 + 1 - 3.5 * 粗略盒子))]
+    左 = 中心行.find(1)
+    if 左 < 0:
+        raise ValueError("找不到定位图形")
+    盒子 = (_找游程终点(中心行, 左, 5) - 左) / 7
+    if 盒子 < 1:
+        raise ValueError("找不到定位图形")
+
+    # 沿第6列向上数模块：定时图形深浅交替，直到连续两个深色模块即左上定位图形的第6、5行
+    x = int(左 + 6.5 * 盒子)
+    底边 = 底行 + 1
+    上一个深色 = False
+    边长 = 0
+    for k in range(8, 178):
+        y = int(底边 - (k + 0.5) * 盒子)
+        if y < 0:
+            break
+        深色 = 二值行列表[y][x] == 1
+        if 深色 and 上一个深色:
+            边长 = k + 6
+            break
+        上一个深色 = 深色
+    if 边长 < 21 or (边长 - 17) % 4:
+        raise ValueError("找不到定时图形")
+    顶边 = 底边 - 边长 * 盒子
+    if 顶边 < 0:
+        raise ValueError("二维码超出图像范围")
+
+    取列 = itemgetter(*[int(左 + (列 + 0.5) * 盒子) for 列 in range(边长)])
+    return [
+        bytes(取列(二值行列表[int(顶边 + (行号 + 0.5) * 盒子)])).translate(_位字符表).decode("ascii")
+        for 行号 in range(边长)
+    ]
+
+
+def 解码二值行(二值行列表: Sequence[bytes]) -> bytes:
+    """
+    解码二值图像（每个字节1表示深色）中的二维码
+
+    异常:
+        ValueError: 找不到二维码或解码失败
+    """
+    return _解码行串(采样模块(二值行列表))
+
+
+def 展开1位行(行列表: Sequence[bytes], 宽度: int) -> List[bytes]:
+    """把1位像素行（0位为黑色，utils.qr_raster的格式）展开为二值行，相同的行只展开一次"""
+    已展开 = {}
+    结果 = []
+    上一行 = 二值行 = None
+    for 行 in 行列表:
+        # 放大后的重复行通常是同一个对象，不必再查字典
+        if 行 is not 上一行:
+            二值行 = 已展开.get(行)
+            if 二值行 is None:
+                位串 = format(int.from_bytes(行, "big"), "0{}b".format(len(行) * 8))
+                二值行 = 已展开[行] = 位串[:宽度].encode("ascii").translate(_1位展开表)
+            上一行 = 行
+        结果.append(二值行)
+    return 结果
+
+
+def 解码1位像素行(行列表: Sequence[bytes], 宽度: int) -> bytes:
+    """
+    解码1位像素行（例如批量打印页的单元格）中的二维码
+
+    异常:
+        ValueError: 找不到二维码或解码失败
+    """
+    return 解码二值行(展开1位行(行列表, 宽度))
+
+
+def _反过滤(数据: bytes, 行字节数: int, 高度: int) -> List[bytes]:
+    """撤销PNG扫描行过滤（每像素不超过1字节）"""
+    步长 = 行字节数 + 1
+    if len(数据) < 步长 * 高度:
+        raise ValueError("PNG数据不完整")
+    零行 = bytes(行字节数)
+    上一行 = 零行
+    行列表 = []
+    for y in range(高度):
+        类型 = 数据[y * 步长]
+        原始 = 数据[y * 步长 + 1:(y + 1) * 步长]
+        if 类型 == 0:
+            行 = 原始
+        elif 类型 == 2:
+            行 = 上一行 if 原始 == 零行 else bytes((甲 + 乙) & 0xFF for 甲, 乙 in zip(原始, 上一行))
+        elif 类型 in (1, 3, 4):
+            新行 = bytearray(原始)
+            左 = 0
+            for i in range(行字节数):
+                上 = 上一行[i]
+                左上 = 上一行[i - 1] if i else 0
+                if 类型 == 1:
+                    预测 = 左
+                elif 类型 == 3:
+                    预测 = (左 + 上) >> 1
+                else:
+                    p = 左 + 上 - 左上
+                    甲, 乙, 丙 = abs(p - 左), abs(p - 上), abs(p - 左上)
+                    预测 = 左 if 甲 <= 乙 and 甲 <= 丙 else (上 if 乙 <= 丙 else 左上)
+                左 = 新行[i] = (新行[i] + 预测) & 0xFF
+            行 = bytes(新行)
+        else:
+            raise ValueError(f"无效的PNG过滤类型: {类型}")
+        行列表.append(行)
+        上一行 = 行
+    return 行列表
+
+
+def 读取PNG(数据: bytes) -> List[bytes]:
+    """
+    读取1位或8位灰度、非隔行的PNG，返回二值像素行
+
+    其他格式（彩色、调色板、隔行扫描）请用PIL打开后交给解码图像。
+
+    异常:
+        ValueError: 不是PNG或格式不受支持
+    """
+    if not 数据.startswith(PNG签名):
+        raise ValueError("不是PNG文件")
+    位置 = len(PNG签名)
+    头部 = None
+    压缩数据 = []
+    while 位置 + 8 <= len(数据):
+        长度, 类型 = struct.unpack(">I4s", 数据[位置:位置 + 8])
+        内容 = 数据[位置 + 8:位置 + 8 + 长度]
+        if len(内容) != 长度:
+            raise ValueError("PNG数据块被截断")
+        位置 += 12 + 长度
+        if 类型 == b"IHDR":
+            # 长度字段来自文件，损坏时不能直接按固定格式解包
+            if 长度 != 13:
+                raise ValueError("PNG头部损坏")
+            头部 = struct.unpack(">IIBBBBB", 内容)
+        elif 类型 == b"IDAT":
+            压缩数据.append(内容)
+        elif 类型 == b"IEND":
+            break
+    if 头部 is None:
+        raise ValueError("PNG缺少IHDR")
+    宽度, 高度, 位深, 颜色类型, _, _, 隔行 = 头部
+    if 颜色类型 != 0 or 位深 not in (1, 8) or 隔行:
+        raise ValueError("只支持1位或8位灰度、非隔行的PNG")
+
+    try:
+        原始数据 = zlib.decompress(b"".join(压缩数据))
+    except zlib.error as e:
+        raise ValueError(f"PNG数据损坏: {e}")
+    行列表 = _反过滤(原始数据, (宽度 * 位深 + 7) // 8, 高度)
+    if 位深 == 1:
+        return 展开1位行(行列表, 宽度)
+    return [行.translate(_阈值表) for 行 in 行列表]
+
+
+def 解码PNG(数据: bytes) -> bytes:
+    """
+    解码PNG图像（1位或8位灰度）中的二维码，不需要PIL
+
+    异常:
+        ValueError: PNG格式不受支持、找不到二维码或解码失败
+    """
+    return 解码二值行(读取PNG(数据))
+
+
+def 解码图像(图像: Any) -> bytes:
+    """
+    解码PIL图像中的二维码（任意模式，按亮度阈值二值化）
+
+    异常:
+        ValueError: 找不到二维码或解码失败
+    """
+    if 图像.mode != "L":
+        图像 = 图像.convert("L")
+    宽度 = 图像.width
+    数据 = 图像.tobytes().translate(_阈值表)
+    return 解码二值行([数据[y * 宽度:(y + 1) * 宽度] for y in range(图像.height)])
+
+
+def 解码文件(文件路径: str) -> bytes:
+    """
+    解码图像文件中的二维码；灰度PNG直接读取，其他格式需要PIL
+
+    异常:
+        OSError: 文件无法读取
+        ImportError: 非灰度PNG且未安装pillow
+        ValueError: 找不到二维码或解码失败
+    """
+    with open(文件路径, "rb") as 文件:
+        数据 = 文件.read()
+    try:
+        return 解码PNG(数据)
+    except ValueError as e:
+        if not str(e).startswith(("不是PNG", "只支持")):
+            raise
+    from PIL import Image
+
+    with Image.open(io.BytesIO(数据)) as 图像:
+        return 解码图像(图像)
+
+
+def 主程序(参数列表: Optional[List[str]] = None) -> int:
+    """命令行入口"""
+    解析器 = argparse.ArgumentParser(description="解码本工具生成的二维码图像，校验其内容")
+    解析器.add_argument("图像文件", nargs="+", help="二维码图像文件")
+    解析器.add_argument("--显示", action="store_true", help="显示解码内容（默认只显示长度和SHA-256摘要）")
+    参数 = 解析器.parse_args(参数列表)
+
+    失败数 = 0
+    for 路径 in 参数.图像文件:
+        try:
+            内容 = 解码文件(路径)
+        except (OSError, ValueError, ImportError) as e:
+            失败数 += 1
+            print(f"✗ {路径}: {e}", file=sys.stderr)
+            continue
+        if 参数.显示:
+            print(f"✓ {路径}: {内容.decode('utf-8', errors='replace')}")
+        else:
+            print(f"✓ {路径}: {len(内容)} 字节, SHA-256 {hashlib.sha256(内容).hexdigest()[:16]}")
+    return 1 if 失败数 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(主程序())
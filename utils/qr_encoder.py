@@ -0,0 +1,492 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+纯Python二维码编码器
+按ISO/IEC 18004把数据编码为模块矩阵，不依赖qrcode和PIL，
+因此终端显示等场景的导入和编码都只需几毫秒。
+与版本相关的功能图形、数据放置顺序和掩码图形按版本缓存，
+每行模块用一个整数表示，掩码选择和罚分计算都在整数和字符串上完成；
+对同样的输入和纠错级别，输出与qrcode库的模块矩阵一致
+"""
+
+import re
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple, Union
+
+# 模式指示符
+数字模式 = 0x1
+字母数字模式 = 0x2
+字节模式 = 0x4
+
+字母数字字符集 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:"
+
+# 纠错级别在格式信息中的编码
+纠错级别编码 = {"L": 1, "M": 0, "Q": 3, "H": 2}
+
+# 每块纠错码字数和纠错块数，按纠错级别和版本（下标0不用）
+_每块纠错码字数 = {
+    "L": (-1, 7, 10, 15, 20, 26, 18, 20, 24, 30, 18, 20, 24, 26, 30, 22, 24, 28, 30, 28, 28,
+          28, 28, 30, 30, 26, 28, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30),
+    "M": (-1, 10, 16, 26, 18, 24, 16, 18, 22, 22, 26, 30, 22, 22, 24, 24, 28, 28, 26, 26, 26,
+          26, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28, 28),
+    "Q": (-1, 13, 22, 18, 26, 18, 24, 18, 22, 20, 24, 28, 26, 24, 20, 30, 24, 28, 28, 26, 30,
+          28, 30, 30, 30, 30, 28, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30),
+    "H": (-1, 17, 28, 22, 16, 22, 28, 26, 26, 24, 28, 24, 28, 22, 24, 24, 30, 28, 28, 26, 28,
+          30, 24, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30),
+}
+_纠错块数 = {
+    "L": (-1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 4, 4, 4, 4, 4, 6, 6, 6, 6, 7, 8,
+          8, 9, 9, 10, 12, 12, 12, 13, 14, 15, 16, 17, 18, 19, 19, 20, 21, 22, 24, 25),
+    "M": (-1, 1, 1, 1, 2, 2, 4, 4, 4, 5, 5, 5, 8, 9, 9, 10, 10, 11, 13, 14, 16,
+          17, 17, 18, 20, 21, 23, 25, 26, 28, 29, 31, 33, 35, 37, 38, 40, 43, 45, 47, 49),
+    "Q": (-1, 1, 1, 2, 2, 4, 4, 6, 6, 8, 8, 8, 10, 12, 16, 12, 17, 16, 18, 21, 20,
+          23, 23, 25, 27, 29, 34, 34, 35, 38, 40, 43, 45, 48, 51, 53, 56, 59, 62, 65, 68),
+    "H": (-1, 1, 1, 2, 4, 4, 4, 5, 6, 8, 8, 11, 11, 16, 16, 18, 16, 19, 21, 25, 25,
+          25, 34, 30, 32, 35, 37, 40, 42, 45, 48, 51, 54, 57, 60, 63, 66, 70, 74, 77, 81),
+}
+
+# GF(256)指数表和对数表，本原多项式 x^8+x^4+x^3+x^2+1
+_指数表 = [0] * 512
+_对数表 = [0] * 256
+_值 = 1
+for _i in range(255):
+    _指数表[_i] = _值
+    _对数表[_值] = _i
+    _值 <<= 1
+    if _值 & 0x100:
+        _值 ^= 0x11D
+for _i in range(255, 512):
+    _指数表[_i] = _指数表[_i - 255]
+
+# 罚分规则3的类定位图形（两个方向）
+_类定位图形 = ("10111010000", "00001011101")
+_同色连续 = re.compile(r"00000+|11111+")
+
+# 一个分段: (模式, 字符数, 位串)
+分段 = Tuple[int, int, str]
+
+
+def _字符计数位数(模式: int, 版本: int) -> int:
+    """返回字符计数指示符的位数"""
+    档位 = 0 if 版本 <= 9 else (1 if 版本 <= 26 else 2)
+    return {数字模式: (10, 12, 14), 字母数字模式: (9, 11, 13), 字节模式: (8, 16, 16)}[模式][档位]
+
+
+def 数字分段(数字: str) -> 分段:
+    """
+    生成数字模式分段（每3位数字10位）
+
+    异常:
+        ValueError: 含有非数字字符
+    """
+    if not 数字.isdigit() or not 数字.isascii():
+        raise ValueError("数字模式只能包含0-9")
+    位串 = "".join(
+        format(int(数字[i:i + 3]), "0{}b".format((10, 4, 7)[len(数字[i:i + 3]) % 3]))
+        for i in range(0, len(数字), 3)
+    )
+    return (数字模式, len(数字), 位串)
+
+
+def 字母数字分段(文本: str) -> 分段:
+    """
+    生成字母数字模式分段（每2个字符11位）
+
+    异常:
+        ValueError: 含有字母数字字符集以外的字符
+    """
+    try:
+        值列表 = [字母数字字符集.index(字符) for 字符 in 文本]
+    except ValueError:
+        raise ValueError("字母数字模式只能包含0-9、大写字母和 $%*+-./: 及空格")
+    位串 = "".join(
+        format(值列表[i] * 45 + 值列表[i + 1], "011b") if i + 1 < len(值列表) else format(值列表[i], "06b")
+        for i in range(0, len(值列表), 2)
+    )
+    return (字母数字模式, len(值列表), 位串)
+
+
+def 字节分段(数据: Union[str, bytes]) -> 分段:
+    """生成字节模式分段，字符串按UTF-8编码"""
+    if isinstance(数据, str):
+        数据 = 数据.encode("utf-8")
+    位串 = format(int.from_bytes(数据, "big"), "0{}b".format(len(数据) * 8)) if 数据 else ""
+    return (字节模式, len(数据), 位串)
+
+
+def 自动分段(数据: Union[str, bytes]) -> 分段:
+    """按能容纳全部数据的最紧凑模式生成单个分段"""
+    if isinstance(数据, str) and 数据:
+        if 数据.isascii() and 数据.isdigit():
+            return 数字分段(数据)
+        if all(字符 in 字母数字字符集 for 字符 in 数据):
+            return 字母数字分段(数据)
+    return 字节分段(数据)
+
+
+def 数据容量位数(版本: int, 错误纠正级别: str) -> int:
+    """返回指定版本和纠错级别下可用于数据的位数"""
+    return (_原始码字数(版本) - _每块纠错码字数[错误纠正级别][版本] * _纠错块数[错误纠正级别][版本]) * 8
+
+
+def _原始码字数(版本: int) -> int:
+    """返回版本中除功能图形外可容纳的码字数（含纠错码字）"""
+    结果 = (16 * 版本 + 128) * 版本 + 64
+    if 版本 >= 2:
+        校正图形数 = 版本 // 7 + 2
+        结果 -= (25 * 校正图形数 - 10) * 校正图形数 - 55
+        if 版本 >= 7:
+            结果 -= 36
+    return 结果 // 8
+
+
+def _校正图形位置(版本: int) -> List[int]:
+    """返回校正图形中心的行列坐标"""
+    if 版本 == 1:
+        return []
+    数量 = 版本 // 7 + 2
+    步长 = 26 if 版本 == 32 else (版本 * 4 + 数量 * 2 + 1) // (数量 * 2 - 2) * 2
+    边长 = 版本 * 4 + 17
+    return [6] + sorted(边长 - 7 - i * 步长 for i in range(数量 - 1))
+
+
+def _格式信息位(错误纠正级别: str, 掩码: int) -> int:
+    """返回15位BCH编码并异或掩码后的格式信息"""
+    数据 = 纠错级别编码[错误纠正级别] << 3 | 掩码
+    余数 = 数据
+    for _ in range(10):
+        余数 = (余数 << 1) ^ ((余数 >> 9) * 0x537)
+    return (数据 << 10 | 余数) ^ 0x5412
+
+
+def _版本信息位(版本: int) -> int:
+    """返回18位BCH编码的版本信息（版本7及以上）"""
+    余数 = 版本
+    for _ in range(12):
+        余数 = (余数 << 1) ^ ((余数 >> 11) * 0x1F25)
+    return 版本 << 12 | 余数
+
+
+def 格式信息坐标(边长: int) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+    """
+    返回格式信息两份副本的模块坐标
+
+    返回:
+        (副本一, 副本二)，各为15个 (行, 列)，第i项存放格式信息的第i位（最低位为第0位）
+    """
+    副本一 = [(i, 8) for i in range(6)] + [(7, 8), (8, 8), (8, 7)] + [(8, 14 - i) for i in range(9, 15)]
+    副本二 = [(8, 边长 - 1 - i) for i in range(8)] + [(边长 - 15 + i, 8) for i in range(8, 15)]
+    return 副本一, 副本二
+
+
+@lru_cache(maxsize=40)
+def _功能图形(版本: int) -> Tuple[Tuple[int, ...], Tuple[int, ...], Tuple[int, ...]]:
+    """
+    返回版本的功能图形
+
+    返回:
+        (功能区行, 图形行, 信息行)：功能区为所有保留模块（含格式信息区），
+        图形为定位、分隔、定时和校正图形中的深色模块，信息为暗模块和版本信息中的深色模块
+    """
+    边长 = 版本 * 4 + 17
+    功能区 = [[False] * 边长 for _ in range(边长)]
+    深色 = [[False] * 边长 for _ in range(边长)]
+    信息 = [[False] * 边长 for _ in range(边长)]
+
+    def 设置(行: int, 列: int, 值: bool, 矩阵: List[List[bool]] = 深色) -> None:
+        功能区[行][列] = True
+        矩阵[行][列] = 值
+
+    for i in range(边长):
+        设置(6, i, i % 2 == 0)
+        设置(i, 6, i % 2 == 0)
+    for 中心行, 中心列 in ((3, 3), (3, 边长 - 4), (边长 - 4, 3)):
+        for 行偏移 in range(-4, 5):
+            for 列偏移 in range(-4, 5):
+                行, 列 = 中心行 + 行偏移, 中心列 + 列偏移
+                if 0 <= 行 < 边长 and 0 <= 列 < 边长:
+                    设置(行, 列, max(abs(行偏移), abs(列偏移)) not in (2, 4))
+    位置 = _校正图形位置(版本)
+    for 行序号, 中心行 in enumerate(位置):
+        for 列序号, 中心列 in enumerate(位置):
+            if (行序号, 列序号) in ((0, 0), (0, len(位置) - 1), (len(位置) - 1, 0)):
+                continue
+            for 行偏移 in range(-2, 3):
+                for 列偏移 in range(-2, 3):
+                    设置(中心行 + 行偏移, 中心列 + 列偏移, max(abs(行偏移), abs(列偏移)) != 1)
+    for 坐标列表 in 格式信息坐标(边长):
+        for 行, 列 in 坐标列表:
+            设置(行, 列, False)
+    设置(边长 - 8, 8, True, 信息)
+    if 版本 >= 7:
+        版本信息 = _版本信息位(版本)
+        for i in range(18):
+            位 = (版本信息 >> i) & 1 == 1
+            设置(边长 - 11 + i % 3, i // 3, 位, 信息)
+            设置(i // 3, 边长 - 11 + i % 3, 位, 信息)
+
+    def 转为整数(矩阵: List[List[bool]]) -> Tuple[int, ...]:
+        return tuple(int("".join("1" if 值 else "0" for 值 in 行), 2) for 行 in 矩阵)
+
+    return 转为整数(功能区), 转为整数(深色), 转为整数(信息)
+
+
+@lru_cache(maxsize=40)
+def 数据模块顺序(版本: int) -> Tuple[Tuple[int, int], ...]:
+    """返回数据位按之字形放置的 (行, 列) 顺序，跳过功能图形"""
+    功能区 = _功能图形(版本)[0]
+    边长 = 版本 * 4 + 17
+    顺序 = []
+    for 右列 in range(边长 - 1, 0, -2):
+        if 右列 <= 6:
+            右列 -= 1
+        向上 = (右列 + 1) & 2 == 0
+        for 纵向 in range(边长):
+            行 = 边长 - 1 - 纵向 if 向上 else 纵向
+            for 列 in (右列, 右列 - 1):
+                if not (功能区[行] >> (边长 - 1 - 列)) & 1:
+                    顺序.append((行, 列))
+    return tuple(顺序)
+
+
+def 掩码条件(掩码: int, 行: int, 列: int) -> bool:
+    """返回掩码图形在 (行, 列) 处是否翻转模块"""
+    if 掩码 == 0:
+        return (行 + 列) % 2 == 0
+    if 掩码 == 1:
+        return 行 % 2 == 0
+    if 掩码 == 2:
+        return 列 % 3 == 0
+    if 掩码 == 3:
+        return (行 + 列) % 3 == 0
+    if 掩码 == 4:
+        return (行 // 2 + 列 // 3) % 2 == 0
+    if 掩码 == 5:
+        return 行 * 列 % 2 + 行 * 列 % 3 == 0
+    if 掩码 == 6:
+        return (行 * 列 % 2 + 行 * 列 % 3) % 2 == 0
+    return ((行 + 列) % 2 + 行 * 列 % 3) % 2 == 0
+
+
+@lru_cache(maxsize=40)
+def _掩码行(版本: int) -> Tuple[Tuple[int, ...], ...]:
+    """返回8种掩码图形在数据区的行整数"""
+    功能区 = _功能图形(版本)[0]
+    边长 = 版本 * 4 + 17
+    全部 = []
+    for 掩码 in range(8):
+        行列表 = []
+        for 行 in range(边长):
+            值 = int("".join("1" if 掩码条件(掩码, 行, 列) else "0" for 列 in range(边长)), 2)
+            行列表.append(值 & ~功能区[行])
+        全部.append(tuple(行列表))
+    return tuple(全部)
+
+
+@lru_cache(maxsize=64)
+def _生成多项式(次数: int) -> Tuple[int, ...]:
+    """返回次数为纠错码字数的RS生成多项式系数（不含首项1）"""
+    多项式 = [1]
+    for i in range(次数):
+        新多项式 = [0] * (len(多项式) + 1)
+        for j, 系数 in enumerate(多项式):
+            新多项式[j] ^= 系数
+            if 系数:
+                新多项式[j + 1] ^= _指数表[_对数表[系数] + i]
+        多项式 = 新多项式
+    return tuple(多项式[1:])
+
+
+def RS纠错码(数据: Sequence[int], 纠错码字数: int) -> List[int]:
+    """计算数据码字的Reed-Solomon纠错码字"""
+    生成多项式 = [_对数表[系数] for 系数 in _生成多项式(纠错码字数)]
+    余数 = [0] * 纠错码字数
+    for 字节 in 数据:
+        因子 = 字节 ^ 余数[0]
+        余数 = 余数[1:] + [0]
+        if 因子:
+            因子对数 = _对数表[因子]
+            for i, 系数对数 in enumerate(生成多项式):
+                余数[i] ^= _指数表[系数对数 + 因子对数]
+    return 余数
+
+
+def 分块结构(版本: int, 错误纠正级别: str) -> Tuple[List[int], int]:
+    """
+    返回各纠错块的数据码字数和每块纠错码字数
+
+    短块在前，长块比短块多一个数据码字。
+    """
+    块数 = _纠错块数[错误纠正级别][版本]
+    纠错码字数 = _每块纠错码字数[错误纠正级别][版本]
+    原始码字数 = _原始码字数(版本)
+    短块数 = 块数 - 原始码字数 % 块数
+    短块数据长度 = 原始码字数 // 块数 - 纠错码字数
+    return [短块数据长度 + (0 if i < 短块数 else 1) for i in range(块数)], 纠错码字数
+
+
+def _交织码字(数据码字: bytes, 版本: int, 错误纠正级别: str) -> bytes:
+    """分块计算纠错码并按列交织全部码字"""
+    块长度列表, 纠错码字数 = 分块结构(版本, 错误纠正级别)
+    数据块 = []
+    位置 = 0
+    for 长度 in 块长度列表:
+        数据块.append(数据码字[位置:位置 + 长度])
+        位置 += 长度
+    纠错块 = [RS纠错码(块, 纠错码字数) for 块 in 数据块]
+
+    结果 = bytearray()
+    for i in range(块长度列表[-1]):
+        结果.extend(块[i] for 块 in 数据块 if i < len(块))
+    for i in range(纠错码字数):
+        结果.extend(块[i] for 块 in 纠错块)
+    return bytes(结果)
+
+
+def _分段位数(分段列表: Sequence[分段], 版本: int) -> int:
+    return sum(4 + _字符计数位数(模式, 版本) + len(位串) for 模式, _, 位串 in 分段列表)
+
+
+def _组装数据码字(分段列表: Sequence[分段], 版本: int, 错误纠正级别: str) -> bytes:
+    """拼接分段、终止符和填充字节，得到该版本的全部数据码字"""
+    位串 = "".join(
+        format(模式, "04b") + format(字符数, "0{}b".format(_字符计数位数(模式, 版本))) + 数据位
+        for 模式, 字符数, 数据位 in 分段列表
+    )
+    容量 = 数据容量位数(版本, 错误纠正级别)
+    位串 += "0" * min(4, 容量 - len(位串))
+    位串 += "0" * (-len(位串) % 8)
+    数据码字 = int(位串, 2).to_bytes(len(位串) // 8, "big") if 位串 else b""
+    填充 = (b"\xec\x11" * (容量 // 16 + 1))[:容量 // 8 - len(数据码字)]
+    return 数据码字 + 填充
+
+
+@lru_cache(maxsize=40)
+def _方块掩码(边长: int) -> int:
+    """规则2中可作为2×2方块右下角的位：第1行起每行的第1列起，行间分隔位除外"""
+    return int("0".join(["0" * 边长] + ["0" + "1" * (边长 - 1)] * (边长 - 1)), 2)
+
+
+def _罚分(行列表: Sequence[int], 边长: int) -> int:
+    """按ISO/IEC 18004的四条规则计算掩码后符号的罚分"""
+    格式 = "0{}b".format(边长)
+    行串 = [format(行, 格式) for 行 in 行列表]
+    # 所有行和列用分隔符拼成一个字符串，规则1和规则3各只需扫描一遍
+    全部 = "2".join(行串) + "2" + "2".join(map("".join, zip(*行串)))
+
+    连续段 = _同色连续.findall(全部)
+    罚分 = sum(map(len, 连续段)) - 2 * len(连续段)
+    罚分 += 40 * (全部.count(_类定位图形[0]) + 全部.count(_类定位图形[1]))
+
+    # 整个符号拼成一个整数（行间一个分隔位），右移一行即与上一行对齐
+    拼接 = "0".join(行串)
+    下 = int(拼接, 2)
+    上 = 下 >> (边长 + 1)
+    上下相同 = ~(上 ^ 下)
+    罚分 += 3 * bin(上下相同 & (上下相同 >> 1) & ~(上 ^ (上 >> 1)) & _方块掩码(边长)).count("1")
+
+    深色数 = 拼接.count("1")
+    罚分 += int(abs(深色数 / 边长 ** 2 * 100 - 50) / 5) * 10
+    return 罚分
+
+
+def _放置格式信息(行列表: List[int], 边长: int, 错误纠正级别: str, 掩码: int) -> None:
+    格式信息 = _格式信息位(错误纠正级别, 掩码)
+    for 坐标列表 in 格式信息坐标(边长):
+        for i, (行, 列) in enumerate(坐标列表):
+            if (格式信息 >> i) & 1:
+                行列表[行] |= 1 << (边长 - 1 - 列)
+
+
+def 选择版本(分段列表: Sequence[分段], 错误纠正级别: str = "M", 最小版本: int = 1) -> int:
+    """
+    返回能容纳全部分段的最小版本
+
+    异常:
+        ValueError: 数据超出版本40的容量
+    """
+    if 错误纠正级别 not in 纠错级别编码:
+        raise ValueError("错误纠正级别必须是L、M、Q或H")
+    for 版本 in range(max(1, 最小版本), 41):
+        if all(字符数 < 1 << _字符计数位数(模式, 版本) for 模式, 字符数, _ in 分段列表) and \
+                _分段位数(分段列表, 版本) <= 数据容量位数(版本, 错误纠正级别):
+            return 版本
+    raise ValueError("数据太长，超出二维码最大容量")
+
+
+def 编码分段(分段列表: Sequence[分段], 错误纠正级别: str = "M", 最小版本: int = 1,
+         掩码: Optional[int] = None) -> List[List[bool]]:
+    """
+    把分段编码为二维码模块矩阵
+
+    参数:
+        分段列表: 由数字分段、字母数字分段、字节分段生成的分段
+        错误纠正级别: L、M、Q或H
+        最小版本: 至少使用的版本（1-40）
+        掩码: 指定掩码图形（0-7），默认选择罚分最低的掩码
+
+    返回:
+        模块矩阵（不含静区），True表示深色模块
+
+    异常:
+        ValueError: 纠错级别或掩码无效，或数据超出二维码最大容量
+    """
+    if 掩码 is not None and not 0 <= 掩码 <= 7:
+        raise ValueError("掩码必须在0到7之间")
+    版本 = 选择版本(分段列表, 错误纠正级别, 最小版本)
+    边长 = 版本 * 4 + 17
+    码字 = _交织码字(_组装数据码字(分段列表, 版本, 错误纠正级别), 版本, 错误纠正级别)
+
+    数据行 = [0] * 边长
+    码字位 = format(int.from_bytes(码字, "big"), "0{}b".format(len(码字) * 8))
+    for (行, 列), 位 in zip(数据模块顺序(版本), 码字位):
+        if 位 == "1":
+            数据行[行] |= 1 << (边长 - 1 - 列)
+
+    _, 图形行, 信息行 = _功能图形(版本)
+    掩码行 = _掩码行(版本)
+    if 掩码 is None:
+        # 与qrcode库一致：评估掩码时格式信息、版本信息和暗模块都按浅色计算
+        罚分列表 = [
+            _罚分([图形 | (数据 ^ 翻转) for 图形, 数据, 翻转 in zip(图形行, 数据行, 掩码行[候选])], 边长)
+            for 候选 in range(8)
+        ]
+        掩码 = 罚分列表.index(min(罚分列表))
+
+    行列表 = [图形 | 信息 | (数据 ^ 翻转) for 图形, 信息, 数据, 翻转 in zip(图形行, 信息行, 数据行, 掩码行[掩码])]
+    _放置格式信息(行列表, 边长, 错误纠正级别, 掩码)
+    格式 = "0{}b".format(边长)
+    return [[位 == "1" for 位 in format(行, 格式)] for 行 in 行列表]
+
+
+def 编码(数据: Union[str, bytes], 错误纠正级别: str = "M", 最小版本: int = 1,
+       掩码: Optional[int] = None) -> List[List[bool]]:
+    """
+    把字符串或字节编码为二维码模块矩阵，自动选择最紧凑的单一模式
+
+    参数:
+        数据: 要编码的字符串（非字母数字内容按UTF-8字节编码）或字节
+        错误纠正级别: L、M、Q或H
+        最小版本: 至少使用的版本（1-40）
+        掩码: 指定掩码图形（0-7），默认选择罚分最低的掩码
+
+    返回:
+        模块矩阵（不含静区），True表示深色模块
+
+    异常:
+        ValueError: 纠错级别或掩码无效，或数据超出二维码最大容量
+    """
+    return 编码分段([自动分段(数据)], 错误纠正级别, 最小版本, 掩码)
+
+
+# 测试代码
+if __name__ == "__main__":
+    import time
+
+    开始时间 = time.perf_counter()
+    矩阵 = 编码("bc1qar0srrr7xfkvy5l643lydnw9re59gtzzwf5mdq")
+    耗时 = (time.perf_counter() - 开始时间) * 1000
+    print(f"{len(矩阵)}x{len(矩阵)} 模块, 耗时 {耗时:.2f} 毫秒")
+    for 行 in 矩阵:
+        print("".join("██" if 模块 else "  " for 模块 in 行))
@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+多帧动态二维码（喷泉码）工具
+参照BC-UR的多部分编码，把放不进一个二维码的数据（SLIP-39分享集、扩展公钥列表、批量地址）
+切成等长片段，用无码率喷泉码生成任意多帧：前 片段数 帧是原始片段，之后每帧是按帧序号
+伪随机选出的若干片段的异或。接收方从任意足够多的帧（通常略多于片段数）即可还原，
+不必按顺序、也不必收齐某一帧。
+
+帧内容形如 "MQR/12-30/<BASE32正文>"，全部是二维码字母数字模式的字符；
+正文为 消息长度(4字节) + CRC32(4字节) + 片段，CRC32同时作为选片段的随机种子。
+选片段使用基于SHA-256的计数器伪随机数，不依赖Python random模块的实现，
+因此不同机器和Python版本生成、解码的结果一致
+"""
+
+import io
+import os
+import sys
+import zlib
+import base64
+import struct
+import hashlib
+import argparse
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+from utils.private_file import 写入私有文件
+from utils.qr_encoder import 编码, 选择版本, 字母数字分段
+from utils.qr_raster import 编码PNG, 像素行, 图像尺寸
+
+帧前缀 = "MQR"
+默认片段长度 = 120
+默认冗余倍数 = 2.0
+默认纠错级别 = "L"
+帧文件格式 = "frame-{:04d}.png"
+# 选片段和解码的耗时与片段数成正比，帧中的片段数来自扫描到的不可信数据，必须有上限
+最大片段数 = 65535
+# 帧序号按32位无符号整数参与选片段的伪随机种子
+最大帧序号 = 2 ** 32 - 1
+_头部格式 = ">II"
+
+
+class _伪随机数:
+    """以SHA-256计数器模式产生确定的64位随机整数"""
+
+    def __init__(self, 种子: bytes):
+        self._种子 = 种子
+        self._计数 = 0
+        self._缓冲: List[int] = []
+
+    def 下一个(self) -> int:
+        if not self._缓冲:
+            摘要 = hashlib.sha256(self._种子 + struct.pack(">Q", self._计数)).digest()
+            self._计数 += 1
+            self._缓冲 = list(struct.unpack(">4Q", 摘要))
+        return self._缓冲.pop()
+
+    def 小数(self) -> float:
+        """[0, 1) 区间的均匀小数"""
+        return (self.下一个() >> 11) / float(1 << 53)
+
+    def 整数(self, 上限: int) -> int:
+        """[0, 上限) 区间的整数"""
+        return self.下一个() % 上限
+
+
+def 选择片段(序号: int, 片段数: int, 校验和: int) -> FrozenSet[int]:
+    """
+    返回第序号帧（从1开始）包含的片段索引
+
+    前 片段数 帧各含一个原始片段；之后的帧按理想孤波分布（度为d的概率正比于1/d）
+    选取度数，再用部分洗牌选出d个不同的片段。
+    """
+    if 序号 <= 片段数:
+        return frozenset((序号 - 1,))
+    随机数 = _伪随机数(struct.pack(">II", 序号, 校验和))
+    累积 = 0.0
+    总权重 = sum(1.0 / i for i in range(1, 片段数 + 1))
+    目标 = 随机数.小数() * 总权重
+    度数 = 片段数
+    for i in range(1, 片段数 + 1):
+        累积 += 1.0 / i
+        if 目标 < 累积:
+            度数 = i
+            break
+    索引 = list(range(片段数))
+    for i in range(度数):
+        j = i + 随机数.整数(片段数 - i)
+        索引[i], 索引[j] = 索引[j], 索引[i]
+    return frozenset(索引[:度数])
+
+
+def _异或(甲: bytes, 乙: bytes) -> bytes:
+    return (int.from_bytes(甲, "big") ^ int.from_bytes(乙, "big")).to_bytes(len(甲), "big")
+
+
+def _默认帧数(片段数: int) -> int:
+    return max(片段数, int(片段数 * 默认冗余倍数 + 0.5))
+
+
+def _片段参数(载荷长度: int, 片段长度: int) -> Tuple[int, int]:
+    """检查载荷长度和片段长度，返回(片段数, 实际片段长度)"""
+    if 载荷长度 < 1:
+        raise ValueError("载荷不能为空")
+    if 片段长度 < 1:
+        raise ValueError("片段长度必须为正数")
+    片段数 = -(-载荷长度 // 片段长度)
+    if 片段数 > 最大片段数:
+        raise ValueError(f"片段数 {片段数} 超过上限 {最大片段数}，请增大片段长度")
+    return 片段数, -(-载荷长度 // 片段数)
+
+
+def _检查帧数(片段数: int, 帧数: Optional[int]) -> int:
+    """返回实际帧数；帧数少于片段数时无论如何都无法还原"""
+    if 帧数 is None:
+        return _默认帧数(片段数)
+    if not 片段数 <= 帧数 <= 最大帧序号:
+        raise ValueError(f"帧数必须在片段数 {片段数} 到 {最大帧序号} 之间")
+    return 帧数
+
+
+def 切分片段(载荷: bytes, 片段长度: int = 默认片段长度) -> List[bytes]:
+    """
+    把载荷切成等长片段，最后一个片段用零字节补齐
+
+    实际片段长度取 ceil(载荷长度 / 片段数)，使补齐的字节尽量少。
+
+    异常:
+        ValueError: 载荷为空、片段长度不是正数或片段数超过上限
+    """
+    片段数, 实际长度 = _片段参数(len(载荷), 片段长度)
+    补齐 = 载荷 + bytes(实际长度 * 片段数 - len(载荷))
+    return [补齐[i:i + 实际长度] for i in range(0, len(补齐), 实际长度)]
+
+
+def 生成帧(载荷: bytes, 片段长度: int = 默认片段长度, 帧数: Optional[int] = None) -> Iterator[str]:
+    """
+    生成多帧二维码的帧内容
+
+    参数:
+        载荷: 要传输的数据
+        片段长度: 每帧携带的最大片段字节数
+        帧数: 生成的帧数，默认为 片段数×默认冗余倍数（循环播放时接收方几乎总能在一轮内还原）
+
+    返回:
+        帧文本迭代器，帧序号从1开始连续递增
+
+    异常:
+        ValueError: 载荷为空、片段长度无效或帧数少于片段数（调用时立即检查）
+    """
+    片段列表 = 切分片段(载荷, 片段长度)
+    return _生成帧(载荷, 片段列表, _检查帧数(len(片段列表), 帧数))
+
+
+def _生成帧(载荷: bytes, 片段列表: List[bytes], 帧数: int) -> Iterator[str]:
+    片段数 = len(片段列表)
+    校验和 = zlib.crc32(载荷)
+    头部 = struct.pack(_头部格式, len(载荷), 校验和)
+    for 序号 in range(1, 帧数 + 1):
+        索引 = 选择片段(序号, 片段数, 校验和)
+        片段 = None
+        for i in 索引:
+            片段 = 片段列表[i] if 片段 is None else _异或(片段, 片段列表[i])
+        正文 = base64.b32encode(头部 + 片段).decode("ascii").rstrip("=")
+        yield f"{帧前缀}/{序号}-{片段数}/{正文}"
+
+
+def 解析帧(帧: str) -> Tuple[int, int, int, int, bytes]:
+    """
+    解析帧内容
+
+    返回:
+        (序号, 片段数, 消息长度, 校验和, 片段)
+
+    异常:
+        ValueError: 帧格式错误，或片段数与消息长度、片段长度不一致
+    """
+    try:
+        前缀, 序列, 正文 = 帧.strip().upper().split("/")
+        序号, 片段数 = (int(值) for 值 in 序列.split("-"))
+        数据 = base64.b32decode(正文 + "=" * (-len(正文) % 8))
+    except (ValueError, TypeError):
+        raise ValueError("不是有效的多帧二维码帧")
+    if (前缀 != 帧前缀 or not 1 <= 序号 <= 最大帧序号 or 片段数 < 1
+            or len(数据) <= struct.calcsize(_头部格式)):
+        raise ValueError("不是有效的多帧二维码帧")
+    消息长度, 校验和 = struct.unpack(_头部格式, 数据[:8])
+    片段 = 数据[8:]
+    # 切分片段的片段长度总是 ceil(消息长度 / 片段数)，且每个片段至少有一个载荷字节
+    if 片段数 > min(最大片段数, 消息长度) or len(片段) != -(-消息长度 // 片段数):
+        raise ValueError("多帧二维码帧的片段数与消息长度不符")
+    return 序号, 片段数, 消息长度, 校验和, 片段
+
+
+class 多帧解码器:
+    """
+    多帧二维码的接收端：逐帧输入，在GF(2)上做增量高斯消元
+
+    每帧是"若干片段的异或 = 帧数据"的一个方程，片段集合用整数位掩码表示。
+    新方程用已有的主元行消去，剩下的最高位成为新主元；主元数达到片段数时回代求出全部片段。
+    与只会消去已知片段的剥离解码相比，所需帧数接近片段数本身。
+    """
+
+    def __init__(self):
+        """初始化空的解码状态"""
+        self.参数: Optional[Tuple[int, int, int, int]] = None
+        self._主元行: Dict[int, Tuple[int, int]] = {}
+        self._已处理序号 = set()
+        self.接收帧数 = 0
+        self.结果: Optional[bytes] = None
+
+    @property
+    def 已完成(self) -> bool:
+        """是否已还原出完整载荷"""
+        return self.结果 is not None
+
+    @property
+    def 进度(self) -> float:
+        """已收到的线性无关帧占片段数的比例"""
+        return len(self._主元行) / self.参数[0] if self.参数 else 0.0
+
+    def 接收(self, 帧: str) -> bool:
+        """
+        输入一帧
+
+        参数:
+            帧: 扫描得到的帧文本
+
+        返回:
+            是否已完成还原
+
+        异常:
+            ValueError: 帧格式错误、与之前的帧不属于同一次传输，或还原后校验和不符
+        """
+        if self.已完成:
+            return True
+        序号, 片段数, 消息长度, 校验和, 片段 = 解析帧(帧)
+        参数 = (片段数, 消息长度, 校验和, len(片段))
+        if self.参数 is None:
+            self.参数 = 参数
+        elif 参数 != self.参数:
+            raise ValueError("帧不属于当前传输")
+        self.接收帧数 += 1
+        if 序号 in self._已处理序号:
+            return False
+        self._已处理序号.add(序号)
+
+        掩码 = sum(1 << i for i in 选择片段(序号, 片段数, 校验和))
+        数据 = int.from_bytes(片段, "big")
+        while 掩码:
+            主元 = 掩码.bit_length() - 1
+            if 主元 not in self._主元行:
+                self._主元行[主元] = (掩码, 数据)
+                break
+            行掩码, 行数据 = self._主元行[主元]
+            掩码 ^= 行掩码
+            数据 ^= 行数据
+
+        if len(self._主元行) == 片段数:
+            self.结果 = self._回代()
+        return self.已完成
+
+    def _回代(self) -> bytes:
+        """从低位主元开始依次求出每个片段并拼接为载荷"""
+        片段数, 消息长度, 校验和, 片段长度 = self.参数
+        片段值: List[int] = []
+        for 主元 in range(片段数):
+            掩码, 数据 = self._主元行[主元]
+            for i in range(主元):
+                if (掩码 >> i) & 1:
+                    数据 ^= 片段值[i]
+            片段值.append(数据)
+        载荷 = b"".join(值.to_bytes(片段长度, "big") for 值 in 片段值)[:消息长度]
+        if zlib.crc32(载荷) != 校验和:
+            raise ValueError("还原的数据校验和不符")
+        return 载荷
+
+
+def 解码帧(帧列表: List[str]) -> bytes:
+    """
+    从帧列表还原载荷
+
+    异常:
+        ValueError: 帧不足以还原或帧无效
+    """
+    解码器 = 多帧解码器()
+    for 帧 in 帧列表:
+        if 解码器.接收(帧):
+            return 解码器.结果
+    raise ValueError(f"帧数不足，已收到 {解码器.进度:.0%} 的有效帧")
+
+
+def 帧版本(载荷长度: int, 片段长度: int = 默认片段长度, 帧数: Optional[int] = None,
+        错误纠正级别: str = 默认纠错级别) -> int:
+    """
+    返回容纳最长一帧所需的二维码版本，所有帧使用同一版本使动画尺寸固定
+
+    异常:
+        ValueError: 载荷长度、片段长度或帧数无效
+    """
+    片段数, 实际长度 = _片段参数(载荷长度, 片段长度)
+    正文长度 = -(-(8 + 实际长度) * 8 // 5)
+    最长帧 = f"{帧前缀}/{_检查帧数(片段数, 帧数)}-{片段数}/" + "A" * 正文长度
+    return 选择版本([字母数字分段(最长帧)], 错误纠正级别)
+
+
+def 帧矩阵(载荷: bytes, 片段长度: int = 默认片段长度, 帧数: Optional[int] = None,
+        错误纠正级别: str = 默认纠错级别) -> Iterator[List[List[bool]]]:
+    """逐帧产出模块矩阵，所有帧的版本相同；参数在调用时立即检查"""
+    版本 = 帧版本(len(载荷), 片段长度, 帧数, 错误纠正级别)
+    return (编码(帧, 错误纠正级别, 最小版本=版本) for 帧 in 生成帧(载荷, 片段长度, 帧数))
+
+
+def 导出PNG帧(载荷: bytes, 输出目录: str, 片段长度: int = 默认片段长度, 帧数: Optional[int] = None,
+          盒子大小: int = 6, 边框大小: int = 4) -> List[str]:
+    """
+    把每一帧写成单独的1位PNG文件（frame-0001.png ...，仅所有者可读写）
+
+    返回:
+        按帧序号排列的文件路径列表
+
+    异常:
+        ValueError: 载荷、片段长度或帧数无效（此时不创建输出目录）
+    """
+    矩阵迭代器 = 帧矩阵(载荷, 片段长度, 帧数)
+    os.makedirs(输出目录, mode=0o700, exist_ok=True)
+    路径列表 = []
+    for 序号, 矩阵 in enumerate(矩阵迭代器, 1):
+        路径 = os.path.join(输出目录, 帧文件格式.format(序号))
+        写入私有文件(路径, 编码PNG(矩阵, 盒子大小, 边框大小))
+        路径列表.append(路径)
+    return 路径列表
+
+
+def 导出GIF(载荷: bytes, 文件路径: str, 片段长度: int = 默认片段长度, 帧数: Optional[int] = None,
+         盒子大小: int = 6, 边框大小: int = 4, 帧间隔毫秒: int = 200) -> str:
+    """
+    把全部帧写成循环播放的动画GIF（需要PIL）
+
+    异常:
+        ImportError: 未安装pillow
+        ValueError: 载荷、片段长度或帧数无效
+    """
+    from PIL import Image
+
+    图像列表 = []
+    for 矩阵 in 帧矩阵(载荷, 片段长度, 帧数):
+        边长 = 图像尺寸(矩阵, 盒子大小, 边框大小)
+        数据 = b"".join([行 * 盒子大小 for 行 in 像素行(矩阵, 盒子大小, 边框大小)])
+        图像列表.append(Image.frombytes("1", (边长, 边长), 数据).convert("P"))
+    输出 = io.BytesIO()
+    图像列表[0].save(输出, format="GIF", save_all=True, append_images=图像列表[1:],
+                 duration=帧间隔毫秒, loop=0, optimize=False)
+    写入私有文件(文件路径, 输出.getvalue())
+    return 文件路径
+
+
+def 主程序(参数列表: Optional[List[str]] = None) -> int:
+    """命令行入口"""
+    解析器 = argparse.ArgumentParser(description="把大文件导出为多帧（喷泉码）动态二维码")
+    解析器.add_argument("输入文件", help="要传输的文件")
+    解析器.add_argument("-o", "--输出", required=True, help="输出目录（PNG帧）或.gif文件")
+    解析器.add_argument("-f", "--片段长度", type=int, default=默认片段长度, help="每帧片段字节数")
+    解析器.add_argument("-n", "--帧数", type=int, default=None, help="帧数（默认片段数的两倍）")
+    解析器.add_argument("-s", "--盒子大小", type=int, default=6, help="每个模块的像素大小")
+    解析器.add_argument("-d", "--帧间隔", type=int, default=200, help="GIF帧间隔（毫秒）")
+    参数 = 解析器.parse_args(参数列表)
+
+    try:
+        with open(参数.输入文件, "rb") as 文件:
+            载荷 = 文件.read()
+        if 参数.输出.lower().endswith(".gif"):
+            导出GIF(载荷, 参数.输出, 参数.片段长度, 参数.帧数, 参数.盒子大小, 帧间隔毫秒=参数.帧间隔)
+            print(f"✓ 已写入动画 {参数.输出}")
+        else:
+            路径列表 = 导出PNG帧(载荷, 参数.输出, 参数.片段长度, 参数.帧数, 参数.盒子大小)
+            print(f"✓ 已写入 {len(路径列表)} 帧到 {参数.输出}")
+    except (OSError, ValueError, ImportError) as e:
+        print(f"错误: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(主程序())
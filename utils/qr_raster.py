@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+二维码1位栅格化与PNG写入工具
+直接把二维码模块矩阵放大为1位灰度PNG，不经过PIL：
+每行模块先打包成每模块1位的字节，再查表把每个字节（8个模块）展开为盒子大小个字节；
+放大后的重复行使用PNG的Up过滤器（全零），配合zlib的RLE策略压缩，
+整个过程只在字节层面操作
+"""
+
+import zlib
+import struct
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Sequence
+
+PNG签名 = b"\x89PNG\r\n\x1a\n"
+默认盒子大小 = 10
+默认边框大小 = 4
+
+# 模块值(0/1)到位字符的映射：深色模块为0位，浅色为1位
+_位字符表 = bytes.maketrans(b"\x00\x01", b"10")
+
+
+@lru_cache(maxsize=32)
+def _展开表(盒子大小: int) -> List[bytes]:
+    """每个字节的8个模块位各重复盒子大小次，正好得到盒子大小个字节"""
+    表 = []
+    for 值 in range(256):
+        位串 = "".join(("1" if (值 >> (7 - i)) & 1 else "0") * 盒子大小 for i in range(8))
+        表.append(int(位串, 2).to_bytes(盒子大小, "big"))
+    return 表
+
+
+def _PNG块(类型: bytes, 数据: bytes) -> bytes:
+    """生成一个带长度和CRC的PNG数据块"""
+    return struct.pack(">I", len(数据)) + 类型 + 数据 + struct.pack(">I", zlib.crc32(类型 + 数据))
+
+
+def 图像尺寸(矩阵: Sequence[Sequence[bool]], 盒子大小: int = 默认盒子大小,
+         边框大小: int = 默认边框大小) -> int:
+    """返回栅格化后正方形图像的边长（像素）"""
+    return (len(矩阵) + 2 * 边框大小) * 盒子大小
+
+
+def 像素行(矩阵: Sequence[Sequence[bool]], 盒子大小: int = 默认盒子大小,
+        边框大小: int = 默认边框大小) -> Iterator[bytes]:
+    """
+    逐个模块行产出放大后的1位像素行
+
+    每个产出的行在图像中竖直方向重复盒子大小次；行末不足一字节的位为浅色。
+
+    参数:
+        矩阵: 二维码模块矩阵（不含静区），True表示深色模块
+        盒子大小: 每个模块的像素大小
+        边框大小: 静区宽度（模块数）
+
+    返回:
+        字节串迭代器，共 len(矩阵) + 2×边框大小 行
+
+    异常:
+        ValueError: 盒子大小不是正数或边框大小为负数
+    """
+    if 盒子大小 < 1 or 边框大小 < 0:
+        raise ValueError("盒子大小必须为正数，边框大小不能为负数")
+    总模块数 = len(矩阵) + 2 * 边框大小
+    行字节数 = (总模块数 * 盒子大小 + 7) // 8
+    打包字节数 = (总模块数 + 7) // 8
+    左边框 = b"1" * 边框大小
+    右边框 = b"1" * (打包字节数 * 8 - 总模块数 + 边框大小)
+    展开表 = _展开表(盒子大小)
+
+    空白行 = b"\xff" * 行字节数
+    for _ in range(边框大小):
+        yield 空白行
+    for 行 in 矩阵:
+        打包 = int(左边框 + bytes(行).translate(_位字符表) + 右边框, 2).to_bytes(打包字节数, "big")
+        yield b"".join([展开表[值] for 值 in 打包])[:行字节数]
+    for _ in range(边框大小):
+        yield 空白行
+
+
+def _组装PNG(宽度: int, 高度: int, 压缩数据: bytes) -> bytes:
+    """用1位灰度IHDR和压缩后的扫描行数据组装PNG文件"""
+    头部 = struct.pack(">IIBBBBB", 宽度, 高度, 1, 0, 0, 0, 0)
+    return b"".join((
+        PNG签名,
+        _PNG块(b"IHDR", 头部),
+        _PNG块(b"IDAT", 压缩数据),
+        _PNG块(b"IEND", b""),
+    ))
+
+
+def 编码1位PNG(宽度: int, 高度: int, 行迭代器: Iterable[bytes]) -> bytes:
+    """
+    把任意1位像素行编码为灰度PNG
+
+    与上一行相同的行用Up过滤器编码为全零，扫描行分批送入压缩器，
+    适合由多个二维码拼成的大页面。
+
+    参数:
+        宽度: 图像宽度（像素）
+        高度: 图像高度（像素）
+        行迭代器: 高度个像素行，每行 (宽度+7)//8 字节，0位为黑色
+
+    返回:
+        PNG文件内容
+
+    异常:
+        ValueError: 行数或行长度与尺寸不符
+    """
+    行字节数 = (宽度 + 7) // 8
+    零行 = b"\x02" + bytes(行字节数)
+    压缩器 = zlib.compressobj(6, zlib.DEFLATED, 15, 8, zlib.Z_RLE)
+    数据块: List[bytes] = []
+    缓冲: List[bytes] = []
+    上一行 = None
+    行数 = 0
+    for 行 in 行迭代器:
+        if len(行) != 行字节数:
+            raise ValueError(f"第 {行数 + 1} 行长度应为 {行字节数} 字节")
+        缓冲.append(零行 if 行 == 上一行 else b"\x00" + 行)
+        上一行 = 行
+        行数 += 1
+        if len(缓冲) >= 256:
+            数据块.append(压缩器.compress(b"".join(缓冲)))
+            缓冲.clear()
+    if 行数 != 高度:
+        raise ValueError(f"图像应有 {高度} 行，实际为 {行数} 行")
+    数据块.append(压缩器.compress(b"".join(缓冲)))
+    数据块.append(压缩器.flush())
+    return _组装PNG(宽度, 高度, b"".join(数据块))
+
+
+def 编码PNG(矩阵: Sequence[Sequence[bool]], 盒子大小: int = 默认盒子大小,
+          边框大小: int = 默认边框大小) -> bytes:
+    """
+    把模块矩阵编码为1位灰度PNG
+
+    参数:
+        矩阵: 二维码模块矩阵（不含静区），True表示深色模块
+        盒子大小: 每个模块的像素大小
+        边框大小: 静区宽度（模块数）
+
+    返回:
+        PNG文件内容
+    """
+    宽度 = 图像尺寸(矩阵, 盒子大小, 边框大小)
+    行字节数 = (宽度 + 7) // 8
+    # 每个模块行的第一条扫描行不过滤，其余重复行用Up过滤器编码为全零
+    重复行 = (b"\x02" + bytes(行字节数)) * (盒子大小 - 1)
+    压缩器 = zlib.compressobj(6, zlib.DEFLATED, 15, 8, zlib.Z_RLE)
+    数据块 = [压缩器.compress(b"".join([b"\x00" + 行 + 重复行 for 行 in 像素行(矩阵, 盒子大小, 边框大小)]))]
+    数据块.append(压缩器.flush())
+    return _组装PNG(宽度, 宽度, b"".join(数据块))
+
+
+def 保存PNG(矩阵: Sequence[Sequence[bool]], 文件路径: str, 盒子大小: int = 默认盒子大小,
+          边框大小: int = 默认边框大小) -> str:
+    """
+    把模块矩阵保存为1位灰度PNG文件
+
+    返回:
+        保存的文件路径
+    """
+    with open(文件路径, "wb") as 文件:
+        文件.write(编码PNG(矩阵, 盒子大小, 边框大小))
+    return 文件路径
+
+
+# 测试代码
+if __name__ == "__main__":
+    测试矩阵 = [[(行 + 列) % 2 == 0 for 列 in range(21)] for 行 in range(21)]
+    内容 = 编码PNG(测试矩阵)
+    print(f"图像边长: {图像尺寸(测试矩阵)} 像素, PNG大小: {len(内容)} 字节")
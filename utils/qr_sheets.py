@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+批量二维码页面生成工具
+把大量数据（助记词、SLIP-39分享、地址等）排成固定网格的可打印页面。
+每一页是进程池中的一个任务：工作进程编码该页的全部二维码，
+在1位像素行上直接拼版并写出PNG文件，主进程只收集每页的摘要，
+因此任何时刻每个进程只持有一页的数据
+"""
+
+import os
+import sys
+import argparse
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from utils.private_file import 写入私有文件
+from utils.qr_raster import 像素行, 图像尺寸, 编码1位PNG
+from utils.qr_decoder import 解码1位像素行
+from utils.qrcode_generator import 二维码生成器
+
+
+默认列数 = 3
+默认行数 = 4
+默认单元格边长 = 800
+默认页边距 = 40
+默认边框大小 = 4
+页面文件格式 = "page-{:04d}.png"
+索引文件名 = "索引.tsv"
+
+
+def _检查版式(版式: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    检查并规范化页面版式
+
+    单元格边长和页边距向下取整到8的倍数，使每个单元格在像素行中按字节对齐。
+    """
+    try:
+        结果 = {
+            "列数": int(版式.get("列数", 默认列数)),
+            "行数": int(版式.get("行数", 默认行数)),
+            "单元格边长": int(版式.get("单元格边长", 默认单元格边长)) // 8 * 8,
+            "页边距": int(版式.get("页边距", 默认页边距)) // 8 * 8,
+            "边框大小": int(版式.get("边框大小", 默认边框大小)),
+            "错误纠正级别": str(版式.get("错误纠正级别", "M")).upper(),
+            "校验": bool(版式.get("校验", False)),
+        }
+    except (TypeError, ValueError):
+        raise ValueError("版式参数必须是整数")
+    if 结果["列数"] < 1 or 结果["行数"] < 1:
+        raise ValueError("列数和行数必须为正数")
+    if 结果["单元格边长"] < 8:
+        raise ValueError("单元格边长至少为8像素")
+    if 结果["页边距"] < 0 or 结果["边框大小"] < 0:
+        raise ValueError("页边距和边框大小不能为负数")
+    if 结果["错误纠正级别"] not in ("L", "M", "Q", "H"):
+        raise ValueError("错误纠正级别必须是L、M、Q或H")
+    return 结果
+
+
+def 页面尺寸(版式: Dict[str, Any]) -> Tuple[int, int]:
+    """返回页面的 (宽度, 高度) 像素"""
+    版式 = _检查版式(版式)
+    return (版式["列数"] * 版式["单元格边长"] + 2 * 版式["页边距"],
+            版式["行数"] * 版式["单元格边长"] + 2 * 版式["页边距"])
+
+
+def _渲染单元格(数据: str, 版式: Dict[str, Any]) -> List[bytes]:
+    """
+    把一个二维码渲染为单元格大小的像素行列表
+
+    盒子大小取能放进单元格的最大整数，二维码在单元格内居中。
+    相同的行共享同一个字节串对象。
+
+    异常:
+        ValueError: 数据超出二维码容量，或单元格放不下每模块至少1像素的二维码
+    """
+    边长 = 版式["单元格边长"]
+    矩阵 = 二维码生成器.生成模块矩阵(数据, 版式["错误纠正级别"])
+    盒子大小 = 边长 // (len(矩阵) + 2 * 版式["边框大小"])
+    if 盒子大小 < 1:
+        raise ValueError(f"数据太长，{边长}像素的单元格放不下")
+
+    二维码边长 = 图像尺寸(矩阵, 盒子大小, 版式["边框大小"])
+    上边距 = (边长 - 二维码边长) // 2
+    右侧位数 = 边长 - 上边距 - 二维码边长
+    左侧 = ((1 << 上边距) - 1) << (二维码边长 + 右侧位数)
+    右侧 = (1 << 右侧位数) - 1
+    填充位数 = -二维码边长 % 8
+
+    空白行 = b"\xff" * (边长 // 8)
+    行列表 = [空白行] * 上边距
+    for 行 in 像素行(矩阵, 盒子大小, 版式["边框大小"]):
+        值 = (int.from_bytes(行, "big") >> 填充位数) << 右侧位数
+        单元格行 = (左侧 | 值 | 右侧).to_bytes(边长 // 8, "big")
+        行列表.extend([单元格行] * 盒子大小)
+    行列表.extend([空白行] * (边长 - len(行列表)))
+    return 行列表
+
+
+def _页面像素行(单元格列表: List[Optional[List[bytes]]], 版式: Dict[str, Any]) -> Iterator[bytes]:
+    """按网格逐行拼接单元格，产出整页的像素行"""
+    列数 = 版式["列数"]
+    边长 = 版式["单元格边长"]
+    边距字节 = b"\xff" * (版式["页边距"] // 8)
+    空白单元格 = [b"\xff" * (边长 // 8)] * 边长
+    空白页行 = b"\xff" * ((列数 * 边长 + 2 * 版式["页边距"]) // 8)
+
+    for _ in range(版式["页边距"]):
+        yield 空白页行
+    for 行号 in range(版式["行数"]):
+        网格行 = [
+            (单元格列表[行号 * 列数 + 列号] if 行号 * 列数 + 列号 < len(单元格列表) else None) or 空白单元格
+            for 列号 in range(列数)
+        ]
+        for y in range(边长):
+            yield 边距字节 + b"".join([单元格[y] for 单元格 in 网格行]) + 边距字节
+    for _ in range(版式["页边距"]):
+        yield 空白页行
+
+
+def _生成页面(任务: Tuple[int, List[Tuple[str, str]], Dict[str, Any], str]) -> Dict[str, Any]:
+    """进程池任务：渲染一页并写入文件（必须是模块级函数才能被pickle）"""
+    页号, 条目列表, 版式, 输出目录 = 任务
+    单元格列表: List[Optional[List[bytes]]] = []
+    错误: List[Tuple[str, str]] = []
+    for 标签, 数据 in 条目列表:
+        try:
+            单元格 = _渲染单元格(数据, 版式)
+            # 校验失败的单元格留空，不把无法还原的二维码印到页面上
+            if 版式["校验"] and 解码1位像素行(单元格, 版式["单元格边长"]) != 数据.encode("utf-8"):
+                raise ValueError("二维码校验失败: 解码内容与原始数据不一致")
+            单元格列表.append(单元格)
+        except ValueError as e:
+            单元格列表.append(None)
+            错误.append((标签, str(e)))
+
+    宽度, 高度 = 页面尺寸(版式)
+    文件路径 = os.path.join(输出目录, 页面文件格式.format(页号))
+    写入私有文件(文件路径, 编码1位PNG(宽度, 高度, _页面像素行(单元格列表, 版式)))
+    return {"页号": 页号, "文件": 文件路径, "标签": [标签 for 标签, _ in 条目列表], "错误": 错误}
+
+
+def 批量生成二维码页(条目列表: Sequence[Tuple[str, str]], 输出目录: str,
+              版式: Optional[Dict[str, Any]] = None,
+              进程数: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    把条目排成网格页面，在进程池中并行渲染并逐页写入输出目录
+
+    参数:
+        条目列表: (标签, 数据) 列表，按行优先顺序填入网格
+        输出目录: 输出目录，页面写为 page-0001.png 等，另写一个标签索引 索引.tsv
+        版式: 版式参数 {"列数", "行数", "单元格边长", "页边距", "边框大小", "错误纠正级别", "校验"}，缺省项使用默认值；
+             "校验"为True时在工作进程中解码每个单元格，与数据不一致的条目计入错误
+        进程数: 工作进程数，默认为CPU核心数；为1时在当前进程中计算
+
+    返回:
+        按页号排列的结果列表，每项包含"页号"、"文件"、"标签"和"错误"（放不下或校验失败的条目）
+    """
+    版式 = _检查版式(版式 or {})
+    每页数量 = 版式["列数"] * 版式["行数"]
+    os.makedirs(输出目录, mode=0o700, exist_ok=True)
+
+    任务迭代器 = (
+        (起点 // 每页数量 + 1, list(条目列表[起点:起点 + 每页数量]), 版式, 输出目录)
+        for 起点 in range(0, len(条目列表), 每页数量)
+    )
+    进程数 = 进程数 or os.cpu_count() or 1
+
+    结果: Dict[int, Dict[str, Any]] = {}
+    if 进程数 == 1:
+        for 任务 in 任务迭代器:
+            页面 = _生成页面(任务)
+            结果[页面["页号"]] = 页面
+    else:
+        # 只保持有限个页面在途，条目很多时不会一次性提交全部任务
+        with ProcessPoolExecutor(max_workers=进程数) as 进程池:
+            在途 = {进程池.submit(_生成页面, 任务) for 任务 in islice(任务迭代器, 进程数 * 2)}
+            while 在途:
+                已完成, 在途 = wait(在途, return_when=FIRST_COMPLETED)
+                for 未来 in 已完成:
+                    页面 = 未来.result()
+                    结果[页面["页号"]] = 页面
+                在途 |= {进程池.submit(_生成页面, 任务) for 任务 in islice(任务迭代器, len(已完成))}
+
+    页面列表 = [结果[页号] for 页号 in sorted(结果)]
+    索引行 = ["页号\t行\t列\t标签"]
+    for 页面 in 页面列表:
+        for 序号, 标签 in enumerate(页面["标签"]):
+            索引行.append(f"{页面['页号']}\t{序号 // 版式['列数'] + 1}\t{序号 % 版式['列数'] + 1}\t{标签}")
+    写入私有文件(os.path.join(输出目录, 索引文件名), ("\n".join(索引行) + "\n").encode("utf-8"))
+    return 页面列表
+
+
+def 读取条目文件(文件路径: str) -> List[Tuple[str, str]]:
+    """
+    读取条目文件：每行一个条目，"标签<TAB>数据"或只有数据（标签为行号）；
+    空行和#开头的行被忽略，因此可以直接读取SLIP-39批量生成的分享文件
+    """
+    条目列表 = []
+    with open(文件路径, "r", encoding="utf-8") as 文件:
+        for 行号, 行 in enumerate(文件, 1):
+            行 = 行.strip()
+            if not 行 or 行.startswith("#"):
+                continue
+            标签, 分隔符, 数据 = 行.partition("\t")
+            条目列表.append((标签, 数据) if 分隔符 else (str(行号), 行))
+    return 条目列表
+
+
+def 主程序(参数列表: Optional[List[str]] = None) -> int:
+    """命令行入口"""
+    解析器 = argparse.ArgumentParser(description="把大量数据批量排成二维码打印页")
+    解析器.add_argument("条目文件", nargs="+", help="条目文件（每行\"标签<TAB>数据\"或只有数据）")
+    解析器.add_argument("-o", "--输出目录", default="qr_sheets", help="页面输出目录")
+    解析器.add_argument("-j", "--进程数", type=int, default=None, help="并行进程数（默认CPU核心数）")
+    解析器.add_argument("--列数", type=int, default=默认列数, help="每页列数")
+    解析器.add_argument("--行数", type=int, default=默认行数, help="每页行数")
+    解析器.add_argument("--单元格边长", type=int, default=默认单元格边长, help="单元格边长（像素）")
+    解析器.add_argument("--页边距", type=int, default=默认页边距, help="页边距（像素）")
+    解析器.add_argument("--错误纠正级别", default="M", choices=["L", "M", "Q", "H"], help="错误纠正级别")
+    解析器.add_argument("--校验", action="store_true", help="解码每个二维码，确认与数据一致")
+    参数 = 解析器.parse_args(参数列表)
+
+    版式 = {"列数": 参数.列数, "行数": 参数.行数, "单元格边长": 参数.单元格边长,
+          "页边距": 参数.页边距, "错误纠正级别": 参数.错误纠正级别, "校验": 参数.校验}
+    try:
+        条目列表 = [条目 for 路径 in 参数.条目文件 for 条目 in 读取条目文件(路径)]
+        页面列表 = 批量生成二维码页(条目列表, 参数.输出目录, 版式, 参数.进程数)
+    except (OSError, ValueError) as e:
+        print(f"错误: {e}", file=sys.stderr)
+        return 1
+
+    失败数 = 0
+    for 页面 in 页面列表:
+        print(f"✓ 第 {页面['页号']} 页 ({len(页面['标签'])} 个) -> {页面['文件']}")
+        for 标签, 错误 in 页面["错误"]:
+            失败数 += 1
+            print(f"  ✗ {标签}: {错误}")
+    print(f"\n完成: {len(条目列表) - 失败数} 个二维码, {len(页面列表)} 页, {失败数} 个失败")
+    return 1 if 失败数 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(主程序())
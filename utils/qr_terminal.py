@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+终端二维码显示工具
+用Unicode半块字符把二维码直接打印到终端，每行文字表示两行模块；
+编码使用纯Python的qr_encoder，不导入qrcode和PIL，
+适合在离线的控制台上显示钱包地址
+"""
+
+import os
+import sys
+import argparse
+from typing import List, Optional, Sequence, TextIO
+
+from utils.qr_encoder import 编码
+
+默认边框大小 = 2
+
+# 按 (上方模块为浅色, 下方模块为浅色) 取字符：字符的前景色画浅色模块
+_半块字符 = (" ", "▄", "▀", "█")
+
+# 白色前景、黑色背景，使二维码的深浅与终端配色无关
+_ANSI开始 = "\x1b[97;40m"
+_ANSI结束 = "\x1b[0m"
+
+
+def 渲染文本(矩阵: Sequence[Sequence[bool]], 边框大小: int = 默认边框大小,
+         ANSI颜色: bool = False, 反色: bool = False) -> str:
+    """
+    把模块矩阵渲染为半块字符文本
+
+    不使用ANSI颜色时，字符的前景（通常是深色背景上的浅色文字）表示浅色模块；
+    在浅色背景的终端上应使用反色，或者直接启用ANSI颜色。
+
+    参数:
+        矩阵: 二维码模块矩阵（不含静区），True表示深色模块
+        边框大小: 静区宽度（模块数）
+        ANSI颜色: 是否用ANSI转义序列固定为白色前景、黑色背景
+        反色: 前景表示深色模块（用于浅色背景的终端，ANSI颜色下忽略）
+
+    返回:
+        多行文本，行数为 (模块行数 + 2×边框大小 + 1) // 2
+
+    异常:
+        ValueError: 边框大小为负数
+    """
+    if 边框大小 < 0:
+        raise ValueError("边框大小不能为负数")
+    前景为浅色 = not (反色 and not ANSI颜色)
+    宽度 = len(矩阵) + 2 * 边框大小
+    空白行 = [前景为浅色] * 宽度
+    边框 = [前景为浅色] * 边框大小
+    行列表: List[List[bool]] = [空白行] * 边框大小
+    行列表.extend(边框 + [(not 模块) == 前景为浅色 for 模块 in 行] + 边框 for 行 in 矩阵)
+    行列表.extend([空白行] * (边框大小 + (len(矩阵) + 边框大小 * 2) % 2))
+
+    文本行 = []
+    for 序号 in range(0, len(行列表), 2):
+        文字 = "".join([_半块字符[上 * 2 + 下] for 上, 下 in zip(行列表[序号], 行列表[序号 + 1])])
+        文本行.append(_ANSI开始 + 文字 + _ANSI结束 if ANSI颜色 else 文字)
+    return "\n".join(文本行)
+
+
+def 支持ANSI颜色(输出: TextIO) -> bool:
+    """输出是终端且未设置NO_COLOR、TERM不是dumb时返回True"""
+    return (hasattr(输出, "isatty") and 输出.isatty()
+            and "NO_COLOR" not in os.environ and os.environ.get("TERM") != "dumb")
+
+
+def 显示二维码(数据: str, 错误纠正级别: str = "L", 边框大小: int = 默认边框大小,
+          ANSI颜色: Optional[bool] = None, 反色: bool = False,
+          输出: Optional[TextIO] = None) -> None:
+    """
+    编码数据并把二维码打印到终端
+
+    参数:
+        数据: 要编码的数据（如钱包地址）
+        错误纠正级别: L、M、Q或H；屏幕显示不会污损，默认用L以得到最小的符号
+        边框大小: 静区宽度（模块数）
+        ANSI颜色: 是否使用ANSI颜色，默认在输出为终端时自动启用
+        反色: 不使用ANSI颜色时，前景表示深色模块
+        输出: 输出流，默认为标准输出
+
+    异常:
+        ValueError: 数据超出二维码最大容量或参数无效
+    """
+    输出 = 输出 or sys.stdout
+    if ANSI颜色 is None:
+        ANSI颜色 = 支持ANSI颜色(输出)
+    矩阵 = 编码(数据, 错误纠正级别)
+    输出.write(渲染文本(矩阵, 边框大小, ANSI颜色, 反色) + "\n")
+
+
+def 主程序(参数列表: Optional[List[str]] = None) -> int:
+    """命令行入口"""
+    解析器 = argparse.ArgumentParser(description="在终端中以二维码显示数据")
+    解析器.add_argument("数据", nargs="?", help="要编码的数据（省略则从标准输入读取一行）")
+    解析器.add_argument("-l", "--错误纠正级别", default="L", choices=["L", "M", "Q", "H"], help="错误纠正级别")
+    解析器.add_argument("-b", "--边框大小", type=int, default=默认边框大小, help="静区宽度（模块数）")
+    解析器.add_argument("--无颜色", action="store_true", help="不使用ANSI颜色")
+    解析器.add_argument("--反色", action="store_true", help="用于浅色背景的终端（仅在无颜色时有效）")
+    参数 = 解析器.parse_args(参数列表)
+
+    数据 = 参数.数据 if 参数.数据 is not None else sys.stdin.readline().rstrip("\n")
+    try:
+        显示二维码(数据, 参数.错误纠正级别, 参数.边框大小, False if 参数.无颜色 else None, 参数.反色)
+    except ValueError as e:
+        print(f"错误: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(主程序())
@@ -3,13 +3,20 @@
 
 """
 二维码生成工具
-用于将助记词或其他敏感信息转换为二维码
+用于将助记词或其他敏感信息转换为二维码。
+模块矩阵由纯Python编码器生成（见utils.qr_encoder），
+不带样式和标题的PNG直接由模块矩阵栅格化写出（见utils.qr_raster），这两步都不需要qrcode和PIL
 """
 
 import os
 import io
 import base64
-from typing import Optional, Union, Tuple
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Union, Tuple
+
+from utils.qr_encoder import 编码, 编码分段, 字节分段
+from utils.qr_raster import 编码PNG, 像素行, 图像尺寸
+from utils.qr_decoder import 解码PNG, 解码图像
 
 try:
     import qrcode
@@ -21,6 +28,88 @@ try:
 except ImportError:
     QRCODE_AVAILABLE = False
 
+默认标题高度 = 40
+默认标题字号 = 20
+
+
+@lru_cache(maxsize=1)
+def _标题字体路径() -> Optional[str]:
+    """探测系统中可显示中文的字体文件，只在第一次需要标题时执行"""
+    if os.name == 'nt':  # Windows
+        候选路径 = ("C:\\Windows\\Fonts\\simhei.ttf",)
+    elif os.name == 'posix':  # macOS/Linux
+        候选路径 = ("/System/Library/Fonts/PingFang.ttc", "/usr/share/fonts/truetype/wqy/wqy-microhei.ttc")
+    else:
+        候选路径 = ()
+    for 路径 in 候选路径:
+        if os.path.exists(路径):
+            return 路径
+    return None
+
+
+@lru_cache(maxsize=8)
+def 获取标题字体(字号: int = 默认标题字号) -> Any:
+    """
+    返回指定字号的标题字体，每个字号只加载一次
+
+    返回:
+        PIL字体对象；找不到系统字体或加载失败时返回None（使用PIL默认字体）
+    """
+    路径 = _标题字体路径()
+    if 路径:
+        try:
+            return ImageFont.truetype(路径, 字号)
+        except Exception:
+            pass
+    return None
+
+
+@lru_cache(maxsize=64)
+def 渲染标题栏(标题: str, 宽度: int, 标题高度: int = 默认标题高度, 字号: int = 默认标题字号) -> Any:
+    """
+    渲染白底黑字、文字居中的灰度标题栏
+
+    同样的标题和宽度直接返回缓存的图像，调用方只能读取（粘贴），不能修改。
+
+    参数:
+        标题: 标题文本
+        宽度: 标题栏宽度（像素），通常等于二维码图像宽度
+        标题高度: 标题栏高度（像素）
+        字号: 标题字号
+
+    返回:
+        'L'模式的PIL图像
+    """
+    标题栏 = Image.new('L', (宽度, 标题高度), 255)
+    draw = ImageDraw.Draw(标题栏)
+    字体 = 获取标题字体(字号)
+    文本宽度 = draw.textlength(标题, font=字体) if 字体 else len(标题) * 10
+    draw.text(((宽度 - 文本宽度) // 2, 10), 标题, fill=0, font=字体)
+    return 标题栏
+
+
+def _矩阵图像(矩阵: List[List[bool]], 盒子大小: int, 边框大小: int) -> Any:
+    """把模块矩阵直接放大为'1'模式的PIL图像，与qrcode库的标准图像逐像素一致"""
+    边长 = 图像尺寸(矩阵, 盒子大小, 边框大小)
+    数据 = b"".join([行 * 盒子大小 for 行 in 像素行(矩阵, 盒子大小, 边框大小)])
+    return Image.frombytes('1', (边长, 边长), 数据)
+
+
+def _校验二维码(解码函数: Callable[[Any], bytes], 图像: Any, 期望: Union[str, bytes]) -> None:
+    """
+    解码刚生成的图像并与原始数据比较
+
+    异常:
+        ValueError: 图像无法解码或内容与原始数据不一致
+    """
+    期望字节 = 期望.encode('utf-8') if isinstance(期望, str) else 期望
+    try:
+        结果 = 解码函数(图像)
+    except ValueError as e:
+        raise ValueError(f"二维码校验失败: {e}")
+    if 结果 != 期望字节:
+        raise ValueError("二维码校验失败: 解码内容与原始数据不一致")
+
 
 class 二维码生成器:
     """二维码生成器类，用于生成和保存二维码"""
@@ -44,14 +133,46 @@ class 二维码生成器:
             安装提示字符串
         """
         return "请安装qrcode和pillow库以启用二维码功能：\npip install qrcode[pil] pillow"
-    
+
+    @staticmethod
+    def 生成模块矩阵(数据: str, 错误纠正级别: str = 'H') -> List[List[bool]]:
+        """
+        编码数据并返回二维码模块矩阵
+
+        参数:
+            数据: 要编码的数据
+            错误纠正级别: 错误纠正级别 (L:7%, M:15%, Q:25%, H:30%)
+
+        返回:
+            模块矩阵（不含静区），True表示深色模块
+
+        异常:
+            ValueError: 数据超出二维码最大容量
+        """
+        return 编码(数据, 错误纠正级别)
+
+    @staticmethod
+    def _输出PNG(PNG数据: bytes, 文件路径: Optional[str]) -> str:
+        """把PNG数据写入文件并返回路径，或在文件路径为None时返回base64编码"""
+        if 文件路径:
+            with open(文件路径, 'wb') as 文件:
+                文件.write(PNG数据)
+            return 文件路径
+        return base64.b64encode(PNG数据).decode('utf-8')
+
+    @staticmethod
+    def _可直接写PNG(文件路径: Optional[str]) -> bool:
+        """未指定文件或文件扩展名为.png时可以跳过PIL直接写出"""
+        return 文件路径 is None or os.path.splitext(文件路径)[1].lower() == '.png'
+
     @staticmethod
     def 生成二维码(数据: str, 文件路径: Optional[str] = None, 
               标题: Optional[str] = None, 
               错误纠正级别: str = 'H', 
               盒子大小: int = 10, 
               边框大小: int = 4,
-              样式化: bool = True) -> Union[str, bytes, None]:
+              样式化: bool = False,
+              校验: bool = False) -> Union[str, bytes, None]:
         """
         生成二维码
         
@@ -62,30 +183,37 @@ class 二维码生成器:
             错误纠正级别: 错误纠正级别 (L:7%, M:15%, Q:25%, H:30%)
             盒子大小: 二维码中每个小方块的像素大小
             边框大小: 二维码周围的边框大小
-            样式化: 是否使用样式化的二维码
+            样式化: 是否使用样式化（圆角模块、渐变色）的二维码，逐模块绘制，速度较慢
+            校验: 保存前用utils.qr_decoder解码生成的图像，确认内容与数据一致
             
         返回:
             如果文件路径为None，则返回二维码图像的base64编码或字节数据
             如果文件路径不为None，则返回保存的文件路径
+
+        异常:
+            ValueError: 启用校验且图像解码结果与数据不一致
         """
+        # 快速路径：不带样式和标题的PNG直接从模块矩阵写出，不需要qrcode和PIL
+        if not 样式化 and not 标题 and 二维码生成器._可直接写PNG(文件路径):
+            矩阵 = 二维码生成器.生成模块矩阵(数据, 错误纠正级别)
+            PNG数据 = 编码PNG(矩阵, 盒子大小, 边框大小)
+            if 校验:
+                _校验二维码(解码PNG, PNG数据, 数据)
+            return 二维码生成器._输出PNG(PNG数据, 文件路径)
+
         if not QRCODE_AVAILABLE:
             print(f"错误: {二维码生成器.安装依赖提示()}")
             return None
         
-        # 创建QR码实例
-        qr = qrcode.QRCode(
-            version=None,  # 自动确定版本
-            error_correction=getattr(qrcode.constants, f'ERROR_CORRECT_{错误纠正级别}'),
-            box_size=盒子大小,
-            border=边框大小,
-        )
-        
-        # 添加数据
-        qr.add_data(数据)
-        qr.make(fit=True)
-        
-        # 创建图像
         if 样式化:
+            qr = qrcode.QRCode(
+                version=None,  # 自动确定版本
+                error_correction=getattr(qrcode.constants, f'ERROR_CORRECT_{错误纠正级别}'),
+                box_size=盒子大小,
+                border=边框大小,
+            )
+            qr.add_data(数据)
+            qr.make(fit=True)
             try:
                 img = qr.make_image(
                     image_factory=StyledPilImage,
@@ -94,56 +222,24 @@ class 二维码生成器:
                         center_color=(0, 0, 0),
                         edge_color=(50, 50, 50),
                     )
-                )
+                ).get_image()
             except Exception:
                 # 如果样式化失败，回退到标准图像
-                img = qr.make_image(fill_color="black", back_color="white")
+                img = _矩阵图像(qr.modules, 盒子大小, 边框大小)
         else:
-            img = qr.make_image(fill_color="black", back_color="white")
-        
-        # 如果有标题，添加标题
+            img = _矩阵图像(二维码生成器.生成模块矩阵(数据, 错误纠正级别), 盒子大小, 边框大小)
+
+        # 如果有标题，在灰度画布上把缓存的标题栏和二维码上下拼接
         if 标题:
-            # 获取二维码图像尺寸
-            二维码宽度 = img.width
-            二维码高度 = img.height
-            
-            # 创建一个新的白色背景图像，高度增加以容纳标题
-            标题高度 = 40  # 标题区域高度
-            新图像 = Image.new('RGB', (二维码宽度, 二维码高度 + 标题高度), color='white')
-            
-            # 将二维码图像粘贴到新图像的底部
-            新图像.paste(img, (0, 标题高度))
-            
-            # 添加标题文本
-            draw = ImageDraw.Draw(新图像)
-            
-            # 尝试加载字体，如果失败则使用默认字体
-            字体 = None
-            try:
-                # 尝试使用系统字体
-                字体路径 = ""
-                if os.name == 'nt':  # Windows
-                    字体路径 = "C:\\Windows\\Fonts\\simhei.ttf"
-                elif os.name == 'posix':  # macOS/Linux
-                    if os.path.exists("/System/Library/Fonts/PingFang.ttc"):
-                        字体路径 = "/System/Library/Fonts/PingFang.ttc"
-                    elif os.path.exists("/usr/share/fonts/truetype/wqy/wqy-microhei.ttc"):
-                        字体路径 = "/usr/share/fonts/truetype/wqy/wqy-microhei.ttc"
-                
-                if 字体路径 and os.path.exists(字体路径):
-                    字体 = ImageFont.truetype(字体路径, 20)
-            except Exception:
-                pass
-            
-            # 计算文本位置以居中显示
-            文本宽度 = draw.textlength(标题, font=字体) if 字体 else len(标题) * 10
-            文本位置 = ((新图像.width - 文本宽度) // 2, 10)
-            
-            # 绘制文本
-            draw.text(文本位置, 标题, fill="black", font=字体)
-            
+            标题栏 = 渲染标题栏(标题, img.width)
+            新图像 = Image.new('L', (img.width, img.height + 标题栏.height), 255)
+            新图像.paste(标题栏, (0, 0))
+            新图像.paste(img.convert('L'), (0, 标题栏.height))
             img = 新图像
-        
+
+        if 校验:
+            _校验二维码(解码图像, img, 数据)
+
         # 保存或返回图像
         if 文件路径:
             img.save(文件路径)
@@ -155,93 +251,102 @@ class 二维码生成器:
             return base64.b64encode(img_byte_arr.getvalue()).decode('utf-8')
     
     @staticmethod
-    def 生成助记词二维码(助记词: str, 文件路径: Optional[str] = None) -> Union[str, bytes, None]:
+    def _输出矩阵(矩阵: List[List[bool]], 文件路径: Optional[str],
+              盒子大小: int, 边框大小: int, 校验内容: Union[str, bytes, None] = None) -> Optional[str]:
+        """
+        把模块矩阵写成图像文件或返回PNG的base64编码；非PNG格式需要PIL。
+        给出校验内容时先解码图像，与之不一致则抛出ValueError
+        """
+        if 二维码生成器._可直接写PNG(文件路径):
+            PNG数据 = 编码PNG(矩阵, 盒子大小, 边框大小)
+            if 校验内容 is not None:
+                _校验二维码(解码PNG, PNG数据, 校验内容)
+            return 二维码生成器._输出PNG(PNG数据, 文件路径)
+        if not QRCODE_AVAILABLE:
+            print(f"错误: {二维码生成器.安装依赖提示()}")
+            return None
+        img = _矩阵图像(矩阵, 盒子大小, 边框大小)
+        if 校验内容 is not None:
+            _校验二维码(解码图像, img, 校验内容)
+        img.save(文件路径)
+        return 文件路径
+
+    @staticmethod
+    def 生成助记词二维码(助记词: str, 文件路径: Optional[str] = None,
+                  编码方式: str = '文本', 校验: bool = False) -> Union[str, bytes, None]:
         """
         为助记词生成二维码
         
         参数:
             助记词: 助记词字符串
             文件路径: 保存二维码的文件路径，如果为None则返回二维码图像数据
+            编码方式: '文本'（单词原文，H级纠错）、'SeedQR'（每词4位数字）
+                     或'紧凑SeedQR'（原始熵字节）；SeedQR格式按规范使用L级纠错，
+                     24词分别只需29×29和25×25模块，可用utils.seedqr.解码SeedQR还原
+            校验: 保存前解码生成的图像，确认能还原出同样的内容
             
         返回:
             如果文件路径为None，则返回二维码图像的base64编码
             如果文件路径不为None，则返回保存的文件路径
+
+        异常:
+            ValueError: 编码方式未知，SeedQR格式下助记词无效，或启用校验且解码结果不一致
         """
-        # 简化二维码生成，不使用标题
-        if not QRCODE_AVAILABLE:
-            print(f"错误: {二维码生成器.安装依赖提示()}")
-            return None
-        
-        # 创建QR码实例
-        qr = qrcode.QRCode(
-            version=None,  # 自动确定版本
-            error_correction=qrcode.constants.ERROR_CORRECT_H,
-            box_size=10,
-            border=4,
-        )
-        
-        # 添加数据
-        qr.add_data(助记词)
-        qr.make(fit=True)
-        
-        # 创建图像
-        img = qr.make_image(fill_color="black", back_color="white")
-        
-        # 保存或返回图像
-        if 文件路径:
-            img.save(文件路径)
-            return 文件路径
-        else:
-            # 返回图像数据
-            img_byte_arr = io.BytesIO()
-            img.save(img_byte_arr, format='PNG')
-            return base64.b64encode(img_byte_arr.getvalue()).decode('utf-8')
-    
+        if 编码方式 == '文本':
+            return 二维码生成器.生成二维码(助记词, 文件路径, 错误纠正级别='H', 盒子大小=10, 边框大小=4, 校验=校验)
+        if 编码方式 not in ('SeedQR', '紧凑SeedQR'):
+            raise ValueError("编码方式必须是'文本'、'SeedQR'或'紧凑SeedQR'")
+
+        from utils.seedqr import SeedQR模块矩阵, 助记词转SeedQR, 助记词转紧凑SeedQR
+        紧凑 = 编码方式 == '紧凑SeedQR'
+        矩阵 = SeedQR模块矩阵(助记词, 紧凑=紧凑)
+        校验内容 = None
+        if 校验:
+            校验内容 = 助记词转紧凑SeedQR(助记词) if 紧凑 else 助记词转SeedQR(助记词)
+        return 二维码生成器._输出矩阵(矩阵, 文件路径, 10, 4, 校验内容)
+
     @staticmethod
-    def 生成种子二维码(种子: bytes, 文件路径: Optional[str] = None) -> Union[str, bytes, None]:
+    def 生成种子二维码(种子: bytes, 文件路径: Optional[str] = None,
+                 二进制: bool = False, 校验: bool = False) -> Union[str, bytes, None]:
         """
         为种子生成二维码
         
         参数:
             种子: 种子字节
             文件路径: 保存二维码的文件路径，如果为None则返回二维码图像数据
+            二进制: 用字节模式直接编码64字节原始种子，而不是128个十六进制字符，
+                   数据位数减半，扫描得到的内容即为种子字节
+            校验: 保存前解码生成的图像，确认能还原出同样的内容
             
         返回:
             如果文件路径为None，则返回二维码图像的base64编码
             如果文件路径不为None，则返回保存的文件路径
         """
-        种子十六进制 = 种子.hex()
-        
-        # 简化二维码生成，不使用标题
-        if not QRCODE_AVAILABLE:
-            print(f"错误: {二维码生成器.安装依赖提示()}")
-            return None
-        
-        # 创建QR码实例
-        qr = qrcode.QRCode(
-            version=None,  # 自动确定版本
-            error_correction=qrcode.constants.ERROR_CORRECT_H,
-            box_size=6,  # 种子较长，使用较小的盒子大小
-            border=4,
-        )
-        
-        # 添加数据
-        qr.add_data(种子十六进制)
-        qr.make(fit=True)
-        
-        # 创建图像
-        img = qr.make_image(fill_color="black", back_color="white")
-        
-        # 保存或返回图像
-        if 文件路径:
-            img.save(文件路径)
-            return 文件路径
-        else:
-            # 返回图像数据
-            img_byte_arr = io.BytesIO()
-            img.save(img_byte_arr, format='PNG')
-            return base64.b64encode(img_byte_arr.getvalue()).decode('utf-8')
-    
+        if 二进制:
+            return 二维码生成器._输出矩阵(编码分段([字节分段(种子)], 'H'), 文件路径, 6, 4,
+                                    bytes(种子) if 校验 else None)
+        # 种子较长，使用较小的盒子大小
+        return 二维码生成器.生成二维码(种子.hex(), 文件路径, 错误纠正级别='H', 盒子大小=6, 边框大小=4, 校验=校验)
+
+    @staticmethod
+    def 批量生成二维码页(条目列表: List[Tuple[str, str]], 输出目录: str,
+                  版式: Optional[dict] = None, 进程数: Optional[int] = None) -> List[dict]:
+        """
+        把大量 (标签, 数据) 条目排成网格打印页，在进程池中逐页渲染并写入输出目录
+
+        参数:
+            条目列表: (标签, 数据) 列表
+            输出目录: 页面输出目录
+            版式: 版式参数，见utils.qr_sheets.批量生成二维码页
+            进程数: 工作进程数，默认为CPU核心数
+
+        返回:
+            按页号排列的结果列表
+        """
+        from utils.qr_sheets import 批量生成二维码页
+
+        return 批量生成二维码页(条目列表, 输出目录, 版式, 进程数)
+
     @staticmethod
     def 显示二维码安全提示() -> str:
         """
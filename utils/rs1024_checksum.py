@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SLIP-39分享RS1024校验工具
+在10位单词索引上计算RS1024校验，支持批量校验，并能定位和纠正单个错误单词。
+RS1024是线性码：某个位置的单词异或e时，校验状态的变化只取决于位置和e，
+因此纠错时按格雷码顺序逐个异或预计算的基向量，一次遍历1024种替换
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    from shamir_mnemonic.wordlist import WORDLIST as 单词表, WORD_INDEX_MAP as _单词索引
+    SLIP39_AVAILABLE = True
+except ImportError:
+    单词表, _单词索引 = [], {}
+    SLIP39_AVAILABLE = False
+
+
+定制字符串 = b"shamir"
+可扩展定制字符串 = b"shamir_extendable"
+校验和单词数 = 3
+最小单词数 = 20
+
+_生成多项式 = (
+    0xE0E040, 0x1C1C080, 0x3838100, 0x7070200, 0xE0E0009,
+    0x1C0C2412, 0x38086C24, 0x3090FC48, 0x21B1F890, 0x3F3F120,
+)
+
+# 多项式表：状态最高10位为b时需要异或的值
+_多项式表 = []
+for _高位 in range(1024):
+    _累计 = 0
+    for _i in range(10):
+        if (_高位 >> _i) & 1:
+            _累计 ^= _生成多项式[_i]
+    _多项式表.append(_累计)
+
+# 10位格雷码序列中每一步翻转的位
+_格雷码翻转位 = [(i & -i).bit_length() - 1 for i in range(1, 1024)]
+
+
+def _多项式模(状态: int, 值列表: Sequence[int]) -> int:
+    """从给定状态继续计算RS1024校验多项式"""
+    表 = _多项式表
+    for 值 in 值列表:
+        状态 = ((状态 & 0xFFFFF) << 10) ^ 值 ^ 表[状态 >> 20]
+    return 状态
+
+
+# 两种定制字符串的前缀状态只计算一次
+_前缀状态 = {
+    False: _多项式模(1, 定制字符串),
+    True: _多项式模(1, 可扩展定制字符串),
+}
+
+
+def _是否可扩展(索引: Sequence[int]) -> bool:
+    """可扩展标志位于前两个单词组成的20位中的第4位（标识符15位之后）"""
+    return bool((索引[1] >> 4) & 1)
+
+
+def 助记词转索引(助记词: str) -> List[int]:
+    """
+    将助记词转换为10位单词索引
+
+    异常:
+        ValueError: 包含不在单词表中的单词
+    """
+    try:
+        return [_单词索引[单词] for 单词 in 助记词.lower().split()]
+    except KeyError as e:
+        raise ValueError(f"无效的单词: {e.args[0]}")
+
+
+def _校验差值(索引: Sequence[int], 可扩展: bool) -> int:
+    """返回校验状态与有效值1的差，为0表示校验通过"""
+    return _多项式模(_前缀状态[可扩展], 索引) ^ 1
+
+
+def _位置基向量(单词数: int) -> List[List[int]]:
+    """
+    计算每个位置上单位错误对最终校验状态的影响
+
+    位置p的第k个基向量是在p处输入1<<k、其后输入零所得到的状态。
+    最后一个位置的基向量就是1<<k，每往前一个位置多经过一次输入零的步骤。
+    """
+    表 = _多项式表
+    基向量 = [[1 << k for k in range(10)]]
+    for _ in range(单词数 - 1):
+        基向量.append([((b & 0xFFFFF) << 10) ^ 表[b >> 20] for b in 基向量[-1]])
+    基向量.reverse()
+    return 基向量
+
+
+def _搜索替换(基向量: List[int], 目标: int) -> Optional[int]:
+    """按格雷码顺序遍历所有非零异或值e，返回影响等于目标的e"""
+    影响 = 0
+    e = 0
+    for 位 in _格雷码翻转位:
+        影响 ^= 基向量[位]
+        e ^= 1 << 位
+        if 影响 == 目标:
+            return e
+    return None
+
+
+class RS1024校验器:
+    """SLIP-39分享的RS1024校验和检查与纠错"""
+
+    @staticmethod
+    def 验证(助记词: str) -> bool:
+        """
+        检查单个分享的RS1024校验和
+
+        参数:
+            助记词: SLIP-39分享助记词
+
+        返回:
+            是否有效（包含未知单词或长度不足时为False）
+        """
+        return RS1024校验器.批量验证([助记词])[0]
+
+    @staticmethod
+    def 批量验证(助记词列表: Sequence[str]) -> List[bool]:
+        """
+        批量检查分享的RS1024校验和
+
+        两种定制字符串的前缀状态预先算好，每个分享只需对自身的单词做一次查表循环。
+
+        参数:
+            助记词列表: SLIP-39分享助记词列表
+
+        返回:
+            与输入顺序一致的布尔列表
+        """
+        索引表 = _单词索引
+        表 = _多项式表
+        前缀状态 = _前缀状态
+        结果 = []
+        for 助记词 in 助记词列表:
+            单词 = 助记词.lower().split()
+            if len(单词) < 最小单词数:
+                结果.append(False)
+                continue
+            try:
+                索引 = [索引表[w] for w in 单词]
+            except KeyError:
+                结果.append(False)
+                continue
+            状态 = 前缀状态[bool((索引[1] >> 4) & 1)]
+            for 值 in 索引:
+                状态 = ((状态 & 0xFFFFF) << 10) ^ 值 ^ 表[状态 >> 20]
+            结果.append(状态 == 1)
+        return 结果
+
+    @staticmethod
+    def 定位错误(助记词: str) -> List[Tuple[int, str]]:
+        """
+        定位单个错误单词并给出纠正建议
+
+        对每个位置，用该位置的基向量按格雷码顺序枚举全部1024种替换，
+        每种替换只需一次异或即可得到新的校验状态。
+        不在单词表中的单词视为已知位置的擦除错误，直接在该位置求解。
+
+        参数:
+            助记词: SLIP-39分享助记词
+
+        返回:
+            (位置, 建议单词) 列表，位置从0开始；校验通过或无法按单个错误纠正时为空列表
+        """
+        单词 = 助记词.lower().split()
+        if len(单词) < 最小单词数:
+            return []
+
+        未知位置 = [i for i, w in enumerate(单词) if w not in _单词索引]
+        if len(未知位置) > 1:
+            return []
+        索引 = [_单词索引.get(w, 0) for w in 单词]
+        if not 未知位置 and _校验差值(索引, _是否可扩展(索引)) == 0:
+            return []
+
+        基向量 = _位置基向量(len(索引))
+        位置范围 = 未知位置 or range(len(索引))
+        建议 = []
+        for 可扩展 in (False, True):
+            差值 = _校验差值(索引, 可扩展)
+            for 位置 in 位置范围:
+                # 只有第2个单词含有可扩展标志，其他位置的替换不会改变定制字符串
+                if 位置 != 1 and 可扩展 != _是否可扩展(索引):
+                    continue
+                # 擦除位置按0处理，差值为0说明正确单词就是索引0
+                e = 0 if 未知位置 and 差值 == 0 else _搜索替换(基向量[位置], 差值)
+                if e is None:
+                    continue
+                新值 = 索引[位置] ^ e
+                if 位置 == 1 and bool((新值 >> 4) & 1) != 可扩展:
+                    continue
+                建议.append((位置, 单词表[新值]))
+        return sorted(set(建议))
+
+    @staticmethod
+    def 纠正(助记词: str) -> Optional[str]:
+        """
+        尝试纠正单个错误单词
+
+        参数:
+            助记词: SLIP-39分享助记词
+
+        返回:
+            唯一的纠正结果；校验已通过时返回规范化后的原助记词；无法唯一纠正时返回None
+        """
+        单词 = 助记词.lower().split()
+        if RS1024校验器.验证(助记词):
+            return " ".join(单词)
+        建议 = RS1024校验器.定位错误(助记词)
+        if len(建议) != 1:
+            return None
+        位置, 新单词 = 建议[0]
+        单词[位置] = 新单词
+        return " ".join(单词)
+
+    @staticmethod
+    def 批量检查(助记词列表: Sequence[str]) -> List[Dict[str, object]]:
+        """
+        批量校验，并只对校验失败的分享做错误定位
+
+        参数:
+            助记词列表: SLIP-39分享助记词列表
+
+        返回:
+            每个分享一个字典: {"有效": bool, "建议": [(位置, 单词), ...]}
+        """
+        return [
+            {"有效": 有效, "建议": [] if 有效 else RS1024校验器.定位错误(助记词)}
+            for 助记词, 有效 in zip(助记词列表, RS1024校验器.批量验证(助记词列表))
+        ]
+
+
+# 测试代码
+if __name__ == "__main__":
+    测试分享 = ("duckling enlarge academic academic agency result length solution fridge kidney "
+            "coal piece deal husband erode duke ajar critical decision keyboard")
+    print(f"校验结果: {RS1024校验器.验证(测试分享)}")
+    错误分享 = 测试分享.replace("fridge", "frozen")
+    print(f"错误定位: {RS1024校验器.定位错误(错误分享)}")
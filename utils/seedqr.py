@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SeedQR紧凑助记词二维码编码
+按SeedSigner的SeedQR规范把BIP-39助记词编码为很小的二维码：
+标准SeedQR把每个单词的词表索引写成4位十进制数字，用数字模式编码（24词为96位数字，29×29模块）；
+紧凑SeedQR直接用字节模式编码原始熵（24词为32字节，25×25模块）。
+两种格式都使用L级纠错，并提供对应的解码函数
+"""
+
+import sys
+import argparse
+import getpass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Union
+
+from utils.qr_encoder import 编码分段, 数字分段, 字节分段
+
+try:
+    from mnemonic import Mnemonic
+    MNEMONIC_AVAILABLE = True
+except ImportError:
+    MNEMONIC_AVAILABLE = False
+
+# BIP-39允许的单词数及对应的熵字节数
+有效单词数 = (12, 15, 18, 21, 24)
+有效熵字节数 = (16, 20, 24, 28, 32)
+SeedQR纠错级别 = "L"
+
+
+@lru_cache(maxsize=1)
+def _BIP39工具() -> Any:
+    """加载英文BIP-39词表（只加载一次）"""
+    if not MNEMONIC_AVAILABLE:
+        raise ImportError("SeedQR功能需要安装mnemonic库：pip install mnemonic")
+    return Mnemonic("english")
+
+
+@lru_cache(maxsize=1)
+def _单词索引() -> Dict[str, int]:
+    """单词到词表索引的映射"""
+    return {单词: 序号 for 序号, 单词 in enumerate(_BIP39工具().wordlist)}
+
+
+def _检查助记词(助记词: str) -> List[str]:
+    """
+    规范化并校验助记词，返回单词列表
+
+    异常:
+        ValueError: 单词数不对、含有词表外的单词或校验和错误
+    """
+    单词列表 = 助记词.lower().split()
+    if len(单词列表) not in 有效单词数:
+        raise ValueError(f"助记词必须是 {'、'.join(map(str, 有效单词数))} 个单词")
+    工具 = _BIP39工具()
+    if not 工具.check(" ".join(单词列表)):
+        raise ValueError("助记词无效（包含词表外的单词或校验和错误）")
+    return 单词列表
+
+
+def 助记词转SeedQR(助记词: str) -> str:
+    """
+    把助记词编码为标准SeedQR的数字串（每个单词4位词表索引）
+
+    异常:
+        ValueError: 助记词无效
+    """
+    索引表 = _单词索引()
+    return "".join(f"{索引表[单词]:04d}" for 单词 in _检查助记词(助记词))
+
+
+def SeedQR转助记词(数字串: str) -> str:
+    """
+    把标准SeedQR的数字串解码为助记词
+
+    异常:
+        ValueError: 数字串格式错误或解码出的助记词无效
+    """
+    if not 数字串.isascii() or not 数字串.isdigit() or len(数字串) // 4 not in 有效单词数 or len(数字串) % 4:
+        raise ValueError("SeedQR必须是48到96位、长度为4的倍数的数字串")
+    词表 = _BIP39工具().wordlist
+    索引列表 = [int(数字串[i:i + 4]) for i in range(0, len(数字串), 4)]
+    if max(索引列表) >= len(词表):
+        raise ValueError("SeedQR中的单词索引超出词表范围")
+    助记词 = " ".join(词表[索引] for 索引 in 索引列表)
+    _检查助记词(助记词)
+    return 助记词
+
+
+def 助记词转紧凑SeedQR(助记词: str) -> bytes:
+    """
+    把助记词编码为紧凑SeedQR的原始熵字节（不含校验和）
+
+    异常:
+        ValueError: 助记词无效
+    """
+    单词列表 = _检查助记词(助记词)
+    return bytes(_BIP39工具().to_entropy(" ".join(单词列表)))
+
+
+def 紧凑SeedQR转助记词(熵: bytes) -> str:
+    """
+    把紧凑SeedQR的原始熵字节解码为助记词（重新计算校验和）
+
+    异常:
+        ValueError: 熵的长度不是16、20、24、28或32字节
+    """
+    if len(熵) not in 有效熵字节数:
+        raise ValueError(f"紧凑SeedQR的熵必须是 {'、'.join(map(str, 有效熵字节数))} 字节")
+    return _BIP39工具().to_mnemonic(bytes(熵))
+
+
+def 解码SeedQR(载荷: Union[str, bytes]) -> str:
+    """
+    解码二维码内容：数字串按标准SeedQR解码，字节按紧凑SeedQR解码
+
+    异常:
+        ValueError: 载荷不是有效的SeedQR
+    """
+    if isinstance(载荷, (bytes, bytearray)):
+        return 紧凑SeedQR转助记词(bytes(载荷))
+    return SeedQR转助记词(载荷)
+
+
+def SeedQR模块矩阵(助记词: str, 紧凑: bool = False,
+               错误纠正级别: str = SeedQR纠错级别) -> List[List[bool]]:
+    """
+    生成SeedQR二维码的模块矩阵
+
+    参数:
+        助记词: BIP-39助记词
+        紧凑: True使用紧凑SeedQR（字节模式的原始熵），False使用标准SeedQR（数字模式）
+        错误纠正级别: 默认使用规范规定的L级，扫描设备据此预期固定的符号尺寸
+
+    返回:
+        模块矩阵（不含静区），True表示深色模块
+
+    异常:
+        ValueError: 助记词无效
+    """
+    if 紧凑:
+        分段 = 字节分段(助记词转紧凑SeedQR(助记词))
+    else:
+        分段 = 数字分段(助记词转SeedQR(助记词))
+    return 编码分段([分段], 错误纠正级别)
+
+
+def 主程序(参数列表: Optional[List[str]] = None) -> int:
+    """命令行入口：从标准输入（或隐藏输入）读取助记词，生成SeedQR图片或在终端显示"""
+    解析器 = argparse.ArgumentParser(description="把BIP-39助记词编码为SeedQR二维码")
+    解析器.add_argument("-o", "--输出文件", help="保存为PNG文件（省略则在终端显示）")
+    解析器.add_argument("-c", "--紧凑", action="store_true", help="使用紧凑SeedQR（原始熵，字节模式）")
+    解析器.add_argument("-s", "--盒子大小", type=int, default=10, help="每个模块的像素大小")
+    参数 = 解析器.parse_args(参数列表)
+
+    助记词 = getpass.getpass("助记词: ") if sys.stdin.isatty() else sys.stdin.readline()
+    try:
+        矩阵 = SeedQR模块矩阵(助记词, 参数.紧凑)
+        if 参数.输出文件:
+            from utils.qr_raster import 保存PNG
+            保存PNG(矩阵, 参数.输出文件, 参数.盒子大小)
+            print(f"✓ {len(矩阵)}x{len(矩阵)} 模块的SeedQR已保存到 {参数.输出文件}")
+        else:
+            from utils.qr_terminal import 渲染文本, 支持ANSI颜色
+            print(渲染文本(矩阵, ANSI颜色=支持ANSI颜色(sys.stdout)))
+    except (OSError, ValueError, ImportError) as e:
+        print(f"错误: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(主程序())
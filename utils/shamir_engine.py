@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SLIP-39 Shamir秘密共享引擎
+在GF(256)上做拉格朗日插值和秘密分割。乘法使用预计算的对数/指数表，
+并通过bytes.translate对整个秘密逐字节批量相乘，异或在大整数上一次完成。
+助记词编解码和Feistel加密仍使用shamir-mnemonic库
+"""
+
+import hmac
+import secrets
+import hashlib
+from typing import Callable, Dict, List, Sequence, Tuple
+
+try:
+    from shamir_mnemonic import EncryptedMasterSecret, MnemonicError, Share
+    from shamir_mnemonic.share import ShareCommonParameters
+    # 可扩展备份标志（extendable）从0.3.0开始才有，0.2.x的Share和EncryptedMasterSecret参数不同
+    SLIP39_AVAILABLE = "extendable" in ShareCommonParameters._fields
+except ImportError:
+    SLIP39_AVAILABLE = False
+
+安装提示 = 'SLIP-39功能需要安装shamir-mnemonic 0.3.0或更高版本: pip install --upgrade "shamir-mnemonic>=0.3.0"'
+
+
+最大分享数 = 16
+摘要长度 = 4
+摘要索引 = 254
+秘密索引 = 255
+最小秘密长度 = 16
+标识符位数 = 15
+最大迭代指数 = 15
+
+原始分享 = Tuple[int, bytes]
+
+
+def _生成对数表() -> Tuple[List[int], List[int]]:
+    """生成GF(256)（约化多项式x^8+x^4+x^3+x+1，生成元x+1）的指数表和对数表"""
+    指数表 = [0] * 510
+    对数表 = [0] * 256
+    值 = 1
+    for i in range(255):
+        指数表[i] = 值
+        指数表[i + 255] = 值
+        对数表[值] = i
+        值 = (值 << 1) ^ 值
+        if 值 & 0x100:
+            值 ^= 0x11B
+    return 指数表, 对数表
+
+
+_指数表, _对数表 = _生成对数表()
+
+# 乘法表：第c行是"乘以c"的256字节translate表，0行全为0
+_乘法表 = [bytes(256)] + [
+    bytes([0] + [_指数表[_对数表[v] + _对数表[c]] for v in range(1, 256)])
+    for c in range(1, 256)
+]
+
+
+def _拉格朗日系数对数(x坐标: Sequence[int], x: int) -> List[int]:
+    """计算各插值基多项式在x处取值的对数"""
+    对数表 = _对数表
+    对数积 = sum(对数表[xi ^ x] for xi in x坐标)
+    return [
+        (对数积 - 对数表[xi ^ x] - sum(对数表[xi ^ xj] for xj in x坐标 if xj != xi)) % 255
+        for xi in x坐标
+    ]
+
+
+def _检查分享(分享列表: Sequence[原始分享]) -> int:
+    if not 分享列表:
+        raise ValueError("分享列表为空")
+    if len({x for x, _ in 分享列表}) != len(分享列表):
+        raise ValueError("分享索引必须互不相同")
+    长度集合 = {len(数据) for _, 数据 in 分享列表}
+    if len(长度集合) != 1:
+        raise ValueError("所有分享的长度必须相同")
+    return 长度集合.pop()
+
+
+def _创建摘要(随机部分: bytes, 秘密: bytes) -> bytes:
+    return hmac.new(随机部分, 秘密, hashlib.sha256).digest()[:摘要长度]
+
+
+class Shamir引擎:
+    """GF(256)上的SLIP-39 Shamir分割和恢复"""
+
+    @staticmethod
+    def 插值(分享列表: Sequence[原始分享], x: int) -> bytes:
+        """
+        求经过给定分享点的多项式在x处的值
+
+        参数:
+            分享列表: (x坐标, 数据) 列表，数据的每个字节是一个独立多项式的取值
+            x: 目标x坐标
+
+        返回:
+            各字节多项式在x处的取值
+        """
+        return Shamir引擎.插值多点(分享列表, [x])[0]
+
+    @staticmethod
+    def 插值多点(分享列表: Sequence[原始分享], x列表: Sequence[int]) -> List[bytes]:
+        """
+        一次求多项式在多个x处的值
+
+        分享数据只转换为大整数一次，每个目标点只需对每个分享做一次translate和异或。
+
+        参数:
+            分享列表: (x坐标, 数据) 列表
+            x列表: 目标x坐标列表
+
+        返回:
+            与x列表顺序一致的取值列表
+        """
+        长度 = _检查分享(分享列表)
+        已知 = dict(分享列表)
+        x坐标 = list(已知)
+        乘法表 = _乘法表
+        指数表 = _指数表
+
+        结果 = []
+        for x in x列表:
+            if x in 已知:
+                结果.append(已知[x])
+                continue
+            累计 = 0
+            for (_, 数据), 系数对数 in zip(分享列表, _拉格朗日系数对数(x坐标, x)):
+                累计 ^= int.from_bytes(数据.translate(乘法表[指数表[系数对数]]), "big")
+            结果.append(累计.to_bytes(长度, "big"))
+        return 结果
+
+    @staticmethod
+    def 分割秘密(阈值: int, 分享数: int, 秘密: bytes,
+              随机源: Callable[[int], bytes] = secrets.token_bytes) -> List[原始分享]:
+        """
+        按SLIP-39方案分割秘密
+
+        阈值大于1时，x=255处为秘密，x=254处为4字节摘要加随机数据，
+        其余阈值-2个点为随机数据，分享由这些点插值得到。
+
+        参数:
+            阈值: 恢复所需的分享数
+            分享数: 生成的分享数
+            秘密: 要分割的秘密
+            随机源: 随机字节来源（测试时可替换）
+
+        返回:
+            (索引, 数据) 列表，索引从0开始
+        """
+        if 阈值 < 1:
+            raise ValueError("阈值必须是正整数")
+        if 阈值 > 分享数:
+            raise ValueError("阈值不能超过分享数")
+        if 分享数 > 最大分享数:
+            raise ValueError(f"分享数不能超过{最大分享数}")
+
+        if 阈值 == 1:
+            return [(i, 秘密) for i in range(分享数)]
+
+        随机分享数 = 阈值 - 2
+        分享列表 = [(i, 随机源(len(秘密))) for i in range(随机分享数)]
+        随机部分 = 随机源(len(秘密) - 摘要长度)
+        基础点 = 分享列表 + [
+            (摘要索引, _创建摘要(随机部分, 秘密) + 随机部分),
+            (秘密索引, 秘密),
+        ]
+        目标索引 = list(range(随机分享数, 分享数))
+        分享列表.extend(zip(目标索引, Shamir引擎.插值多点(基础点, 目标索引)))
+        return 分享列表
+
+    @staticmethod
+    def 恢复秘密(阈值: int, 分享列表: Sequence[原始分享]) -> bytes:
+        """
+        从阈值个分享恢复秘密并校验摘要
+
+        参数:
+            阈值: 分割时的阈值
+            分享列表: (索引, 数据) 列表，只使用前阈值个
+
+        返回:
+            秘密
+
+        异常:
+            ValueError: 分享不足、格式错误或摘要不匹配
+        """
+        if len(分享列表) < 阈值:
+            raise ValueError(f"分享不足，需要{阈值}个")
+        if 阈值 == 1:
+            return 分享列表[0][1]
+
+        秘密, 摘要分享 = Shamir引擎.插值多点(分享列表[:阈值], [秘密索引, 摘要索引])
+        if not hmac.compare_digest(摘要分享[:摘要长度], _创建摘要(摘要分享[摘要长度:], 秘密)):
+            raise ValueError("共享秘密的摘要无效")
+        return 秘密
+
+
+def _检查分组(组阈值: int, 组列表: Sequence[Tuple[int, int]]) -> None:
+    if not 1 <= 组阈值 <= len(组列表):
+        raise ValueError("组阈值必须在1到组数之间")
+    if any(阈值 == 1 and 成员数 > 1 for 阈值, 成员数 in 组列表):
+        raise ValueError("成员数大于1时阈值不能为1，请使用1-of-1分享")
+
+
+def 生成SLIP39分享(组阈值: int, 组列表: Sequence[Tuple[int, int]], 主秘密: bytes,
+               密码: bytes = b"", 可扩展: bool = True, 迭代指数: int = 1) -> List[List[str]]:
+    """
+    加密主秘密并分割为两级SLIP-39分享助记词
+
+    参数:
+        组阈值: 恢复所需的组数
+        组列表: 每组的 (成员阈值, 成员数)
+        主秘密: 主秘密，至少16字节且长度为偶数
+        密码: SLIP-39密码短语（可打印ASCII）
+        可扩展: 是否使用可扩展备份标志
+        迭代指数: Feistel加密的PBKDF2迭代指数（0-15，总迭代次数为10000×2^迭代指数）
+
+    返回:
+        按组排列的分享助记词列表
+    """
+    if not SLIP39_AVAILABLE:
+        raise ImportError(安装提示)
+    if not all(32 <= c <= 126 for c in 密码):
+        raise ValueError("密码短语只能包含可打印ASCII字符")
+    if len(主秘密) < 最小秘密长度 or len(主秘密) % 2:
+        raise ValueError(f"主秘密长度必须至少{最小秘密长度}字节且为偶数")
+    if not 0 <= 迭代指数 <= 最大迭代指数:
+        raise ValueError(f"迭代指数必须在0到{最大迭代指数}之间")
+    _检查分组(组阈值, 组列表)
+
+    标识符 = int.from_bytes(secrets.token_bytes(2), "big") & ((1 << 标识符位数) - 1)
+    加密主秘密 = EncryptedMasterSecret.from_master_secret(主秘密, 密码, 标识符, 可扩展, 迭代指数)
+
+    组分享 = Shamir引擎.分割秘密(组阈值, len(组列表), 加密主秘密.ciphertext)
+    return [
+        [
+            Share(标识符, 可扩展, 迭代指数, 组索引, 组阈值, len(组列表),
+                  成员索引, 成员阈值, 值).mnemonic()
+            for 成员索引, 值 in Shamir引擎.分割秘密(成员阈值, 成员数, 组秘密)
+        ]
+        for (成员阈值, 成员数), (组索引, 组秘密) in zip(组列表, 组分享)
+    ]
+
+
+def 恢复加密主秘密(分享列表: Sequence["Share"]) -> "EncryptedMasterSecret":
+    """
+    从已解析的分享恢复加密主秘密
+
+    各组只使用前成员阈值个分享，只使用前组阈值个已完成的组。
+
+    参数:
+        分享列表: shamir_mnemonic.Share对象列表，公共参数必须一致
+
+    返回:
+        加密主秘密
+
+    异常:
+        ValueError: 分享不足或插值校验失败
+    """
+    if not 分享列表:
+        raise ValueError("分享列表为空")
+    公共参数 = 分享列表[0].common_parameters()
+    if any(分享.common_parameters() != 公共参数 for 分享 in 分享列表):
+        raise ValueError("所有分享的标识符、迭代指数、组阈值和组数必须相同")
+
+    分组: Dict[int, Dict[int, bytes]] = {}
+    成员阈值: Dict[int, int] = {}
+    for 分享 in 分享列表:
+        if 成员阈值.setdefault(分享.group_index, 分享.member_threshold) != 分享.member_threshold:
+            raise ValueError(f"组 {分享.group_index + 1} 的成员阈值不一致")
+        分组.setdefault(分享.group_index, {})[分享.index] = 分享.value
+
+    组秘密 = []
+    for 组索引, 成员 in sorted(分组.items()):
+        if len(成员) >= 成员阈值[组索引]:
+            组秘密.append((组索引, Shamir引擎.恢复秘密(成员阈值[组索引], list(成员.items()))))
+        if len(组秘密) == 公共参数.group_threshold:
+            break
+    else:
+        raise ValueError(f"分享不足，需要{公共参数.group_threshold}个完整的组，"
+                         f"目前只有{len(组秘密)}个")
+
+    密文 = Shamir引擎.恢复秘密(公共参数.group_threshold, 组秘密)
+    return EncryptedMasterSecret(
+        公共参数.identifier, 公共参数.extendable, 公共参数.iteration_exponent, 密文
+    )
+
+
+def 组合SLIP39分享(助记词列表: Sequence[str], 密码: bytes = b"") -> bytes:
+    """
+    解析分享助记词并恢复主秘密
+
+    参数:
+        助记词列表: SLIP-39分享助记词
+        密码: SLIP-39密码短语
+
+    返回:
+        主秘密
+
+    异常:
+        ValueError: 助记词无效、分享不足或插值校验失败
+    """
+    if not SLIP39_AVAILABLE:
+        raise ImportError(安装提示)
+    try:
+        分享列表 = [Share.from_mnemonic(助记词) for 助记词 in 助记词列表]
+    except MnemonicError as e:
+        raise ValueError(f"无效的分享: {e}")
+    return 恢复加密主秘密(分享列表).decrypt(密码)
+
+
+# 测试代码
+if __name__ == "__main__":
+    分享 = Shamir引擎.分割秘密(3, 5, bytes(range(32)))
+    print(f"恢复一致: {Shamir引擎.恢复秘密(3, 分享[1:4]) == bytes(range(32))}")
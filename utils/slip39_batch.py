@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SLIP-39批量分享生成工具
+按清单中的分组/阈值模板为多个主秘密生成SLIP-39分享，
+每个主秘密作为独立任务在进程池中并行计算（各自承担Feistel加密的PBKDF2开销），
+结果完成一个写出一个，每个主秘密对应一个输出文件
+"""
+
+import os
+import sys
+import json
+import argparse
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from utils.private_file import 写入私有文件
+from utils.shamir_engine import SLIP39_AVAILABLE, 安装提示, 最大迭代指数, 生成SLIP39分享
+from utils.slip39_cost import 默认迭代指数, 成本说明, 测量PBKDF2速度
+
+
+最大分享数 = 16
+输出文件后缀 = ".slip39.txt"
+
+
+def _检查模板(模板: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    检查并规范化分组模板
+
+    模板格式: {"组阈值": 2, "组": [[成员阈值, 成员数], ...], "迭代指数": 1}
+    """
+    try:
+        组阈值 = int(模板["组阈值"])
+        组列表 = [(int(阈值), int(成员数)) for 阈值, 成员数 in 模板["组"]]
+    except (KeyError, TypeError, ValueError):
+        raise ValueError("模板必须包含'组阈值'和'组'([[成员阈值, 成员数], ...])")
+    try:
+        迭代指数 = int(模板.get("迭代指数", 默认迭代指数))
+    except (TypeError, ValueError):
+        raise ValueError("迭代指数必须是整数")
+
+    if not 1 <= len(组列表) <= 最大分享数:
+        raise ValueError(f"组数必须在1到{最大分享数}之间")
+    if not 1 <= 组阈值 <= len(组列表):
+        raise ValueError(f"组阈值必须在1到{len(组列表)}之间")
+    for 序号, (阈值, 成员数) in enumerate(组列表, 1):
+        if not 1 <= 成员数 <= 最大分享数:
+            raise ValueError(f"组 {序号} 的成员数必须在1到{最大分享数}之间")
+        if not 1 <= 阈值 <= 成员数:
+            raise ValueError(f"组 {序号} 的阈值必须在1到{成员数}之间")
+        if 阈值 == 1 and 成员数 > 1:
+            raise ValueError(f"组 {序号}: 成员数大于1时阈值不能为1")
+    if not 0 <= 迭代指数 <= 最大迭代指数:
+        raise ValueError(f"迭代指数必须在0到{最大迭代指数}之间")
+
+    return {"组阈值": 组阈值, "组": 组列表, "迭代指数": 迭代指数}
+
+
+def _检查名称(名称: str) -> str:
+    """名称用作输出文件名，不允许包含路径成分"""
+    名称 = str(名称).strip()
+    if (not 名称 or 名称 in (".", "..") or os.path.basename(名称) != 名称
+            or "/" in 名称 or "\\" in 名称 or "\0" in 名称):
+        raise ValueError(f"无效的条目名称: {名称!r}")
+    return 名称
+
+
+def _检查名称列表(名称列表: List[str]) -> List[str]:
+    """
+    检查每个名称并确认互不重复，返回规范化后的名称
+
+    在不区分大小写或按Unicode规范化比较文件名的文件系统上，只差大小写或组合方式的
+    两个名称会写到同一个文件，同样视为重复
+    """
+    结果 = []
+    已用名称: Dict[str, str] = {}
+    for 名称 in 名称列表:
+        名称 = _检查名称(名称)
+        键 = unicodedata.normalize("NFC", 名称).casefold()
+        if 键 in 已用名称:
+            raise ValueError(f"条目名称重复: {名称}" + (f"（与 {已用名称[键]} 冲突）" if 已用名称[键] != 名称 else ""))
+        已用名称[键] = 名称
+        结果.append(名称)
+    return 结果
+
+
+def 加载清单(清单路径: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    读取并检查批量生成清单
+
+    清单为JSON文件，格式如下:
+        {
+            "模板": {"组阈值": 2, "组": [[2, 3], [2, 3], [3, 5]], "迭代指数": 1},
+            "秘密": [
+                {"名称": "vault-001", "主秘密": "十六进制字符串", "密码": "可选"},
+                ...
+            ]
+        }
+
+    参数:
+        清单路径: 清单文件路径
+
+    返回:
+        (模板, 条目列表)，条目中的主秘密已转换为字节
+
+    异常:
+        ValueError: 清单格式、模板或条目无效
+    """
+    with open(清单路径, "r", encoding="utf-8") as 文件:
+        try:
+            清单 = json.load(文件)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"清单不是有效的JSON: {e}")
+
+    if not isinstance(清单, dict) or "模板" not in 清单 or "秘密" not in 清单:
+        raise ValueError("清单必须包含'模板'和'秘密'两个字段")
+
+    模板 = _检查模板(清单["模板"])
+
+    for 序号, 条目 in enumerate(清单["秘密"], 1):
+        if not isinstance(条目, dict) or "主秘密" not in 条目:
+            raise ValueError(f"第 {序号} 个条目缺少'主秘密'")
+    名称列表 = _检查名称列表([条目.get("名称", f"secret-{序号:04d}") for 序号, 条目 in enumerate(清单["秘密"], 1)])
+
+    条目列表 = []
+    for 名称, 条目 in zip(名称列表, 清单["秘密"]):
+        try:
+            主秘密 = bytes.fromhex(条目["主秘密"])
+        except (TypeError, ValueError):
+            raise ValueError(f"条目 {名称} 的主秘密不是有效的十六进制字符串")
+        if len(主秘密) < 16 or len(主秘密) % 2:
+            raise ValueError(f"条目 {名称} 的主秘密长度必须至少16字节且为偶数")
+
+        条目列表.append({"名称": 名称, "主秘密": 主秘密, "密码": 条目.get("密码", "")})
+
+    return 模板, 条目列表
+
+
+def _生成单个分享集(任务: Tuple[str, bytes, str, int, List[Tuple[int, int]], int]) -> Tuple[str, List[List[str]]]:
+    """进程池任务：为一个主秘密生成分享（必须是模块级函数才能被pickle）"""
+    名称, 主秘密, 密码, 组阈值, 组列表, 迭代指数 = 任务
+    规范化密码 = unicodedata.normalize('NFKD', 密码)
+    分享组 = 生成SLIP39分享(组阈值, 组列表, 主秘密, 规范化密码.encode(), 迭代指数=迭代指数)
+    return 名称, 分享组
+
+
+def 迭代生成分享(条目列表: List[Dict[str, Any]], 模板: Dict[str, Any],
+             进程数: Optional[int] = None) -> Iterator[Tuple[str, Any]]:
+    """
+    并行生成分享，按完成顺序逐个产出结果
+
+    参数:
+        条目列表: 条目字典列表，包含"名称"、"主秘密"(bytes)和可选的"密码"
+        模板: 分组模板
+        进程数: 工作进程数，默认为CPU核心数；为1时在当前进程中顺序计算
+
+    返回:
+        (名称, 分享组) 迭代器；某个条目失败时分享组为对应的异常对象
+    """
+    if not SLIP39_AVAILABLE:
+        raise ImportError(安装提示)
+
+    模板 = _检查模板(模板)
+    任务列表 = [
+        (条目["名称"], 条目["主秘密"], 条目.get("密码", ""), 模板["组阈值"], 模板["组"], 模板["迭代指数"])
+        for 条目 in 条目列表
+    ]
+    进程数 = min(进程数 or os.cpu_count() or 1, len(任务列表) or 1)
+
+    if 进程数 == 1:
+        for 任务 in 任务列表:
+            try:
+                yield _生成单个分享集(任务)
+            except Exception as e:
+                yield 任务[0], e
+        return
+
+    with ProcessPoolExecutor(max_workers=进程数) as 进程池:
+        未来列表 = {进程池.submit(_生成单个分享集, 任务): 任务[0] for 任务 in 任务列表}
+        for 未来 in as_completed(未来列表):
+            try:
+                yield 未来.result()
+            except Exception as e:
+                yield 未来列表[未来], e
+
+
+def 格式化分享文件(名称: str, 分享组: List[List[str]], 模板: Dict[str, Any],
+            每秒迭代次数: Optional[float] = None) -> str:
+    """将一个主秘密的分享格式化为输出文件内容，给出PBKDF2速度时同时记录恢复成本"""
+    行列表 = [
+        f"# SLIP-39分享: {名称}",
+        f"# 恢复需要 {模板['组阈值']}/{len(模板['组'])} 个组",
+    ]
+    if 每秒迭代次数:
+        行列表.append(f"# {成本说明(模板.get('迭代指数', 默认迭代指数), 每秒迭代次数)}")
+    for 组序号, (组, (阈值, 成员数)) in enumerate(zip(分享组, 模板["组"]), 1):
+        行列表.append("")
+        行列表.append(f"# 组 {组序号}: 需要 {阈值}/{成员数} 个成员")
+        行列表.extend(组)
+    return "\n".join(行列表) + "\n"
+
+
+def 批量生成分享(条目列表: List[Dict[str, Any]], 模板: Dict[str, Any], 输出目录: str,
+           进程数: Optional[int] = None) -> List[Dict[str, str]]:
+    """
+    为多个主秘密批量生成分享，并分别写入输出目录
+
+    参数:
+        条目列表: 条目字典列表，包含"名称"、"主秘密"(bytes)和可选的"密码"
+        模板: 分组模板 {"组阈值": int, "组": [(成员阈值, 成员数), ...], "迭代指数": int}
+        输出目录: 输出目录，每个条目写入 <名称>.slip39.txt
+        进程数: 工作进程数，默认为CPU核心数
+
+    每个文件头部记录迭代指数和按本机PBKDF2速度估计的恢复耗时。
+
+    返回:
+        按清单顺序排列的结果列表，成功项包含"名称"和"文件"，失败项包含"名称"和"错误"
+
+    异常:
+        ValueError: 模板无效，或条目名称无效、重复
+    """
+    模板 = _检查模板(模板)
+    # 名称决定输出文件名，重复的名称会互相覆盖，必须在生成任何分享前检查
+    名称列表 = _检查名称列表([条目["名称"] for 条目 in 条目列表])
+    条目列表 = [dict(条目, 名称=名称) for 条目, 名称 in zip(条目列表, 名称列表)]
+    os.makedirs(输出目录, mode=0o700, exist_ok=True)
+    # 在进程池启动前测量，避免与工作进程争用CPU
+    每秒迭代次数 = 测量PBKDF2速度()
+
+    结果 = {}
+    for 名称, 分享组 in 迭代生成分享(条目列表, 模板, 进程数):
+        if isinstance(分享组, Exception):
+            结果[名称] = {"名称": 名称, "错误": str(分享组)}
+            continue
+        文件路径 = os.path.join(输出目录, 名称 + 输出文件后缀)
+        写入私有文件(文件路径, 格式化分享文件(名称, 分享组, 模板, 每秒迭代次数))
+        结果[名称] = {"名称": 名称, "文件": 文件路径}
+
+    return [结果[条目["名称"]] for 条目 in 条目列表]
+
+
+def 主程序(参数列表: Optional[List[str]] = None) -> int:
+    """命令行入口"""
+    解析器 = argparse.ArgumentParser(description="按清单批量生成SLIP-39分享")
+    解析器.add_argument("清单", help="JSON清单文件路径")
+    解析器.add_argument("-o", "--输出目录", default="slip39_shares", help="分享文件输出目录")
+    解析器.add_argument("-j", "--进程数", type=int, default=None, help="并行进程数（默认CPU核心数）")
+    解析器.add_argument("-e", "--迭代指数", type=int, default=None,
+                     help="Feistel加密的迭代指数，覆盖清单模板中的值（可用 python -m utils.slip39_cost 校准）")
+    参数 = 解析器.parse_args(参数列表)
+
+    try:
+        模板, 条目列表 = 加载清单(参数.清单)
+        if 参数.迭代指数 is not None:
+            模板 = _检查模板(dict(模板, 迭代指数=参数.迭代指数))
+        结果列表 = 批量生成分享(条目列表, 模板, 参数.输出目录, 参数.进程数)
+    except (OSError, ValueError, ImportError) as e:
+        print(f"错误: {e}", file=sys.stderr)
+        return 1
+
+    失败数 = 0
+    for 结果 in 结果列表:
+        if "错误" in 结果:
+            失败数 += 1
+            print(f"✗ {结果['名称']}: {结果['错误']}")
+        else:
+            print(f"✓ {结果['名称']} -> {结果['文件']}")
+    print(f"\n完成: {len(结果列表) - 失败数} 成功, {失败数} 失败")
+    return 1 if 失败数 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(主程序())
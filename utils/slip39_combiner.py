@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SLIP-39增量分享组合器
+逐个接收分享：每个分享在输入时立即检查RS1024校验和及元数据，
+某个组达到成员阈值时立即插值出组秘密，达到组阈值时立即恢复加密主秘密
+"""
+
+import unicodedata
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.rs1024_checksum import RS1024校验器
+from utils.shamir_engine import SLIP39_AVAILABLE, 安装提示, Shamir引擎
+
+if SLIP39_AVAILABLE:
+    from shamir_mnemonic import EncryptedMasterSecret, MnemonicError, Share
+
+
+class SLIP39增量组合器:
+    """
+    有状态的SLIP-39分享组合器
+
+    添加分享()失败时组合器状态保持不变，可以继续输入其他分享。
+    组或整体完成后，后续分享只做元数据比对，不再重复插值。
+    """
+
+    def __init__(self):
+        """初始化空的组合器"""
+        if not SLIP39_AVAILABLE:
+            raise ImportError(安装提示)
+        self._公共参数 = None
+        self._秘密长度 = None
+        self._组参数: Dict[int, Any] = {}
+        self._组成员: Dict[int, Dict[int, Share]] = {}
+        self._组秘密: Dict[int, bytes] = {}
+        self._加密主秘密: Optional[EncryptedMasterSecret] = None
+
+    @property
+    def 已完成(self) -> bool:
+        """是否已收集到足够的分享"""
+        return self._加密主秘密 is not None
+
+    @property
+    def 组阈值(self) -> Optional[int]:
+        """恢复所需的组数（尚未输入分享时为None）"""
+        return self._公共参数.group_threshold if self._公共参数 else None
+
+    @property
+    def 组数(self) -> Optional[int]:
+        """分享集中的总组数（尚未输入分享时为None）"""
+        return self._公共参数.group_count if self._公共参数 else None
+
+    @property
+    def 已完成组(self) -> List[int]:
+        """已恢复出组秘密的组索引（从0开始）"""
+        return sorted(self._组秘密)
+
+    def 添加分享(self, 分享文本: str) -> Dict[str, Any]:
+        """
+        添加一个分享
+
+        参数:
+            分享文本: SLIP-39分享助记词
+
+        返回:
+            状态字典:
+                组索引/成员索引: 分享所属的组和成员（从0开始）
+                重复: 是否与已输入的分享完全相同
+                组已完成: 该分享所在组是否已达到成员阈值
+                已完成: 是否已可恢复主秘密
+
+        异常:
+            ValueError: 校验和错误（单个单词错误时附带纠正建议）、
+                元数据与已输入的分享不一致或插值校验失败
+        """
+        try:
+            分享 = Share.from_mnemonic(" ".join(分享文本.split()))
+        except MnemonicError as e:
+            建议 = RS1024校验器.定位错误(分享文本)
+            if len(建议) == 1:
+                位置, 单词 = 建议[0]
+                raise ValueError(f"无效的分享: 第 {位置 + 1} 个单词有误，可能应为 \"{单词}\"")
+            raise ValueError(f"无效的分享: {e}")
+
+        if self._公共参数 is None:
+            公共参数 = 分享.common_parameters()
+        else:
+            公共参数 = self._公共参数
+            self._检查公共参数(分享)
+        if self._秘密长度 is not None and len(分享.value) != self._秘密长度:
+            raise ValueError("分享长度与已输入的分享不一致")
+
+        组索引 = 分享.group_index
+        if 组索引 in self._组参数 and self._组参数[组索引] != 分享.group_parameters():
+            raise ValueError(f"组 {组索引 + 1} 的成员阈值与已输入的分享不一致")
+
+        成员表 = self._组成员.get(组索引, {})
+        已有分享 = 成员表.get(分享.index)
+        if 已有分享 is not None:
+            if 已有分享 != 分享:
+                raise ValueError(f"组 {组索引 + 1} 成员 {分享.index + 1} 与已输入的同编号分享内容不同")
+            return self._状态(分享, 重复=True)
+
+        # 组已完成或已可恢复时，多余的分享只需通过上面的元数据检查
+        if 组索引 in self._组秘密 or self.已完成:
+            self._提交(分享, 公共参数)
+            return self._状态(分享)
+
+        新成员表 = dict(成员表)
+        新成员表[分享.index] = 分享
+        组秘密 = None
+        if len(新成员表) >= 分享.member_threshold:
+            组秘密 = self._插值(分享.member_threshold,
+                             [(s.index, s.value) for s in 新成员表.values()],
+                             f"组 {组索引 + 1} 的分享插值校验失败，其中至少有一个分享不属于该组")
+
+        加密主秘密 = None
+        if 组秘密 is not None and len(self._组秘密) + 1 >= 公共参数.group_threshold:
+            组分享 = list(self._组秘密.items()) + [(组索引, 组秘密)]
+            密文 = self._插值(公共参数.group_threshold, 组分享, "组秘密插值校验失败")
+            加密主秘密 = EncryptedMasterSecret(
+                公共参数.identifier, 公共参数.extendable, 公共参数.iteration_exponent, 密文
+            )
+
+        # 所有检查和插值都通过后才修改状态
+        self._提交(分享, 公共参数)
+        if 组秘密 is not None:
+            self._组秘密[组索引] = 组秘密
+        if 加密主秘密 is not None:
+            self._加密主秘密 = 加密主秘密
+        return self._状态(分享)
+
+    def 主秘密(self, 密码: str = "") -> bytes:
+        """
+        解密并返回主秘密
+
+        参数:
+            密码: SLIP-39密码短语
+
+        返回:
+            主秘密字节
+
+        异常:
+            ValueError: 尚未收集到足够的分享
+        """
+        if not self.已完成:
+            raise ValueError("分享数量不足，无法恢复主秘密")
+        return self._加密主秘密.decrypt(unicodedata.normalize('NFKD', 密码).encode())
+
+    def 进度(self) -> Dict[str, Any]:
+        """
+        返回当前收集进度
+
+        返回:
+            {"组阈值", "组数", "已完成组数", "已完成", "组": {组索引: {"已有", "需要", "已完成"}}}
+        """
+        return {
+            "组阈值": self.组阈值,
+            "组数": self.组数,
+            "已完成组数": len(self._组秘密),
+            "已完成": self.已完成,
+            "组": {
+                组索引: {
+                    "已有": len(成员表),
+                    "需要": self._组参数[组索引].member_threshold,
+                    "已完成": 组索引 in self._组秘密,
+                }
+                for 组索引, 成员表 in sorted(self._组成员.items())
+            },
+        }
+
+    def _检查公共参数(self, 分享: "Share") -> None:
+        公共参数 = 分享.common_parameters()
+        if 公共参数 == self._公共参数:
+            return
+        if 公共参数.identifier != self._公共参数.identifier:
+            raise ValueError("分享的标识符不同，不属于同一分享集")
+        if 公共参数.iteration_exponent != self._公共参数.iteration_exponent:
+            raise ValueError("分享的迭代指数与已输入的分享不一致")
+        raise ValueError("分享的组阈值或组数与已输入的分享不一致")
+
+    def _提交(self, 分享: "Share", 公共参数) -> None:
+        self._公共参数 = 公共参数
+        self._秘密长度 = len(分享.value)
+        self._组参数[分享.group_index] = 分享.group_parameters()
+        self._组成员.setdefault(分享.group_index, {})[分享.index] = 分享
+
+    @staticmethod
+    def _插值(阈值: int, 原始分享: List[Tuple[int, bytes]], 错误信息: str) -> bytes:
+        try:
+            return Shamir引擎.恢复秘密(阈值, 原始分享)
+        except ValueError:
+            raise ValueError(错误信息)
+
+    def _状态(self, 分享: "Share", 重复: bool = False) -> Dict[str, Any]:
+        return {
+            "组索引": 分享.group_index,
+            "成员索引": 分享.index,
+            "重复": 重复,
+            "组已完成": 分享.group_index in self._组秘密,
+            "已完成": self.已完成,
+        }
+
+
+# 测试代码
+if __name__ == "__main__":
+    import shamir_mnemonic
+
+    分享组 = shamir_mnemonic.generate_mnemonics(2, [(2, 3), (1, 1)], bytes(16))
+    组合器 = SLIP39增量组合器()
+    for 分享 in (分享组[0][0], 分享组[0][2], 分享组[1][0]):
+        print(组合器.添加分享(分享))
+    print(f"主秘密: {组合器.主秘密().hex()}")
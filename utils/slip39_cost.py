@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SLIP-39迭代指数成本校准工具
+SLIP-39用4轮Feistel网络加密主秘密，每轮是一次PBKDF2-HMAC-SHA256，
+四轮合计10000×2^迭代指数次迭代。加密和每次恢复（以及攻击者每次猜测密码短语）
+都要付出同样的成本。本工具测量本机的PBKDF2速度，估计各迭代指数的恢复耗时，
+并为目标恢复时间推荐迭代指数
+"""
+
+import sys
+import time
+import hashlib
+import argparse
+from typing import Any, Dict, List, Optional
+
+from utils.shamir_engine import 最大迭代指数
+
+
+基础迭代次数 = 10000
+默认迭代指数 = 1
+默认目标秒数 = 2.0
+最短测量秒数 = 0.2
+
+
+def 总迭代次数(迭代指数: int) -> int:
+    """
+    返回一次加密或解密的PBKDF2总迭代次数
+
+    异常:
+        ValueError: 迭代指数超出0-15
+    """
+    if not 0 <= 迭代指数 <= 最大迭代指数:
+        raise ValueError(f"迭代指数必须在0到{最大迭代指数}之间")
+    return 基础迭代次数 << 迭代指数
+
+
+def 测量PBKDF2速度(最短秒数: float = 最短测量秒数) -> float:
+    """
+    测量本机单核PBKDF2-HMAC-SHA256的速度
+
+    使用与Feistel轮函数相同的参数形状（短密码、16字节盐和输出），
+    迭代次数逐次翻倍，直到单次测量不短于最短秒数。
+
+    参数:
+        最短秒数: 单次测量的最短耗时
+
+    返回:
+        每秒迭代次数
+    """
+    迭代次数 = 1000
+    while True:
+        开始时间 = time.perf_counter()
+        hashlib.pbkdf2_hmac("sha256", b"\x00TREZOR", bytes(16), 迭代次数, dklen=16)
+        耗时 = time.perf_counter() - 开始时间
+        if 耗时 >= 最短秒数:
+            return 迭代次数 / 耗时
+        迭代次数 *= 2
+
+
+def 估计耗时(迭代指数: int, 每秒迭代次数: float) -> float:
+    """估计一次加密或恢复的耗时（秒）"""
+    return 总迭代次数(迭代指数) / 每秒迭代次数
+
+
+def 推荐迭代指数(目标秒数: float, 每秒迭代次数: float) -> int:
+    """
+    返回恢复耗时不超过目标秒数的最大迭代指数
+
+    参数:
+        目标秒数: 可接受的单次恢复耗时
+        每秒迭代次数: 测量得到的PBKDF2速度
+
+    返回:
+        推荐的迭代指数；即使指数为0也超过目标时返回0
+
+    异常:
+        ValueError: 目标秒数不是正数
+    """
+    if 目标秒数 <= 0:
+        raise ValueError("目标恢复时间必须大于0")
+    推荐值 = 0
+    for 迭代指数 in range(最大迭代指数 + 1):
+        if 估计耗时(迭代指数, 每秒迭代次数) <= 目标秒数:
+            推荐值 = 迭代指数
+    return 推荐值
+
+
+def 校准(目标秒数: float = 默认目标秒数, 每秒迭代次数: Optional[float] = None) -> Dict[str, Any]:
+    """
+    测量本机速度并列出各迭代指数的成本
+
+    参数:
+        目标秒数: 可接受的单次恢复耗时
+        每秒迭代次数: 已知的PBKDF2速度，为None时现场测量
+
+    返回:
+        {
+            "每秒迭代次数": float, "目标秒数": float, "推荐迭代指数": int,
+            "指数表": [{"迭代指数", "迭代次数", "耗时", "每核每秒猜测次数"}, ...],
+        }
+    """
+    if 每秒迭代次数 is None:
+        每秒迭代次数 = 测量PBKDF2速度()
+    指数表: List[Dict[str, Any]] = []
+    for 迭代指数 in range(最大迭代指数 + 1):
+        耗时 = 估计耗时(迭代指数, 每秒迭代次数)
+        指数表.append({
+            "迭代指数": 迭代指数,
+            "迭代次数": 总迭代次数(迭代指数),
+            "耗时": 耗时,
+            "每核每秒猜测次数": 1 / 耗时,
+        })
+    return {
+        "每秒迭代次数": 每秒迭代次数,
+        "目标秒数": 目标秒数,
+        "推荐迭代指数": 推荐迭代指数(目标秒数, 每秒迭代次数),
+        "指数表": 指数表,
+    }
+
+
+def 成本说明(迭代指数: int, 每秒迭代次数: float) -> str:
+    """生成记录在分享旁边的一行成本说明"""
+    return (f"迭代指数 {迭代指数}（PBKDF2共 {总迭代次数(迭代指数):,} 次迭代，"
+            f"本机每次恢复约 {估计耗时(迭代指数, 每秒迭代次数):.2f} 秒，"
+            f"测得 {每秒迭代次数:,.0f} 次迭代/秒）")
+
+
+def 主程序(参数列表: Optional[List[str]] = None) -> int:
+    """命令行入口"""
+    解析器 = argparse.ArgumentParser(description="测量本机PBKDF2速度并推荐SLIP-39迭代指数")
+    解析器.add_argument("-t", "--目标秒数", type=float, default=默认目标秒数,
+                     help=f"可接受的单次恢复耗时（默认{默认目标秒数}秒）")
+    参数 = 解析器.parse_args(参数列表)
+
+    try:
+        结果 = 校准(参数.目标秒数)
+    except ValueError as e:
+        print(f"错误: {e}", file=sys.stderr)
+        return 1
+
+    print(f"本机PBKDF2-HMAC-SHA256速度: {结果['每秒迭代次数']:,.0f} 次迭代/秒（单核）\n")
+    print(f"{'指数':>4} {'迭代次数':>12} {'恢复耗时':>12} {'每核每秒猜测':>14}")
+    for 行 in 结果["指数表"]:
+        标记 = " ←推荐" if 行["迭代指数"] == 结果["推荐迭代指数"] else ""
+        print(f"{行['迭代指数']:>4} {行['迭代次数']:>14,} {行['耗时']:>12.3f}秒 "
+              f"{行['每核每秒猜测次数']:>14,.2f}{标记}")
+    print(f"\n目标恢复时间 {结果['目标秒数']} 秒，推荐迭代指数: {结果['推荐迭代指数']}")
+    print("迭代指数每加1，恢复耗时和暴力破解密码短语的成本都翻倍")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(主程序())
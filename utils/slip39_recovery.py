@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SLIP-39分享堆组合恢复工具
+输入的分享可能多于所需、混有其他分享集的分享或被抄错。先批量做RS1024校验
+（可纠正单个错误单词）并按标识符分组，再在多个进程中并行尝试阈值大小的分享子集，
+找到第一个经摘要分享或目标地址确认的重建结果即停止
+"""
+
+import os
+import sys
+import time
+import getpass
+import argparse
+import unicodedata
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import combinations, islice, product
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from utils.private_file import 写入私有文件
+from utils.rs1024_checksum import RS1024校验器
+from utils.shamir_engine import SLIP39_AVAILABLE, 安装提示, Shamir引擎
+
+if SLIP39_AVAILABLE:
+    from shamir_mnemonic import EncryptedMasterSecret, MnemonicError, Share
+
+
+默认块大小 = 64
+默认检查地址数 = 20
+
+# 工作进程状态，由_初始化工作进程()设置
+_工作状态: Dict[str, Any] = {}
+
+
+def 整理分享堆(分享列表: Sequence[str], 纠正单词错误: bool = True) -> Dict[str, Any]:
+    """
+    校验、去重并按分享集分组
+
+    参数:
+        分享列表: 分享助记词列表（可包含无效或无关的分享）
+        纠正单词错误: 是否自动纠正只有单个错误单词的分享
+
+    返回:
+        {
+            "分享": [(组索引, 成员索引, 成员阈值, 值), ...],
+            "原文": 与"分享"对应的规范化助记词,
+            "分享集": [{"公共参数": (标识符, 可扩展, 迭代指数, 组阈值), "组": {(组索引, 成员阈值): [分享序号, ...]}}, ...],
+            "拒绝": [(输入序号, 原因), ...],
+            "纠正": [(输入序号, 单词位置, 建议单词), ...],
+        }
+    """
+    分享表: List[Tuple[int, int, int, bytes]] = []
+    原文表: List[str] = []
+    分享集: Dict[Tuple, Dict[Tuple[int, int], List[int]]] = {}
+    拒绝: List[Tuple[int, str]] = []
+    纠正: List[Tuple[int, int, str]] = []
+    已见 = set()
+
+    规范化列表 = [" ".join(分享.lower().split()) for 分享 in 分享列表]
+    for 序号, (助记词, 有效) in enumerate(zip(规范化列表, RS1024校验器.批量验证(规范化列表))):
+        if not 有效:
+            建议 = RS1024校验器.定位错误(助记词) if 纠正单词错误 else []
+            if len(建议) != 1:
+                拒绝.append((序号, "校验和无效"))
+                continue
+            位置, 单词 = 建议[0]
+            单词列表 = 助记词.split()
+            单词列表[位置] = 单词
+            助记词 = " ".join(单词列表)
+            纠正.append((序号, 位置, 单词))
+
+        if 助记词 in 已见:
+            拒绝.append((序号, "重复"))
+            continue
+        已见.add(助记词)
+
+        try:
+            分享 = Share.from_mnemonic(助记词)
+        except MnemonicError as e:
+            拒绝.append((序号, str(e)))
+            continue
+
+        键 = (分享.identifier, 分享.extendable, 分享.iteration_exponent,
+             分享.group_threshold, 分享.group_count, len(分享.value))
+        组键 = (分享.group_index, 分享.member_threshold)
+        分享集.setdefault(键, {}).setdefault(组键, []).append(len(分享表))
+        分享表.append((分享.group_index, 分享.index, 分享.member_threshold, 分享.value))
+        原文表.append(助记词)
+
+    return {
+        "分享": 分享表,
+        "原文": 原文表,
+        "分享集": [{"公共参数": 键[:4], "组": 组} for 键, 组 in 分享集.items()],
+        "拒绝": 拒绝,
+        "纠正": 纠正,
+    }
+
+
+def _成员子集(分享表: Sequence[Tuple[int, int, int, bytes]], 序号列表: Sequence[int],
+          阈值: int) -> Iterator[Tuple[int, ...]]:
+    """枚举成员索引互不相同的阈值大小子集"""
+    for 子集 in combinations(序号列表, 阈值):
+        if len({分享表[i][1] for i in 子集}) == 阈值:
+            yield 子集
+
+
+def 枚举尝试(整理结果: Dict[str, Any]) -> Iterator[Tuple[int, Tuple[Tuple[int, ...], ...]]]:
+    """
+    惰性枚举所有候选重建
+
+    每个尝试是 (分享集序号, 每个选中组的成员子集)。先选组阈值个不同的组，
+    再对每个组选成员阈值个成员索引互不相同的分享。
+    """
+    分享表 = 整理结果["分享"]
+    for 集序号, 分享集 in enumerate(整理结果["分享集"]):
+        组阈值 = 分享集["公共参数"][3]
+        可用组 = [
+            (组键, 序号列表) for 组键, 序号列表 in sorted(分享集["组"].items())
+            if len({分享表[i][1] for i in 序号列表}) >= 组键[1]
+        ]
+        for 组组合 in combinations(可用组, 组阈值):
+            if len({组键[0] for 组键, _ in 组组合}) != 组阈值:
+                continue
+            for 子集组合 in product(*(list(_成员子集(分享表, 序号列表, 组键[1])) for 组键, 序号列表 in 组组合)):
+                yield 集序号, 子集组合
+
+
+def _初始化工作进程(状态: Dict[str, Any]) -> None:
+    global _工作状态
+    _工作状态 = dict(状态, 缓存={})
+
+
+def _匹配目标地址(主秘密: bytes, 目标: Tuple[str, str, int]) -> bool:
+    """把主秘密当作BIP-32种子派生地址，检查目标地址是否在前若干个地址中"""
+    from utils.wallet_address import 钱包地址生成器
+
+    目标地址, 币种, 数量 = 目标
+    批次 = 钱包地址生成器.批量生成地址(主秘密, 币种, 0, 0, 数量)
+    候选 = set(批次.所有地址()) | {地址 for 地址 in 批次.所有隔离见证地址() if 地址}
+    if 币种 == "ETH":
+        return 目标地址.lower() in {地址.lower() for 地址 in 候选}
+    return 目标地址 in 候选
+
+
+def _评估尝试(集序号: int, 子集组合: Tuple[Tuple[int, ...], ...]) -> Optional[Tuple[bytes, str]]:
+    """
+    评估一个候选重建
+
+    返回:
+        (加密主秘密密文, 确认方式)，不一致或无法确认时返回None
+    """
+    状态 = _工作状态
+    分享表 = 状态["分享"]
+    缓存 = 状态["缓存"]
+    已校验摘要 = False
+
+    组秘密 = []
+    for 子集 in 子集组合:
+        if 子集 not in 缓存:
+            try:
+                缓存[子集] = Shamir引擎.恢复秘密(
+                    len(子集), [(分享表[i][1], 分享表[i][3]) for i in 子集]
+                )
+            except ValueError:
+                缓存[子集] = None
+        if 缓存[子集] is None:
+            return None
+        已校验摘要 = 已校验摘要 or len(子集) > 1
+        组秘密.append((分享表[子集[0]][0], 缓存[子集]))
+
+    标识符, 可扩展, 迭代指数, 组阈值 = 状态["公共参数"][集序号]
+    try:
+        密文 = Shamir引擎.恢复秘密(组阈值, 组秘密)
+    except ValueError:
+        return None
+    已校验摘要 = 已校验摘要 or 组阈值 > 1
+
+    if 状态["目标"] is None:
+        return (密文, "摘要") if 已校验摘要 else None
+
+    主秘密 = EncryptedMasterSecret(标识符, 可扩展, 迭代指数, 密文).decrypt(状态["密码"])
+    return (密文, "地址") if _匹配目标地址(主秘密, 状态["目标"]) else None
+
+
+def _评估块(块: List[Tuple[int, Tuple[Tuple[int, ...], ...]]]) -> Tuple[int, Optional[Tuple]]:
+    """依次评估一块尝试，遇到第一个成功的尝试即返回"""
+    for 数量, (集序号, 子集组合) in enumerate(块, 1):
+        结果 = _评估尝试(集序号, 子集组合)
+        if 结果 is not None:
+            return 数量, (集序号, 子集组合) + 结果
+    return len(块), None
+
+
+def _分块(迭代器: Iterator, 块大小: int) -> Iterator[List]:
+    while True:
+        块 = list(islice(迭代器, 块大小))
+        if not 块:
+            return
+        yield 块
+
+
+def 从分享堆恢复(分享列表: Sequence[str], 密码: str = "", 目标地址: Optional[str] = None,
+           币种: str = "BTC", 检查地址数: int = 默认检查地址数, 进程数: Optional[int] = None,
+           块大小: int = 默认块大小, 纠正单词错误: bool = True) -> Dict[str, Any]:
+    """
+    从混杂的分享堆中恢复主秘密
+
+    没有目标地址时，只接受至少经过一次摘要分享校验的重建（阈值都为1的分享集无法确认）。
+    提供目标地址时，每个通过摘要校验的候选都会解密，并把主秘密作为种子派生
+    BIP-44账户0的前若干个地址与目标地址比对。
+
+    参数:
+        分享列表: 分享助记词列表
+        密码: SLIP-39密码短语
+        目标地址: 用于确认的地址（可选）
+        币种: 目标地址的币种
+        检查地址数: 比对的地址数量
+        进程数: 工作进程数，默认为CPU核心数；为1时在当前进程中计算
+        块大小: 每次交给工作进程的尝试数
+        纠正单词错误: 是否自动纠正只有单个错误单词的分享
+
+    返回:
+        {
+            "成功": bool, "主秘密": bytes或None, "标识符": int或None,
+            "使用分享": 成功重建所用的助记词列表, "确认方式": "摘要"/"地址"/None,
+            "尝试次数": int, "耗时": 秒, "每秒尝试次数": float,
+            "拒绝": [(输入序号, 原因), ...], "纠正": [(输入序号, 单词位置, 建议单词), ...],
+        }
+    """
+    if not SLIP39_AVAILABLE:
+        raise ImportError(安装提示)
+    密码字节 = unicodedata.normalize('NFKD', 密码).encode()
+    if 目标地址 is not None:
+        from utils.wallet_address import 钱包地址生成器, 支持币种
+        if 币种 not in 支持币种:
+            raise ValueError(f"不支持的币种: {币种}")
+        if not 钱包地址生成器.检查依赖():
+            raise ImportError(钱包地址生成器.安装依赖提示())
+
+    开始时间 = time.perf_counter()
+    整理结果 = 整理分享堆(分享列表, 纠正单词错误)
+    状态 = {
+        "分享": 整理结果["分享"],
+        "公共参数": [分享集["公共参数"] for 分享集 in 整理结果["分享集"]],
+        "密码": 密码字节,
+        "目标": (目标地址, 币种, 检查地址数) if 目标地址 is not None else None,
+    }
+
+    块迭代器 = _分块(枚举尝试(整理结果), 块大小)
+    尝试次数 = 0
+    成功 = None
+    进程数 = 进程数 or os.cpu_count() or 1
+
+    if 进程数 == 1:
+        _初始化工作进程(状态)
+        for 块 in 块迭代器:
+            数量, 成功 = _评估块(块)
+            尝试次数 += 数量
+            if 成功:
+                break
+    else:
+        # 只保持有限个块在途，避免组合数很大时一次性生成全部尝试
+        进程池 = ProcessPoolExecutor(max_workers=进程数, initializer=_初始化工作进程, initargs=(状态,))
+        try:
+            在途 = {进程池.submit(_评估块, 块) for 块 in islice(块迭代器, 进程数 * 2)}
+            while 在途 and not 成功:
+                已完成, 在途 = wait(在途, return_when=FIRST_COMPLETED)
+                for 未来 in 已完成:
+                    数量, 结果 = 未来.result()
+                    尝试次数 += 数量
+                    成功 = 成功 or 结果
+                if not 成功:
+                    在途 |= {进程池.submit(_评估块, 块) for 块 in islice(块迭代器, len(已完成))}
+        finally:
+            进程池.shutdown(wait=True, cancel_futures=True)
+
+    耗时 = time.perf_counter() - 开始时间
+    结果 = {
+        "成功": bool(成功),
+        "主秘密": None,
+        "标识符": None,
+        "使用分享": [],
+        "确认方式": None,
+        "尝试次数": 尝试次数,
+        "耗时": 耗时,
+        "每秒尝试次数": 尝试次数 / 耗时 if 耗时 > 0 else 0.0,
+        "拒绝": 整理结果["拒绝"],
+        "纠正": 整理结果["纠正"],
+    }
+    if 成功:
+        集序号, 子集组合, 密文, 确认方式 = 成功
+        标识符, 可扩展, 迭代指数, _ = 状态["公共参数"][集序号]
+        结果.update({
+            "主秘密": EncryptedMasterSecret(标识符, 可扩展, 迭代指数, 密文).decrypt(密码字节),
+            "标识符": 标识符,
+            "使用分享": [整理结果["原文"][i] for 子集 in 子集组合 for i in 子集],
+            "确认方式": 确认方式,
+        })
+    return 结果
+
+
+def 主程序(参数列表: Optional[List[str]] = None) -> int:
+    """命令行入口"""
+    解析器 = argparse.ArgumentParser(description="从混杂的SLIP-39分享堆中恢复主秘密")
+    解析器.add_argument("分享文件", help="每行一个分享的文本文件（#开头的行被忽略）")
+    解析器.add_argument("-p", "--密码", action="store_true", help="提示输入SLIP-39密码短语")
+    解析器.add_argument("-a", "--目标地址", default=None, help="用于确认重建结果的地址")
+    解析器.add_argument("-c", "--币种", default="BTC", help="目标地址的币种（默认BTC）")
+    解析器.add_argument("-n", "--检查地址数", type=int, default=默认检查地址数, help="比对的地址数量")
+    解析器.add_argument("-j", "--进程数", type=int, default=None, help="并行进程数（默认CPU核心数）")
+    解析器.add_argument("-o", "--输出文件", default=None, help="把完整的主秘密（十六进制）写入仅所有者可读写的文件")
+    解析器.add_argument("--显示", action="store_true", help="在终端显示完整的主秘密（默认只显示首尾各16位）")
+    参数 = 解析器.parse_args(参数列表)
+
+    try:
+        with open(参数.分享文件, "r", encoding="utf-8") as 文件:
+            分享列表 = [行.strip() for 行 in 文件 if 行.strip() and not 行.lstrip().startswith("#")]
+        密码 = getpass.getpass("SLIP-39密码短语: ") if 参数.密码 else ""
+        结果 = 从分享堆恢复(分享列表, 密码, 参数.目标地址, 参数.币种, 参数.检查地址数, 参数.进程数)
+    except (OSError, ValueError, ImportError) as e:
+        print(f"错误: {e}", file=sys.stderr)
+        return 1
+
+    for 序号, 位置, 单词 in 结果["纠正"]:
+        print(f"ℹ️ 第 {序号 + 1} 个分享的第 {位置 + 1} 个单词已纠正为 \"{单词}\"")
+    for 序号, 原因 in 结果["拒绝"]:
+        print(f"✗ 第 {序号 + 1} 个分享被忽略: {原因}")
+    print(f"\n尝试 {结果['尝试次数']} 个子集，耗时 {结果['耗时']:.2f} 秒，"
+          f"{结果['每秒尝试次数']:,.0f} 次/秒")
+
+    if not 结果["成功"]:
+        print("未找到一致的重建结果")
+        return 1
+    种子十六进制 = 结果["主秘密"].hex()
+    print(f"成功恢复主秘密（{结果['确认方式']}确认，使用 {len(结果['使用分享'])} 个分享）")
+    if 参数.输出文件:
+        try:
+            写入私有文件(参数.输出文件, 种子十六进制 + "\n")
+        except OSError as e:
+            print(f"错误: {e}", file=sys.stderr)
+            return 1
+        print(f"完整的主秘密已写入 {参数.输出文件}（仅所有者可读写），用完请安全删除")
+    if 参数.显示:
+        print("⚠️ 主秘密将完整显示在屏幕上，注意身后、屏幕录制和终端回滚记录", file=sys.stderr)
+        print(f"种子(十六进制): {种子十六进制}")
+    else:
+        print(f"种子(十六进制): {种子十六进制[:16]}...{种子十六进制[-16:]}")
+        if not 参数.输出文件:
+            print("使用 --显示 查看完整的主秘密，或用 -o 写入仅所有者可读写的文件")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(主程序())
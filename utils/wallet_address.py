@@ -8,18 +8,265 @@
 
 import hashlib
 import hmac
+import struct
 import binascii
-from typing import Dict, List, Tuple, Optional, Union
+import importlib.util
+from typing import Dict, List, Tuple, Optional, Union, Iterator
 
-try:
-    import base58
-    import bech32
-    import ecdsa
-    from hdwallet import HDWallet
-    from hdwallet.symbols import BTC, ETH, DOGE, LTC, BCH
-    HDWALLET_AVAILABLE = True
-except ImportError:
-    HDWALLET_AVAILABLE = False
+from utils.base58_encoder import Base58编码器
+from utils.bech32_encoder import Bech32编码器
+from utils.hash_functions import hash160, hash160_batch, keccak_batch
+
+# HD钱包相关依赖较重（hdwallet会连带导入ecdsa、pycryptodome等），
+# 模块导入时只检查是否安装，首次派生地址时才由_加载依赖()真正导入
+_依赖模块 = ("hdwallet", "ecdsa")
+
+HDWALLET_AVAILABLE = all(importlib.util.find_spec(模块) is not None for 模块 in _依赖模块)
+
+ecdsa = None
+SECP256k1 = None
+VerifyingKey = None
+HDWallet = None
+_依赖已加载 = False
+
+
+def _加载依赖() -> bool:
+    """
+    导入地址派生所需的依赖库，只在第一次调用时真正执行导入
+    
+    返回:
+        依赖是否可用
+    """
+    global ecdsa, SECP256k1, VerifyingKey, HDWallet
+    global HDWALLET_AVAILABLE, _依赖已加载
+    
+    if _依赖已加载 or not HDWALLET_AVAILABLE:
+        return HDWALLET_AVAILABLE
+    
+    try:
+        import ecdsa
+        from ecdsa import SECP256k1, VerifyingKey
+        from hdwallet import HDWallet
+        _依赖已加载 = True
+    except ImportError:
+        HDWALLET_AVAILABLE = False
+    
+    return HDWALLET_AVAILABLE
+
+
+# 支持的币种及其编码参数
+# 币种索引: BIP-44路径中的coin_type
+# 版本字节: P2PKH地址的网络前缀（ETH不使用）
+# HRP: SegWit地址的人类可读前缀（不支持SegWit的币种为None）
+币种参数 = {
+    "BTC": {"币种索引": 0, "版本字节": b"\x00", "HRP": "bc"},
+    "ETH": {"币种索引": 60, "版本字节": None, "HRP": None},
+    "DOGE": {"币种索引": 3, "版本字节": b"\x1e", "HRP": None},
+    "LTC": {"币种索引": 2, "版本字节": b"\x30", "HRP": "ltc"},
+    "BCH": {"币种索引": 145, "版本字节": b"\x00", "HRP": None},
+}
+
+支持币种 = list(币种参数.keys())
+
+# BIP-32索引是32位无符号数，高位为1表示硬化派生，所以账户和非硬化地址索引都小于2^31
+硬化偏移 = 2 ** 31
+
+
+def _批量以太坊地址(压缩公钥列表: List[bytes]) -> List[str]:
+    """从压缩公钥批量计算带EIP-55校验和的以太坊地址"""
+    未压缩公钥列表 = [
+        VerifyingKey.from_string(压缩公钥, curve=SECP256k1).to_string("uncompressed")[1:]
+        for 压缩公钥 in 压缩公钥列表
+    ]
+    地址列表 = [摘要[-20:].hex() for 摘要 in keccak_batch(未压缩公钥列表)]
+    校验哈希列表 = keccak_batch([地址.encode() for 地址 in 地址列表])
+    
+    结果 = []
+    for 地址十六进制, 校验哈希 in zip(地址列表, 校验哈希列表):
+        # EIP-55: 校验哈希对应半字节>=8时该位字母大写
+        结果.append("0x" + "".join(
+            字符.upper() if (校验哈希[i >> 1] >> (0 if i & 1 else 4)) & 0x8 else 字符
+            for i, 字符 in enumerate(地址十六进制)
+        ))
+    return 结果
+
+
+def _以太坊地址(压缩公钥: bytes) -> str:
+    """从压缩公钥计算带EIP-55校验和的以太坊地址"""
+    return _批量以太坊地址([压缩公钥])[0]
+
+
+def _编码地址(币种: str, 压缩公钥: bytes) -> str:
+    """按币种规则将压缩公钥编码为地址字符串"""
+    if 币种 == "ETH":
+        return _以太坊地址(压缩公钥)
+    版本字节 = 币种参数[币种]["版本字节"]
+    return Base58编码器.编码校验(版本字节 + hash160(压缩公钥))
+
+
+def _编码隔离见证地址(币种: str, 压缩公钥: bytes) -> Optional[str]:
+    """编码P2WPKH地址，币种不支持SegWit时返回None"""
+    hrp = 币种参数[币种]["HRP"]
+    if hrp is None:
+        return None
+    return Bech32编码器.编码隔离见证地址(hrp, 0, hash160(压缩公钥))
+
+
+class 地址记录:
+    """
+    单个派生地址的紧凑记录
+
+    记录本身只保存所属批次和在批次中的位置，公钥原始字节存放在批次的
+    连续缓冲区中，地址和十六进制公钥等字符串在访问时才编码。
+    为兼容旧接口，记录也支持按中文键名以字典方式访问。
+    """
+
+    __slots__ = ("_批次", "_位置")
+
+    字段 = ("币种", "地址", "隔离见证地址", "公钥", "HD路径", "扩展公钥", "账户索引", "地址索引")
+
+    def __init__(self, 批次: "地址批次", 位置: int):
+        self._批次 = 批次
+        self._位置 = 位置
+
+    @property
+    def 币种(self) -> str:
+        return self._批次.币种
+
+    @property
+    def 账户索引(self) -> int:
+        return self._批次.账户索引
+
+    @property
+    def 地址索引(self) -> int:
+        return self._批次.起始索引 + self._位置
+
+    @property
+    def 扩展公钥(self) -> str:
+        return self._批次.扩展公钥
+
+    @property
+    def 公钥字节(self) -> bytes:
+        return self._批次.公钥字节(self._位置)
+
+    @property
+    def 公钥(self) -> str:
+        return self.公钥字节.hex()
+
+    @property
+    def 地址(self) -> str:
+        return _编码地址(self._批次.币种, self.公钥字节)
+
+    @property
+    def 隔离见证地址(self) -> Optional[str]:
+        return _编码隔离见证地址(self._批次.币种, self.公钥字节)
+
+    @property
+    def HD路径(self) -> str:
+        return f"{self._批次.路径前缀}/{self.地址索引}"
+
+    def __getitem__(self, 键: str):
+        if 键 not in 地址记录.字段:
+            raise KeyError(键)
+        return getattr(self, 键)
+
+    def __contains__(self, 键: str) -> bool:
+        return 键 in 地址记录.字段
+
+    def get(self, 键: str, 默认值=None):
+        return getattr(self, 键) if 键 in 地址记录.字段 else 默认值
+
+    def keys(self) -> Tuple[str, ...]:
+        return 地址记录.字段
+
+    def 转字典(self) -> Dict:
+        """转换为旧版的地址信息字典"""
+        return {键: getattr(self, 键) for 键 in 地址记录.字段}
+
+    def __repr__(self) -> str:
+        return f"地址记录({self.币种}, {self.HD路径})"
+
+
+class 地址批次:
+    """
+    同一账户下连续地址索引的批量派生结果
+
+    账户级扩展公钥每批只保存一次，所有压缩公钥按33字节定长依次存放在
+    一个bytearray中，按索引访问时才创建地址记录对象。
+    """
+
+    __slots__ = ("币种", "账户索引", "扩展公钥", "起始索引", "_公钥数据")
+
+    公钥长度 = 33
+
+    def __init__(self, 币种: str, 账户索引: int, 扩展公钥: str, 起始索引: int = 0):
+        self.币种 = 币种
+        self.账户索引 = 账户索引
+        self.扩展公钥 = 扩展公钥
+        self.起始索引 = 起始索引
+        self._公钥数据 = bytearray()
+
+    @property
+    def 路径前缀(self) -> str:
+        return f"m/44'/{币种参数[self.币种]['币种索引']}'/{self.账户索引}'/0"
+
+    def 添加公钥(self, 压缩公钥: bytes) -> None:
+        """追加下一个地址索引的压缩公钥"""
+        if len(压缩公钥) != 地址批次.公钥长度:
+            raise ValueError("压缩公钥必须为33字节")
+        self._公钥数据 += 压缩公钥
+
+    def 公钥字节(self, 位置: int) -> bytes:
+        偏移 = 位置 * 地址批次.公钥长度
+        return bytes(self._公钥数据[偏移:偏移 + 地址批次.公钥长度])
+
+    def 所有公钥字节(self) -> List[bytes]:
+        """按地址索引顺序返回全部压缩公钥"""
+        return [bytes(self._公钥数据[偏移:偏移 + 地址批次.公钥长度])
+                for 偏移 in range(0, len(self._公钥数据), 地址批次.公钥长度)]
+
+    def 所有地址(self) -> List[str]:
+        """批量编码批次中的全部地址"""
+        if self.币种 == "ETH":
+            return _批量以太坊地址(self.所有公钥字节())
+        公钥哈希列表 = hash160_batch(self.所有公钥字节())
+        return Base58编码器.批量编码校验(公钥哈希列表, 币种参数[self.币种]["版本字节"])
+
+    def 所有隔离见证地址(self) -> List[Optional[str]]:
+        """批量编码批次中的全部P2WPKH地址，币种不支持SegWit时返回None列表"""
+        hrp = 币种参数[self.币种]["HRP"]
+        if hrp is None:
+            return [None] * len(self)
+        见证程序列表 = hash160_batch(self.所有公钥字节())
+        return Bech32编码器.批量编码隔离见证地址(hrp, 0, 见证程序列表)
+
+    def __len__(self) -> int:
+        return len(self._公钥数据) // 地址批次.公钥长度
+
+    def __getitem__(self, 位置: int) -> 地址记录:
+        长度 = len(self)
+        if 位置 < 0:
+            位置 += 长度
+        if not 0 <= 位置 < 长度:
+            raise IndexError("地址批次索引超出范围")
+        return 地址记录(self, 位置)
+
+    def __iter__(self) -> Iterator[地址记录]:
+        for 位置 in range(len(self)):
+            yield 地址记录(self, 位置)
+
+    def __repr__(self) -> str:
+        return f"地址批次({self.币种}, {self.路径前缀}/{self.起始索引}..., 共{len(self)}个)"
+
+
+def _派生子公钥(父公钥点, 父公钥: bytes, 链码: bytes, 索引: int) -> bytes:
+    """BIP-32非硬化公钥派生(CKDpub)，返回子节点的压缩公钥"""
+    I = hmac.new(链码, 父公钥 + struct.pack(">L", 索引), hashlib.sha512).digest()
+    左半 = int.from_bytes(I[:32], "big")
+    if 左半 >= SECP256k1.order:
+        raise ValueError(f"地址索引 {索引} 派生无效，请跳过该索引")
+    子公钥点 = 父公钥点 + SECP256k1.generator * 左半
+    return VerifyingKey.from_public_point(子公钥点, curve=SECP256k1).to_string("compressed")
 
 
 class 钱包地址生成器:
@@ -28,7 +275,7 @@ class 钱包地址生成器:
     @staticmethod
     def 检查依赖() -> bool:
         """
-        检查是否安装了必要的依赖库
+        检查是否安装了必要的依赖库（不会导入依赖库）
         
         返回:
             是否可用
@@ -43,10 +290,126 @@ class 钱包地址生成器:
         返回:
             安装提示字符串
         """
-        return "请安装必要的依赖库以启用钱包地址生成功能：\npip install hdwallet base58 bech32 ecdsa"
+        return "请安装必要的依赖库以启用钱包地址生成功能：\npip install hdwallet ecdsa"
+    
+    @staticmethod
+    def _派生批次(根钱包, 币种: str, 账户索引: int, 起始索引: int, 数量: int) -> 地址批次:
+        """
+        从已导入根密钥的HD钱包派生一批地址
+        
+        硬化路径 m/44'/币种'/账户' 只派生一次，外部链节点 /0 之后的
+        每个地址只需一次非硬化公钥派生。
+        """
+        币种索引 = 币种参数[币种]["币种索引"]
+        根钱包.from_path(f"m/44'/{币种索引}'/{账户索引}'")
+        扩展公钥 = Base58编码器.编码校验(bytes.fromhex(根钱包.xpublic_key(encoded=False)))
+        批次 = 地址批次(币种, 账户索引, 扩展公钥, 起始索引)
+        
+        # 外部链节点
+        根钱包.from_index(0)
+        链公钥 = bytes.fromhex(根钱包.public_key())
+        链码 = bytes.fromhex(根钱包.chain_code())
+        链公钥点 = VerifyingKey.from_string(链公钥, curve=SECP256k1).pubkey.point
+        
+        for 地址索引 in range(起始索引, 起始索引 + 数量):
+            批次.添加公钥(_派生子公钥(链公钥点, 链公钥, 链码, 地址索引))
+        
+        return 批次
+    
+    @staticmethod
+    def _检查批量参数(币种: str, 数量: int, 账户索引: int = 0, 起始索引: int = 0) -> None:
+        if not _加载依赖():
+            raise ImportError(f"缺少必要的依赖库。{钱包地址生成器.安装依赖提示()}")
+        if 币种 not in 币种参数:
+            raise ValueError(f"不支持的币种: {币种}，支持: {', '.join(支持币种)}")
+        if 数量 < 1:
+            raise ValueError("地址数量必须大于0")
+        # 超出范围的索引打包进路径或struct.pack(">L")时会变成硬化路径或直接报错
+        if not 0 <= 账户索引 < 硬化偏移:
+            raise ValueError(f"账户索引必须在0到{硬化偏移 - 1}之间: {账户索引}")
+        if 起始索引 < 0:
+            raise ValueError(f"起始索引不能为负数: {起始索引}")
+        if 起始索引 + 数量 > 硬化偏移:
+            raise ValueError(f"起始索引加数量不能超过{硬化偏移}: {起始索引} + {数量}")
+    
+    @staticmethod
+    def 批量生成地址(种子: bytes, 币种: str = "BTC", 账户索引: int = 0,
+                起始索引: int = 0, 数量: int = 1) -> 地址批次:
+        """
+        从种子批量生成同一账户下连续索引的地址
+        
+        参数:
+            种子: 种子字节
+            币种: 币种代码 (BTC, ETH, DOGE, LTC, BCH)
+            账户索引: HD钱包的账户索引
+            起始索引: 第一个地址的地址索引
+            数量: 生成的地址数量
+            
+        返回:
+            地址批次对象
+            
+        异常:
+            ImportError: 缺少依赖库
+            ValueError: 币种不支持，数量或索引超出范围
+        """
+        钱包地址生成器._检查批量参数(币种, 数量, 账户索引, 起始索引)
+        根钱包 = HDWallet(symbol=币种)
+        根钱包.from_seed(seed=种子.hex())
+        return 钱包地址生成器._派生批次(根钱包, 币种, 账户索引, 起始索引, 数量)
+    
+    @staticmethod
+    def 从助记词批量生成地址(助记词: str, 密码短语: str = "", 币种: str = "BTC",
+                    账户索引: int = 0, 起始索引: int = 0, 数量: int = 1) -> 地址批次:
+        """
+        从助记词批量生成同一账户下连续索引的地址
+        
+        参数:
+            助记词: 助记词字符串
+            密码短语: 可选密码短语
+            币种: 币种代码 (BTC, ETH, DOGE, LTC, BCH)
+            账户索引: HD钱包的账户索引
+            起始索引: 第一个地址的地址索引
+            数量: 生成的地址数量
+            
+        返回:
+            地址批次对象
+        """
+        钱包地址生成器._检查批量参数(币种, 数量, 账户索引, 起始索引)
+        根钱包 = HDWallet(symbol=币种)
+        根钱包.from_mnemonic(mnemonic=助记词, passphrase=密码短语 or None)
+        return 钱包地址生成器._派生批次(根钱包, 币种, 账户索引, 起始索引, 数量)
+    
+    @staticmethod
+    def 生成账户扩展公钥(种子: bytes, 币种: str = "BTC", 起始账户: int = 0, 数量: int = 1) -> List[str]:
+        """
+        批量生成连续账户 m/44'/币种'/账户' 的扩展公钥
+        
+        参数:
+            种子: 种子字节
+            币种: 币种代码 (BTC, ETH, DOGE, LTC, BCH)
+            起始账户: 第一个账户索引
+            数量: 账户数量
+            
+        返回:
+            扩展公钥字符串列表
+        """
+        钱包地址生成器._检查批量参数(币种, 数量, 起始索引=起始账户)
+        根钱包 = HDWallet(symbol=币种)
+        根钱包.from_seed(seed=种子.hex())
+        币种索引 = 币种参数[币种]["币种索引"]
+        
+        原始扩展公钥 = []
+        for 账户索引 in range(起始账户, 起始账户 + 数量):
+            根钱包.clean_derivation()
+            根钱包.from_path(f"m/44'/{币种索引}'/{账户索引}'")
+            原始扩展公钥.append(bytes.fromhex(根钱包.xpublic_key(encoded=False)))
+        
+        # 同一币种的扩展公钥版本号相同，作为公共前缀只哈希一次
+        版本号 = 原始扩展公钥[0][:4]
+        return Base58编码器.批量编码校验([数据[4:] for 数据 in 原始扩展公钥], 版本号)
     
     @staticmethod
-    def 从种子生成地址(种子: bytes, 币种: str = "BTC", 账户索引: int = 0, 地址索引: int = 0) -> Dict:
+    def 从种子生成地址(种子: bytes, 币种: str = "BTC", 账户索引: int = 0, 地址索引: int = 0) -> Union[地址记录, Dict]:
         """
         从种子生成指定币种的钱包地址
         
@@ -57,39 +420,18 @@ class 钱包地址生成器:
             地址索引: HD钱包的地址索引
             
         返回:
-            包含地址信息的字典
+            地址记录（可按字典方式访问），出错时返回包含"错误"键的字典
         """
         if not HDWALLET_AVAILABLE:
             return {"错误": f"缺少必要的依赖库。{钱包地址生成器.安装依赖提示()}"}
         
         try:
-            # 创建HD钱包
-            hdwallet = HDWallet(symbol=币种)
-            
-            # 从种子导入
-            hdwallet.from_seed(seed=种子)
-            
-            # 设置HD路径
-            # m/44'/{币种索引}'/0'/0/0
-            hdwallet.from_path(f"m/44'/{hdwallet.cryptocurrency().INDEX}'/{账户索引}'/0/{地址索引}")
-            
-            # 获取钱包信息
-            钱包信息 = {
-                "币种": 币种,
-                "地址": hdwallet.address(),
-                "公钥": hdwallet.public_key(),
-                "HD路径": hdwallet.path(),
-                "扩展公钥": hdwallet.extended_public_key(),
-                "账户索引": 账户索引,
-                "地址索引": 地址索引
-            }
-            
-            return 钱包信息
+            return 钱包地址生成器.批量生成地址(种子, 币种, 账户索引, 地址索引, 1)[0]
         except Exception as e:
             return {"错误": f"生成{币种}地址时出错: {str(e)}"}
     
     @staticmethod
-    def 从助记词生成地址(助记词: str, 密码短语: str = "", 币种: str = "BTC", 账户索引: int = 0, 地址索引: int = 0) -> Dict:
+    def 从助记词生成地址(助记词: str, 密码短语: str = "", 币种: str = "BTC", 账户索引: int = 0, 地址索引: int = 0) -> Union[地址记录, Dict]:
         """
         从助记词生成指定币种的钱包地址
         
@@ -101,39 +443,18 @@ class 钱包地址生成器:
             地址索引: HD钱包的地址索引
             
         返回:
-            包含地址信息的字典
+            地址记录（可按字典方式访问），出错时返回包含"错误"键的字典
         """
         if not HDWALLET_AVAILABLE:
             return {"错误": f"缺少必要的依赖库。{钱包地址生成器.安装依赖提示()}"}
         
         try:
-            # 创建HD钱包
-            hdwallet = HDWallet(symbol=币种)
-            
-            # 从助记词导入
-            hdwallet.from_mnemonic(mnemonic=助记词, passphrase=密码短语)
-            
-            # 设置HD路径
-            # m/44'/{币种索引}'/0'/0/0
-            hdwallet.from_path(f"m/44'/{hdwallet.cryptocurrency().INDEX}'/{账户索引}'/0/{地址索引}")
-            
-            # 获取钱包信息
-            钱包信息 = {
-                "币种": 币种,
-                "地址": hdwallet.address(),
-                "公钥": hdwallet.public_key(),
-                "HD路径": hdwallet.path(),
-                "扩展公钥": hdwallet.extended_public_key(),
-                "账户索引": 账户索引,
-                "地址索引": 地址索引
-            }
-            
-            return 钱包信息
+            return 钱包地址生成器.从助记词批量生成地址(助记词, 密码短语, 币种, 账户索引, 地址索引, 1)[0]
         except Exception as e:
             return {"错误": f"生成{币种}地址时出错: {str(e)}"}
     
     @staticmethod
-    def 生成多币种地址(助记词: str, 密码短语: str = "") -> Dict[str, Dict]:
+    def 生成多币种地址(助记词: str, 密码短语: str = "") -> Dict[str, Union[地址记录, Dict]]:
         """
         从助记词生成多种常见加密货币的地址
         
@@ -142,12 +463,11 @@ class 钱包地址生成器:
             密码短语: 可选密码短语
             
         返回:
-            包含多种币种地址信息的字典
+            以币种代码为键的地址记录字典
         """
         if not HDWALLET_AVAILABLE:
             return {"错误": f"缺少必要的依赖库。{钱包地址生成器.安装依赖提示()}"}
         
-        支持币种 = [BTC, ETH, DOGE, LTC, BCH]
         结果 = {}
         
         for 币种 in 支持币种:
@@ -171,6 +491,8 @@ class 钱包地址生成器:
         
         输出 = f"\n===== {地址信息['币种']}钱包地址 =====\n"
         输出 += f"地址: {地址信息['地址']}\n"
+        if 地址信息.get("隔离见证地址"):
+            输出 += f"隔离见证地址: {地址信息['隔离见证地址']}\n"
         输出 += f"HD路径: {地址信息['HD路径']}\n"
         输出 += f"公钥: {地址信息['公钥'][:10]}...{地址信息['公钥'][-10:]}\n"
         
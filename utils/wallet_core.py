@@ -0,0 +1,703 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+钱包核心引擎
+多源熵收集、BIP-39助记词生成与验证、SLIP-39分割备份，供交互菜单和其他程序嵌入使用。
+导入本模块不读写文件、不启动线程、不等待：mnemonic、cryptography和shamir-mnemonic
+只检查是否安装，第一次使用时才导入；配置项由调用方通过构造参数传入
+"""
+
+import os
+import time
+import ctypes
+import getpass
+import hashlib
+import platform
+import secrets
+import unicodedata
+import importlib.util
+from typing import Dict, List, Tuple, Optional, Union, Any
+
+# 安全常量
+DEFAULT_ENTROPY_BITS = 256  # 默认使用256位熵（24个词）
+MIN_ENTROPY_BITS = 128      # 最小允许128位熵（12个词）
+PBKDF2_ITERATIONS = 2048    # BIP-39标准迭代次数
+ENTROPY_SOURCES_REQUIRED = 3  # 要求至少3个熵源
+DEFAULT_LANGUAGE = "english"  # 默认使用英文助记词
+
+# 依赖库只检查是否安装，真正的导入推迟到第一次使用
+MNEMONIC_AVAILABLE = importlib.util.find_spec("mnemonic") is not None
+CRYPTOGRAPHY_AVAILABLE = importlib.util.find_spec("cryptography") is not None
+SLIP39_AVAILABLE = importlib.util.find_spec("shamir_mnemonic") is not None
+
+
+class 安全工具:
+    """安全相关的工具函数"""
+    
+    @staticmethod
+    def 安全清除内存(数据):
+        """
+        安全清除内存中的敏感数据
+        
+        参数:
+            数据: 要清除的数据对象
+        """
+        if 数据 is None:
+            return
+        
+        try:
+            # 根据数据类型选择不同的清除方法
+            if isinstance(数据, str):
+                # 字符串类型，先覆盖为随机字符，再覆盖为零
+                长度 = len(数据)
+                # 使用ctypes直接操作内存
+                ctypes.memset(id(数据) + 20, ord('X'), 长度)
+                ctypes.memset(id(数据) + 20, 0, 长度)
+            elif isinstance(数据, bytes) or isinstance(数据, bytearray):
+                # 字节类型，先覆盖为随机字节，再覆盖为零
+                长度 = len(数据)
+                if 长度 > 0:
+                    # 使用ctypes直接操作内存
+                    ctypes.memset(id(数据) + 33, 0xFF, 长度)
+                    ctypes.memset(id(数据) + 33, 0, 长度)
+            elif isinstance(数据, list):
+                # 列表类型，递归清除每个元素
+                for i in range(len(数据)):
+                    安全工具.安全清除内存(数据[i])
+                    数据[i] = None
+                数据.clear()
+            elif isinstance(数据, dict):
+                # 字典类型，递归清除每个值
+                for key in 数据:
+                    安全工具.安全清除内存(数据[key])
+                    数据[key] = None
+                数据.clear()
+            elif isinstance(数据, int) or isinstance(数据, float):
+                # 数值类型，无法直接清除，但可以尝试覆盖
+                pass  # Python中的数值是不可变的，无法直接清除
+            
+            # 强制垃圾回收
+            安全工具.强制垃圾回收()
+        except Exception as e:
+            # 捕获所有异常，确保不会因为清除失败而中断程序
+            print(f"内存清除异常: {str(e)}")
+            # 即使出错，也尝试进行垃圾回收
+            安全工具.强制垃圾回收()
+    
+    @staticmethod
+    def 强制垃圾回收():
+        """
+        强制执行Python垃圾回收，确保内存被释放
+        """
+        import gc
+        # 禁用垃圾回收器自动运行
+        gc.disable()
+        # 手动运行垃圾回收
+        gc.collect()
+        # 重新启用垃圾回收器
+        gc.enable()
+        return True
+    
+    @staticmethod
+    def 清除终端显示():
+        """
+        清除终端屏幕上的所有内容
+        """
+        # 对于类Unix系统
+        if platform.system() != "Windows":
+            os.system('clear')
+        # 对于Windows系统
+        else:
+            os.system('cls')
+        return True
+    
+    @staticmethod
+    def 安全清除所有痕迹(敏感数据列表=None):
+        """
+        全面清除所有可能的敏感数据痕迹
+        
+        参数:
+            敏感数据列表: 需要清除的敏感数据对象列表
+        """
+        # 清除指定的敏感数据
+        if 敏感数据列表:
+            for 数据 in 敏感数据列表:
+                安全工具.安全清除内存(数据)
+        
+        # 强制垃圾回收
+        安全工具.强制垃圾回收()
+        
+        # 返回成功
+        return True
+    
+    @staticmethod
+    def 规范化字符串(文本: str) -> str:
+        """
+        对字符串进行NFKD Unicode规范化处理
+        
+        参数:
+            文本: 要规范化的字符串
+            
+        返回:
+            规范化后的字符串
+        """
+        return unicodedata.normalize('NFKD', 文本)
+    
+    @staticmethod
+    def 检查系统安全性() -> Dict[str, bool]:
+        """
+        检查系统安全状态
+        
+        返回:
+            包含安全检查结果的字典
+        """
+        结果 = {}
+        
+        # 检查是否为离线环境（简单检查，不完全可靠）
+        try:
+            import socket
+            # 设置较短的超时时间，避免长时间等待
+            socket.setdefaulttimeout(2.0)
+            # 尝试连接多个网站，增加检测可靠性
+            for host in ["www.baidu.com", "www.google.com", "www.cloudflare.com"]:
+                try:
+                    socket.create_connection((host, 80), timeout=1)
+                    结果["离线环境"] = False
+                    break
+                except:
+                    continue
+            else:  # 如果所有连接都失败
+                结果["离线环境"] = True
+        except Exception as e:
+            # 如果发生任何异常，假设为离线环境
+            结果["离线环境"] = True
+            print(f"网络检测异常: {str(e)}")
+        
+        # 检查操作系统类型
+        结果["操作系统"] = platform.system()
+        
+        # 检查是否有安全的随机源
+        try:
+            os.urandom(16)
+            结果["安全随机源"] = True
+        except NotImplementedError:
+            结果["安全随机源"] = False
+        
+        # 检查是否有硬件随机源
+        结果["硬件随机源"] = os.path.exists('/dev/hwrng')
+        
+        return 结果
+
+
+class 熵池:
+    """熵池管理器，负责收集和混合多源熵"""
+    
+    def __init__(self, 要求熵源数: int = ENTROPY_SOURCES_REQUIRED):
+        """
+        初始化熵池
+        
+        参数:
+            要求熵源数: 熵池健康所需的最少熵源数量
+        """
+        self.要求熵源数 = 要求熵源数
+        self.熵源计数 = 0
+        self.熵池 = hashlib.sha512()
+        self.已添加熵源 = set()
+    
+    def 添加熵(self, 熵源名称: str, 熵数据: bytes) -> None:
+        """
+        向熵池添加熵
+        
+        参数:
+            熵源名称: 熵源的名称标识
+            熵数据: 熵数据
+        """
+        if 熵源名称 not in self.已添加熵源:
+            self.熵池.update(熵数据)
+            self.熵源计数 += 1
+            self.已添加熵源.add(熵源名称)
+    
+    def 获取熵池状态(self) -> Dict[str, Any]:
+        """
+        获取熵池当前状态
+        
+        返回:
+            包含熵池状态的字典
+        """
+        return {
+            "熵源数量": self.熵源计数,
+            "已添加熵源": list(self.已添加熵源),
+            "熵池健康度": min(100, self.熵源计数 * 100 // self.要求熵源数)
+        }
+    
+    def 熵池是否健康(self) -> bool:
+        """
+        检查熵池是否有足够的熵源
+        
+        返回:
+            如果熵池有足够的熵源，返回True
+        """
+        return self.熵源计数 >= self.要求熵源数
+    
+    def 获取熵(self, 字节数: int) -> bytes:
+        """
+        从熵池获取指定字节数的熵
+        
+        参数:
+            字节数: 需要的字节数
+            
+        返回:
+            随机字节
+        
+        异常:
+            ValueError: 如果熵池不健康
+        """
+        if not self.熵池是否健康():
+            raise ValueError(f"熵池不健康，当前熵源数量: {self.熵源计数}，需要至少: {self.要求熵源数}")
+        
+        # 获取当前熵池的哈希
+        当前哈希 = self.熵池.digest()
+        
+        # 创建一个新的哈希对象用于扩展熵
+        扩展哈希 = hashlib.sha512()
+        扩展哈希.update(当前哈希)
+        
+        # 如果需要的字节数超过了哈希长度，则需要扩展
+        结果 = bytearray()
+        剩余字节 = 字节数
+        计数器 = 0
+        
+        while 剩余字节 > 0:
+            # 添加计数器以生成不同的哈希
+            计数器哈希 = hashlib.sha512()
+            计数器哈希.update(当前哈希)
+            计数器哈希.update(计数器.to_bytes(4, byteorder='big'))
+            
+            哈希结果 = 计数器哈希.digest()
+            取用字节数 = min(len(哈希结果), 剩余字节)
+            结果.extend(哈希结果[:取用字节数])
+            
+            剩余字节 -= 取用字节数
+            计数器 += 1
+        
+        return bytes(结果)
+
+
+class 熵源生成器:
+    """负责从多种来源收集熵"""
+    
+    def __init__(self, 要求熵源数: int = ENTROPY_SOURCES_REQUIRED):
+        """
+        初始化熵源生成器
+        
+        参数:
+            要求熵源数: 熵池健康所需的最少熵源数量
+        """
+        self.熵池 = 熵池(要求熵源数)
+    
+    def 收集系统熵(self) -> None:
+        """从操作系统的CSPRNG收集熵"""
+        try:
+            系统熵 = os.urandom(64)
+            self.熵池.添加熵("系统CSPRNG", 系统熵)
+            print("✓ 系统熵收集成功")
+        except NotImplementedError:
+            print("✗ 警告: 当前系统不支持os.urandom，无法获取系统随机熵")
+        except Exception as e:
+            print(f"✗ 系统熵收集失败: {str(e)}")
+    
+    def 收集Python安全熵(self) -> None:
+        """从Python的secrets模块收集熵"""
+        try:
+            安全熵 = secrets.token_bytes(64)
+            self.熵池.添加熵("Python_secrets", 安全熵)
+            print("✓ Python安全熵收集成功")
+        except Exception as e:
+            print(f"✗ 警告: 无法从Python的secrets模块获取熵: {str(e)}")
+    
+    def 收集时间熵(self) -> None:
+        """从高精度时间收集熵（弱熵源，仅作为补充）"""
+        try:
+            时间哈希 = hashlib.sha256()
+            
+            # 收集多个时间点以增加熵
+            for _ in range(10):
+                时间哈希.update(str(time.time_ns()).encode())
+                time.sleep(0.01)  # 微小延迟以获取不同时间
+            
+            self.熵池.添加熵("时间熵", 时间哈希.digest())
+            print("✓ 时间熵收集成功")
+        except Exception as e:
+            print(f"✗ 时间熵收集失败: {str(e)}")
+    
+    def 收集硬件熵(self) -> None:
+        """尝试从硬件随机源收集熵"""
+        try:
+            # 尝试读取/dev/hwrng (硬件随机数生成器)
+            if os.path.exists('/dev/hwrng'):
+                with open('/dev/hwrng', 'rb') as f:
+                    硬件熵 = f.read(64)
+                    self.熵池.添加熵("硬件RNG", 硬件熵)
+                    print("✓ 硬件随机源熵收集成功")
+                    return
+            # 尝试读取/dev/random (高质量熵池)
+            elif os.path.exists('/dev/random'):
+                with open('/dev/random', 'rb') as f:
+                    随机设备熵 = f.read(64)
+                    self.熵池.添加熵("dev_random", 随机设备熵)
+                    print("✓ /dev/random熵收集成功")
+                    return
+            print("✗ 未找到硬件随机源，跳过此熵源")
+        except Exception as e:
+            print(f"✗ 硬件熵收集失败: {str(e)}")
+    
+    def 收集计算熵(self) -> None:
+        """通过计算密集型操作生成熵"""
+        try:
+            # 生成RSA密钥对是计算密集型的，可以作为熵源
+            from cryptography.hazmat.primitives.asymmetric import rsa
+            私钥 = rsa.generate_private_key(
+                public_exponent=65537,
+                key_size=2048
+            )
+            # 使用私钥的内存地址和对象ID作为熵
+            计算熵 = hashlib.sha256()
+            计算熵.update(str(id(私钥)).encode())
+            计算熵.update(str(私钥.private_numbers().d).encode())
+            
+            self.熵池.添加熵("计算熵", 计算熵.digest())
+            print("✓ 计算熵收集成功")
+        except Exception as e:
+            print(f"✗ 计算熵收集失败: {str(e)}")
+    
+    def 收集用户熵(self, 用户输入: str = None) -> None:
+        """
+        从用户输入收集熵
+        
+        参数:
+            用户输入: 用户提供的熵字符串，如果为None则提示用户输入
+        """
+        try:
+            if 用户输入 is None:
+                print("\n为增强随机性，请输入一些随机字符（按回车结束）:")
+                用户输入 = getpass.getpass("（输入内容不会显示）: ")
+            
+            if 用户输入:
+                用户熵 = hashlib.sha256(用户输入.encode()).digest()
+                self.熵池.添加熵("用户输入", 用户熵)
+                print("✓ 用户熵收集成功")
+            else:
+                print("✗ 未提供用户输入，跳过此熵源")
+        except Exception as e:
+            print(f"✗ 用户熵收集失败: {str(e)}")
+    
+    def 收集所有可用熵(self, 包含用户熵: bool = True) -> None:
+        """
+        收集所有可用的熵源
+        
+        参数:
+            包含用户熵: 是否包含用户输入的熵
+        """
+        # 显示初始熵池状态
+        熵池状态 = self.获取熵池状态()
+        print(f"初始熵池状态: {熵池状态['熵池健康度']}% ({熵池状态['熵源数量']}/{self.熵池.要求熵源数}个熵源)")
+        if 熵池状态['熵源数量'] > 0:
+            print(f"已添加熵源: {', '.join(熵池状态['已添加熵源'])}")
+        else:
+            print("已添加熵源: 无")
+        
+        # 收集系统熵
+        print("\n正在收集系统熵...")
+        self.收集系统熵()
+        
+        # 收集Python安全熵
+        print("正在收集Python安全熵...")
+        self.收集Python安全熵()
+        
+        # 收集时间熵
+        print("正在收集时间熵...")
+        self.收集时间熵()
+        
+        # 收集硬件熵
+        print("正在尝试收集硬件熵...")
+        self.收集硬件熵()
+        
+        # 收集计算熵
+        print("正在生成计算熵...")
+        self.收集计算熵()
+        
+        # 收集用户熵
+        if 包含用户熵:
+            self.收集用户熵()
+        
+        # 再次显示熵池状态
+        熵池状态 = self.获取熵池状态()
+        print(f"\n当前熵池状态: {熵池状态['熵池健康度']}% ({熵池状态['熵源数量']}/{self.熵池.要求熵源数}个熵源)")
+        print(f"已添加熵源: {', '.join(熵池状态['已添加熵源'])}")
+    
+    def 获取熵(self, 字节数: int) -> bytes:
+        """
+        获取指定字节数的熵
+        
+        参数:
+            字节数: 需要的字节数
+            
+        返回:
+            随机字节
+        """
+        # 确保熵池健康
+        if not self.熵池.熵池是否健康():
+            print("\n警告: 熵池不够健康，正在收集更多熵...")
+            self.收集所有可用熵(包含用户熵=True)
+            
+            # 再次检查熵池健康状态
+            if not self.熵池.熵池是否健康():
+                print("\n严重警告: 熵池仍然不够健康，但将继续生成。")
+                print("生成的助记词可能不具备足够的随机性和安全性。")
+                print("建议取消操作，检查系统随机源后重试。")
+                
+                # 询问用户是否继续
+                继续操作 = input("\n是否仍要继续生成? (y/n): ").lower()
+                if 继续操作 not in ['y', 'yes', '是']:
+                    raise ValueError("用户取消了操作")
+        
+        return self.熵池.获取熵(字节数)
+    
+    def 获取熵池状态(self) -> Dict[str, Any]:
+        """
+        获取熵池状态
+        
+        返回:
+            熵池状态字典
+        """
+        return self.熵池.获取熵池状态()
+
+
+class 钱包生成器:
+    """钱包助记词生成器，遵循BIP-39标准"""
+    
+    def __init__(self, 语言: str = DEFAULT_LANGUAGE, 要求熵源数: int = ENTROPY_SOURCES_REQUIRED):
+        """
+        初始化钱包生成器
+        
+        参数:
+            语言: 助记词语言，默认为英文
+            要求熵源数: 生成助记词前熵池至少需要的熵源数量
+        
+        异常:
+            ImportError: 未安装mnemonic库
+        """
+        from mnemonic import Mnemonic
+        
+        self.语言 = 语言
+        self.助记词工具 = Mnemonic(self.语言)
+        self.熵源生成器 = 熵源生成器(要求熵源数)
+    
+    def 生成助记词(self, 强度: int = DEFAULT_ENTROPY_BITS) -> str:
+        """
+        生成BIP-39标准助记词
+        
+        参数:
+            强度: 熵的位数，必须是32的倍数，范围是128-256
+                 128位生成12个词，256位生成24个词
+        
+        返回:
+            助记词字符串
+        """
+        if 强度 % 32 != 0 or 强度 < MIN_ENTROPY_BITS or 强度 > 256:
+            raise ValueError(f"熵的位数必须是32的倍数，范围是{MIN_ENTROPY_BITS}-256")
+        
+        print("\n开始收集熵源...")
+        
+        # 收集所有可用熵
+        self.熵源生成器.收集所有可用熵()
+        
+        # 显示最终熵池状态
+        熵池状态 = self.熵源生成器.获取熵池状态()
+        print(f"\n最终熵池状态: {熵池状态['熵池健康度']}% ({熵池状态['熵源数量']}/{self.熵源生成器.熵池.要求熵源数}个熵源)")
+        print(f"已添加熵源: {', '.join(熵池状态['已添加熵源'])}")
+        
+        # 计算需要的字节数
+        字节数 = 强度 // 8
+        
+        print("\n正在生成助记词...")
+        
+        # 获取熵
+        熵 = self.熵源生成器.获取熵(字节数)
+        
+        # 生成助记词
+        助记词 = self.助记词工具.to_mnemonic(熵)
+        
+        return 助记词
+    
+    def 验证助记词(self, 助记词: str) -> bool:
+        """
+        验证助记词是否有效
+        
+        参数:
+            助记词: 助记词字符串
+            
+        返回:
+            是否有效
+        """
+        # 对助记词进行NFKD规范化
+        规范化助记词 = 安全工具.规范化字符串(助记词)
+        return self.助记词工具.check(规范化助记词)
+    
+    def 助记词转种子(self, 助记词: str, 密码: str = "") -> bytes:
+        """
+        将助记词转换为种子
+        
+        参数:
+            助记词: 助记词字符串
+            密码: 可选密码短语
+            
+        返回:
+            种子字节
+        """
+        # 对助记词和密码进行NFKD规范化
+        规范化助记词 = 安全工具.规范化字符串(助记词)
+        规范化密码 = 安全工具.规范化字符串(密码)
+        
+        # 使用BIP-39标准的PBKDF2函数
+        种子 = self.助记词工具.to_seed(规范化助记词, 规范化密码)
+        
+        return 种子
+
+
+class SLIP39管理器:
+    """SLIP-39 Shamir备份管理器"""
+    
+    def __init__(self):
+        """初始化SLIP-39管理器"""
+        if not SLIP39_AVAILABLE:
+            raise ImportError("SLIP-39功能需要安装shamir-mnemonic库")
+    
+    def 生成分享(self, 主秘密: bytes, 组数: int, 阈值: int, 
+              每组成员数: List[int], 每组阈值: List[int], 
+              密码: str = "", 迭代指数: int = 1) -> List[List[str]]:
+        """
+        将主秘密分割为多个分享
+        
+        参数:
+            主秘密: 要分割的主秘密
+            组数: 分组数量
+            阈值: 恢复所需的组数量
+            每组成员数: 每个组的成员数量列表
+            每组阈值: 每个组的阈值列表
+            密码: 可选密码短语
+            迭代指数: Feistel加密的PBKDF2迭代指数（0-15），每加1恢复耗时翻倍
+            
+        返回:
+            分享列表的列表，每个内部列表代表一个组的所有分享
+        """
+        # 对密码进行NFKD规范化
+        规范化密码 = 安全工具.规范化字符串(密码)
+        
+        # 生成分享（GF(256)分割由项目内置的Shamir引擎完成）
+        from utils.shamir_engine import 生成SLIP39分享
+
+        所有分享 = 生成SLIP39分享(
+            组阈值=阈值,
+            组列表=[(每组阈值[i], 每组成员数[i]) for i in range(组数)],
+            主秘密=主秘密,
+            密码=规范化密码.encode(),
+            迭代指数=迭代指数
+        )
+        
+        return 所有分享
+
+    def 批量生成分享(self, 条目列表: List[Dict[str, Any]], 模板: Dict[str, Any],
+               输出目录: str, 进程数: Optional[int] = None) -> List[Dict[str, str]]:
+        """
+        在进程池中为多个主秘密批量生成分享，每个主秘密写入一个文件
+
+        参数:
+            条目列表: 条目字典列表，包含"名称"、"主秘密"和可选的"密码"
+            模板: 分组模板 {"组阈值": int, "组": [(成员阈值, 成员数), ...]}
+            输出目录: 分享文件输出目录
+            进程数: 工作进程数，默认为CPU核心数
+
+        返回:
+            按条目顺序排列的结果列表，见utils.slip39_batch.批量生成分享
+        """
+        from utils.slip39_batch import 批量生成分享
+
+        return 批量生成分享(条目列表, 模板, 输出目录, 进程数)
+
+    def 创建组合器(self):
+        """
+        创建逐个接收分享的增量组合器
+
+        返回:
+            SLIP39增量组合器实例，见utils.slip39_combiner
+        """
+        from utils.slip39_combiner import SLIP39增量组合器
+
+        return SLIP39增量组合器()
+
+    def 检查分享(self, 分享列表: List[str]) -> List[Dict[str, Any]]:
+        """
+        批量检查分享的RS1024校验和，并为单个单词错误给出纠正建议
+
+        参数:
+            分享列表: SLIP-39分享列表
+
+        返回:
+            每个分享一个字典: {"有效": bool, "建议": [(位置, 单词), ...]}
+        """
+        from utils.rs1024_checksum import RS1024校验器
+
+        return RS1024校验器.批量检查(分享列表)
+
+    def 恢复秘密(self, 分享列表: List[str], 密码: str = "") -> bytes:
+        """
+        从分享中恢复主秘密
+        
+        参数:
+            分享列表: SLIP-39分享列表
+            密码: 可选密码短语
+            
+        返回:
+            恢复的主秘密
+        """
+        # 对密码进行NFKD规范化
+        规范化密码 = 安全工具.规范化字符串(密码)
+        
+        # 先批量校验所有分享，输错的分享在插值之前就能指出
+        for 序号, 结果 in enumerate(self.检查分享(分享列表), 1):
+            if 结果["有效"]:
+                continue
+            if len(结果["建议"]) == 1:
+                位置, 单词 = 结果["建议"][0]
+                raise ValueError(f"第 {序号} 个分享的第 {位置 + 1} 个单词有误，可能应为 \"{单词}\"")
+            raise ValueError(f"第 {序号} 个分享无效")
+
+        # 恢复主秘密
+        from utils.shamir_engine import 组合SLIP39分享
+
+        主秘密 = 组合SLIP39分享(分享列表, 规范化密码.encode())
+
+        return 主秘密
+
+    def 从分享堆恢复(self, 分享列表: List[str], 密码: str = "", 目标地址: Optional[str] = None,
+                币种: str = "BTC", 进程数: Optional[int] = None) -> Dict[str, Any]:
+        """
+        从可能混有无关或抄错分享的分享堆中恢复主秘密
+
+        并行尝试阈值大小的分享子集，找到第一个经摘要分享或目标地址确认的结果即停止。
+
+        参数:
+            分享列表: SLIP-39分享列表
+            密码: 可选密码短语
+            目标地址: 用于确认的钱包地址（可选）
+            币种: 目标地址的币种
+            进程数: 工作进程数，默认为CPU核心数
+
+        返回:
+            恢复结果字典，见utils.slip39_recovery.从分享堆恢复
+        """
+        from utils.slip39_recovery import 从分享堆恢复
+
+        return 从分享堆恢复(分享列表, 密码, 目标地址, 币种, 进程数=进程数)